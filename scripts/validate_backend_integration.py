@@ -25,6 +25,7 @@ from typing import Any
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from cogex_mcp.clients.neo4j_client import Neo4jClient
+from cogex_mcp.clients.query_catalog import QUERY_REGISTRY
 from cogex_mcp.config import Settings
 
 # Configure logging
@@ -556,7 +557,7 @@ class BackendValidator:
         # Test kinase analysis query
         try:
             # Check if query exists
-            if "kinase_analysis" in self.client._get_cypher_query.__code__.co_consts:
+            if "kinase_analysis" in QUERY_REGISTRY:
                 result = await self.client.execute_query(
                     "kinase_analysis",
                     gene_ids=[TEST_ENTITIES["genes"]["TP53"]],
@@ -5,23 +5,44 @@ Implements:
 - Connection pooling for Neo4j
 - Circuit breaker pattern for fault tolerance
 - Automatic fallback from Neo4j → REST
-- Health checking and monitoring
+- Background health probing and monitoring
+- Single-flight coalescing of identical concurrent queries
+- Adaptive concurrency limits with separate lookup and analytics lanes
+- Hedged reads: slow primary queries are raced against the fallback
 - Thread-safe operations
 """
 
 import asyncio
+import functools
+import hashlib
+import json
 import logging
+import time
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import aclosing
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
+from cogex_mcp.clients.health import HealthProber
+from cogex_mcp.clients.hedging import HedgeBudget, HedgeStats, LatencyTracker
+from cogex_mcp.clients.limiter import AdaptiveLimiter, QueryRejectedError, QueryTimeoutError
 from cogex_mcp.clients.neo4j_client import Neo4jClient
+from cogex_mcp.clients.query_catalog import QUERY_REGISTRY
 from cogex_mcp.clients.rest_client import RestClient
 from cogex_mcp.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+# Composite analyses run in the heavy concurrency lane; everything else is a lookup
+HEAVY_QUERIES = frozenset({"enrichment_analysis", "kinase_analysis", "extract_subnetwork"})
+
+# Health probes slower than this mark a backend DEGRADED
+DEGRADED_LATENCY_MS = 1000
+
+
 class BackendType(str, Enum):
     """Available backend types."""
 
@@ -93,6 +114,54 @@ class CircuitBreaker:
         Raises:
             Exception: If circuit is open or function fails
         """
+        await self._check_state()
+
+        # Execute function
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            await self.record_failure()
+            raise
+
+        await self.record_success()
+        return result
+
+    async def stream(self, func, *args, **kwargs) -> AsyncIterator[Any]:
+        """
+        Iterate an async generator through circuit breaker.
+
+        A failure at any point while iterating counts against the breaker.
+        Reaching the end, or the consumer closing the stream early, counts
+        as a success.
+
+        Args:
+            func: Async generator function
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Yields:
+            Items of the generator
+
+        Raises:
+            Exception: If circuit is open or the generator fails
+        """
+        await self._check_state()
+
+        try:
+            async with aclosing(func(*args, **kwargs)) as items:
+                async for item in items:
+                    yield item
+        except Exception:
+            await self.record_failure()
+            raise
+        except GeneratorExit:
+            await self.record_success()
+            raise
+
+        await self.record_success()
+
+    async def _check_state(self) -> None:
+        """Reject the call while open, moving to half-open after the recovery timeout."""
         async with self._lock:
             # Check if circuit should transition to half-open
             if self.state == CircuitBreakerState.OPEN:
@@ -105,37 +174,51 @@ class CircuitBreaker:
                 else:
                     raise Exception("Circuit breaker is OPEN")
 
-        # Execute function
-        try:
-            result = await func(*args, **kwargs)
+    async def record_success(self) -> None:
+        """Record a successful call."""
+        async with self._lock:
+            self.failure_count = 0
+            if self.state == CircuitBreakerState.HALF_OPEN:
+                self.success_count += 1
+                if self.success_count >= self.success_threshold:
+                    logger.info("Circuit breaker CLOSED after recovery")
+                    self.state = CircuitBreakerState.CLOSED
+                    self.success_count = 0
 
-            # Record success
-            async with self._lock:
+    async def record_failure(self) -> None:
+        """Record a failed call, opening the circuit past the threshold."""
+        async with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = datetime.now()
+
+            if self.state == CircuitBreakerState.HALF_OPEN:
+                logger.warning("Circuit breaker OPEN after failed recovery attempt")
+                self.state = CircuitBreakerState.OPEN
                 self.failure_count = 0
-                if self.state == CircuitBreakerState.HALF_OPEN:
-                    self.success_count += 1
-                    if self.success_count >= self.success_threshold:
-                        logger.info("Circuit breaker CLOSED after recovery")
-                        self.state = CircuitBreakerState.CLOSED
-                        self.success_count = 0
-
-            return result
-
-        except Exception as e:
-            # Record failure
-            async with self._lock:
-                self.failure_count += 1
-                self.last_failure_time = datetime.now()
-
-                if self.state == CircuitBreakerState.HALF_OPEN:
-                    logger.warning("Circuit breaker OPEN after failed recovery attempt")
-                    self.state = CircuitBreakerState.OPEN
-                    self.failure_count = 0
-                elif self.failure_count >= self.failure_threshold:
-                    logger.error(f"Circuit breaker OPEN after {self.failure_count} failures")
-                    self.state = CircuitBreakerState.OPEN
-
-            raise e
+            elif self.failure_count >= self.failure_threshold:
+                logger.error(f"Circuit breaker OPEN after {self.failure_count} failures")
+                self.state = CircuitBreakerState.OPEN
+
+    async def record_probe(self, healthy: bool) -> None:
+        """
+        Record a background health probe.
+
+        Failed probes count like failed calls. A successful probe of an open
+        circuit moves it to HALF_OPEN, so live traffic retests the backend
+        without waiting out the recovery timeout.
+
+        Args:
+            healthy: Whether the probe succeeded
+        """
+        if not healthy:
+            await self.record_failure()
+            return
+
+        async with self._lock:
+            if self.state == CircuitBreakerState.OPEN:
+                logger.info("Circuit breaker HALF_OPEN after successful health probe")
+                self.state = CircuitBreakerState.HALF_OPEN
+                self.success_count = 0
 
     def is_open(self) -> bool:
         """Check if circuit is open."""
@@ -149,6 +232,127 @@ class CircuitBreaker:
         self.last_failure_time = None
 
 
+@dataclass
+class CoalescingStats:
+    """Single-flight coalescing statistics."""
+
+    requests: int = 0
+    executions: int = 0
+    merged: int = 0
+    in_flight: int = 0
+    abandoned: int = 0  # Executions cancelled because every caller left
+
+    @property
+    def merge_rate(self) -> float:
+        """Fraction of requests that joined an in-flight execution."""
+        return self.merged / self.requests if self.requests > 0 else 0.0
+
+
+def query_key(query_name: str, params: Mapping[str, Any]) -> str:
+    """
+    Canonical hash of a query name and its parameters.
+
+    Parameter order does not matter, and sets hash the same in any order.
+
+    Args:
+        query_name: Query operation name
+        params: Query parameters
+
+    Returns:
+        Hex digest identifying the query
+    """
+
+    def canonical(value: Any) -> Any:
+        if isinstance(value, (set, frozenset)):
+            return sorted(value, key=str)
+        return str(value)
+
+    payload = json.dumps(
+        [query_name, params], sort_keys=True, default=canonical, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class _Flight:
+    """An in-flight execution and the number of callers waiting on it."""
+
+    task: asyncio.Task
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls into one execution.
+
+    The first caller for a key starts the execution; callers arriving while
+    it is in flight await the same task and receive the same result (or
+    exception). Results are shared, so callers must not mutate them.
+
+    A cancelled caller leaves the execution running for the others. Once the
+    last caller has left, the execution is cancelled too, so nobody's work
+    keeps holding a connection or limiter slot.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: dict[str, _Flight] = {}
+        self.stats = CoalescingStats()
+
+    async def do(self, key: str, func, *args, **kwargs) -> Any:
+        """
+        Run func(*args, **kwargs), or join the in-flight call for key.
+
+        Args:
+            key: Call identity (see query_key)
+            func: Async function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Function result
+        """
+        self.stats.requests += 1
+        flight = self._calls.get(key)
+        if flight is None:
+            self.stats.executions += 1
+            flight = _Flight(asyncio.ensure_future(func(*args, **kwargs)))
+            self._calls[key] = flight
+            self.stats.in_flight = len(self._calls)
+            flight.task.add_done_callback(lambda done: self._finish(key, flight))
+        else:
+            self.stats.merged += 1
+            logger.debug(f"Coalesced request onto in-flight call {key[:12]}")
+
+        flight.waiters += 1
+        try:
+            # A cancelled caller must not cancel the execution other callers share
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                self._abandon(key, flight)
+
+    def _abandon(self, key: str, flight: _Flight) -> None:
+        """Cancel an execution no caller is waiting for any more."""
+        self.stats.abandoned += 1
+        logger.debug(f"Cancelling in-flight call {key[:12]}: every caller left")
+        # Forget it now so a new caller starts a fresh execution
+        if self._calls.get(key) is flight:
+            del self._calls[key]
+        self.stats.in_flight = len(self._calls)
+        flight.task.cancel()
+
+    def _finish(self, key: str, flight: _Flight) -> None:
+        """Forget a completed call."""
+        if self._calls.get(key) is flight:
+            del self._calls[key]
+        self.stats.in_flight = len(self._calls)
+        # Mark the exception retrieved in case every caller was cancelled
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+
 class ClientAdapter:
     """
     Unified interface to CoGEx backends with automatic fallback.
@@ -175,7 +379,31 @@ class ClientAdapter:
         self.neo4j_health = BackendHealth.UNKNOWN
         self.rest_health = BackendHealth.UNKNOWN
         self.last_health_check: datetime | None = None
-        self.health_check_interval = 300  # 5 minutes
+        self._prober: HealthProber | None = None
+
+        # Identical concurrent queries share one execution
+        self._single_flight = SingleFlight()
+
+        # Hedged reads: primary latency percentiles per query name, extra-load budget
+        self._latency = LatencyTracker(min_samples=settings.hedge_min_samples)
+        self._hedge_budget = HedgeBudget(settings.hedge_budget_ratio)
+        self._hedge_stats = HedgeStats()
+
+        # Concurrency lanes: cheap lookups and heavy analytics
+        self._limiters = {
+            "light": AdaptiveLimiter(
+                "light",
+                max_limit=settings.max_concurrent_queries,
+                max_queue=settings.max_queued_queries,
+                adaptive=settings.adaptive_concurrency,
+            ),
+            "heavy": AdaptiveLimiter(
+                "heavy",
+                max_limit=settings.max_concurrent_enrichments,
+                max_queue=settings.max_queued_queries,
+                adaptive=settings.adaptive_concurrency,
+            ),
+        }
 
     async def initialize(self) -> None:
         """
@@ -199,6 +427,18 @@ class ClientAdapter:
                         max_connection_pool_size=settings.neo4j_max_connection_pool_size,
                         connection_timeout=settings.neo4j_connection_timeout,
                         max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+                        batch_chunk_size=settings.neo4j_batch_chunk_size,
+                        database=settings.neo4j_database,
+                        causal_consistency=settings.neo4j_causal_consistency,
+                        default_timeout=settings.query_timeout_ms,
+                        long_running_timeout=settings.complex_query_timeout_ms,
+                        batch_timeout=settings.batch_query_timeout_ms,
+                        fulltext_search=settings.neo4j_fulltext_search,
+                        create_fulltext_indexes=settings.neo4j_create_fulltext_indexes,
+                        local_name_index_max_entries=settings.neo4j_local_name_index_max_entries,
+                        domain_client_workers=settings.domain_client_workers,
+                        enrichment_workers=settings.max_concurrent_enrichments,
+                        subnetwork_timeout=settings.subnetwork_timeout_ms,
                     )
                     await self.neo4j_client.connect()
                     self.neo4j_breaker = CircuitBreaker(
@@ -208,7 +448,10 @@ class ClientAdapter:
                     )
                     self.primary_backend = BackendType.NEO4J
                     self.neo4j_health = BackendHealth.HEALTHY
-                    logger.info("Neo4j client initialized successfully")
+                    logger.info(
+                        f"Neo4j client initialized successfully "
+                        f"(routing={settings.uses_neo4j_routing})"
+                    )
                 except Exception as e:
                     logger.warning(f"Failed to initialize Neo4j: {e}")
                     self.neo4j_health = BackendHealth.UNHEALTHY
@@ -244,16 +487,40 @@ class ClientAdapter:
                     "No backends available. Configure Neo4j or enable REST fallback."
                 )
 
+            self._start_prober()
+
             self._initialized = True
             logger.info(
                 f"ClientAdapter initialized: primary={self.primary_backend}, "
                 f"fallback={self.fallback_backend}"
             )
 
+    def _start_prober(self) -> None:
+        """Start background health probes of the connected backends."""
+        probes = {}
+        if self.neo4j_client:
+            probes[BackendType.NEO4J.value] = self.neo4j_client.health_check
+        if self.rest_client:
+            probes[BackendType.REST.value] = self.rest_client.health_check
+
+        self._prober = HealthProber(
+            probes,
+            on_result=self._record_probe,
+            interval=settings.health_check_interval_seconds,
+            max_backoff=settings.health_check_max_backoff_seconds,
+            jitter=settings.health_check_jitter,
+            timeout=settings.health_check_timeout_seconds,
+        )
+        self._prober.start()
+
     async def close(self) -> None:
         """Close all backend connections."""
         logger.info("Closing ClientAdapter connections")
 
+        if self._prober:
+            await self._prober.stop()
+            self._prober = None
+
         if self.neo4j_client:
             await self.neo4j_client.close()
             logger.info("Neo4j client closed")
@@ -272,6 +539,11 @@ class ClientAdapter:
         """
         Execute query with automatic backend selection and fallback.
 
+        Concurrent calls with the same query name and parameters share one
+        execution (settings.coalesce_queries) and receive the same result,
+        which callers must treat as read-only. Executions then run through
+        the concurrency lane for the query (see _limited_query).
+
         Args:
             query_name: Name of the query operation
             **params: Query parameters
@@ -280,22 +552,65 @@ class ClientAdapter:
             Query results as dictionary
 
         Raises:
+            QueryRejectedError: If the query is shed by the concurrency limiter
             Exception: If all backends fail
         """
+        if not settings.coalesce_queries:
+            return await self._limited_query(query_name, **params)
+
+        return await self._single_flight.do(
+            query_key(query_name, params), self._limited_query, query_name, **params
+        )
+
+    async def _limited_query(
+        self,
+        query_name: str,
+        **params: Any,
+    ) -> dict[str, Any]:
+        """Execute query once its concurrency lane has a free slot."""
+        return await self._limiters[self._lane(query_name)].run(
+            functools.partial(self._query, query_name, **params),
+            queue_timeout=self._queue_timeout(params.get("timeout")),
+            key=query_name,
+        )
+
+    @staticmethod
+    def _lane(query_name: str) -> str:
+        """Concurrency lane for a query: analyses and long-running scans are heavy."""
+        query = QUERY_REGISTRY.get(query_name)
+        if query_name in HEAVY_QUERIES or (query is not None and query.long_running):
+            return "heavy"
+        return "light"
+
+    @staticmethod
+    def _queue_timeout(timeout_ms: int | None) -> float:
+        """Seconds a query may wait for a slot (capped by its own timeout)."""
+        wait_ms = settings.query_queue_timeout_ms
+        if timeout_ms:
+            wait_ms = min(wait_ms, timeout_ms)
+        return wait_ms / 1000
+
+    async def _query(
+        self,
+        query_name: str,
+        **params: Any,
+    ) -> dict[str, Any]:
+        """Execute query on the primary backend, then the fallback."""
         if not self._initialized:
             await self.initialize()
 
-        # Periodically check health
-        await self._check_health_if_needed()
+        if await self._should_hedge(query_name):
+            return await self._hedged_query(query_name, **params)
 
         # Try primary backend first
         if await self._can_use_backend(self.primary_backend):
             try:
-                result = await self._execute_on_backend(self.primary_backend, query_name, **params)
+                result = await self._execute_primary(query_name, **params)
                 logger.debug(f"Query '{query_name}' succeeded on {self.primary_backend}")
                 return result
             except Exception as e:
                 logger.warning(f"Query '{query_name}' failed on {self.primary_backend}: {e}")
+                self._record_timeout(query_name, e)
                 # Continue to fallback
 
         # Try fallback backend
@@ -317,6 +632,276 @@ class ClientAdapter:
             f"Fallback: {self.fallback_backend} ({self.rest_health})"
         )
 
+    def _record_timeout(self, query_name: str, error: BaseException | None) -> None:
+        """
+        Report a primary timeout to the query's lane limiter.
+
+        The limiter only sees the outcome of the whole call, so a primary
+        timeout answered by the fallback would otherwise look like a success
+        and the lane would never back off from an overloaded Neo4j.
+        """
+        if isinstance(error, QueryTimeoutError):
+            self._limiters[self._lane(query_name)].record_timeout()
+
+    async def _execute_primary(self, query_name: str, **params: Any) -> dict[str, Any]:
+        """
+        Execute query on the primary backend, tracking its latency.
+
+        A call cancelled before it answers (typically because a hedge won) is
+        recorded with the time it had run so far. That is only a lower bound,
+        but dropping it would leave the slowest primaries out of the samples
+        and pull the hedge threshold down with every hedge that wins.
+        """
+        started = time.perf_counter()
+        try:
+            result = await self._execute_on_backend(self.primary_backend, query_name, **params)
+        except asyncio.CancelledError:
+            self._latency.record(query_name, time.perf_counter() - started)
+            raise
+        self._latency.record(query_name, time.perf_counter() - started)
+        return result
+
+    async def _should_hedge(self, query_name: str) -> bool:
+        """Check whether a query may be hedged to the fallback backend."""
+        return (
+            settings.hedge_queries
+            and self.primary_backend == BackendType.NEO4J
+            and self.fallback_backend == BackendType.REST
+            and query_name not in HEAVY_QUERIES
+            and self.neo4j_client.is_read_only_query(query_name)
+            and await self._can_use_backend(self.primary_backend)
+            and await self._can_use_backend(self.fallback_backend)
+        )
+
+    async def _hedged_query(
+        self,
+        query_name: str,
+        **params: Any,
+    ) -> dict[str, Any]:
+        """
+        Execute a read on the primary, racing the fallback once it is slow.
+
+        If the primary has not answered within its recent p95 latency for
+        this query name (and the hedge budget allows), the query is also sent
+        to the fallback. The first successful answer wins and the other call
+        is cancelled. A primary failure before the hedge falls back as usual.
+
+        Args:
+            query_name: Query operation name
+            **params: Query parameters
+
+        Returns:
+            Query results
+
+        Raises:
+            Exception: If every backend tried fails
+        """
+        self._hedge_stats.eligible += 1
+        self._hedge_budget.earn()
+        hedge_delay = self._latency.percentile(query_name)
+
+        primary = asyncio.ensure_future(self._execute_primary(query_name, **params))
+        tasks = {primary}
+        error: BaseException | None = None
+        primary_error: BaseException | None = None
+        try:
+            # Without enough latency samples there is no threshold: no hedge
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done:
+                if self._hedge_budget.try_spend():
+                    self._hedge_stats.hedged += 1
+                    logger.debug(
+                        f"Hedging '{query_name}' to {self.fallback_backend} "
+                        f"after {hedge_delay * 1000:.0f}ms"
+                    )
+                    tasks.add(
+                        asyncio.ensure_future(
+                            self._execute_on_backend(self.fallback_backend, query_name, **params)
+                        )
+                    )
+                else:
+                    self._hedge_stats.budget_exhausted += 1
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if task is primary:
+                        primary_error = error
+                    if error is None:
+                        if task is not primary:
+                            self._record_timeout(query_name, primary_error)
+                            self._hedge_stats.hedge_wins += 1
+                            logger.info(
+                                f"Query '{query_name}' answered first by hedge to "
+                                f"{self.fallback_backend}"
+                            )
+                        return task.result()
+                    backend = self.primary_backend if task is primary else self.fallback_backend
+                    logger.warning(f"Query '{query_name}' failed on {backend}: {error}")
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        if len(tasks) > 1:
+            # The hedge already tried the fallback
+            if error is not primary_error:
+                self._record_timeout(query_name, primary_error)
+            raise error
+
+        self._record_timeout(query_name, primary_error)
+        result = await self._execute_on_backend(self.fallback_backend, query_name, **params)
+        logger.info(f"Query '{query_name}' succeeded on fallback {self.fallback_backend}")
+        return result
+
+    async def query_batch(
+        self,
+        query_name: str,
+        param_rows: Sequence[Mapping[str, Any]],
+        **params: Any,
+    ) -> dict[str, Any]:
+        """
+        Execute a query for many parameter rows, batching where possible.
+
+        On Neo4j the rows are sent as UNWIND batches (see
+        Neo4jClient.execute_batch). A timeout applies per row; each batch
+        chunk gets at least settings.batch_query_timeout_ms, since it does
+        the work of many rows. Otherwise, or if the batch fails, each row is
+        run through query() so per-row fallback still applies, with at most
+        settings.max_concurrent_queries rows in flight.
+
+        Args:
+            query_name: Name of the query operation
+            param_rows: Query parameters, one mapping per input row
+            **params: Parameters shared by every row (e.g. limit, timeout)
+
+        Returns:
+            Dictionary with one result per input row, in input order:
+                {"success": True, "results": [...], "count": 200}
+
+        Raises:
+            QueryRejectedError: If the query is shed by the concurrency limiter
+            Exception: If all backends fail
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        timeout = params.pop("timeout", None)
+        rows = [{**params, **row} for row in param_rows]
+
+        if (
+            self.primary_backend == BackendType.NEO4J
+            and await self._can_use_backend(BackendType.NEO4J)
+            and self.neo4j_client.is_catalog_query(query_name)
+        ):
+            try:
+                result = await self._limiters["light"].run(
+                    functools.partial(
+                        self.neo4j_breaker.call,
+                        self.neo4j_client.execute_batch,
+                        query_name,
+                        rows,
+                        timeout=max(timeout or 0, settings.batch_query_timeout_ms),
+                    ),
+                    queue_timeout=self._queue_timeout(timeout),
+                    key=f"batch:{query_name}",
+                )
+                logger.debug(f"Batch query '{query_name}' succeeded for {len(rows)} rows")
+                return result
+            except QueryRejectedError:
+                # Shed under load; retrying row by row would only add more
+                raise
+            except Exception as e:
+                logger.warning(f"Batch query '{query_name}' failed on {BackendType.NEO4J}: {e}")
+
+        # Composite operations, REST backend, or failed batch: run row by row,
+        # no more at once than the lookup lane admits, so a large batch
+        # neither floods the fallback nor fills the lane's queue
+        if timeout is not None:
+            rows = [{**row, "timeout": timeout} for row in rows]
+
+        semaphore = asyncio.Semaphore(settings.max_concurrent_queries)
+
+        async def query_row(row: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.query(query_name, **row)
+
+        results = await asyncio.gather(*(query_row(row) for row in rows))
+
+        return {
+            "success": True,
+            "results": list(results),
+            "count": len(results),
+        }
+
+    async def stream_query(
+        self,
+        query_name: str,
+        **params: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield query records lazily, streaming from Neo4j where possible.
+
+        Catalog queries on a healthy Neo4j backend are streamed with
+        Neo4jClient.stream_query(), through the Neo4j circuit breaker. The
+        stream holds a slot in the query's concurrency lane until it ends.
+        Otherwise, or if the stream fails before its first record, the query
+        runs through query() (with its usual fallback) and the records are
+        yielded from the result. A stream that fails part-way is not retried,
+        since the records already yielded cannot be taken back.
+
+        Args:
+            query_name: Name of the query operation
+            **params: Query parameters
+
+        Yields:
+            Parsed result records
+
+        Raises:
+            QueryRejectedError: If the query is shed by the concurrency limiter
+            Exception: If all backends fail, or the stream fails part-way
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        if (
+            self.primary_backend == BackendType.NEO4J
+            and await self._can_use_backend(BackendType.NEO4J)
+            and self.neo4j_client.is_catalog_query(query_name)
+        ):
+            yielded = 0
+            limiter = self._limiters[self._lane(query_name)]
+            try:
+                async with (
+                    limiter.hold(self._queue_timeout(params.get("timeout"))),
+                    aclosing(
+                        self.neo4j_breaker.stream(
+                            self.neo4j_client.stream_query, query_name, **params
+                        )
+                    ) as records,
+                ):
+                    async for record in records:
+                        yielded += 1
+                        yield record
+                return
+            except QueryRejectedError:
+                # Shed under load; the buffered path would only add more
+                raise
+            except Exception as e:
+                if yielded:
+                    logger.error(
+                        f"Stream '{query_name}' failed on {BackendType.NEO4J} "
+                        f"after {yielded} records: {e}"
+                    )
+                    raise
+                logger.warning(f"Stream '{query_name}' failed on {BackendType.NEO4J}: {e}")
+
+        result = await self.query(query_name, **params)
+        for record in result.get("records", []):
+            yield record
+
     async def _can_use_backend(self, backend: BackendType) -> bool:
         """Check if backend is available for use."""
         if backend == BackendType.NONE:
@@ -368,35 +953,24 @@ class ClientAdapter:
         else:
             raise ValueError(f"Invalid backend: {backend}")
 
-    async def _check_health_if_needed(self) -> None:
-        """Check backend health if interval has passed."""
-        if self.last_health_check is None or datetime.now() - self.last_health_check > timedelta(
-            seconds=self.health_check_interval
-        ):
-            await self._check_health()
-
-    async def _check_health(self) -> None:
-        """Check health of all backends."""
-        logger.debug("Checking backend health")
-
-        # Check Neo4j
-        if self.neo4j_client:
-            try:
-                await self.neo4j_client.health_check()
-                self.neo4j_health = BackendHealth.HEALTHY
-            except Exception as e:
-                logger.warning(f"Neo4j health check failed: {e}")
-                self.neo4j_health = BackendHealth.UNHEALTHY
+    async def _record_probe(self, backend: str, healthy: bool, latency_ms: float) -> None:
+        """Cache a probe result as backend health and feed it to the breaker."""
+        if not healthy:
+            health = BackendHealth.UNHEALTHY
+        elif latency_ms > DEGRADED_LATENCY_MS:
+            health = BackendHealth.DEGRADED
+        else:
+            health = BackendHealth.HEALTHY
 
-        # Check REST
-        if self.rest_client:
-            try:
-                await self.rest_client.health_check()
-                self.rest_health = BackendHealth.HEALTHY
-            except Exception as e:
-                logger.warning(f"REST health check failed: {e}")
-                self.rest_health = BackendHealth.UNHEALTHY
+        if backend == BackendType.NEO4J.value:
+            self.neo4j_health = health
+            breaker = self.neo4j_breaker
+        else:
+            self.rest_health = health
+            breaker = self.rest_breaker
 
+        if breaker:
+            await breaker.record_probe(healthy)
         self.last_health_check = datetime.now()
 
     def get_status(self) -> dict[str, Any]:
@@ -422,11 +996,35 @@ class ClientAdapter:
                 "available": neo4j_available,
                 "health": self.neo4j_health.value,
                 "circuit_open": (self.neo4j_breaker.is_open() if self.neo4j_breaker else None),
+                "probe": self._prober.get_stats(BackendType.NEO4J.value) if self._prober else None,
+                "query_stats": (
+                    asdict(self.neo4j_client.get_query_stats()) if self.neo4j_client else None
+                ),
+                "executor_stats": (
+                    {
+                        pool: {**asdict(stats), "avg_wait_ms": stats.avg_wait_ms}
+                        for pool, stats in self.neo4j_client.get_executor_stats().items()
+                    }
+                    if self.neo4j_client
+                    else None
+                ),
             },
             "rest": {
                 "available": rest_available,
                 "health": self.rest_health.value,
                 "circuit_open": (self.rest_breaker.is_open() if self.rest_breaker else None),
+                "probe": self._prober.get_stats(BackendType.REST.value) if self._prober else None,
+            },
+            "limiters": {
+                lane: asdict(limiter.get_stats()) for lane, limiter in self._limiters.items()
+            },
+            "hedging": {
+                "enabled": settings.hedge_queries,
+                **asdict(self._hedge_stats),
+            },
+            "coalescing": {
+                **asdict(self._single_flight.stats),
+                "merge_rate": self._single_flight.stats.merge_rate,
             },
             "last_health_check": (
                 self.last_health_check.isoformat() if self.last_health_check else None
@@ -0,0 +1,343 @@
+"""
+Native async subnetwork client.
+
+Runs subnetwork extraction directly on the Neo4j async driver instead of
+the synchronous `indra_subnetwork*` functions wrapped by SubnetworkClient.
+Statement type, evidence, belief and the statement limit are applied in
+Cypher, and lightweight relationship rows are returned instead of
+deserialized INDRA Statement objects.
+
+Responses have the same shape as SubnetworkClient's.
+"""
+
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cogex_mcp.clients.neo4j_client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSubnetworkClient:
+    """
+    Async subnetwork extraction over INDRA relationships (indra_rel edges).
+
+    Example usage:
+        >>> client = AsyncSubnetworkClient(neo4j_client)
+        >>> result = await client.extract_direct(
+        ...     gene_ids=["hgnc:11998", "hgnc:6973"],  # TP53, MDM2
+        ...     min_evidence=2,
+        ...     min_belief=0.7,
+        ... )
+        >>> print(f"Found {result['statistics']['statement_count']} statements")
+    """
+
+    def __init__(self, neo4j_client: "Neo4jClient", timeout: int | None = None):
+        """
+        Initialize async subnetwork client.
+
+        Args:
+            neo4j_client: Connected Neo4j client
+            timeout: Optional transaction timeout in milliseconds
+        """
+        self.client = neo4j_client
+        self.timeout = timeout
+
+    async def extract_direct(
+        self,
+        gene_ids: list[str],
+        statement_types: list[str] | None = None,
+        min_evidence: int = 1,
+        min_belief: float = 0.0,
+        max_statements: int = 100,
+        tissue: str | None = None,
+        go_term: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Extract direct mechanistic edges between genes.
+
+        Args:
+            gene_ids: List of gene CURIEs (e.g., ["hgnc:11998", "hgnc:6407"])
+            statement_types: Filter by statement types (e.g., ["Phosphorylation"])
+            min_evidence: Minimum evidence count threshold
+            min_belief: Minimum belief score threshold (0.0-1.0)
+            max_statements: Maximum statements to return
+            tissue: Optional tissue context; both genes must be expressed in it
+            go_term: Optional GO term context; edges between genes annotated
+                with the term that involve at least one query gene (ignored
+                when tissue is given)
+
+        Returns:
+            Dict with statements, nodes, and statistics
+        """
+        logger.info(f"Extracting direct subnetwork for {len(gene_ids)} genes")
+
+        params = {
+            "gene_ids": self._normalize_gene_ids(gene_ids),
+            "statement_types": statement_types or None,
+            "min_evidence": min_evidence,
+            "min_belief": min_belief,
+            "max_statements": max_statements,
+        }
+
+        # Tissue context takes precedence over GO context, as in SubnetworkClient
+        if tissue:
+            if go_term:
+                logger.warning(f"Both tissue and go_term given; ignoring go_term {go_term}")
+            rows = await self._run(
+                "subnetwork_direct", tissue_id=self._normalize_curie(tissue), **params
+            )
+        elif go_term:
+            rows = await self._run("subnetwork_go", go_id=self._normalize_curie(go_term), **params)
+        else:
+            rows = await self._run("subnetwork_direct", tissue_id=None, **params)
+
+        return self._format_subnetwork_response(rows)
+
+    async def extract_mediated(
+        self,
+        gene_ids: list[str],
+        statement_types: list[str] | None = None,
+        min_evidence: int = 1,
+        min_belief: float = 0.0,
+        max_statements: int = 100,
+    ) -> dict[str, Any]:
+        """
+        Extract two-hop mediated paths (A→X→B) connecting genes.
+
+        Args:
+            gene_ids: List of gene CURIEs
+            statement_types: Filter by statement types
+            min_evidence: Minimum evidence count
+            min_belief: Minimum belief score
+            max_statements: Maximum statements to return
+
+        Returns:
+            Dict with mediated statements, nodes, and statistics
+        """
+        logger.info(f"Extracting mediated subnetwork for {len(gene_ids)} genes")
+
+        rows = await self._run(
+            "subnetwork_mediated",
+            gene_ids=self._normalize_gene_ids(gene_ids),
+            statement_types=statement_types or None,
+            min_evidence=min_evidence,
+            min_belief=min_belief,
+            max_statements=max_statements,
+        )
+
+        return self._format_subnetwork_response(rows, note="Two-hop mediated paths shown")
+
+    async def extract_shared_upstream(
+        self,
+        gene_ids: list[str],
+        statement_types: list[str] | None = None,
+        min_evidence: int = 1,
+        min_belief: float = 0.0,
+        max_statements: int = 100,
+    ) -> dict[str, Any]:
+        """
+        Find regulators shared by at least two target genes (X→A, X→B).
+
+        Args:
+            gene_ids: List of gene CURIEs (targets)
+            statement_types: Filter by statement types
+            min_evidence: Minimum evidence count
+            min_belief: Minimum belief score
+            max_statements: Maximum statements to return
+
+        Returns:
+            Dict with shared regulators and their connections
+        """
+        logger.info(f"Finding shared upstream regulators for {len(gene_ids)} genes")
+
+        rows = await self._run(
+            "subnetwork_shared_upstream",
+            gene_ids=self._normalize_gene_ids(gene_ids),
+            statement_types=statement_types or None,
+            min_evidence=min_evidence,
+            min_belief=min_belief,
+            max_statements=max_statements,
+        )
+
+        return self._format_subnetwork_response(rows, note="Shared upstream regulators shown")
+
+    async def extract_shared_downstream(
+        self,
+        gene_ids: list[str],
+        statement_types: list[str] | None = None,
+        min_evidence: int = 1,
+        min_belief: float = 0.0,
+        max_statements: int = 100,
+    ) -> dict[str, Any]:
+        """
+        Find targets shared by at least two source genes (A→X, B→X).
+
+        Args:
+            gene_ids: List of gene CURIEs (sources)
+            statement_types: Filter by statement types
+            min_evidence: Minimum evidence count
+            min_belief: Minimum belief score
+            max_statements: Maximum statements to return
+
+        Returns:
+            Dict with shared targets and their connections
+        """
+        logger.info(f"Finding shared downstream targets for {len(gene_ids)} genes")
+
+        rows = await self._run(
+            "subnetwork_shared_downstream",
+            gene_ids=self._normalize_gene_ids(gene_ids),
+            statement_types=statement_types or None,
+            min_evidence=min_evidence,
+            min_belief=min_belief,
+            max_statements=max_statements,
+        )
+
+        return self._format_subnetwork_response(rows, note="Shared downstream targets shown")
+
+    # Helper methods
+
+    async def _run(self, query_name: str, **params: Any) -> list[dict[str, Any]]:
+        """Run a subnetwork catalog query and return its rows."""
+        result = await self.client.run_catalog_query(query_name, timeout=self.timeout, **params)
+        logger.debug(f"{query_name} returned {result['count']} rows")
+        return result["records"]
+
+    @staticmethod
+    def _normalize_curie(curie: str) -> str:
+        """Lowercase the namespace of a CURIE to match graph node IDs."""
+        namespace, _, identifier = curie.partition(":")
+        if not identifier:
+            raise ValueError(f"Invalid CURIE format: {curie}")
+        # GO term IDs keep their uppercase prefix in the graph
+        if namespace.upper() == "GO":
+            return f"GO:{identifier}"
+        return f"{namespace.lower()}:{identifier}"
+
+    @staticmethod
+    def _normalize_gene_ids(gene_ids: list[str]) -> list[str]:
+        """
+        Convert gene references to graph node IDs.
+
+        Args:
+            gene_ids: Gene CURIEs; bare values are assumed to be HGNC
+
+        Returns:
+            List of node IDs (e.g., ["hgnc:11998"])
+        """
+        normalized = []
+        for gene_id in gene_ids:
+            namespace, _, identifier = gene_id.partition(":")
+            if identifier:
+                normalized.append(f"{namespace.lower()}:{identifier}")
+            else:
+                normalized.append(f"hgnc:{gene_id}")
+                logger.debug(f"Assuming HGNC namespace for gene: {gene_id}")
+        return normalized
+
+    @staticmethod
+    def _agent_to_dict(curie: str | None, name: str | None) -> dict[str, Any]:
+        """Build a subject/object entry from a node ID and name."""
+        if not curie or ":" not in curie:
+            return {
+                "curie": "unknown:unknown",
+                "namespace": "unknown",
+                "identifier": "unknown",
+                "name": "Unknown",
+            }
+
+        namespace, identifier = curie.split(":", 1)
+        return {
+            "curie": f"{namespace.lower()}:{identifier}",
+            "namespace": namespace.lower(),
+            "identifier": identifier,
+            "name": name or identifier,
+        }
+
+    @classmethod
+    def _row_to_statement(cls, row: dict[str, Any]) -> dict[str, Any]:
+        """
+        Convert a relationship row to the MCP statement format.
+
+        Args:
+            row: Row from a subnetwork_* query
+
+        Returns:
+            Statement dictionary with subject, object, evidence, etc.
+        """
+        source_counts = row.get("source_counts") or {}
+        if isinstance(source_counts, str):
+            try:
+                source_counts = json.loads(source_counts)
+            except json.JSONDecodeError:
+                source_counts = {}
+
+        return {
+            "stmt_hash": row.get("stmt_hash"),
+            "stmt_type": row.get("stmt_type"),
+            "subject": cls._agent_to_dict(row.get("subj_id"), row.get("subj_name")),
+            "object": cls._agent_to_dict(row.get("obj_id"), row.get("obj_name")),
+            "evidence_count": row.get("evidence_count") or 0,
+            "belief_score": float(row.get("belief") or 0.0),
+            "sources": sorted(source_counts),
+        }
+
+    def _format_subnetwork_response(
+        self,
+        rows: list[dict[str, Any]],
+        note: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Convert relationship rows to the SubnetworkClient response format.
+
+        Args:
+            rows: Rows from a subnetwork_* query
+            note: Optional informational note
+
+        Returns:
+            Dict with statements, nodes, statistics, and metadata
+        """
+        statements = [self._row_to_statement(row) for row in rows]
+
+        nodes: dict[str, dict[str, Any]] = {}
+        for stmt in statements:
+            for agent in (stmt["subject"], stmt["object"]):
+                if agent["curie"] != "unknown:unknown":
+                    nodes.setdefault(agent["curie"], agent)
+
+        type_counts: dict[str, int] = {}
+        for stmt in statements:
+            type_counts[stmt["stmt_type"]] = type_counts.get(stmt["stmt_type"], 0) + 1
+
+        count = len(statements)
+        statistics = {
+            "statement_count": count,
+            "node_count": len(nodes),
+            "statement_types": type_counts,
+            "avg_evidence_per_statement": (
+                sum(stmt["evidence_count"] for stmt in statements) / count if count else 0.0
+            ),
+            "avg_belief_score": (
+                sum(stmt["belief_score"] for stmt in statements) / count if count else 0.0
+            ),
+        }
+
+        result = {
+            "success": True,
+            "statements": statements,
+            "nodes": list(nodes.values()),
+            "statistics": statistics,
+        }
+
+        if note:
+            result["note"] = note
+
+        logger.info(
+            f"Subnetwork response: {statistics['statement_count']} statements, "
+            f"{statistics['node_count']} nodes"
+        )
+
+        return result
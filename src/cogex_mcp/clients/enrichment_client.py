@@ -10,8 +10,6 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
-from scipy.stats import fisher_exact
-from statsmodels.stats.multitest import multipletests
 
 from indra_cogex.client.neo4j_client import Neo4jClient, autoclient
 from indra_cogex.client.queries import (
@@ -21,6 +19,11 @@ from indra_cogex.client.queries import (
     get_pathways_for_gene,
 )
 
+from cogex_mcp.clients.enrichment_engine import enrichment_table, table_to_records
+from cogex_mcp.clients.gene_set_library import GeneSetLibrary, get_gene_set_library
+from cogex_mcp.clients.gsea_engine import DEFAULT_PERMUTATIONS, DEFAULT_SEED, gsea_table
+from cogex_mcp.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,12 +31,15 @@ class EnrichmentClient:
     """
     Direct enrichment analysis using CoGEx Neo4j client.
 
-    Implements Fisher's exact test enrichment for:
+    Implements Fisher's exact test enrichment (scored in one vectorized
+    hypergeometric pass, see enrichment_engine) for:
     - GO terms
     - Reactome pathways
     - WikiPathways
     - Phenotypes
     - INDRA upstream/downstream
+
+    and preranked GSEA (see gsea_engine) for continuous gene scores.
     """
 
     def __init__(self, neo4j_client: Optional[Neo4jClient] = None):
@@ -70,6 +76,35 @@ class EnrichmentClient:
         """
         logger.info(f"GO enrichment for {len(gene_ids)} genes")
 
+        term_genes, term_names = self.go_gene_sets(gene_ids, client=client)
+
+        # Score all terms at once
+        return enrichment_table(
+            gene_ids,
+            term_genes,
+            term_names=term_names,
+            background_gene_ids=background_gene_ids,
+            alpha=alpha,
+            correction_method=correction_method,
+        )
+
+    @autoclient()
+    def go_gene_sets(
+        self,
+        gene_ids: List[str],
+        *,
+        client: Neo4jClient,
+    ) -> tuple[Dict[str, set], Dict[str, str]]:
+        """
+        Collect GO terms annotating any of the genes, with all their genes.
+
+        Args:
+            gene_ids: List of gene CURIEs
+            client: Neo4j client (injected by autoclient)
+
+        Returns:
+            Tuple of (term -> annotated genes, term -> name)
+        """
         # Get all GO terms for input genes
         gene_go_terms = {}
         for gene_id in gene_ids:
@@ -81,58 +116,17 @@ class EnrichmentClient:
         for terms in gene_go_terms.values():
             all_go_terms.update(terms)
 
-        # Run enrichment test for each GO term
-        results = []
+        # Collect genes annotated to each candidate GO term
+        term_genes = {}
+        term_names = {}
         for go_term in all_go_terms:
-            # Get genes with this GO term
             term_genes_data = get_genes_for_go_term(go_term, client=client)
-            term_gene_ids = {g["gene_id"] for g in term_genes_data}
-
-            # Build contingency table
-            in_term_and_set = len(set(gene_ids) & term_gene_ids)
-            in_term_not_set = len(term_gene_ids - set(gene_ids))
-            not_term_in_set = len(set(gene_ids) - term_gene_ids)
-
-            if background_gene_ids:
-                not_term_not_set = len(set(background_gene_ids) - term_gene_ids - set(gene_ids))
-            else:
-                # Estimate background (total genes in GO)
-                not_term_not_set = 20000  # Approximate human genome size
-
-            # Fisher's exact test
-            oddsratio, pvalue = fisher_exact(
-                [[in_term_and_set, in_term_not_set],
-                 [not_term_in_set, not_term_not_set]],
-                alternative='greater'
+            term_genes[go_term] = {g["gene_id"] for g in term_genes_data}
+            term_names[go_term] = (
+                term_genes_data[0].get('go_name', 'Unknown') if term_genes_data else 'Unknown'
             )
 
-            if in_term_and_set > 0:  # Only keep terms with overlap
-                results.append({
-                    'term_id': go_term,
-                    'term_name': term_genes_data[0].get('go_name', 'Unknown') if term_genes_data else 'Unknown',
-                    'p_value': pvalue,
-                    'gene_count': in_term_and_set,
-                    'term_size': len(term_gene_ids),
-                    'genes': list(set(gene_ids) & term_gene_ids),
-                })
-
-        # Convert to DataFrame
-        df = pd.DataFrame(results)
-
-        if df.empty:
-            return df
-
-        # Multiple testing correction
-        df['adjusted_p_value'] = multipletests(
-            df['p_value'],
-            alpha=alpha,
-            method=correction_method
-        )[1]
-
-        # Sort by p-value
-        df = df.sort_values('p_value')
-
-        return df
+        return term_genes, term_names
 
     @autoclient()
     def reactome_enrichment(
@@ -159,6 +153,35 @@ class EnrichmentClient:
         """
         logger.info(f"Reactome enrichment for {len(gene_ids)} genes")
 
+        term_genes, term_names = self.reactome_gene_sets(gene_ids, client=client)
+
+        # Score all pathways at once
+        return enrichment_table(
+            gene_ids,
+            term_genes,
+            term_names=term_names,
+            background_gene_ids=background_gene_ids,
+            alpha=alpha,
+            correction_method=correction_method,
+        )
+
+    @autoclient()
+    def reactome_gene_sets(
+        self,
+        gene_ids: List[str],
+        *,
+        client: Neo4jClient,
+    ) -> tuple[Dict[str, set], Dict[str, str]]:
+        """
+        Collect Reactome pathways containing any of the genes, with all their genes.
+
+        Args:
+            gene_ids: List of gene CURIEs
+            client: Neo4j client (injected by autoclient)
+
+        Returns:
+            Tuple of (pathway -> member genes, pathway -> name)
+        """
         # Get all pathways for input genes
         gene_pathways = {}
         for gene_id in gene_ids:
@@ -172,62 +195,132 @@ class EnrichmentClient:
         for pathways in gene_pathways.values():
             all_pathways.update(pathways)
 
-        # Run enrichment test for each pathway
-        results = []
+        # Collect genes in each candidate pathway
+        query = """
+        MATCH (g:BioEntity)-[:partof]->(p:BioEntity {id: $pathway_id})
+        WHERE g:Gene
+        RETURN g.id AS gene_id
+        """
+        term_genes = {}
         for pathway_id in all_pathways:
-            # Query genes in this pathway
-            query = """
-            MATCH (g:BioEntity)-[:partof]->(p:BioEntity {id: $pathway_id})
-            WHERE g:Gene
-            RETURN g.id AS gene_id
-            """
             pathway_genes_data = client.query_tx(query, pathway_id=pathway_id)
-            pathway_gene_ids = {g['gene_id'] for g in pathway_genes_data}
-
-            # Build contingency table
-            in_pathway_and_set = len(set(gene_ids) & pathway_gene_ids)
-            in_pathway_not_set = len(pathway_gene_ids - set(gene_ids))
-            not_pathway_in_set = len(set(gene_ids) - pathway_gene_ids)
-
-            if background_gene_ids:
-                not_pathway_not_set = len(set(background_gene_ids) - pathway_gene_ids - set(gene_ids))
-            else:
-                not_pathway_not_set = 20000
-
-            # Fisher's exact test
-            oddsratio, pvalue = fisher_exact(
-                [[in_pathway_and_set, in_pathway_not_set],
-                 [not_pathway_in_set, not_pathway_not_set]],
-                alternative='greater'
-            )
+            term_genes[pathway_id] = {g['gene_id'] for g in pathway_genes_data}
 
-            if in_pathway_and_set > 0:
-                results.append({
-                    'term_id': pathway_id,
-                    'term_name': pathway_id.split(':')[-1].replace('-', ' ').title(),
-                    'p_value': pvalue,
-                    'gene_count': in_pathway_and_set,
-                    'term_size': len(pathway_gene_ids),
-                    'genes': list(set(gene_ids) & pathway_gene_ids),
-                })
-
-        # Convert to DataFrame
-        df = pd.DataFrame(results)
-
-        if df.empty:
-            return df
-
-        # Multiple testing correction
-        df['adjusted_p_value'] = multipletests(
-            df['p_value'],
-            alpha=alpha,
-            method=correction_method
-        )[1]
+        term_names = {
+            pathway_id: pathway_id.split(':')[-1].replace('-', ' ').title()
+            for pathway_id in all_pathways
+        }
+
+        return term_genes, term_names
+
+    def gsea(
+        self,
+        ranked_genes: Dict[str, float],
+        source: str = "go",
+        permutations: int = DEFAULT_PERMUTATIONS,
+        alpha: float = 0.05,
+        correction_method: str = "fdr_bh",
+        seed: int = DEFAULT_SEED,
+        keep_insignificant: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Perform preranked gene set enrichment analysis (GSEA).
+
+        Gene sets come from the gene-set library when it covers the source,
+        otherwise from Neo4j (sets containing at least one ranked gene).
+
+        Args:
+            ranked_genes: Gene CURIE -> score (e.g., log fold change)
+            source: Enrichment source ("go", "reactome", ...)
+            permutations: Number of gene-label permutations
+            alpha: Significance threshold
+            correction_method: Multiple testing correction method
+            seed: Random seed for permutations
+            keep_insignificant: Keep gene sets with adjusted p-value > alpha
+
+        Returns:
+            DataFrame with GSEA results
+        """
+        logger.info(f"GSEA ({source}) for {len(ranked_genes)} ranked genes, {permutations} permutations")
+
+        options = {
+            "permutations": permutations,
+            "seed": seed,
+            "processes": settings.gsea_processes,
+            "alpha": alpha,
+            "correction_method": correction_method,
+            "keep_insignificant": keep_insignificant,
+        }
+
+        library = get_gene_set_library()
+        if library is not None and library.has_source(source):
+            return library.gsea(ranked_genes, source, **options)
+
+        if source == "go":
+            term_genes, term_names = self.go_gene_sets(list(ranked_genes))
+        elif source == "reactome":
+            term_genes, term_names = self.reactome_gene_sets(list(ranked_genes))
+        else:
+            raise ValueError(f"Unsupported source: {source}")
+
+        return gsea_table(ranked_genes, term_genes, term_names=term_names, **options)
+
+    def batch_enrichment(
+        self,
+        gene_lists: Dict[str, List[str]],
+        source: str = "go",
+        background_gene_ids: Optional[List[str]] = None,
+        alpha: float = 0.05,
+        correction_method: str = "fdr_bh",
+        keep_insignificant: bool = False,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Perform discrete enrichment for many gene lists with a shared background.
+
+        Gene sets come from the gene-set library when it covers the source.
+        Otherwise they are looked up in Neo4j once for the union of all
+        lists, so genes shared between lists are only queried once.
+
+        Args:
+            gene_lists: List name -> gene CURIEs
+            source: Enrichment source ("go", "reactome", ...)
+            background_gene_ids: Optional background gene set (all lists)
+            alpha: Significance threshold
+            correction_method: Multiple testing correction method
+            keep_insignificant: Keep terms with adjusted p-value > alpha
 
-        # Sort by p-value
-        df = df.sort_values('p_value')
+        Returns:
+            List name -> DataFrame with enrichment results
+        """
+        logger.info(f"Batch enrichment ({source}) for {len(gene_lists)} gene lists")
+
+        options = {
+            "background_gene_ids": background_gene_ids,
+            "alpha": alpha,
+            "correction_method": correction_method,
+            "keep_insignificant": keep_insignificant,
+        }
 
-        return df
+        library = get_gene_set_library()
+        if library is not None and library.has_source(source):
+            return library.batch_enrichment(gene_lists, source, **options)
+
+        all_genes = sorted({gene_id for genes in gene_lists.values() for gene_id in genes})
+        if source == "go":
+            term_genes, term_names = self.go_gene_sets(all_genes)
+        elif source == "reactome":
+            term_genes, term_names = self.reactome_gene_sets(all_genes)
+        else:
+            raise ValueError(f"Unsupported source: {source}")
+
+        # One-off library over the candidate terms
+        memberships = [
+            (term_id, term_names.get(term_id), gene_id)
+            for term_id, genes in term_genes.items()
+            for gene_id in genes
+        ]
+        library = GeneSetLibrary.from_memberships({source: memberships}, version="neo4j")
+        return library.batch_enrichment(gene_lists, source, **options)
 
     def run_enrichment(
         self,
@@ -242,17 +335,40 @@ class EnrichmentClient:
         Args:
             gene_ids: List of gene CURIEs
             source: Enrichment source ("go", "reactome", "wikipathways", etc.)
-            analysis_type: Analysis type ("discrete", "continuous", "signed")
-            **kwargs: Additional parameters (alpha, correction_method, etc.)
+            analysis_type: Analysis type ("discrete", "continuous" for GSEA,
+                or "batch" for many gene lists)
+            **kwargs: Additional parameters (alpha, correction_method, etc.;
+                ranked_genes and permutations for "continuous"; gene_lists
+                for "batch"; keep_insignificant for both)
 
         Returns:
             Dict with enrichment results
         """
+        if analysis_type == "continuous":
+            ranked_genes = kwargs.pop("ranked_genes", None) or {}
+            df = self.gsea(ranked_genes, source, **kwargs)
+            return {
+                'success': True,
+                'results': table_to_records(df),
+                'total_genes': len(ranked_genes),
+            }
+        if analysis_type == "batch":
+            gene_lists = kwargs.pop("gene_lists", None) or {}
+            tables = self.batch_enrichment(gene_lists, source, **kwargs)
+            return {
+                'success': True,
+                'results': {name: table_to_records(df) for name, df in tables.items()},
+                'total_lists': len(gene_lists),
+            }
         if analysis_type != "discrete":
             raise NotImplementedError(f"Analysis type '{analysis_type}' not yet implemented")
 
-        # Route to appropriate enrichment function
-        if source == "go":
+        # Score in-process from the gene-set library when it covers the source
+        library = get_gene_set_library()
+        if library is not None and library.has_source(source):
+            df = library.enrichment(gene_ids, source, **kwargs)
+        # Otherwise route to the per-source Neo4j enrichment function
+        elif source == "go":
             df = self.go_enrichment(gene_ids, **kwargs)
         elif source == "reactome":
             df = self.reactome_enrichment(gene_ids, **kwargs)
@@ -260,17 +376,7 @@ class EnrichmentClient:
             raise ValueError(f"Unsupported source: {source}")
 
         # Convert DataFrame to dict format
-        results = []
-        for _, row in df.iterrows():
-            results.append({
-                'term_id': row['term_id'],
-                'term_name': row['term_name'],
-                'p_value': float(row['p_value']),
-                'adjusted_p_value': float(row['adjusted_p_value']),
-                'gene_count': int(row['gene_count']),
-                'term_size': int(row['term_size']),
-                'genes': row['genes'],
-            })
+        results = table_to_records(df)
 
         return {
             'success': True,
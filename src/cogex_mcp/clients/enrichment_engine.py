@@ -0,0 +1,326 @@
+"""
+Vectorized over-representation analysis.
+
+Scores every candidate term at once: contingency counts are collected into
+NumPy arrays, p-values come from one vectorized hypergeometric survival
+function, and multiple-testing correction runs on the resulting array. This
+is equivalent to a one-sided (greater) Fisher's exact test per term.
+
+scipy.stats.hypergeom.sf evaluates each element with an exact Boost
+summation (~100 µs per term at genome-sized totals), so the tail sums here
+are computed directly from PMFs over blocks of outcomes instead.
+"""
+
+import logging
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+from scipy.special import gammaln
+from statsmodels.stats.multitest import multipletests
+
+logger = logging.getLogger(__name__)
+
+# Count of genes outside both the term and the gene set when no background is
+# given (approximate human genome size)
+DEFAULT_NOT_TERM_NOT_SET = 20000
+
+# Outcomes evaluated per row and step when summing a PMF tail
+_TAIL_BLOCK = 8
+
+# Tail summation stops once the newest term is below this fraction of the sum
+_TAIL_EPSILON = 1e-17
+
+RESULT_COLUMNS = [
+    "term_id",
+    "term_name",
+    "p_value",
+    "gene_count",
+    "term_size",
+    "genes",
+    "adjusted_p_value",
+]
+
+
+def _log_comb(n: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Log binomial coefficient."""
+    return gammaln(n + 1) - gammaln(k + 1) - gammaln(n - k + 1)
+
+
+def _tail_sum(
+    start: np.ndarray,
+    stop: np.ndarray,
+    step: int,
+    total: np.ndarray,
+    good: np.ndarray,
+    draws: np.ndarray,
+) -> np.ndarray:
+    """
+    Sum hypergeometric PMFs from start towards stop (inclusive), per row.
+
+    Callers start at the end of the tail nearest the mode, so terms shrink
+    with each step and rows stop early once the remainder is negligible.
+    Only the first PMF of each row needs log-gamma; the rest follow from
+    the ratio of consecutive PMFs, accumulated in log space.
+
+    Args:
+        start: First outcome per row
+        stop: Last outcome per row
+        step: +1 to sum upwards, -1 to sum downwards
+        total: Population size per row
+        good: Successes in the population per row
+        draws: Number of draws per row
+
+    Returns:
+        Tail probability per row
+    """
+    sums = np.zeros(len(start))
+    position = start.copy()
+    bad = total - good
+    # Columns 0.._TAIL_BLOCK-1 are summed; the last one starts the next block
+    offsets = step * np.arange(_TAIL_BLOCK + 1)
+    active = np.flatnonzero((position - stop) * step <= 0)
+
+    log_pmf = np.zeros(len(start))
+    log_pmf[active] = (
+        _log_comb(good[active], start[active])
+        + _log_comb(bad[active], draws[active] - start[active])
+        - _log_comb(total[active], draws[active])
+    )
+
+    while active.size:
+        x = position[active, None] + offsets
+        valid = (x - stop[active, None]) * step <= 0
+        g, b, n = good[active, None], bad[active, None], draws[active, None]
+
+        # log(pmf(x) / pmf(x - step)) for the outcomes after the first
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if step > 0:
+                ratio = (g - x + 1) * (n - x + 1) / (x * (b - n + x))
+            else:
+                ratio = (x + 1) * (b - n + x + 1) / ((g - x) * (n - x))
+            log_ratio = np.where(valid[:, 1:], np.log(ratio[:, 1:]), 0.0)
+
+        log_block = np.empty(x.shape)
+        log_block[:, 0] = log_pmf[active]
+        np.cumsum(log_ratio, axis=1, out=log_block[:, 1:])
+        log_block[:, 1:] += log_pmf[active, None]
+
+        pmf = np.where(valid[:, :-1], np.exp(log_block[:, :-1]), 0.0)
+        sums[active] += pmf.sum(axis=1)
+        position[active] += step * _TAIL_BLOCK
+        log_pmf[active] = log_block[:, -1]
+
+        remaining = (position[active] - stop[active]) * step <= 0
+        significant = pmf[:, -1] > _TAIL_EPSILON * sums[active]
+        active = active[remaining & significant]
+
+    return sums
+
+
+def hypergeometric_pvalues(
+    overlap: np.ndarray,
+    term_size: np.ndarray,
+    set_size: np.ndarray | int,
+    total: np.ndarray | int,
+) -> np.ndarray:
+    """
+    One-sided over-representation p-values for many terms.
+
+    P(X >= overlap) for X ~ Hypergeometric(total, term_size, set_size), the
+    same value as scipy.stats.fisher_exact(..., alternative="greater") on the
+    2x2 table of each term. Overlaps above the mode sum the upper tail
+    directly; the rest use 1 - P(X < overlap), which sums fewer terms and
+    loses no precision there since the p-value is not small.
+
+    Args:
+        overlap: Genes in both the term and the gene set, per term
+        term_size: Genes in the term, per term
+        set_size: Genes in the gene set (scalar or per term)
+        total: Genes in the table (scalar or per term)
+
+    Returns:
+        Array of p-values
+    """
+    k, good, draws, total = (
+        np.asarray(a, dtype=np.int64)
+        for a in np.broadcast_arrays(overlap, term_size, set_size, total)
+    )
+    lowest = np.maximum(0, draws - (total - good))
+    highest = np.minimum(good, draws)
+    mode = (draws + 1) * (good + 1) // (total + 2)
+
+    p_values = np.empty(k.shape)
+
+    upper = np.flatnonzero(k > mode)
+    p_values[upper] = _tail_sum(
+        k[upper], highest[upper], 1, total[upper], good[upper], draws[upper]
+    )
+
+    lower = np.flatnonzero(k <= mode)
+    p_values[lower] = 1.0 - _tail_sum(
+        k[lower] - 1, lowest[lower], -1, total[lower], good[lower], draws[lower]
+    )
+
+    return np.clip(p_values, 0.0, 1.0)
+
+
+def csr_row_sums(values: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+    """
+    Sum per-entry values over each row of a CSR matrix.
+
+    Args:
+        values: One value per stored entry (e.g., a mask gathered by column)
+        indptr: Row pointers, starting at 0
+
+    Returns:
+        Integer sum per row
+    """
+    cumulative = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+    return cumulative[indptr[1:]] - cumulative[indptr[:-1]]
+
+
+def enrichment_table(
+    gene_ids: Iterable[str],
+    term_genes: Mapping[str, Iterable[str]],
+    term_names: Mapping[str, str] | None = None,
+    background_gene_ids: Iterable[str] | None = None,
+    alpha: float = 0.05,
+    correction_method: str = "fdr_bh",
+) -> pd.DataFrame:
+    """
+    Score all candidate terms for over-representation in a gene set.
+
+    Only terms sharing at least one gene with the gene set are scored and
+    corrected for multiple testing.
+
+    Args:
+        gene_ids: Gene set (CURIEs)
+        term_genes: Genes annotated to each candidate term
+        term_names: Optional display names (defaults to the term ID)
+        background_gene_ids: Optional background; without one, the
+            not-in-term/not-in-set cell is DEFAULT_NOT_TERM_NOT_SET
+        alpha: Significance threshold for the correction
+        correction_method: statsmodels multipletests method
+
+    Returns:
+        DataFrame with RESULT_COLUMNS sorted by p-value (empty if no term
+        overlaps the gene set)
+    """
+    query = set(gene_ids)
+    background = set(background_gene_ids) if background_gene_ids else None
+    background_in_query = len(background & query) if background is not None else 0
+    term_names = term_names or {}
+
+    term_ids: list[str] = []
+    overlap_genes: list[list[str]] = []
+    overlap: list[int] = []
+    term_size: list[int] = []
+    not_term_not_set: list[int] = []
+
+    for term_id, genes in term_genes.items():
+        genes = genes if isinstance(genes, (set, frozenset)) else set(genes)
+        shared = query & genes
+        if not shared:
+            continue
+
+        term_ids.append(term_id)
+        overlap_genes.append(list(shared))
+        overlap.append(len(shared))
+        term_size.append(len(genes))
+        if background is not None:
+            # |background - term - query|
+            background_in_term = len(background & genes)
+            background_in_both = len(background & shared)
+            not_term_not_set.append(
+                len(background) - background_in_term - background_in_query + background_in_both
+            )
+
+    if not term_ids:
+        return pd.DataFrame()
+
+    return score_terms(
+        term_ids=term_ids,
+        term_names=[term_names.get(term_id, term_id) for term_id in term_ids],
+        overlap_genes=overlap_genes,
+        overlap=np.array(overlap, dtype=np.int64),
+        term_size=np.array(term_size, dtype=np.int64),
+        set_size=len(query),
+        not_term_not_set=(
+            np.array(not_term_not_set, dtype=np.int64) if background is not None else None
+        ),
+        alpha=alpha,
+        correction_method=correction_method,
+    )
+
+
+def score_terms(
+    term_ids: list[str],
+    term_names: list[str],
+    overlap_genes: list[list[str]],
+    overlap: np.ndarray,
+    term_size: np.ndarray,
+    set_size: int,
+    not_term_not_set: np.ndarray | None = None,
+    alpha: float = 0.05,
+    correction_method: str = "fdr_bh",
+) -> pd.DataFrame:
+    """
+    Score terms from precomputed contingency counts.
+
+    Args:
+        term_ids: Term IDs (only terms with overlap > 0)
+        term_names: Display names, parallel to term_ids
+        overlap_genes: Shared genes per term
+        overlap: Genes in both the term and the gene set, per term
+        term_size: Genes in the term, per term
+        set_size: Genes in the gene set
+        not_term_not_set: Per-term count outside both the term and the gene
+            set (None = DEFAULT_NOT_TERM_NOT_SET)
+        alpha: Significance threshold for the correction
+        correction_method: statsmodels multipletests method
+
+    Returns:
+        DataFrame with RESULT_COLUMNS sorted by p-value
+    """
+    d = DEFAULT_NOT_TERM_NOT_SET if not_term_not_set is None else not_term_not_set
+
+    # Table total: a + b + c + d with b = term_size - a and c = set_size - a
+    total = term_size + set_size - overlap + d
+
+    p_values = hypergeometric_pvalues(overlap, term_size, set_size, total)
+    adjusted = multipletests(p_values, alpha=alpha, method=correction_method)[1]
+
+    order = np.argsort(p_values, kind="stable")
+    logger.debug(f"Scored {len(term_ids)} terms for {set_size} genes")
+
+    return pd.DataFrame(
+        {
+            "term_id": [term_ids[i] for i in order],
+            "term_name": [term_names[i] for i in order],
+            "p_value": p_values[order],
+            "gene_count": overlap[order],
+            "term_size": term_size[order],
+            "genes": [overlap_genes[i] for i in order],
+            "adjusted_p_value": adjusted[order],
+        },
+        columns=RESULT_COLUMNS,
+    )
+
+
+def table_to_records(df: pd.DataFrame) -> list[dict]:
+    """
+    Convert an enrichment table to JSON-friendly result dicts.
+
+    Args:
+        df: DataFrame from enrichment_table() (or any results table)
+
+    Returns:
+        List of dicts with native Python types
+    """
+    if df.empty:
+        return []
+
+    # Series.tolist() converts NumPy scalars to Python ints/floats
+    columns = {name: df[name].tolist() for name in df.columns}
+    return [dict(zip(columns, values, strict=True)) for values in zip(*columns.values(), strict=True)]
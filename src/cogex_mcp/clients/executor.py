@@ -0,0 +1,160 @@
+"""
+Bounded thread pools for synchronous domain clients.
+
+The indra_cogex domain clients (SubnetworkClient, EnrichmentClient,
+DiseaseClient, ...) are synchronous. Calling them directly inside
+`async def` blocks the event loop for the duration of the query, so
+Neo4jClient dispatches them through a BlockingExecutor instead.
+
+Each executor tracks:
+- Queue depth (calls submitted but not yet running)
+- Wait time (submission to start of execution)
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class ExecutorStats:
+    """Thread pool statistics."""
+
+    max_workers: int
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    queued: int = 0  # Waiting for a worker thread
+    running: int = 0
+    max_queued: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        """Average time calls waited for a worker thread."""
+        started = self.completed + self.failed + self.running
+        return self.total_wait_ms / started if started else 0.0
+
+
+class BlockingExecutor:
+    """
+    Fixed-size thread pool for running blocking calls from async code.
+
+    The pool is created on first use and recreated after shutdown(), so an
+    executor survives Neo4jClient close()/connect() cycles.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        """
+        Initialize executor.
+
+        Args:
+            name: Pool name (used as the worker thread name prefix)
+            max_workers: Maximum concurrently running calls
+        """
+        self.name = name
+        self.max_workers = max_workers
+
+        self._pool: ThreadPoolExecutor | None = None
+        self._stats = ExecutorStats(max_workers=max_workers)
+        self._stats_lock = threading.Lock()
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking callable in the pool without blocking the event loop.
+
+        Args:
+            func: Synchronous callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Return value of func
+
+        Raises:
+            Exception: Whatever func raises
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=self.name
+            )
+
+        submitted_at = time.monotonic()
+        # Set once the call has left the queue (started, or cancelled while queued)
+        dequeued = False
+
+        with self._stats_lock:
+            self._stats.submitted += 1
+            self._stats.queued += 1
+            self._stats.max_queued = max(self._stats.max_queued, self._stats.queued)
+
+        def call() -> T:
+            nonlocal dequeued
+            wait_ms = (time.monotonic() - submitted_at) * 1000
+            with self._stats_lock:
+                if dequeued:
+                    raise asyncio.CancelledError()
+                dequeued = True
+                self._stats.queued -= 1
+                self._stats.running += 1
+                self._stats.total_wait_ms += wait_ms
+                self._stats.max_wait_ms = max(self._stats.max_wait_ms, wait_ms)
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                with self._stats_lock:
+                    self._stats.running -= 1
+                    self._stats.failed += 1
+                raise
+
+            with self._stats_lock:
+                self._stats.running -= 1
+                self._stats.completed += 1
+            return result
+
+        # Keep context variables (e.g. request-scoped logging) in the worker
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool, functools.partial(context.run, call))
+        finally:
+            with self._stats_lock:
+                if not dequeued:
+                    # Cancelled before a worker picked the call up
+                    dequeued = True
+                    self._stats.queued -= 1
+
+    def get_stats(self) -> ExecutorStats:
+        """
+        Get a snapshot of executor statistics.
+
+        Returns:
+            ExecutorStats copy
+        """
+        with self._stats_lock:
+            return ExecutorStats(**vars(self._stats))
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Shut down the worker threads.
+
+        Args:
+            wait: Wait for running calls to finish
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+            logger.info(f"Executor '{self.name}' shut down")
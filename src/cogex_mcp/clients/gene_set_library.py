@@ -0,0 +1,635 @@
+"""
+Gene-set library for in-process enrichment.
+
+Materializes gene-set memberships (GO, Reactome, WikiPathways, HPO) into a
+CSR sparse matrix with one row per term and one column per gene, so
+enrichment needs no graph round-trips: overlap counts (or, for GSEA, member
+ranks) for every term of a source come from one pass over the matrix.
+
+Libraries are built from Neo4j and stored as versioned directories:
+    <library_dir>/<version>/meta.json    genes, terms, source row ranges
+    <library_dir>/<version>/indptr.npy   CSR row pointers (int64)
+    <library_dir>/<version>/indices.npy  CSR gene columns (int32)
+    <library_dir>/CURRENT                name of the active version
+The arrays are memory-mapped on load.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from statsmodels.stats.multitest import multipletests
+
+from cogex_mcp.clients.enrichment_engine import (
+    DEFAULT_NOT_TERM_NOT_SET,
+    RESULT_COLUMNS,
+    csr_row_sums,
+    hypergeometric_pvalues,
+    score_terms,
+)
+from cogex_mcp.clients.gsea_engine import rank_genes, score_gene_sets
+from cogex_mcp.config import settings
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+CURRENT_FILE = "CURRENT"
+
+# Transaction timeout for streaming memberships while building
+_BUILD_TIMEOUT_MS = 300000
+
+
+@dataclass(frozen=True)
+class GeneSetSource:
+    """Catalog query yielding (term, gene) memberships for one source."""
+
+    query_name: str
+    prefix: str
+
+
+GENE_SET_SOURCES: dict[str, GeneSetSource] = {
+    "go": GeneSetSource("gene_set_annotations", "GO:"),
+    "phenotype": GeneSetSource("gene_set_annotations", "HP:"),
+    "reactome": GeneSetSource("gene_set_pathways", "reactome:"),
+    "wikipathways": GeneSetSource("gene_set_pathways", "wikipathways:"),
+}
+
+
+def _normalize_gene_id(gene_id: str) -> str:
+    """Lowercase the namespace of a gene CURIE (e.g., "HGNC:11998" -> "hgnc:11998")."""
+    namespace, sep, identifier = gene_id.partition(":")
+    return f"{namespace.lower()}{sep}{identifier}"
+
+
+class GeneSetLibrary:
+    """
+    Sparse gene × gene-set membership matrix with term metadata.
+
+    Terms of each source occupy a contiguous block of rows; the genes of
+    term i are genes[indices[indptr[i]:indptr[i + 1]]].
+    """
+
+    def __init__(
+        self,
+        genes: list[str],
+        term_ids: list[str],
+        term_names: list[str],
+        source_ranges: dict[str, tuple[int, int]],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        version: str,
+    ):
+        """
+        Initialize library from its arrays.
+
+        Args:
+            genes: Gene IDs (matrix columns)
+            term_ids: Term IDs (matrix rows)
+            term_names: Term names, parallel to term_ids
+            source_ranges: Source name -> (first row, end row)
+            indptr: CSR row pointers (len(term_ids) + 1)
+            indices: CSR column indexes
+            version: Library version label
+        """
+        self.genes = genes
+        self.term_ids = term_ids
+        self.term_names = term_names
+        self.source_ranges = source_ranges
+        self.indptr = indptr
+        self.indices = indices
+        self.version = version
+
+        self.gene_index = {_normalize_gene_id(gene): i for i, gene in enumerate(genes)}
+        self._gene_array = np.array(genes, dtype=object)
+
+    @property
+    def sources(self) -> list[str]:
+        """Sources materialized in this library."""
+        return list(self.source_ranges)
+
+    def has_source(self, source: str) -> bool:
+        """Whether the library holds gene sets for a source."""
+        return source in self.source_ranges
+
+    @classmethod
+    def from_memberships(
+        cls,
+        memberships: Mapping[str, Iterable[tuple[str, str | None, str]]],
+        version: str | None = None,
+    ) -> "GeneSetLibrary":
+        """
+        Build library from membership rows.
+
+        Args:
+            memberships: Source name -> (term_id, term_name, gene_id) rows
+            version: Version label (defaults to the build timestamp)
+
+        Returns:
+            GeneSetLibrary
+        """
+        genes: list[str] = []
+        gene_index: dict[str, int] = {}
+        term_ids: list[str] = []
+        term_names: list[str] = []
+        source_ranges: dict[str, tuple[int, int]] = {}
+        rows: list[np.ndarray] = []
+
+        for source, source_rows in memberships.items():
+            members: dict[str, set[int]] = {}
+            names: dict[str, str] = {}
+            for term_id, term_name, gene_id in source_rows:
+                gene_id = _normalize_gene_id(gene_id)
+                column = gene_index.get(gene_id)
+                if column is None:
+                    column = gene_index[gene_id] = len(genes)
+                    genes.append(gene_id)
+                members.setdefault(term_id, set()).add(column)
+                if term_name:
+                    names.setdefault(term_id, term_name)
+
+            start = len(term_ids)
+            for term_id in sorted(members):
+                term_ids.append(term_id)
+                term_names.append(names.get(term_id, term_id))
+                rows.append(np.array(sorted(members[term_id]), dtype=np.int32))
+            source_ranges[source] = (start, len(term_ids))
+
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=indptr[1:])
+        indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int32)
+
+        return cls(
+            genes=genes,
+            term_ids=term_ids,
+            term_names=term_names,
+            source_ranges=source_ranges,
+            indptr=indptr,
+            indices=indices,
+            version=version or datetime.now().strftime("%Y%m%dT%H%M%S"),
+        )
+
+    def save(self, directory: Path) -> Path:
+        """
+        Write this library as a new version and make it current.
+
+        Args:
+            directory: Library directory
+
+        Returns:
+            Path of the version directory
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        version_dir = directory / self.version
+        tmp_dir = directory / f".{self.version}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir()
+
+        np.save(tmp_dir / "indptr.npy", np.asarray(self.indptr))
+        np.save(tmp_dir / "indices.npy", np.asarray(self.indices))
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "version": self.version,
+            "created_at": datetime.now().isoformat(),
+            "genes": self.genes,
+            "term_ids": self.term_ids,
+            "term_names": self.term_names,
+            "sources": {name: list(bounds) for name, bounds in self.source_ranges.items()},
+        }
+        (tmp_dir / "meta.json").write_text(json.dumps(meta))
+
+        shutil.rmtree(version_dir, ignore_errors=True)
+        tmp_dir.rename(version_dir)
+
+        current_tmp = directory / f".{CURRENT_FILE}.tmp"
+        current_tmp.write_text(self.version)
+        os.replace(current_tmp, directory / CURRENT_FILE)
+
+        logger.info(f"Saved gene-set library {self.version} to {version_dir}")
+        return version_dir
+
+    @classmethod
+    def load(cls, directory: Path, version: str | None = None) -> "GeneSetLibrary":
+        """
+        Load a library version with memory-mapped arrays.
+
+        Args:
+            directory: Library directory
+            version: Version to load (default: the CURRENT version)
+
+        Returns:
+            GeneSetLibrary
+
+        Raises:
+            FileNotFoundError: If no library version exists
+            ValueError: If the on-disk format is not supported
+        """
+        if version is None:
+            version = (directory / CURRENT_FILE).read_text().strip()
+        version_dir = directory / version
+
+        meta = json.loads((version_dir / "meta.json").read_text())
+        if meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported gene-set library format: {meta.get('format_version')}"
+            )
+
+        return cls(
+            genes=meta["genes"],
+            term_ids=meta["term_ids"],
+            term_names=meta["term_names"],
+            source_ranges={name: tuple(bounds) for name, bounds in meta["sources"].items()},
+            indptr=np.load(version_dir / "indptr.npy", mmap_mode="r"),
+            indices=np.load(version_dir / "indices.npy", mmap_mode="r"),
+            version=meta["version"],
+        )
+
+    def enrichment(
+        self,
+        gene_ids: Iterable[str],
+        source: str,
+        background_gene_ids: Iterable[str] | None = None,
+        alpha: float = 0.05,
+        correction_method: str = "fdr_bh",
+    ) -> pd.DataFrame:
+        """
+        Score all gene sets of a source for over-representation.
+
+        Same contingency tables as enrichment_engine.enrichment_table(),
+        with counts computed from the membership matrix.
+
+        Args:
+            gene_ids: Gene set (CURIEs)
+            source: Source name (e.g., "go", "reactome")
+            background_gene_ids: Optional background gene set
+            alpha: Significance threshold for the correction
+            correction_method: statsmodels multipletests method
+
+        Returns:
+            DataFrame with enrichment_engine.RESULT_COLUMNS sorted by p-value
+
+        Raises:
+            ValueError: If the source is not in the library
+        """
+        first, columns, bounds = self._source_rows(source)
+        query = {_normalize_gene_id(gene_id) for gene_id in gene_ids}
+        query_mask = self._gene_mask(query)
+
+        hits = query_mask[columns]
+        overlap = csr_row_sums(hits, bounds)
+        term_size = np.diff(bounds)
+
+        selected = np.flatnonzero(overlap)
+        if not selected.size:
+            return pd.DataFrame()
+
+        not_term_not_set = None
+        if background_gene_ids:
+            background = {_normalize_gene_id(gene_id) for gene_id in background_gene_ids}
+            background_mask = self._gene_mask(background)
+            in_term = csr_row_sums(background_mask[columns], bounds)
+            in_both = csr_row_sums(background_mask[columns] & hits, bounds)
+            not_term_not_set = (
+                len(background) - in_term - len(background & query) + in_both
+            )[selected]
+
+        # Shared genes, grouped by row (entries are in row order)
+        shared = self._gene_array[columns[hits]]
+        overlap_genes = [
+            genes.tolist() for genes in np.split(shared, np.cumsum(overlap[selected])[:-1])
+        ]
+
+        return score_terms(
+            term_ids=[self.term_ids[first + row] for row in selected],
+            term_names=[self.term_names[first + row] for row in selected],
+            overlap_genes=overlap_genes,
+            overlap=overlap[selected],
+            term_size=term_size[selected],
+            set_size=len(query),
+            not_term_not_set=not_term_not_set,
+            alpha=alpha,
+            correction_method=correction_method,
+        )
+
+    def batch_enrichment(
+        self,
+        gene_lists: Mapping[str, Iterable[str]],
+        source: str,
+        background_gene_ids: Iterable[str] | None = None,
+        alpha: float = 0.05,
+        correction_method: str = "fdr_bh",
+        keep_insignificant: bool = False,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Score all gene sets of a source for many gene lists at once.
+
+        Overlaps for every (term, list) pair come from one sparse product of
+        the membership matrix with a gene × list matrix, and all p-values
+        from one vectorized pass. Correction is applied per list, as if each
+        list were run through enrichment() separately.
+
+        Args:
+            gene_lists: List name -> gene set (CURIEs)
+            source: Source name (e.g., "go", "reactome")
+            background_gene_ids: Optional background shared by all lists
+            alpha: Significance threshold for the correction
+            correction_method: statsmodels multipletests method
+            keep_insignificant: Keep terms with adjusted p-value > alpha
+
+        Returns:
+            List name -> DataFrame with enrichment_engine.RESULT_COLUMNS
+            sorted by p-value
+
+        Raises:
+            ValueError: If the source is not in the library
+        """
+        first, columns, bounds = self._source_rows(source)
+        names = list(gene_lists)
+        queries = [{_normalize_gene_id(gene_id) for gene_id in gene_lists[name]} for name in names]
+        n_terms, n_genes = len(bounds) - 1, len(self.genes)
+
+        # Gene × list membership of the query lists
+        query_columns = [[self.gene_index[g] for g in query if g in self.gene_index] for query in queries]
+        gene_rows = np.fromiter((c for cols in query_columns for c in cols), dtype=np.int64)
+        list_columns = np.repeat(np.arange(len(names)), [len(cols) for cols in query_columns])
+        query_matrix = sparse.csr_matrix(
+            (np.ones(len(gene_rows), dtype=np.int32), (gene_rows, list_columns)),
+            shape=(n_genes, len(names)),
+        )
+        membership = sparse.csr_matrix(
+            (np.ones(len(columns), dtype=np.int32), columns, bounds), shape=(n_terms, n_genes)
+        )
+
+        pairs = (membership @ query_matrix).tocoo()
+        term, list_index, overlap = pairs.row, pairs.col, pairs.data.astype(np.int64)
+        term_size = np.diff(bounds)[term]
+        set_size = np.array([len(query) for query in queries], dtype=np.int64)[list_index]
+
+        if background_gene_ids:
+            background = {_normalize_gene_id(gene_id) for gene_id in background_gene_ids}
+            background_mask = self._gene_mask(background).astype(np.int32)
+            in_term = membership @ background_mask
+            in_query = np.array([len(background & query) for query in queries])
+            in_both = np.asarray(
+                (membership.multiply(background_mask) @ query_matrix)[term, list_index]
+            ).ravel()
+            not_term_not_set = (
+                len(background) - in_term[term] - in_query[list_index] + in_both
+            )
+        else:
+            not_term_not_set = DEFAULT_NOT_TERM_NOT_SET
+
+        total = term_size + set_size - overlap + not_term_not_set
+        p_values = hypergeometric_pvalues(overlap, term_size, set_size, total)
+
+        # Group pairs by list, most significant first
+        order = np.lexsort((p_values, list_index))
+        list_bounds = np.searchsorted(list_index[order], np.arange(len(names) + 1))
+
+        tables = {}
+        for i, name in enumerate(names):
+            rows = order[list_bounds[i]:list_bounds[i + 1]]
+            adjusted = (
+                multipletests(p_values[rows], alpha=alpha, method=correction_method)[1]
+                if rows.size
+                else np.zeros(0)
+            )
+            if not keep_insignificant:
+                rows, adjusted = rows[adjusted <= alpha], adjusted[adjusted <= alpha]
+
+            query_mask = self._gene_mask(queries[i])
+            tables[name] = pd.DataFrame(
+                {
+                    "term_id": [self.term_ids[first + term[r]] for r in rows],
+                    "term_name": [self.term_names[first + term[r]] for r in rows],
+                    "p_value": p_values[rows],
+                    "gene_count": overlap[rows],
+                    "term_size": term_size[rows],
+                    "genes": [self._shared_genes(columns, bounds, term[r], query_mask) for r in rows],
+                    "adjusted_p_value": adjusted,
+                },
+                columns=RESULT_COLUMNS,
+            )
+
+        return tables
+
+    def _shared_genes(
+        self,
+        columns: np.ndarray,
+        bounds: np.ndarray,
+        row: int,
+        mask: np.ndarray,
+    ) -> list[str]:
+        """Genes of one source row that are set in a column mask."""
+        row_columns = columns[bounds[row]:bounds[row + 1]]
+        return self._gene_array[row_columns[mask[row_columns]]].tolist()
+
+    def gsea(
+        self,
+        ranked_genes: Mapping[str, float],
+        source: str,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Preranked GSEA over all gene sets of a source.
+
+        Args:
+            ranked_genes: Gene ID -> score (e.g., log fold change)
+            source: Source name (e.g., "go", "reactome")
+            **kwargs: Options for gsea_engine.score_gene_sets()
+
+        Returns:
+            DataFrame with gsea_engine.RESULT_COLUMNS sorted by p-value
+
+        Raises:
+            ValueError: If the source is not in the library
+        """
+        first, columns, bounds = self._source_rows(source)
+        ranked_gene_ids, scores = rank_genes(
+            {_normalize_gene_id(gene_id): score for gene_id, score in ranked_genes.items()}
+        )
+
+        rank = np.full(len(self.genes), -1, dtype=np.int64)
+        for position, gene_id in enumerate(ranked_gene_ids):
+            column = self.gene_index.get(gene_id)
+            if column is not None:
+                rank[column] = position
+
+        # Ranks of each gene set's members, ascending within the set
+        ranks = rank[columns]
+        hits = ranks >= 0
+        rows = np.repeat(np.arange(len(bounds) - 1), np.diff(bounds))[hits]
+        positions = ranks[hits]
+        positions = positions[np.lexsort((positions, rows))]
+        indptr = np.concatenate(([0], np.cumsum(csr_row_sums(hits, bounds))))
+
+        return score_gene_sets(
+            ranked_gene_ids,
+            scores,
+            self.term_ids[first:first + len(bounds) - 1],
+            self.term_names[first:first + len(bounds) - 1],
+            indptr,
+            positions,
+            **kwargs,
+        )
+
+    def _source_rows(self, source: str) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        Rows of one source.
+
+        Returns:
+            Tuple of (first row, gene columns of the rows' entries, row
+            bounds relative to the first entry)
+
+        Raises:
+            ValueError: If the source is not in the library
+        """
+        if source not in self.source_ranges:
+            raise ValueError(f"Gene-set library {self.version} has no source '{source}'")
+
+        first, end = self.source_ranges[source]
+        bounds = np.asarray(self.indptr[first:end + 1])
+        columns = np.asarray(self.indices[bounds[0]:bounds[-1]])
+        return first, columns, bounds - bounds[0]
+
+    def _gene_mask(self, gene_ids: Iterable[str]) -> np.ndarray:
+        """Boolean column mask of the given (normalized) gene IDs."""
+        mask = np.zeros(len(self.genes), dtype=bool)
+        columns = [self.gene_index[g] for g in gene_ids if g in self.gene_index]
+        mask[columns] = True
+        return mask
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get library size per source."""
+        return {
+            "version": self.version,
+            "genes": len(self.genes),
+            "memberships": int(self.indptr[-1]) if len(self.indptr) else 0,
+            "sources": {name: end - start for name, (start, end) in self.source_ranges.items()},
+        }
+
+
+async def build_gene_set_library(
+    sources: Iterable[str],
+    fetch_size: int = 5000,
+) -> GeneSetLibrary:
+    """
+    Build a gene-set library by streaming memberships from Neo4j.
+
+    Args:
+        sources: Source names (keys of GENE_SET_SOURCES)
+        fetch_size: Records fetched per round-trip
+
+    Returns:
+        GeneSetLibrary
+
+    Raises:
+        ValueError: If a source is unknown
+    """
+    from cogex_mcp.clients.adapter import get_adapter
+
+    adapter = await get_adapter()
+    memberships: dict[str, list[tuple[str, str | None, str]]] = {}
+
+    for source in sources:
+        spec = GENE_SET_SOURCES.get(source)
+        if spec is None:
+            raise ValueError(
+                f"Unknown gene-set source: {source}. Must be one of {sorted(GENE_SET_SOURCES)}"
+            )
+
+        rows = []
+        async for record in adapter.stream_query(
+            spec.query_name,
+            prefix=spec.prefix,
+            timeout=_BUILD_TIMEOUT_MS,
+            fetch_size=fetch_size,
+        ):
+            rows.append((record["term_id"], record["term_name"], record["member_id"]))
+        memberships[source] = rows
+        logger.info(f"Gene-set library: {len(rows)} {source} memberships")
+
+    return await asyncio.to_thread(GeneSetLibrary.from_memberships, memberships)
+
+
+# Global gene-set library (loaded lazily from settings.gene_set_library_dir)
+_library: GeneSetLibrary | None = None
+_library_loaded = False
+_library_lock = threading.Lock()
+
+
+def get_gene_set_library() -> GeneSetLibrary | None:
+    """
+    Get the current gene-set library (singleton).
+
+    Safe to call from worker threads.
+
+    Returns:
+        GeneSetLibrary, or None if not configured or not built yet
+    """
+    global _library, _library_loaded
+
+    if _library_loaded or not settings.gene_set_library_dir:
+        return _library
+
+    with _library_lock:
+        if not _library_loaded:
+            directory = Path(settings.gene_set_library_dir).expanduser()
+            if (directory / CURRENT_FILE).exists():
+                try:
+                    _library = GeneSetLibrary.load(directory)
+                    logger.info(f"Loaded gene-set library: {_library.get_stats()}")
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"Could not load gene-set library from {directory}: {e}")
+            _library_loaded = True
+
+    return _library
+
+
+def set_gene_set_library(library: GeneSetLibrary | None) -> None:
+    """Replace the current gene-set library."""
+    global _library, _library_loaded
+
+    with _library_lock:
+        _library = library
+        _library_loaded = True
+
+
+async def ensure_gene_set_library() -> GeneSetLibrary | None:
+    """
+    Load the gene-set library, building it from Neo4j if none exists.
+
+    Called in the background at server startup.
+
+    Returns:
+        GeneSetLibrary, or None if not configured or the build failed
+    """
+    if not settings.gene_set_library_dir:
+        return None
+
+    library = await asyncio.to_thread(get_gene_set_library)
+    if library is not None or not settings.gene_set_library_auto_build:
+        return library
+
+    try:
+        library = await build_gene_set_library(settings.gene_set_library_source_list)
+        await asyncio.to_thread(library.save, Path(settings.gene_set_library_dir).expanduser())
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning(f"Gene-set library build failed: {e}")
+        return None
+
+    set_gene_set_library(library)
+    logger.info(f"Built gene-set library: {library.get_stats()}")
+    return library
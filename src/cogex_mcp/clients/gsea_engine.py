@@ -0,0 +1,441 @@
+"""
+Vectorized preranked gene set enrichment analysis (GSEA).
+
+Enrichment scores follow Subramanian et al. (2005): a weighted
+Kolmogorov-Smirnov running sum over the ranked gene list. The running sum
+only peaks just after a hit and only dips just before one, so the score of
+every gene set is computed at once from the ranks of its members alone.
+
+Significance comes from gene-label permutation. Permuting labels places the
+k members of a set at k uniformly random ranks, so the null distribution
+depends only on k and is shared by all sets of that size. Permutations run
+in batches seeded from one SeedSequence: results depend only on the seed,
+not on how batches are spread over worker processes.
+"""
+
+import logging
+import multiprocessing
+import threading
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from statsmodels.stats.multitest import multipletests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERMUTATIONS = 1000
+DEFAULT_SEED = 0
+
+# Gene sets are scored when this many members are in the ranked list
+DEFAULT_MIN_SIZE = 5
+DEFAULT_MAX_SIZE = 500
+
+# Exponent applied to |score| when weighting hits (1 = classic GSEA)
+DEFAULT_WEIGHT = 1.0
+
+# Permutations per batch (one task when running on a process pool)
+_PERMUTATION_BATCH = 100
+
+RESULT_COLUMNS = [
+    "term_id",
+    "term_name",
+    "enrichment_score",
+    "normalized_enrichment_score",
+    "p_value",
+    "adjusted_p_value",
+    "gene_count",
+    "term_size",
+    "genes",
+]
+
+# Process pool for permutation batches (created on first use)
+_pool: ProcessPoolExecutor | None = None
+_pool_processes = 0
+_pool_lock = threading.Lock()
+
+
+def rank_genes(ranked_genes: Mapping[str, float]) -> tuple[list[str], np.ndarray]:
+    """
+    Order genes by descending score.
+
+    Ties are broken by gene ID so the ranking is deterministic.
+
+    Args:
+        ranked_genes: Gene ID -> score
+
+    Returns:
+        Tuple of (gene IDs in rank order, scores in rank order)
+    """
+    genes = sorted(ranked_genes)
+    scores = np.array([ranked_genes[gene] for gene in genes], dtype=np.float64)
+    order = np.argsort(-scores, kind="stable")
+    return [genes[i] for i in order], scores[order]
+
+
+def _enrichment_scores(
+    positions: np.ndarray,
+    indptr: np.ndarray,
+    weights: np.ndarray,
+    n_genes: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Running-sum enrichment scores for many gene sets.
+
+    Args:
+        positions: Member ranks, ascending within each set
+        indptr: Set boundaries in positions (no empty sets)
+        weights: Hit weight per rank
+        n_genes: Length of the ranked list
+
+    Returns:
+        Tuple of (score per set, running sum just after each hit, running
+        sum just before each hit)
+    """
+    sizes = np.diff(indptr)
+    starts = indptr[:-1]
+    owner = np.repeat(np.arange(len(sizes)), sizes)
+
+    hit_weights = weights[positions]
+    cumulative = np.cumsum(hit_weights)
+    hit_sum = cumulative - (cumulative[starts] - hit_weights[starts])[owner]
+    norm = hit_sum[indptr[1:] - 1]
+    norm = np.where(norm > 0, norm, 1.0)[owner]
+
+    # Misses up to and including the rank of the j-th hit: rank + 1 - j
+    hit_number = np.arange(1, len(positions) + 1) - starts[owner]
+    misses = (positions + 1 - hit_number) / (n_genes - sizes)[owner]
+
+    after = hit_sum / norm - misses
+    before = (hit_sum - hit_weights) / norm - misses
+    top = np.maximum.reduceat(after, starts)
+    bottom = np.minimum.reduceat(before, starts)
+
+    return np.where(top >= -bottom, top, bottom), after, before
+
+
+def _null_batch(
+    seed: np.random.SeedSequence,
+    batch: int,
+    sizes: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """
+    Enrichment scores of random gene sets for one permutation batch.
+
+    Each permutation draws a random order of the ranked list; its first k
+    genes form the random set of size k.
+
+    Args:
+        seed: Seed for this batch
+        batch: Number of permutations
+        sizes: Distinct gene set sizes (ascending)
+        weights: Hit weight per rank
+
+    Returns:
+        Array of shape (len(sizes), batch)
+    """
+    rng = np.random.default_rng(seed)
+    n_genes = len(weights)
+    largest = int(sizes[-1])
+
+    # The `largest` smallest of n_genes random keys, in key order, are the
+    # head of a uniformly random permutation
+    keys = rng.random((batch, n_genes))
+    head = np.argpartition(keys, largest - 1, axis=1)[:, :largest]
+    head = np.take_along_axis(
+        head, np.argsort(np.take_along_axis(keys, head, axis=1), axis=1), axis=1
+    )
+
+    null = np.empty((len(sizes), batch))
+    for i, size in enumerate(sizes):
+        positions = np.sort(head[:, :size], axis=1)
+
+        # _enrichment_scores() on equal-sized sets, one per row
+        hit_weights = weights[positions]
+        hit_sum = np.cumsum(hit_weights, axis=1)
+        norm = hit_sum[:, -1:]
+        norm[norm <= 0] = 1.0
+        misses = (positions - np.arange(size)) / (n_genes - size)
+        after = hit_sum / norm - misses
+        top = after.max(axis=1)
+        bottom = (after - hit_weights / norm).min(axis=1)
+        null[i] = np.where(top >= -bottom, top, bottom)
+    return null
+
+
+def _permutation_pvalues(
+    es: np.ndarray,
+    size_index: np.ndarray,
+    null: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Nominal p-values and normalized scores against size-matched nulls.
+
+    Each score is compared with the null scores of the same sign, and
+    normalized by their mean magnitude.
+
+    Args:
+        es: Enrichment score per gene set
+        size_index: Row of null per gene set
+        null: Null scores per distinct size (rows)
+
+    Returns:
+        Tuple of (p-values, normalized enrichment scores)
+    """
+    p_values = np.empty(len(es))
+    nes = np.full(len(es), np.nan)
+    permutations = null.shape[1]
+
+    groups = np.argsort(size_index, kind="stable")
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(size_index, minlength=len(null)))))
+
+    for row, start, end in zip(np.sort(null, axis=1), bounds[:-1], bounds[1:], strict=True):
+        members = groups[start:end]
+        if not members.size:
+            continue
+        values = es[members]
+        up = values >= 0
+        negatives = np.searchsorted(row, 0.0)
+
+        # P(null >= es | null >= 0) and P(null <= es | null < 0)
+        extreme = np.where(
+            up,
+            permutations - np.searchsorted(row, values, side="left"),
+            np.searchsorted(row, values, side="right"),
+        )
+        same_sign = np.where(up, permutations - negatives, negatives)
+        p_values[members] = (extreme + 1) / (same_sign + 1)
+
+        if negatives < permutations:
+            nes[members[up]] = values[up] / row[negatives:].mean()
+        if negatives > 0:
+            nes[members[~up]] = values[~up] / -row[:negatives].mean()
+
+    return p_values, nes
+
+
+def _get_pool(processes: int) -> ProcessPoolExecutor:
+    """Get the shared process pool, resized if needed."""
+    global _pool, _pool_processes
+
+    with _pool_lock:
+        if _pool is None or _pool_processes != processes:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # spawn: forking a threaded server process is unsafe
+            _pool = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pool_processes = processes
+        return _pool
+
+
+def close_process_pool() -> None:
+    """Shut down the permutation process pool (if started)."""
+    global _pool, _pool_processes
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+            _pool_processes = 0
+
+
+def null_distributions(
+    sizes: np.ndarray,
+    weights: np.ndarray,
+    permutations: int = DEFAULT_PERMUTATIONS,
+    seed: int = DEFAULT_SEED,
+    processes: int = 0,
+) -> np.ndarray:
+    """
+    Permutation null enrichment scores for each gene set size.
+
+    Args:
+        sizes: Distinct gene set sizes (ascending)
+        weights: Hit weight per rank
+        permutations: Number of permutations
+        seed: Random seed
+        processes: Worker processes (0 or 1 = run in the calling thread)
+
+    Returns:
+        Array of shape (len(sizes), permutations)
+    """
+    batches = [
+        min(_PERMUTATION_BATCH, permutations - start)
+        for start in range(0, permutations, _PERMUTATION_BATCH)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+
+    if processes > 1 and len(batches) > 1:
+        pool = _get_pool(processes)
+        futures = [
+            pool.submit(_null_batch, batch_seed, batch, sizes, weights)
+            for batch_seed, batch in zip(seeds, batches, strict=True)
+        ]
+        results = [future.result() for future in futures]
+    else:
+        results = [
+            _null_batch(batch_seed, batch, sizes, weights)
+            for batch_seed, batch in zip(seeds, batches, strict=True)
+        ]
+
+    return np.concatenate(results, axis=1)
+
+
+def score_gene_sets(
+    ranked_gene_ids: list[str],
+    scores: np.ndarray,
+    term_ids: list[str],
+    term_names: list[str],
+    indptr: np.ndarray,
+    positions: np.ndarray,
+    permutations: int = DEFAULT_PERMUTATIONS,
+    min_size: int = DEFAULT_MIN_SIZE,
+    max_size: int = DEFAULT_MAX_SIZE,
+    weight: float = DEFAULT_WEIGHT,
+    seed: int = DEFAULT_SEED,
+    processes: int = 0,
+    alpha: float = 0.05,
+    correction_method: str = "fdr_bh",
+    keep_insignificant: bool = True,
+) -> pd.DataFrame:
+    """
+    Score gene sets given the ranks of their members.
+
+    Args:
+        ranked_gene_ids: Gene IDs in rank order (from rank_genes())
+        scores: Scores in rank order
+        term_ids: Term IDs, one per gene set
+        term_names: Display names, parallel to term_ids
+        indptr: Gene set boundaries in positions
+        positions: Member ranks, ascending within each gene set
+        permutations: Number of permutations
+        min_size: Smallest gene set scored (members in the ranked list)
+        max_size: Largest gene set scored
+        weight: Exponent applied to |score| when weighting hits
+        seed: Random seed
+        processes: Worker processes for permutations
+        alpha: Significance threshold for the correction
+        correction_method: statsmodels multipletests method
+        keep_insignificant: Keep gene sets with adjusted p-value > alpha
+
+    Returns:
+        DataFrame with RESULT_COLUMNS sorted by p-value; gene_count and
+        genes describe the leading edge, term_size the members in the list
+
+    Raises:
+        ValueError: If permutations is not positive or all scores are equal
+            (the ranking would only reflect tie-breaking by gene ID)
+    """
+    if permutations < 1:
+        raise ValueError(f"permutations must be positive, got {permutations}")
+    if len(scores) and np.ptp(scores) == 0:
+        raise ValueError("GSEA needs varying scores, but all ranked genes have the same score")
+
+    n_genes = len(ranked_gene_ids)
+    sizes = np.diff(indptr)
+    keep = (sizes >= max(min_size, 1)) & (sizes <= max_size) & (sizes < n_genes)
+    if not keep.any():
+        return pd.DataFrame()
+
+    positions = np.asarray(positions)[np.repeat(keep, sizes)]
+    sizes = sizes[keep]
+    indptr = np.concatenate(([0], np.cumsum(sizes)))
+    selected = np.flatnonzero(keep)
+
+    weights = np.abs(scores) ** weight
+    es, after, before = _enrichment_scores(positions, indptr, weights, n_genes)
+
+    distinct_sizes, size_index = np.unique(sizes, return_inverse=True)
+    null = null_distributions(distinct_sizes, weights, permutations, seed, processes)
+
+    p_values, nes = _permutation_pvalues(es, size_index, null)
+
+    adjusted = multipletests(p_values, alpha=alpha, method=correction_method)[1]
+
+    positive = es >= 0
+
+    # Leading edge: hits up to the peak (positive) or from the dip (negative)
+    owner = np.repeat(np.arange(len(sizes)), sizes)
+    at_peak = np.where(positive[owner], after == es[owner], before == es[owner])
+    first = np.full(len(sizes), len(positions))
+    np.minimum.at(first, owner[at_peak], np.flatnonzero(at_peak))
+    last = np.full(len(sizes), -1)
+    np.maximum.at(last, owner[at_peak], np.flatnonzero(at_peak))
+    offsets = np.arange(len(positions))
+    leading = np.where(positive[owner], offsets <= first[owner], offsets >= last[owner])
+    leading_genes = np.array(ranked_gene_ids, dtype=object)[positions]
+
+    order = np.argsort(p_values, kind="stable")
+    if not keep_insignificant:
+        order = order[adjusted[order] <= alpha]
+    logger.debug(
+        f"GSEA: {len(sizes)} gene sets, {n_genes} ranked genes, {permutations} permutations"
+    )
+
+    return pd.DataFrame(
+        {
+            "term_id": [term_ids[selected[i]] for i in order],
+            "term_name": [term_names[selected[i]] for i in order],
+            "enrichment_score": es[order],
+            "normalized_enrichment_score": nes[order],
+            "p_value": p_values[order],
+            "adjusted_p_value": adjusted[order],
+            "gene_count": np.add.reduceat(leading, indptr[:-1])[order],
+            "term_size": sizes[order],
+            "genes": [
+                leading_genes[indptr[i]:indptr[i + 1]][leading[indptr[i]:indptr[i + 1]]].tolist()
+                for i in order
+            ],
+        },
+        columns=RESULT_COLUMNS,
+    )
+
+
+def gsea_table(
+    ranked_genes: Mapping[str, float],
+    term_genes: Mapping[str, Iterable[str]],
+    term_names: Mapping[str, str] | None = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Preranked GSEA over gene sets given as gene collections.
+
+    Args:
+        ranked_genes: Gene ID -> score (e.g., log fold change)
+        term_genes: Genes in each gene set
+        term_names: Optional display names (defaults to the term ID)
+        **kwargs: Options for score_gene_sets() (permutations, seed, ...)
+
+    Returns:
+        DataFrame with RESULT_COLUMNS sorted by p-value
+    """
+    ranked_gene_ids, scores = rank_genes(ranked_genes)
+    rank = {gene: i for i, gene in enumerate(ranked_gene_ids)}
+    term_names = term_names or {}
+
+    term_ids: list[str] = []
+    members: list[np.ndarray] = []
+    for term_id, genes in term_genes.items():
+        ranks = sorted({rank[gene] for gene in genes if gene in rank})
+        if ranks:
+            term_ids.append(term_id)
+            members.append(np.array(ranks, dtype=np.int64))
+
+    if not term_ids:
+        return pd.DataFrame()
+
+    indptr = np.concatenate(([0], np.cumsum([len(m) for m in members])))
+    return score_gene_sets(
+        ranked_gene_ids,
+        scores,
+        term_ids,
+        [term_names.get(term_id, term_id) for term_id in term_ids],
+        indptr,
+        np.concatenate(members),
+        **kwargs,
+    )
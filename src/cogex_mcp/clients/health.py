@@ -0,0 +1,233 @@
+"""
+Background health probing for backends.
+
+ClientAdapter used to run health checks inline, so every few minutes one
+request paid for them before its own work. HealthProber runs one asyncio
+task per backend instead:
+
+- Healthy backends are probed every interval, with random jitter so probes
+  of several servers do not line up.
+- After consecutive failures the delay doubles, up to max_backoff.
+- Probe latencies are kept in fixed-bucket histograms.
+
+Results are reported through a callback; the adapter turns them into
+cached health state and circuit breaker signals.
+"""
+
+import asyncio
+import bisect
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds (ms); larger latencies go to an overflow bucket
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        """
+        Initialize empty histogram.
+
+        Args:
+            bounds: Increasing bucket upper bounds (ms)
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        """Add one latency sample."""
+        self.counts[bisect.bisect_left(self.bounds, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Upper bound of the bucket holding the q-th percentile sample.
+
+        Args:
+            q: Percentile (0-100)
+
+        Returns:
+            Latency bound in ms (the maximum for the overflow bucket), or
+            None if there are no samples
+        """
+        if not self.count:
+            return None
+        rank = max(1, round(q / 100 * self.count))
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return float(self.bounds[i]) if i < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary with percentiles and per-bucket counts."""
+        buckets = {
+            f"le_{bound}ms": count
+            for bound, count in zip(self.bounds, self.counts[:-1], strict=True)
+        }
+        buckets["overflow"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class ProbeStats:
+    """Probe statistics for one backend."""
+
+    probes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_probe: datetime | None = None
+    last_latency_ms: float = 0.0
+    last_error: str | None = None
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class HealthProber:
+    """Probes backends periodically in background tasks."""
+
+    def __init__(
+        self,
+        probes: Mapping[str, Callable[[], Awaitable[Any]]],
+        on_result: Callable[[str, bool, float], Awaitable[None]],
+        interval: float = 30.0,
+        max_backoff: float = 300.0,
+        jitter: float = 0.1,
+        timeout: float = 10.0,
+    ):
+        """
+        Initialize prober.
+
+        Args:
+            probes: Backend name -> health check coroutine function (a falsy
+                result or an exception counts as a failure)
+            on_result: Called with (backend, healthy, latency_ms) after each probe
+            interval: Seconds between probes of a healthy backend
+            max_backoff: Maximum seconds between probes of a failing backend
+            jitter: Random fraction (±) applied to every delay
+            timeout: Seconds before a probe counts as failed
+        """
+        self.probes = dict(probes)
+        self.on_result = on_result
+        self.interval = interval
+        self.max_backoff = max(max_backoff, interval)
+        self.jitter = jitter
+        self.timeout = timeout
+
+        self._stats = {name: ProbeStats() for name in self.probes}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def start(self) -> None:
+        """Start one probe loop per backend."""
+        for name in self.probes:
+            task = self._tasks.get(name)
+            if task is None or task.done():
+                self._tasks[name] = asyncio.create_task(self._run(name))
+
+    async def stop(self) -> None:
+        """Stop the probe loops."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, name: str) -> None:
+        """Probe one backend forever."""
+        while True:
+            await asyncio.sleep(self.next_delay(name))
+            await self.probe(name)
+
+    def next_delay(self, name: str) -> float:
+        """Seconds until the next probe of a backend (with backoff and jitter)."""
+        failures = self._stats[name].consecutive_failures
+        # Exponent capped so the float stays finite for long outages
+        delay = min(self.max_backoff, self.interval * 2 ** min(failures, 16))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def probe(self, name: str) -> bool:
+        """
+        Probe one backend now and report the result.
+
+        Args:
+            name: Backend name
+
+        Returns:
+            True if the backend is healthy
+        """
+        stats = self._stats[name]
+        started = time.perf_counter()
+        try:
+            healthy = bool(await asyncio.wait_for(self.probes[name](), self.timeout))
+            error = None if healthy else "health check returned failure"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            healthy = False
+            error = str(e) or type(e).__name__
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        stats.probes += 1
+        stats.last_probe = datetime.now()
+        stats.last_latency_ms = latency_ms
+        stats.last_error = error
+        stats.latency.record(latency_ms)
+        if healthy:
+            stats.consecutive_failures = 0
+        else:
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            logger.warning(
+                f"Health probe of {name} failed ({stats.consecutive_failures} in a row): {error}"
+            )
+
+        try:
+            await self.on_result(name, healthy, latency_ms)
+        except Exception as e:
+            logger.error(f"Health probe callback for {name} failed: {e}", exc_info=True)
+        return healthy
+
+    def get_stats(self, name: str) -> dict[str, Any]:
+        """
+        Get probe statistics for a backend.
+
+        Args:
+            name: Backend name
+
+        Returns:
+            Statistics dictionary (empty for unknown backends)
+        """
+        stats = self._stats.get(name)
+        if stats is None:
+            return {}
+        return {
+            "probes": stats.probes,
+            "failures": stats.failures,
+            "consecutive_failures": stats.consecutive_failures,
+            "last_probe": stats.last_probe.isoformat() if stats.last_probe else None,
+            "last_latency_ms": stats.last_latency_ms,
+            "last_error": stats.last_error,
+            "latency": stats.latency.to_dict(),
+        }
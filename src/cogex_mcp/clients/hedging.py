@@ -0,0 +1,101 @@
+"""
+Hedged requests between the primary and fallback backends.
+
+Sequential failover pays the primary's full timeout before the fallback is
+tried. For idempotent reads, ClientAdapter can instead send the same query
+to the fallback once the primary is slower than its usual tail latency
+(the per-query-name p95 of recent primary latencies), and take whichever
+answer arrives first. Primaries cancelled by a winning hedge still count,
+with their elapsed time as a lower bound, so the threshold does not drift
+down as hedges win.
+
+A token bucket caps the extra load: every eligible query earns
+budget_ratio tokens and every hedge spends one, so at most about that
+fraction of queries is duplicated.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+
+# Percentile of recent primary latencies after which a query is hedged
+HEDGE_PERCENTILE = 95
+
+# Recent primary latencies kept per query name
+LATENCY_WINDOW = 200
+
+
+@dataclass
+class HedgeStats:
+    """Hedged request statistics."""
+
+    eligible: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    budget_exhausted: int = 0
+
+
+class LatencyTracker:
+    """Rolling per-query-name latency percentiles."""
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = 20):
+        """
+        Initialize tracker.
+
+        Args:
+            window: Latest samples kept per query name
+            min_samples: Samples needed before a percentile is reported
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, query_name: str, seconds: float) -> None:
+        """Add a latency sample for a query name."""
+        samples = self._samples.get(query_name)
+        if samples is None:
+            samples = self._samples[query_name] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, query_name: str, q: float = HEDGE_PERCENTILE) -> float | None:
+        """
+        Latency percentile of recent samples (nearest rank).
+
+        Args:
+            query_name: Query operation name
+            q: Percentile (0-100)
+
+        Returns:
+            Latency in seconds, or None with fewer than min_samples samples
+        """
+        samples = self._samples.get(query_name)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+class HedgeBudget:
+    """Token bucket limiting hedges to a fraction of eligible queries."""
+
+    def __init__(self, ratio: float, burst: float = 10.0):
+        """
+        Initialize budget with a full bucket.
+
+        Args:
+            ratio: Tokens earned per eligible query (hedges per query)
+            burst: Maximum tokens saved up
+        """
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = burst
+
+    def earn(self) -> None:
+        """Credit one eligible query."""
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take a token for one hedge, if there is one."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
@@ -0,0 +1,358 @@
+"""
+Kinase-substrate index for phosphosite enrichment (Tool 15).
+
+Maps kinases to the phosphosites they phosphorylate, taken from the
+graph's INDRA Phosphorylation statements. Sites are keyed GENE_S123
+(substrate symbol, residue, position). The index is built in the background
+(warmed at server startup) and kept in memory for kinase_index_ttl_seconds,
+so analyses run no graph queries.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from cogex_mcp.clients.enrichment_engine import csr_row_sums, score_terms
+from cogex_mcp.config import settings
+
+if TYPE_CHECKING:
+    from cogex_mcp.clients.neo4j_client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+# Transaction timeout for streaming phosphorylation statements
+_BUILD_TIMEOUT_MS = 300000
+
+# enrichment_engine result columns -> kinase result fields
+_RESULT_FIELDS = {
+    "term_id": "kinase_id",
+    "term_name": "kinase_name",
+    "gene_count": "substrate_count",
+    "term_size": "total_substrates",
+    "genes": "phosphosites",
+}
+
+
+def normalize_site(site: str) -> str:
+    """Canonical phosphosite key (e.g., "mapk1_t185" -> "MAPK1_T185")."""
+    return site.strip().upper()
+
+
+def site_from_statement(substrate_name: str, stmt_json: str | Mapping[str, Any]) -> str | None:
+    """
+    Phosphosite key of a Phosphorylation statement.
+
+    Args:
+        substrate_name: Substrate gene symbol
+        stmt_json: INDRA statement (JSON string or dict)
+
+    Returns:
+        Site key, or None if the statement has no residue and position
+    """
+    try:
+        stmt = json.loads(stmt_json) if isinstance(stmt_json, str) else stmt_json
+    except ValueError:
+        return None
+    if not stmt or not substrate_name:
+        return None
+
+    residue = stmt.get("residue")
+    position = stmt.get("position")
+    if not residue or not position:
+        return None
+    return normalize_site(f"{substrate_name}_{residue}{position}")
+
+
+class KinaseSubstrateIndex:
+    """
+    Sparse kinase × phosphosite matrix.
+
+    The sites of kinase i are sites[indices[indptr[i]:indptr[i + 1]]].
+    """
+
+    def __init__(
+        self,
+        kinase_ids: list[str],
+        kinase_names: list[str],
+        sites: list[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+    ):
+        """
+        Initialize index from its arrays.
+
+        Args:
+            kinase_ids: Kinase CURIEs (matrix rows)
+            kinase_names: Kinase symbols, parallel to kinase_ids
+            sites: Phosphosite keys (matrix columns)
+            indptr: CSR row pointers (len(kinase_ids) + 1)
+            indices: CSR column indexes
+        """
+        self.kinase_ids = kinase_ids
+        self.kinase_names = kinase_names
+        self.sites = sites
+        self.indptr = indptr
+        self.indices = indices
+        self.built_at = time.monotonic()
+
+        self.site_index = {site: i for i, site in enumerate(sites)}
+        self._site_array = np.array(sites, dtype=object)
+
+    @classmethod
+    def from_records(cls, rows: Iterable[tuple[str, str | None, str]]) -> "KinaseSubstrateIndex":
+        """
+        Build index from (kinase_id, kinase_name, site) rows.
+
+        Args:
+            rows: Kinase-site pairs (duplicates are merged)
+
+        Returns:
+            KinaseSubstrateIndex
+        """
+        sites: list[str] = []
+        site_index: dict[str, int] = {}
+        substrates: dict[str, set[int]] = {}
+        names: dict[str, str] = {}
+
+        for kinase_id, kinase_name, site in rows:
+            site = normalize_site(site)
+            column = site_index.get(site)
+            if column is None:
+                column = site_index[site] = len(sites)
+                sites.append(site)
+            substrates.setdefault(kinase_id, set()).add(column)
+            if kinase_name:
+                names.setdefault(kinase_id, kinase_name)
+
+        kinase_ids = sorted(substrates)
+        members = [np.array(sorted(substrates[k]), dtype=np.int32) for k in kinase_ids]
+        indptr = np.zeros(len(members) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in members], out=indptr[1:])
+
+        return cls(
+            kinase_ids=kinase_ids,
+            kinase_names=[names.get(k, k) for k in kinase_ids],
+            sites=sites,
+            indptr=indptr,
+            indices=np.concatenate(members) if members else np.zeros(0, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_statements(cls, records: Iterable[Mapping[str, Any]]) -> "KinaseSubstrateIndex":
+        """
+        Build index from list_phosphorylations records.
+
+        Statements without a residue and position are skipped.
+
+        Args:
+            records: Records with kinase_id, kinase_name, substrate_name, stmt_json
+
+        Returns:
+            KinaseSubstrateIndex
+        """
+        rows = []
+        for record in records:
+            site = site_from_statement(record["substrate_name"], record["stmt_json"])
+            if site is not None:
+                rows.append((record["kinase_id"], record["kinase_name"], site))
+        return cls.from_records(rows)
+
+    def is_expired(self, ttl_seconds: int) -> bool:
+        """Whether the index is older than ttl_seconds (0 = never expires)."""
+        return ttl_seconds > 0 and time.monotonic() - self.built_at > ttl_seconds
+
+    def enrichment(
+        self,
+        phosphosites: Iterable[str],
+        background: Iterable[str] | None = None,
+        alpha: float = 0.05,
+        correction_method: str = "fdr_bh",
+    ) -> pd.DataFrame:
+        """
+        Score every kinase for over-representation of its substrate sites.
+
+        Without a background, the universe is every indexed site plus the
+        query sites.
+
+        Args:
+            phosphosites: Query phosphosites (GENE_S123)
+            background: Optional background phosphosites
+            alpha: Significance threshold for the correction
+            correction_method: statsmodels multipletests method
+
+        Returns:
+            DataFrame sorted by p-value with kinase_id, kinase_name,
+            kinase_namespace, kinase_identifier, p_value, adjusted_p_value,
+            substrate_count, total_substrates and phosphosites
+        """
+        query = {normalize_site(site) for site in phosphosites}
+        query_mask = self._site_mask(query)
+        hits = query_mask[self.indices]
+
+        overlap = csr_row_sums(hits, self.indptr)
+        total_substrates = np.diff(self.indptr)
+        selected = np.flatnonzero(overlap)
+        if not selected.size:
+            return pd.DataFrame()
+
+        if background:
+            background_sites = {normalize_site(site) for site in background}
+            background_mask = self._site_mask(background_sites)
+            in_kinase = csr_row_sums(background_mask[self.indices], self.indptr)
+            in_both = csr_row_sums(background_mask[self.indices] & hits, self.indptr)
+            not_kinase_not_set = (
+                len(background_sites) - in_kinase - len(background_sites & query) + in_both
+            )
+        else:
+            universe = len(self.sites) + len(query - self.site_index.keys())
+            not_kinase_not_set = universe - total_substrates - len(query) + overlap
+
+        # Shared sites, grouped by row (entries are in row order)
+        shared = self._site_array[self.indices[hits]]
+        overlap_sites = [
+            sites.tolist() for sites in np.split(shared, np.cumsum(overlap[selected])[:-1])
+        ]
+
+        df = score_terms(
+            term_ids=[self.kinase_ids[row] for row in selected],
+            term_names=[self.kinase_names[row] for row in selected],
+            overlap_genes=overlap_sites,
+            overlap=overlap[selected],
+            term_size=total_substrates[selected],
+            set_size=len(query),
+            not_term_not_set=not_kinase_not_set[selected],
+            alpha=alpha,
+            correction_method=correction_method,
+        ).rename(columns=_RESULT_FIELDS)
+
+        curies = df["kinase_id"].str.split(":", n=1)
+        df.insert(2, "kinase_namespace", curies.str[0])
+        df.insert(3, "kinase_identifier", curies.str[1])
+        return df
+
+    def _site_mask(self, sites: Iterable[str]) -> np.ndarray:
+        """Boolean column mask of the given (normalized) sites."""
+        mask = np.zeros(len(self.sites), dtype=bool)
+        mask[[self.site_index[s] for s in sites if s in self.site_index]] = True
+        return mask
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index size."""
+        return {
+            "kinases": len(self.kinase_ids),
+            "sites": len(self.sites),
+            "pairs": int(self.indptr[-1]) if len(self.indptr) else 0,
+        }
+
+
+async def build_kinase_index(
+    client: "Neo4jClient",
+    fetch_size: int = 5000,
+) -> KinaseSubstrateIndex:
+    """
+    Build the kinase-substrate index from Phosphorylation statements.
+
+    Args:
+        client: Connected Neo4j client
+        fetch_size: Records fetched per round-trip
+
+    Returns:
+        KinaseSubstrateIndex
+    """
+    records = [
+        record
+        async for record in client.stream_query(
+            "list_phosphorylations", timeout=_BUILD_TIMEOUT_MS, fetch_size=fetch_size
+        )
+    ]
+    # Statement JSON is parsed off the event loop
+    index = await asyncio.to_thread(KinaseSubstrateIndex.from_statements, records)
+    logger.info(f"Built kinase-substrate index from {len(records)} statements: {index.get_stats()}")
+    return index
+
+
+class KinaseIndexNotReadyError(RuntimeError):
+    """Raised when the kinase index is still being built."""
+
+
+# Global kinase-substrate index, built by a background task
+_index: KinaseSubstrateIndex | None = None
+_build_task: asyncio.Task | None = None
+
+
+async def _build_and_swap(client: "Neo4jClient") -> KinaseSubstrateIndex:
+    """Build the index and publish it, replacing any previous one."""
+    global _index
+
+    _index = await build_kinase_index(client)
+    return _index
+
+
+def _log_build_failure(task: asyncio.Task) -> None:
+    """Log a failed background build (the next request starts a new one)."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Kinase-substrate index build failed: {task.exception()}")
+
+
+def start_kinase_index_build(client: "Neo4jClient") -> asyncio.Task:
+    """
+    Start building the index in the background, unless a build is running.
+
+    Called at server startup to warm the index, and by get_kinase_index to
+    refresh it after the TTL. The build is not tied to any request, so a
+    cancelled request does not discard it.
+
+    Args:
+        client: Connected Neo4j client
+
+    Returns:
+        The running build task
+    """
+    global _build_task
+
+    if _build_task is None or _build_task.done():
+        _build_task = asyncio.create_task(_build_and_swap(client))
+        _build_task.add_done_callback(_log_build_failure)
+    return _build_task
+
+
+async def get_kinase_index(
+    client: "Neo4jClient",
+    wait: float | None = None,
+) -> KinaseSubstrateIndex:
+    """
+    Get the kinase-substrate index (singleton).
+
+    Concurrent callers share one background build. Once the index is older
+    than settings.kinase_index_ttl_seconds it keeps being served while a
+    replacement builds. Before the first build completes, callers wait for
+    it for at most `wait` seconds.
+
+    Args:
+        client: Connected Neo4j client used for (re)builds
+        wait: Seconds to wait for a build in progress (None = until done)
+
+    Returns:
+        KinaseSubstrateIndex
+
+    Raises:
+        KinaseIndexNotReadyError: If the first build is not done within `wait`
+    """
+    if _index is not None:
+        if _index.is_expired(settings.kinase_index_ttl_seconds):
+            start_kinase_index_build(client)
+        return _index
+
+    task = start_kinase_index_build(client)
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), wait)
+    except asyncio.TimeoutError:
+        raise KinaseIndexNotReadyError(
+            "Kinase-substrate index is still being built, retry shortly"
+        ) from None
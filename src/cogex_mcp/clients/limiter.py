@@ -0,0 +1,308 @@
+"""
+Adaptive concurrency limits for backend queries.
+
+A burst of tool calls can otherwise exhaust the Neo4j connection pool and
+pile up on connection acquisition. ClientAdapter runs every query through an
+AdaptiveLimiter lane instead:
+
+- The limit follows AIMD driven by observed latency: it grows by about one
+  per limit's worth of fast completions, and shrinks multiplicatively when
+  recent queries are persistently much slower than their baseline, or when
+  a query times out. Backends report timeouts as QueryTimeoutError, and
+  ClientAdapter also reports primary timeouts it recovers from on the
+  fallback (record_timeout()), so they are not hidden by the fallback's answer.
+- Baselines (the lowest recent latency) are kept per query name, so a lane
+  mixing cheap and expensive queries does not mistake the expensive ones for
+  congestion. A single slow sample never backs off on its own: the median
+  inflation over the last few completions has to exceed the tolerance.
+- Queries over the limit wait in a bounded FIFO queue until a slot frees up
+  or their deadline passes; when the queue is full they are rejected at once.
+- Streamed queries hold a slot for as long as they are consumed (see hold()).
+  Their duration includes the consumer's own work, so it does not feed the
+  latency baseline.
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TypeVar
+
+from neo4j.exceptions import Neo4jError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# A completion slower than baseline × tolerance counts as inflated
+LATENCY_TOLERANCE = 2.0
+
+# Baselines are never taken below this (seconds): a few milliseconds of
+# scheduling noise would otherwise look like inflation on very fast queries
+BASELINE_FLOOR = 0.005
+
+# Completions whose median inflation decides whether the lane is congested
+INFLATION_WINDOW = 5
+
+# Limit multiplier applied on congestion
+BACKOFF_RATIO = 0.9
+
+# Fraction of the gap to a slower sample the baseline drifts up by, so it
+# follows a backend that has become slower for good
+BASELINE_DRIFT = 0.01
+
+
+class QueryRejectedError(Exception):
+    """Raised when a query is shed by the concurrency limiter."""
+
+
+class QueryTimeoutError(Neo4jError):
+    """Raised when a backend query runs past its timeout."""
+
+
+# Exceptions from a call that count as congestion
+_TIMEOUT_ERRORS = (asyncio.TimeoutError, QueryTimeoutError)
+
+
+@dataclass
+class LimiterStats:
+    """Concurrency limiter statistics."""
+
+    limit: float
+    max_limit: int
+    in_flight: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    admitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    timeouts: int = 0  # Calls that timed out (backed off)
+    rejected: int = 0  # Queue full
+    expired: int = 0  # Deadline passed while queued
+    baseline_ms: float = 0.0  # Baseline of the last completed query name
+    last_latency_ms: float = 0.0
+    inflation: float = 0.0  # Median latency / baseline over the recent window
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter with a bounded, deadline-aware wait queue.
+
+    Slots are handed directly to the oldest waiter on release, so queued
+    calls are admitted in arrival order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        min_limit: int = 1,
+        max_queue: int = 100,
+        adaptive: bool = True,
+    ):
+        """
+        Initialize limiter at its maximum limit.
+
+        Args:
+            name: Lane name (for logging)
+            max_limit: Maximum concurrent calls
+            min_limit: Floor for the adaptive limit
+            max_queue: Maximum waiting calls (0 = reject when at the limit)
+            adaptive: Adapt the limit to latency (otherwise fixed at max_limit)
+        """
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.max_queue = max_queue
+        self.adaptive = adaptive
+
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._baselines: dict[str, float] = {}
+        self._inflation: deque[float] = deque(maxlen=INFLATION_WINDOW)
+        self._stats = LimiterStats(limit=self._limit, max_limit=max_limit)
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return max(self.min_limit, int(self._limit))
+
+    async def run(
+        self,
+        func: Callable[[], Awaitable[T]],
+        queue_timeout: float | None = None,
+        key: str = "",
+    ) -> T:
+        """
+        Run an async call once a slot is free.
+
+        Args:
+            func: Zero-argument coroutine function
+            queue_timeout: Maximum seconds to wait for a slot (None = no limit)
+            key: Latency baseline to compare the call with (e.g. the query name)
+
+        Returns:
+            Return value of func
+
+        Raises:
+            QueryRejectedError: If the queue is full or the deadline passes
+            Exception: Whatever func raises
+        """
+        await self._acquire(queue_timeout)
+
+        started = time.monotonic()
+        try:
+            result = await func()
+        except _TIMEOUT_ERRORS:
+            self._stats.failed += 1
+            self.record_timeout()
+            raise
+        except BaseException:
+            self._stats.failed += 1
+            raise
+        else:
+            self._stats.completed += 1
+            self._on_latency(key, time.monotonic() - started)
+            return result
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def hold(self, queue_timeout: float | None = None) -> AsyncIterator[None]:
+        """
+        Hold a slot for the duration of the block (e.g. while a stream is read).
+
+        Args:
+            queue_timeout: Maximum seconds to wait for a slot (None = no limit)
+
+        Raises:
+            QueryRejectedError: If the queue is full or the deadline passes
+        """
+        await self._acquire(queue_timeout)
+        try:
+            yield
+        except GeneratorExit:
+            # The consumer closed a stream early
+            self._stats.completed += 1
+            raise
+        except _TIMEOUT_ERRORS:
+            self._stats.failed += 1
+            self.record_timeout()
+            raise
+        except BaseException:
+            self._stats.failed += 1
+            raise
+        else:
+            self._stats.completed += 1
+        finally:
+            self._release()
+
+    async def _acquire(self, queue_timeout: float | None) -> None:
+        """Take a slot, waiting in the queue if the limit is reached."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._admit()
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self._stats.rejected += 1
+            raise QueryRejectedError(
+                f"Too many concurrent {self.name} queries "
+                f"({self._in_flight} running, {len(self._waiters)} queued)"
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._stats.queued = len(self._waiters)
+        self._stats.max_queued = max(self._stats.max_queued, self._stats.queued)
+
+        try:
+            await asyncio.wait_for(waiter, queue_timeout)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended
+                self._release()
+            else:
+                self._remove_waiter(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                self._stats.expired += 1
+                raise QueryRejectedError(
+                    f"Timed out after {queue_timeout:.1f}s waiting for a {self.name} query slot"
+                ) from None
+            raise
+
+    def _admit(self) -> None:
+        """Count a call as running."""
+        self._in_flight += 1
+        self._stats.admitted += 1
+        self._stats.in_flight = self._in_flight
+
+    def _release(self) -> None:
+        """Free a slot, handing it to the oldest waiter if the limit allows."""
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._admit()
+                waiter.set_result(None)
+        self._stats.in_flight = self._in_flight
+        self._stats.queued = len(self._waiters)
+
+    def _remove_waiter(self, waiter: asyncio.Future) -> None:
+        """Drop a waiter that gave up."""
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        self._stats.queued = len(self._waiters)
+
+    def _on_latency(self, key: str, latency: float) -> None:
+        """Adapt the limit to a successful call's latency."""
+        self._stats.last_latency_ms = latency * 1000
+        baseline = self._baselines.get(key)
+        if baseline is None or latency < baseline:
+            baseline = latency
+        else:
+            baseline += (latency - baseline) * BASELINE_DRIFT
+        self._baselines[key] = baseline
+        self._stats.baseline_ms = baseline * 1000
+
+        ratio = latency / max(baseline, BASELINE_FLOOR)
+        self._inflation.append(ratio)
+        inflation = statistics.median(self._inflation)
+        self._stats.inflation = inflation
+
+        if len(self._inflation) == INFLATION_WINDOW and inflation > LATENCY_TOLERANCE:
+            # Start a fresh window so one slow stretch backs off once
+            self._inflation.clear()
+            self._on_congestion()
+        elif self.adaptive and ratio <= LATENCY_TOLERANCE and self._in_flight >= self._limit / 2:
+            # Only grow while the limit is actually being used
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._stats.limit = self._limit
+
+    def record_timeout(self) -> None:
+        """Back off after a call in this lane timed out."""
+        self._stats.timeouts += 1
+        self._on_congestion()
+
+    def _on_congestion(self) -> None:
+        """Back off after a slow or timed-out call."""
+        if not self.adaptive:
+            return
+        self._limit = max(self.min_limit, self._limit * BACKOFF_RATIO)
+        self._stats.limit = self._limit
+        logger.debug(f"Limiter '{self.name}' backed off to {self._limit:.1f}")
+
+    def get_stats(self) -> LimiterStats:
+        """
+        Get a snapshot of limiter statistics.
+
+        Returns:
+            LimiterStats copy
+        """
+        return LimiterStats(**vars(self._stats))
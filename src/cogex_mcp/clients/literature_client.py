@@ -6,6 +6,7 @@ INDRA statements, and evidence text. Provides access to the INDRA knowledge
 extraction pipeline results.
 """
 
+import json
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -20,6 +21,21 @@ from indra_cogex.client.queries import (
 
 logger = logging.getLogger(__name__)
 
+# Evidence for many statements in one query. The per-statement cap is applied
+# inside the subquery so unused evidence rows never leave the database.
+# MedScan evidence is excluded, as in get_evidences_for_stmt_hash.
+_EVIDENCE_BATCH_QUERY = """
+    UNWIND $stmt_hashes AS stmt_hash
+    CALL {
+        WITH stmt_hash
+        MATCH (e:Evidence {stmt_hash: stmt_hash})
+        WHERE NOT e.evidence CONTAINS '"source_api": "medscan"'
+        RETURN e.evidence AS evidence
+        LIMIT $max_evidence
+    }
+    RETURN stmt_hash, collect(evidence) AS evidence
+"""
+
 
 class LiteratureClient:
     """
@@ -95,22 +111,19 @@ class LiteratureClient:
         logger.debug(f"Retrieved {len(stmt_results)} raw statements")
 
         # Convert to statement dicts
-        statements = []
-        for stmt_data in stmt_results:
-            stmt_dict = self._format_statement_dict(stmt_data)
-
-            # Add evidence if requested
-            if include_evidence_text and stmt_dict.get("stmt_hash"):
-                evidence_list = self._get_evidence_for_hash(
-                    stmt_dict["stmt_hash"],
-                    max_evidence=max_evidence_per_statement,
-                    client=client,
-                )
-                stmt_dict["evidence"] = evidence_list
-            else:
-                stmt_dict["evidence"] = []
+        statements = [self._format_statement_dict(stmt_data) for stmt_data in stmt_results]
+
+        # Fetch capped evidence for all statements in one query
+        evidence_map = {}
+        if include_evidence_text:
+            evidence_map = self._get_evidence_for_hashes(
+                [stmt["stmt_hash"] for stmt in statements if stmt.get("stmt_hash")],
+                max_evidence=max_evidence_per_statement,
+                client=client,
+            )
 
-            statements.append(stmt_dict)
+        for stmt_dict in statements:
+            stmt_dict["evidence"] = evidence_map.get(stmt_dict.get("stmt_hash"), [])
 
         logger.info(f"Formatted {len(statements)} statements for PMID {pmid}")
 
@@ -280,22 +293,19 @@ class LiteratureClient:
         logger.debug(f"Retrieved {len(stmt_results)} statements")
 
         # Convert to statement dicts
-        statements = []
-        for stmt_data in stmt_results:
-            stmt_dict = self._format_statement_dict(stmt_data)
-
-            # Add evidence if requested
-            if include_evidence_text and stmt_dict.get("stmt_hash"):
-                evidence_list = self._get_evidence_for_hash(
-                    stmt_dict["stmt_hash"],
-                    max_evidence=max_evidence_per_statement,
-                    client=client,
-                )
-                stmt_dict["evidence"] = evidence_list
-            else:
-                stmt_dict["evidence"] = []
+        statements = [self._format_statement_dict(stmt_data) for stmt_data in stmt_results]
+
+        # Fetch capped evidence for all statements in one query
+        evidence_map = {}
+        if include_evidence_text:
+            evidence_map = self._get_evidence_for_hashes(
+                [stmt["stmt_hash"] for stmt in statements if stmt.get("stmt_hash")],
+                max_evidence=max_evidence_per_statement,
+                client=client,
+            )
 
-            statements.append(stmt_dict)
+        for stmt_dict in statements:
+            stmt_dict["evidence"] = evidence_map.get(stmt_dict.get("stmt_hash"), [])
 
         logger.info(f"Formatted {len(statements)} statements")
 
@@ -307,34 +317,48 @@ class LiteratureClient:
 
     # Helper methods
 
-    def _get_evidence_for_hash(
+    def _get_evidence_for_hashes(
         self,
-        stmt_hash: str,
+        stmt_hashes: List[str],
         max_evidence: int,
         client: Neo4jClient,
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Get limited evidence for a statement hash.
+        Get limited evidence for many statement hashes in one query.
 
         Args:
-            stmt_hash: Statement hash
-            max_evidence: Maximum evidence entries to return
+            stmt_hashes: Statement hashes
+            max_evidence: Maximum evidence entries per statement
             client: Neo4j client
 
         Returns:
-            List of evidence dicts (limited to max_evidence)
+            Dict mapping statement hash to its evidence dicts (at most
+            max_evidence each); hashes without evidence are omitted
         """
-        evidence_results = list(get_evidences_for_stmt_hash(stmt_hash, client=client))
-
-        # Limit evidence count
-        limited_results = evidence_results[:max_evidence]
-
-        evidence_list = []
-        for ev_data in limited_results:
-            evidence_dict = self._format_evidence_dict(ev_data)
-            evidence_list.append(evidence_dict)
-
-        return evidence_list
+        hashes = []
+        for stmt_hash in stmt_hashes:
+            try:
+                hashes.append(int(stmt_hash))
+            except (TypeError, ValueError):
+                logger.warning(f"Skipping invalid statement hash: {stmt_hash}")
+
+        if not hashes or max_evidence <= 0:
+            return {}
+
+        rows = client.query_tx(
+            _EVIDENCE_BATCH_QUERY,
+            stmt_hashes=hashes,
+            max_evidence=max_evidence,
+        )
+
+        evidence_map = {}
+        for stmt_hash, evidence_jsons in rows:
+            evidence_map[str(stmt_hash)] = [
+                self._format_evidence_json(evidence_json) for evidence_json in evidence_jsons
+            ]
+
+        logger.debug(f"Retrieved evidence for {len(evidence_map)}/{len(hashes)} statements")
+        return evidence_map
 
     def _format_statement_dict(self, stmt_data: Any) -> Dict[str, Any]:
         """
@@ -475,6 +499,30 @@ class LiteratureClient:
             "annotations": annotations if annotations else None,
         }
 
+    def _format_evidence_json(self, evidence_json: Any) -> Dict[str, Any]:
+        """
+        Convert a serialized Evidence node to standardized dict.
+
+        Reads the fields used by _format_evidence_dict straight from the
+        Evidence JSON, without building INDRA Evidence objects.
+
+        Args:
+            evidence_json: JSON string (or parsed dict) from an Evidence node
+
+        Returns:
+            Evidence dict with text, PMID, source, annotations
+        """
+        evidence = json.loads(evidence_json) if isinstance(evidence_json, str) else evidence_json
+
+        pmid = evidence.get("pmid") or (evidence.get("text_refs") or {}).get("PMID")
+
+        return {
+            "text": evidence.get("text") or "",
+            "pmid": pmid,
+            "source_api": evidence.get("source_api", "unknown"),
+            "annotations": evidence.get("annotations") or None,
+        }
+
     def _format_publication_dict(
         self,
         pmid: str,
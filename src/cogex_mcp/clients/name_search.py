@@ -0,0 +1,403 @@
+"""
+Full-text entity name search for the Neo4j client.
+
+Replaces `toLower(name) CONTAINS toLower($name)` label scans with:
+- A Neo4j full-text index on BioEntity.name (checked for, or created)
+- Per-entity-type Lucene query construction with exact-match boosting
+- An in-memory name index when the database cannot provide full-text search
+- The original CONTAINS catalog queries while an index is still populating
+"""
+
+import asyncio
+import bisect
+import logging
+import re
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from neo4j.exceptions import Neo4jError
+
+from cogex_mcp.clients.query_catalog import CURIE_FIELDS
+
+if TYPE_CHECKING:
+    from cogex_mcp.clients.neo4j_client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+FULLTEXT_INDEX_NAME = "bioentity_name_fulltext"
+FULLTEXT_ANALYZER = "standard-no-stop-words"
+
+# Maximum candidates returned by a name search (matches the CONTAINS queries)
+SEARCH_LIMIT = 10
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+@dataclass(frozen=True)
+class NameSearchSpec:
+    """How to search names for one entity type."""
+
+    query_name: str  # CONTAINS catalog query served by this spec
+    id_field: str  # Result field holding the entity CURIE
+    prefixes: tuple[str, ...]  # Namespace prefixes of matching entities
+    fuzzy: bool = False  # Add edit-distance terms to the Lucene query
+
+
+NAME_SEARCH_SPECS: dict[str, NameSearchSpec] = {
+    spec.query_name: spec
+    for spec in (
+        NameSearchSpec(
+            query_name="search_drug_by_name",
+            id_field="drug_id",
+            prefixes=("chebi:", "chembl:", "pubchem:", "drugbank:"),
+        ),
+        NameSearchSpec(
+            query_name="search_disease_by_name",
+            id_field="disease_id",
+            prefixes=("doid:", "mondo:", "mesh:", "hp:", "efo:"),
+        ),
+        NameSearchSpec(
+            query_name="search_pathway_by_name",
+            id_field="pathway_id",
+            prefixes=("reactome:", "wikipathways:", "kegg.pathway:"),
+            fuzzy=True,
+        ),
+    )
+}
+
+
+class IndexState(str, Enum):
+    """Full-text index availability."""
+
+    UNKNOWN = "unknown"
+    ONLINE = "online"
+    POPULATING = "populating"  # Being built; use CONTAINS queries meanwhile
+    UNAVAILABLE = "unavailable"  # Missing and cannot be created; use local index
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens (no Lucene special characters)."""
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+def build_lucene_query(name: str, fuzzy: bool = False) -> str | None:
+    """
+    Build a Lucene query string for an entity name.
+
+    The exact phrase is boosted above documents that merely contain every
+    token as a prefix. Fuzzy specs also accept single-edit typos.
+
+    Args:
+        name: Entity name as entered by the user
+        fuzzy: Whether to add edit-distance alternatives
+
+    Returns:
+        Lucene query string, or None if the name has no searchable tokens
+    """
+    tokens = tokenize(name)
+    if not tokens:
+        return None
+
+    clauses = [
+        f'"{" ".join(tokens)}"^10',
+        "(" + " AND ".join(f"{token}*" for token in tokens) + ")",
+    ]
+    if fuzzy:
+        clauses.append(
+            "("
+            + " AND ".join(f"{token}~1" if len(token) >= 4 else token for token in tokens)
+            + ")"
+        )
+
+    return " OR ".join(clauses)
+
+
+class LocalNameIndex:
+    """
+    In-memory token index over entity names.
+
+    Matches names containing every query token as a word prefix, ranking
+    exact (case-insensitive) matches first and shorter names next.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries: list[tuple[str, str]] = []  # (entity_id, name)
+        self._postings: dict[str, set[int]] = {}
+        self._tokens: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entity_id: str, name: str) -> None:
+        """
+        Add an entity name to the index.
+
+        Args:
+            entity_id: Entity CURIE
+            name: Entity name
+        """
+        position = len(self._entries)
+        self._entries.append((entity_id, name))
+        for token in tokenize(name):
+            self._postings.setdefault(token, set()).add(position)
+
+    def freeze(self) -> None:
+        """Sort the token vocabulary for prefix lookups (call after adding)."""
+        self._tokens = sorted(self._postings)
+
+    def search(self, name: str, limit: int = SEARCH_LIMIT) -> list[tuple[str, str]]:
+        """
+        Find entities whose name contains every token of the query.
+
+        Args:
+            name: Query name
+            limit: Maximum results
+
+        Returns:
+            List of (entity_id, name) tuples, best match first
+        """
+        tokens = tokenize(name)
+        if not tokens:
+            return []
+
+        candidates: set[int] | None = None
+        for token in tokens:
+            matches: set[int] = set()
+            start = bisect.bisect_left(self._tokens, token)
+            for indexed in self._tokens[start:]:
+                if not indexed.startswith(token):
+                    break
+                matches |= self._postings[indexed]
+
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return []
+
+        query = name.casefold()
+        ranked = sorted(
+            candidates,
+            key=lambda i: (self._entries[i][1].casefold() != query, len(self._entries[i][1])),
+        )
+        return [self._entries[i] for i in ranked[:limit]]
+
+
+class NameSearchIndex:
+    """
+    Entity name search backed by a Neo4j full-text index.
+
+    Falls back to:
+    - The CONTAINS catalog queries while the index is populating
+    - A LocalNameIndex per entity type if the index is missing and cannot
+      be created (e.g. read-only credentials)
+    """
+
+    def __init__(
+        self,
+        client: "Neo4jClient",
+        create_indexes: bool = False,
+        local_index_max_entries: int = 250000,
+        recheck_interval: int = 60,
+    ):
+        """
+        Initialize name search.
+
+        Args:
+            client: Connected Neo4j client
+            create_indexes: Create the full-text index if it is missing
+            local_index_max_entries: Maximum entities loaded into a local index
+                (larger namespaces keep using CONTAINS queries)
+            recheck_interval: Seconds between index state checks while not online
+        """
+        self._client = client
+        self.create_indexes = create_indexes
+        self.local_index_max_entries = local_index_max_entries
+        self.recheck_interval = recheck_interval
+
+        self.index_name = FULLTEXT_INDEX_NAME
+        self.state = IndexState.UNKNOWN
+        self._last_check = 0.0
+        self._lock = asyncio.Lock()
+
+        # Local fallback indexes by query name (None = too large to hold),
+        # each built under its own lock so one entity type's build does not
+        # hold up index checks or other entity types
+        self._local_indexes: dict[str, LocalNameIndex | None] = {}
+        self._local_locks: dict[str, asyncio.Lock] = {}
+
+    async def search(
+        self,
+        query_name: str,
+        timeout: int | None = None,
+        **params: Any,
+    ) -> dict[str, Any]:
+        """
+        Search entity names for a search_*_by_name query.
+
+        Args:
+            query_name: One of NAME_SEARCH_SPECS
+            timeout: Optional transaction timeout in milliseconds
+            **params: Query parameters (name is required)
+
+        Returns:
+            Query results in the same shape as the CONTAINS catalog query
+        """
+        spec = NAME_SEARCH_SPECS[query_name]
+        name = params.get("name") or ""
+        search = build_lucene_query(name, fuzzy=spec.fuzzy)
+
+        if search is not None:
+            state = await self._ensure_index()
+
+            if state == IndexState.ONLINE:
+                try:
+                    result = await self._client.run_catalog_query(
+                        "fulltext_name_search",
+                        timeout=timeout,
+                        index_name=self.index_name,
+                        search=search,
+                        name=name,
+                        prefixes=list(spec.prefixes),
+                    )
+                    return self._format_result(spec, result["records"])
+                except Neo4jError as e:
+                    if "timeout" in str(e).lower():
+                        raise
+                    logger.warning(f"Full-text name search failed, rechecking index: {e}")
+                    self.state = IndexState.UNKNOWN
+
+            elif state == IndexState.UNAVAILABLE:
+                local_index = await self._get_local_index(spec)
+                if local_index is not None:
+                    records = [
+                        {"name": entity_name, "entity_id": entity_id}
+                        for entity_id, entity_name in local_index.search(name)
+                    ]
+                    return self._format_result(spec, records)
+
+        return await self._client.run_catalog_query(query_name, timeout=timeout, **params)
+
+    async def _ensure_index(self) -> IndexState:
+        """Check (and if allowed, create) the full-text index."""
+        if self.state == IndexState.ONLINE:
+            return self.state
+        if (
+            self.state != IndexState.UNKNOWN
+            and time.monotonic() - self._last_check < self.recheck_interval
+        ):
+            return self.state
+
+        async with self._lock:
+            if self.state == IndexState.ONLINE:
+                return self.state
+
+            self._last_check = time.monotonic()
+            try:
+                self.state = await self._check_index()
+            except Exception as e:
+                logger.warning(f"Could not check full-text indexes: {e}")
+                self.state = IndexState.UNAVAILABLE
+
+            logger.info(f"Full-text name index '{self.index_name}' state: {self.state.value}")
+            return self.state
+
+    async def _check_index(self) -> IndexState:
+        """Look up the index state, creating the index if it is missing."""
+        records = await self._client.execute_raw_cypher(
+            """
+            SHOW FULLTEXT INDEXES
+            YIELD name, state, labelsOrTypes, properties
+            WHERE 'BioEntity' IN labelsOrTypes AND 'name' IN properties
+            RETURN name, state
+            """
+        )
+
+        if records:
+            # Adopt any existing full-text index on BioEntity.name
+            self.index_name = records[0]["name"]
+            if records[0]["state"] == "ONLINE":
+                return IndexState.ONLINE
+            if records[0]["state"] == "POPULATING":
+                return IndexState.POPULATING
+            return IndexState.UNAVAILABLE
+
+        if not self.create_indexes:
+            return IndexState.UNAVAILABLE
+
+        try:
+            await self._client.execute_raw_cypher(
+                f"""
+                CREATE FULLTEXT INDEX {FULLTEXT_INDEX_NAME} IF NOT EXISTS
+                FOR (n:BioEntity) ON EACH [n.name]
+                OPTIONS {{indexConfig: {{`fulltext.analyzer`: '{FULLTEXT_ANALYZER}'}}}}
+                """
+            )
+        except Neo4jError as e:
+            logger.warning(f"Could not create full-text index '{FULLTEXT_INDEX_NAME}': {e}")
+            return IndexState.UNAVAILABLE
+
+        logger.info(f"Created full-text index '{FULLTEXT_INDEX_NAME}'")
+        self.index_name = FULLTEXT_INDEX_NAME
+        return IndexState.POPULATING
+
+    async def _get_local_index(self, spec: NameSearchSpec) -> LocalNameIndex | None:
+        """Get (building on first use) the local name index for an entity type."""
+        if spec.query_name in self._local_indexes:
+            return self._local_indexes[spec.query_name]
+
+        lock = self._local_locks.setdefault(spec.query_name, asyncio.Lock())
+        async with lock:
+            if spec.query_name in self._local_indexes:
+                return self._local_indexes[spec.query_name]
+
+            local_index: LocalNameIndex | None = LocalNameIndex()
+            records = self._client.stream_query(
+                "list_entity_names",
+                prefixes=list(spec.prefixes),
+                limit=self.local_index_max_entries + 1,
+                fetch_size=1000,
+            )
+            async for record in records:
+                if len(local_index) >= self.local_index_max_entries:
+                    logger.warning(
+                        f"Local name index for {spec.query_name} exceeds "
+                        f"{self.local_index_max_entries} entries; using CONTAINS queries"
+                    )
+                    local_index = None
+                    await records.aclose()
+                    break
+                local_index.add(record["entity_id"], record["name"])
+
+            if local_index is not None:
+                local_index.freeze()
+                logger.info(
+                    f"Built local name index for {spec.query_name}: {len(local_index)} entries"
+                )
+
+            self._local_indexes[spec.query_name] = local_index
+            return local_index
+
+    @staticmethod
+    def _format_result(spec: NameSearchSpec, records: list[dict[str, Any]]) -> dict[str, Any]:
+        """Shape name search records like the CONTAINS catalog query."""
+        formatted = []
+        for record in records:
+            entity_id = record["entity_id"]
+            namespace, _, identifier = entity_id.partition(":")
+            formatted_record = {
+                "name": record["name"],
+                spec.id_field: entity_id,
+                "namespace": namespace,
+            }
+            if spec.id_field in CURIE_FIELDS and identifier:
+                formatted_record[f"{spec.id_field}_namespace"] = namespace
+                formatted_record[f"{spec.id_field}_identifier"] = identifier
+            formatted.append(formatted_record)
+
+        return {
+            "success": True,
+            "records": formatted,
+            "count": len(formatted),
+        }
@@ -4,39 +4,117 @@ Neo4j client with connection pooling and query optimization.
 Provides high-performance access to INDRA CoGEx Neo4j database with:
 - Connection pooling for concurrent queries
 - Query timeout management
-- Automatic retry with exponential backoff
+- Driver-managed retries of transient failures
 - Health checking
+- Bounded thread pools for synchronous indra_cogex domain clients
 """
 
 import asyncio
 import logging
+from collections import Counter
+from collections.abc import AsyncIterator, Mapping, Sequence
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import Any
 
-from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
-from neo4j.exceptions import Neo4jError, ServiceUnavailable, TransientError
-from tenacity import (
-    before_sleep_log,
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+    Query,
+    unit_of_work,
 )
+from neo4j.api import AsyncBookmarkManager
+from neo4j.exceptions import Neo4jError
 
+from cogex_mcp.clients.async_subnetwork import AsyncSubnetworkClient
+from cogex_mcp.clients.cell_line_client import CellLineClient
+from cogex_mcp.clients.cell_marker_client import CellMarkerClient
+from cogex_mcp.clients.clinical_trial_client import ClinicalTrialClient
 from cogex_mcp.clients.disease_client import DiseaseClient
-from cogex_mcp.clients.pathway_client import PathwayClient
 from cogex_mcp.clients.drug_client import DrugClient
 from cogex_mcp.clients.enrichment_client import EnrichmentClient
-from cogex_mcp.clients.clinical_trial_client import ClinicalTrialClient
-from cogex_mcp.clients.cell_line_client import CellLineClient
-from cogex_mcp.clients.variant_client import VariantClient
-from cogex_mcp.clients.cell_marker_client import CellMarkerClient
+from cogex_mcp.clients.enrichment_engine import table_to_records
+from cogex_mcp.clients.executor import BlockingExecutor, ExecutorStats
+from cogex_mcp.clients.gsea_engine import DEFAULT_PERMUTATIONS
+from cogex_mcp.clients.kinase_index import get_kinase_index
+from cogex_mcp.clients.limiter import QueryTimeoutError
 from cogex_mcp.clients.literature_client import LiteratureClient
+from cogex_mcp.clients.name_search import NAME_SEARCH_SPECS, NameSearchIndex
 from cogex_mcp.clients.ontology_client import OntologyClient
-from cogex_mcp.clients.subnetwork_client import SubnetworkClient
+from cogex_mcp.clients.pathway_client import PathwayClient
+from cogex_mcp.clients.query_catalog import (
+    BATCH_INDEX_FIELD,
+    BATCH_ROWS_PARAMETER,
+    PARAMETER_DEFAULTS,
+    QUERY_REGISTRY,
+    CypherQuery,
+    get_query,
+    is_read_only_cypher,
+)
+from cogex_mcp.clients.variant_client import VariantClient
 
 logger = logging.getLogger(__name__)
 
+# Composite operations served by domain clients instead of a single Cypher query
+_CLIENT_ROUTES: dict[str, str] = {
+    "extract_subnetwork": "_execute_subnetwork_extraction",
+    "enrichment_analysis": "_execute_enrichment",
+    "kinase_analysis": "_execute_kinase_analysis",
+    "disease_query": "_execute_disease_query",
+    "drug_query": "_execute_drug_query",
+    "pathway_query": "_execute_pathway_query",
+    "cell_line_query": "_execute_cell_line_query",
+    "variant_query": "_execute_variant_query",
+    "cell_marker_query": "_execute_cell_marker_query",
+    "clinical_trial_query": "_execute_clinical_trial_query",
+    "literature_query": "_execute_literature_query",
+    "ontology_query": "_execute_ontology_query",
+}
+
+# Legacy ontology query names mapped to the ontology_query direction
+_LEGACY_ONTOLOGY_DIRECTIONS: dict[str, str] = {
+    "get_ontology_parents": "parents",
+    "get_ontology_children": "children",
+    "get_ontology_hierarchy": "both",
+}
+
+
+@dataclass
+class QueryStats:
+    """Query execution statistics."""
+
+    queries: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    timeouts_by_query: Counter = field(default_factory=Counter)
+
+
+# Seconds the client waits beyond a transaction timeout before giving up on
+# its own, in case the server's answer never arrives (e.g. a hung connection)
+CLIENT_TIMEOUT_GRACE = 2.0
+
+
+def _client_timeout(timeout: int | None) -> float | None:
+    """Client-side limit in seconds for a transaction timeout in milliseconds."""
+    return timeout / 1000.0 + CLIENT_TIMEOUT_GRACE if timeout else None
+
+
+def _is_timeout_error(error: Neo4jError) -> bool:
+    """Check whether the server terminated a transaction for exceeding its timeout."""
+    return "TransactionTimedOut" in (error.code or "")
+
+
+async def _fetch_records(
+    tx: AsyncManagedTransaction, cypher: str, params: Mapping[str, Any]
+) -> list[dict[str, Any]]:
+    """Transaction function: run a query and consume its records."""
+    result = await tx.run(cypher, params)
+    return await result.data()
+
 
 class Neo4jClient:
     """
@@ -57,6 +135,18 @@ class Neo4jClient:
         max_connection_pool_size: int = 50,
         connection_timeout: int = 30,
         max_connection_lifetime: int = 3600,
+        batch_chunk_size: int = 500,
+        database: str | None = None,
+        causal_consistency: bool = False,
+        default_timeout: int | None = None,
+        long_running_timeout: int | None = None,
+        batch_timeout: int | None = None,
+        fulltext_search: bool = True,
+        create_fulltext_indexes: bool = False,
+        local_name_index_max_entries: int = 250000,
+        domain_client_workers: int = 8,
+        enrichment_workers: int = 3,
+        subnetwork_timeout: int | None = None,
     ):
         """
         Initialize Neo4j client.
@@ -68,6 +158,29 @@ class Neo4jClient:
             max_connection_pool_size: Maximum connections in pool
             connection_timeout: Connection timeout in seconds
             max_connection_lifetime: Maximum connection lifetime in seconds
+            batch_chunk_size: Maximum parameter rows per batched query
+            database: Database name (None uses the server default)
+            causal_consistency: Chain sessions with bookmarks so reads
+                observe earlier writes, even on read replicas
+            default_timeout: Transaction timeout in milliseconds for catalog
+                queries called without one (None = server default)
+            long_running_timeout: Transaction timeout in milliseconds for
+                long-running catalog queries called without one
+                (None = default_timeout)
+            batch_timeout: Transaction timeout in milliseconds per batch
+                chunk when execute_batch() is called without one
+                (None = default_timeout)
+            fulltext_search: Resolve entity names through full-text indexes
+            create_fulltext_indexes: Create missing full-text indexes (a schema
+                write, so off by default)
+            local_name_index_max_entries: Maximum entities held by the
+                in-memory fallback name index
+            domain_client_workers: Threads running synchronous domain
+                client calls (disease, drug, subnetwork, ...)
+            enrichment_workers: Threads running enrichment analyses
+                (kept separate so long analyses cannot starve other tools)
+            subnetwork_timeout: Transaction timeout in milliseconds for
+                subnetwork extraction queries (None = default_timeout)
         """
         self.uri = uri
         self.user = user
@@ -75,10 +188,34 @@ class Neo4jClient:
         self.max_connection_pool_size = max_connection_pool_size
         self.connection_timeout = connection_timeout
         self.max_connection_lifetime = max_connection_lifetime
+        self.batch_chunk_size = batch_chunk_size
+        self.database = database
+        self.causal_consistency = causal_consistency
+        self.default_timeout = default_timeout
+        self.long_running_timeout = long_running_timeout
+        self.batch_timeout = batch_timeout
+        self.subnetwork_timeout = subnetwork_timeout
+        self.name_search: NameSearchIndex | None = (
+            NameSearchIndex(
+                self,
+                create_indexes=create_fulltext_indexes,
+                local_index_max_entries=local_name_index_max_entries,
+            )
+            if fulltext_search
+            else None
+        )
+
+        # Synchronous indra_cogex domain clients run off the event loop
+        self._domain_executor = BlockingExecutor("cogex-domain", domain_client_workers)
+        self._enrichment_executor = BlockingExecutor("cogex-enrichment", enrichment_workers)
 
         self.driver: AsyncDriver | None = None
+        self._bookmark_manager: AsyncBookmarkManager | None = None
         self._lock = asyncio.Lock()
 
+        # Query metrics
+        self._stats = QueryStats()
+
     async def connect(self) -> None:
         """
         Establish connection to Neo4j with connection pooling.
@@ -99,9 +236,14 @@ class Neo4jClient:
                     max_connection_lifetime=self.max_connection_lifetime,
                     # Performance optimizations
                     connection_acquisition_timeout=30.0,
+                    # Managed transactions retry transient failures for up
+                    # to this long; this is the client's only retry layer
                     max_transaction_retry_time=30.0,
                 )
 
+                if self.causal_consistency:
+                    self._bookmark_manager = AsyncGraphDatabase.bookmark_manager()
+
                 # Verify connectivity
                 await self.driver.verify_connectivity()
 
@@ -122,11 +264,21 @@ class Neo4jClient:
                 self.driver = None
                 logger.info("Neo4j client closed")
 
+            self._domain_executor.shutdown()
+            self._enrichment_executor.shutdown()
+
     @asynccontextmanager
-    async def get_session(self) -> AsyncSession:
+    async def get_session(self, access_mode: str = READ_ACCESS, **config: Any) -> AsyncSession:
         """
         Get Neo4j session from pool.
 
+        Sessions default to READ access so that, with a neo4j:// routing URI,
+        auto-commit queries are served by cluster read replicas.
+
+        Args:
+            access_mode: Default access mode (READ_ACCESS or WRITE_ACCESS)
+            **config: Optional session configuration (e.g. fetch_size)
+
         Yields:
             AsyncSession: Neo4j session
 
@@ -136,19 +288,123 @@ class Neo4jClient:
         if self.driver is None:
             raise RuntimeError("Neo4j client not connected. Call connect() first.")
 
-        session = self.driver.session()
+        session = self.driver.session(
+            database=self.database,
+            default_access_mode=access_mode,
+            bookmark_manager=self._bookmark_manager,
+            **config,
+        )
         try:
             yield session
         finally:
             await session.close()
 
-    @retry(
-        retry=retry_if_exception_type((ServiceUnavailable, TransientError)),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        stop=stop_after_attempt(3),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
+    async def _run_managed(
+        self,
+        session: AsyncSession,
+        cypher: str,
+        params: Mapping[str, Any],
+        read_only: bool = True,
+        timeout: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Run a query in a managed transaction and fetch all records.
+
+        Read-only work goes through execute_read so a routing driver can
+        send it to a follower; the driver retries transient failures.
+
+        The timeout is sent to the server as the transaction timeout, so the
+        database itself terminates runaway queries (e.g. unbounded
+        variable-length matches) rather than leaving them running after the
+        client gives up. The client also stops waiting CLIENT_TIMEOUT_GRACE
+        seconds later, in case the server's answer never arrives.
+
+        Args:
+            session: Open session
+            cypher: Cypher query string
+            params: Query parameters
+            read_only: Whether the query contains no writes
+            timeout: Optional transaction timeout in milliseconds
+
+        Returns:
+            List of record dictionaries
+        """
+        work = session.execute_read if read_only else session.execute_write
+
+        if not timeout:
+            return await work(_fetch_records, cypher, params)
+
+        # Convert ms to seconds
+        transaction_function = unit_of_work(timeout=timeout / 1000.0)(_fetch_records)
+        return await asyncio.wait_for(
+            work(transaction_function, cypher, params), _client_timeout(timeout)
+        )
+
+    @asynccontextmanager
+    async def _track_query(self, query_name: str, timeout: int | None) -> AsyncIterator[None]:
+        """
+        Record query metrics and translate server-side timeouts.
+
+        Args:
+            query_name: Query name (for metrics and logging)
+            timeout: Transaction timeout in milliseconds, if any
+
+        Raises:
+            QueryTimeoutError: "Query timeout after {timeout}ms" if the server
+                terminated the transaction or the client-side limit passed
+            Neo4jError: The original error otherwise
+        """
+        self._stats.queries += 1
+        try:
+            yield
+        except asyncio.TimeoutError:
+            self._stats.timeouts += 1
+            self._stats.timeouts_by_query[query_name] += 1
+            logger.error(f"Query '{query_name}' got no answer within {timeout}ms")
+            raise QueryTimeoutError(f"Query timeout after {timeout}ms") from None
+        except Neo4jError as e:
+            if _is_timeout_error(e):
+                self._stats.timeouts += 1
+                self._stats.timeouts_by_query[query_name] += 1
+                logger.error(f"Query '{query_name}' timed out after {timeout}ms")
+                raise QueryTimeoutError(f"Query timeout after {timeout}ms") from e
+
+            self._stats.failures += 1
+            logger.error(f"Neo4j query '{query_name}' failed: {e}")
+            raise
+
+    def _default_timeout(self, query: CypherQuery) -> int | None:
+        """Transaction timeout in milliseconds for a query called without one."""
+        if query.long_running and self.long_running_timeout:
+            return self.long_running_timeout
+        return self.default_timeout
+
+    def get_query_stats(self) -> QueryStats:
+        """
+        Get query execution statistics.
+
+        Returns:
+            QueryStats snapshot
+        """
+        return QueryStats(
+            queries=self._stats.queries,
+            failures=self._stats.failures,
+            timeouts=self._stats.timeouts,
+            timeouts_by_query=Counter(self._stats.timeouts_by_query),
+        )
+
+    def get_executor_stats(self) -> dict[str, ExecutorStats]:
+        """
+        Get domain client thread pool statistics.
+
+        Returns:
+            ExecutorStats snapshots keyed by pool ("domain", "enrichment")
+        """
+        return {
+            "domain": self._domain_executor.get_stats(),
+            "enrichment": self._enrichment_executor.get_stats(),
+        }
+
     async def execute_query(
         self,
         query_name: str,
@@ -156,7 +412,11 @@ class Neo4jClient:
         **params: Any,
     ) -> dict[str, Any]:
         """
-        Execute named query with retry logic.
+        Execute named query.
+
+        Transient failures (leader changes, dropped connections) are retried
+        by the driver inside each managed transaction, within
+        max_transaction_retry_time; there is no second retry layer here.
 
         Args:
             query_name: Name of the query to execute
@@ -173,125 +433,268 @@ class Neo4jClient:
         if self.driver is None:
             raise RuntimeError("Neo4j client not connected")
 
-        # Set default limit if not provided
-        if "limit" not in params:
-            params["limit"] = 20
-
-        # Set default offset if not provided
-        if "offset" not in params:
-            params["offset"] = 0
-
-        # Set default min_evidence if not provided (for INDRA statement queries)
-        if "min_evidence" not in params:
-            params["min_evidence"] = 1
-
-        # Set default min_belief if not provided (for INDRA statement queries)
-        if "min_belief" not in params:
-            params["min_belief"] = 0.0
-
-        # Set default max_statements if not provided (for INDRA statement queries)
-        if "max_statements" not in params:
-            params["max_statements"] = 100
-
-        # Set default ontology term resolution parameters (for get_ontology_term)
-        if "term_id" not in params:
-            params["term_id"] = None
-        if "name" not in params:
-            params["name"] = None
-        if "namespace" not in params:
-            params["namespace"] = None
+        # Apply shared defaults (pagination, INDRA statement filters,
+        # ontology term resolution)
+        params = {**PARAMETER_DEFAULTS, **params}
 
         # Handle check_relationship dispatcher
         if query_name == "check_relationship" and "relationship_type" in params:
             query_name, params = self._dispatch_relationship_check(params)
 
         # Backward compatibility for legacy ontology query names
-        if query_name in ("get_ontology_parents", "get_ontology_children", "get_ontology_hierarchy"):
-            # Map old query names to new unified query name with appropriate direction
-            if query_name == "get_ontology_parents":
-                params["direction"] = "parents"
-            elif query_name == "get_ontology_children":
-                params["direction"] = "children"
-            elif query_name == "get_ontology_hierarchy":
-                # Keep existing direction if specified, otherwise default to "both"
-                params["direction"] = params.get("direction", "both")
+        if query_name in _LEGACY_ONTOLOGY_DIRECTIONS:
+            # Keep an explicit direction for get_ontology_hierarchy, otherwise use the default
+            direction = _LEGACY_ONTOLOGY_DIRECTIONS[query_name]
+            if query_name == "get_ontology_hierarchy":
+                direction = params.get("direction", direction)
+            params["direction"] = direction
             query_name = "ontology_query"
 
-        # Handle extract_subnetwork - route to subnetwork client
-        if query_name == "extract_subnetwork":
-            return await self._execute_subnetwork_extraction(params)
+        # Route composite operations to their domain clients
+        route = _CLIENT_ROUTES.get(query_name)
+        if route is not None:
+            return await getattr(self, route)(params)
 
-        # Handle enrichment_analysis - route to enrichment client
-        if query_name == "enrichment_analysis":
-            return await self._execute_enrichment(params)
+        # Name searches use full-text indexes when available
+        if query_name in NAME_SEARCH_SPECS and self.name_search is not None:
+            return await self.name_search.search(query_name, timeout=timeout, **params)
 
-        # Handle disease_query - route to disease client
-        if query_name == "disease_query":
-            return await self._execute_disease_query(params)
+        return await self.run_catalog_query(query_name, timeout=timeout, **params)
 
-        # Handle drug_query - route to drug client
-        if query_name == "drug_query":
-            return await self._execute_drug_query(params)
+    async def run_catalog_query(
+        self,
+        query_name: str,
+        timeout: int | None = None,
+        **params: Any,
+    ) -> dict[str, Any]:
+        """
+        Execute a catalog Cypher query directly, without operation routing.
 
-        # Handle pathway_query - route to pathway client
-        if query_name == "pathway_query":
-            return await self._execute_pathway_query(params)
+        Args:
+            query_name: Name or alias of a catalog query
+            timeout: Optional transaction timeout in milliseconds
+            **params: Query parameters
 
-        # Handle cell_line_query - route to cell line client
-        if query_name == "cell_line_query":
-            return await self._execute_cell_line_query(params)
+        Returns:
+            Query results as dictionary
 
-        # Handle variant_query - route to variant client
-        if query_name == "variant_query":
-            return await self._execute_variant_query(params)
+        Raises:
+            Neo4jError: If query fails
+            ValueError: If query name is unknown
+        """
+        # Look up the compiled Cypher query
+        query = get_query(query_name)
+        cypher = query.cypher
+        params = query.bind(params)
+        timeout = timeout or self._default_timeout(query)
 
-        # Handle cell_marker_query - route to cell marker client
-        if query_name == "cell_marker_query":
-            return await self._execute_cell_marker_query(params)
+        async with self._track_query(query_name, timeout), self.get_session() as session:
+            # Run in a managed transaction and consume all records
+            records = await self._run_managed(
+                session, cypher, params, read_only=query.read_only, timeout=timeout
+            )
 
-        # Handle literature_query - route to literature client
-        if query_name == "literature_query":
-            return await self._execute_literature_query(params)
+        logger.debug(f"Query '{query_name}' returned {len(records)} records")
 
-        # Handle ontology_query - route to ontology client
-        if query_name == "ontology_query":
-            return await self._execute_ontology_query(params)
+        # Parse records to extract namespace from CURIEs
+        parsed_records = self._parse_result(records, query)
 
-        # Map query name to Cypher query
-        cypher = self._get_cypher_query(query_name)
+        return {
+            "success": True,
+            "records": parsed_records,
+            "count": len(parsed_records),
+        }
 
-        try:
-            async with self.get_session() as session:
-                # Execute with timeout if specified
-                if timeout:
-                    result = await asyncio.wait_for(
-                        session.run(cypher, **params),
-                        timeout=timeout / 1000.0,  # Convert ms to seconds
-                    )
-                else:
-                    result = await session.run(cypher, **params)
+    def is_catalog_query(self, query_name: str) -> bool:
+        """
+        Check whether a query is a single catalog Cypher query.
+
+        Only catalog queries can run through execute_batch() and stream_query();
+        composite operations are served by domain clients. check_relationship
+        is not one: it picks a catalog query per call from relationship_type.
+
+        Args:
+            query_name: Query operation name
 
-                # Consume all records
-                records = await result.data()
+        Returns:
+            True if the query is a single catalog Cypher query
+        """
+        if query_name in _CLIENT_ROUTES or query_name in _LEGACY_ONTOLOGY_DIRECTIONS:
+            return False
+        if query_name == "check_relationship":
+            return False
+        return query_name in QUERY_REGISTRY
 
-                logger.debug(f"Query '{query_name}' returned {len(records)} records")
+    def is_read_only_query(self, query_name: str) -> bool:
+        """
+        Check whether a query only reads, so running it twice is harmless.
 
-                # Parse records to extract namespace from CURIEs
-                parsed_records = self._parse_result(records, query_name)
+        Composite operations (domain clients) are all reads; catalog queries
+        are checked for write clauses when compiled.
 
-                return {
+        Args:
+            query_name: Query operation name
+
+        Returns:
+            True if the query has no side effects
+        """
+        if query_name in _CLIENT_ROUTES or query_name in _LEGACY_ONTOLOGY_DIRECTIONS:
+            return True
+        query = QUERY_REGISTRY.get(query_name)
+        return query is not None and query.read_only
+
+    async def execute_batch(
+        self,
+        query_name: str,
+        param_rows: Sequence[Mapping[str, Any]],
+        timeout: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Execute a named query for many parameter rows in few round-trips.
+
+        The query is rewritten into its UNWIND form and rows are sent in
+        chunks of batch_chunk_size, one managed transaction per chunk. Results are
+        demultiplexed back to their input rows.
+
+        Args:
+            query_name: Name of a catalog query (composite operations are not batchable)
+            param_rows: Query parameters, one mapping per input row
+            timeout: Optional timeout per chunk in milliseconds
+
+        Returns:
+            Dictionary with one result per input row, in input order:
+                {
+                    "success": True,
+                    "results": [{"success": True, "records": [...], "count": 2}, ...],
+                    "count": 200
+                }
+
+        Raises:
+            Neo4jError: If query fails
+            RuntimeError: If not connected
+            ValueError: If query is unknown or not batchable
+        """
+        if self.driver is None:
+            raise RuntimeError("Neo4j client not connected")
+
+        if not self.is_catalog_query(query_name):
+            raise ValueError(f"Query '{query_name}' does not support batch execution")
+
+        query = get_query(query_name)
+        timeout = timeout or self.batch_timeout or self._default_timeout(query)
+        records_by_row: list[list[dict[str, Any]]] = [[] for _ in param_rows]
+
+        async with self._track_query(query_name, timeout), self.get_session() as session:
+            for shared_params, rows in query.bind_batch(param_rows):
+                for start in range(0, len(rows), self.batch_chunk_size):
+                    chunk = rows[start : start + self.batch_chunk_size]
+                    chunk_params = {**shared_params, BATCH_ROWS_PARAMETER: chunk}
+
+                    records = await self._run_managed(
+                        session,
+                        query.batch_cypher,
+                        chunk_params,
+                        read_only=query.read_only,
+                        timeout=timeout,
+                    )
+
+                    for record in records:
+                        index = record.pop(BATCH_INDEX_FIELD)
+                        records_by_row[index].append(record)
+
+        results = []
+        for records in records_by_row:
+            parsed_records = self._parse_result(records, query)
+            results.append(
+                {
                     "success": True,
                     "records": parsed_records,
                     "count": len(parsed_records),
                 }
+            )
 
-        except asyncio.TimeoutError:
-            logger.error(f"Query '{query_name}' timed out after {timeout}ms")
-            raise Neo4jError(f"Query timeout after {timeout}ms")
+        logger.debug(f"Batch query '{query_name}' executed for {len(param_rows)} rows")
 
-        except Neo4jError as e:
-            logger.error(f"Neo4j query '{query_name}' failed: {e}")
-            raise
+        return {
+            "success": True,
+            "results": results,
+            "count": len(results),
+        }
+
+    async def stream_query(
+        self,
+        query_name: str,
+        timeout: int | None = None,
+        fetch_size: int = 100,
+        **params: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Execute named query and yield parsed records as they arrive.
+
+        Records are pulled from the server fetch_size at a time, so a
+        consumer that stops early (e.g. once a response budget is reached)
+        never fetches the rest. Closing the generator discards the remaining
+        records server-side. Each fetch is also bounded client-side by the
+        time left until the transaction timeout (plus CLIENT_TIMEOUT_GRACE).
+
+        Args:
+            query_name: Name of a catalog query (composite operations are not streamable)
+            timeout: Optional server-side transaction timeout in milliseconds
+            fetch_size: Records fetched per round-trip
+            **params: Query parameters
+
+        Yields:
+            Parsed records, in the same shape as execute_query() records
+
+        Raises:
+            Neo4jError: If query fails
+            RuntimeError: If not connected
+            ValueError: If query is unknown or not streamable
+        """
+        if self.driver is None:
+            raise RuntimeError("Neo4j client not connected")
+
+        if query_name == "check_relationship" and "relationship_type" in params:
+            query_name, params = self._dispatch_relationship_check(params)
+
+        if not self.is_catalog_query(query_name):
+            raise ValueError(f"Query '{query_name}' does not support streaming")
+
+        query = get_query(query_name)
+        params = query.bind(params)
+        timeout = timeout or self._default_timeout(query)
+        count = 0
+
+        access_mode = READ_ACCESS if query.read_only else WRITE_ACCESS
+
+        loop = asyncio.get_running_loop()
+        client_timeout = _client_timeout(timeout)
+        deadline = loop.time() + client_timeout if client_timeout else None
+
+        def remaining() -> float | None:
+            return max(0.0, deadline - loop.time()) if deadline is not None else None
+
+        try:
+            async with (
+                self._track_query(query_name, timeout),
+                self.get_session(access_mode=access_mode, fetch_size=fetch_size) as session,
+            ):
+                # Auto-commit query with a server-side transaction timeout
+                result = await asyncio.wait_for(
+                    session.run(
+                        Query(query.cypher, timeout=timeout / 1000.0 if timeout else None),
+                        params,
+                    ),
+                    remaining(),
+                )
+
+                while records := await asyncio.wait_for(result.fetch(fetch_size), remaining()):
+                    for record in records:
+                        count += 1
+                        yield self._parse_record(record.data(), query.curie_fields)
+
+        finally:
+            logger.debug(f"Streamed {count} records from query '{query_name}'")
 
     def _dispatch_relationship_check(self, params: dict[str, Any]) -> tuple[str, dict[str, Any]]:
         """
@@ -359,7 +762,7 @@ class Neo4jClient:
         """
         DEPRECATED: This dispatcher is no longer used.
 
-        Subnetwork extraction now routes directly to SubnetworkClient via
+        Subnetwork extraction now routes directly to AsyncSubnetworkClient via
         _execute_subnetwork_extraction(). This method is kept for backward
         compatibility but should not be called.
 
@@ -445,42 +848,52 @@ class Neo4jClient:
         logger.debug(f"Transformed extract_subnetwork params: {list(params.keys())} -> {list(transformed.keys())}")
         return transformed
 
-    def _parse_result(self, records: list[dict[str, Any]], query_name: str) -> list[dict[str, Any]]:
+    def _parse_result(
+        self, records: list[dict[str, Any]], query: CypherQuery
+    ) -> list[dict[str, Any]]:
         """
         Parse Neo4j records to extract namespace from CURIEs and standardize format.
 
+        Records from result.data() are already fresh dictionaries, so they are
+        parsed in place rather than copied.
+
         Args:
             records: Raw records from Neo4j
-            query_name: Name of the query (for context)
+            query: Compiled query that produced the records
 
         Returns:
             Parsed records with namespace extracted
         """
-        parsed_records = []
+        return [self._parse_record(record, query.curie_fields) for record in records]
 
-        for record in records:
-            parsed_record = dict(record)
+    @staticmethod
+    def _parse_record(record: dict[str, Any], curie_fields: tuple[str, ...]) -> dict[str, Any]:
+        """
+        Split CURIE fields of a single record into namespace and identifier.
 
-            # Extract namespace from any CURIE ID fields
-            for key in ["id", "gene_id", "tissue_id", "go_id", "pathway_id", "disease_id"]:
-                if key in parsed_record and parsed_record[key]:
-                    curie = parsed_record[key]
-                    if isinstance(curie, str) and ":" in curie:
-                        namespace, identifier = curie.split(":", 1)
-                        # Add namespace and identifier as separate fields
-                        parsed_record[f"{key}_namespace"] = namespace
-                        parsed_record[f"{key}_identifier"] = identifier
+        Args:
+            record: Record dictionary (modified in place)
+            curie_fields: CURIE-valued fields returned by the query
 
-            parsed_records.append(parsed_record)
+        Returns:
+            The record with {field}_namespace / {field}_identifier added
+        """
+        for key in curie_fields:
+            curie = record.get(key)
+            if isinstance(curie, str) and ":" in curie:
+                namespace, identifier = curie.split(":", 1)
+                # Add namespace and identifier as separate fields
+                record[f"{key}_namespace"] = namespace
+                record[f"{key}_identifier"] = identifier
 
-        return parsed_records
+        return record
 
     def _get_cypher_query(self, query_name: str) -> str:
         """
         Get Cypher query for named operation.
 
         Args:
-            query_name: Query operation name
+            query_name: Query operation name or alias
 
         Returns:
             Cypher query string
@@ -488,1389 +901,7 @@ class Neo4jClient:
         Raises:
             ValueError: If query name is unknown
         """
-        # Alias mappings for backward compatibility with test naming
-        query_aliases = {
-            # Tool 1: Gene/Feature query aliases - now handled as direct queries
-            # Tool 6: Pathway aliases
-            "pathway_get_genes": "get_genes_in_pathway",
-            "pathway_get_pathways": "get_pathways_for_gene",
-            "pathway_find_shared": "get_shared_pathways_for_genes",
-            "pathway_check": "is_gene_in_pathway",
-            # Tool 7: Cell Line aliases
-            "cell_line_properties": "get_mutations_for_cell_line",
-            "cell_line_mutations": "get_mutations_for_cell_line",
-            "cell_lines_with_mutation": "get_cell_lines_for_mutation",
-            "cell_line_check": "is_mutated_in_cell_line",
-            # Tool 8: Clinical Trials aliases
-            "trials_for_drug": "get_trials_for_drug",
-            "trials_for_disease": "get_trials_for_disease",
-            "trial_by_id": "get_trial_by_id",
-            # Tool 9: Literature aliases
-            "lit_statements_pmid": "get_statements_for_paper",
-            "lit_evidence": "get_evidences_for_stmt_hash",
-            "lit_mesh_search": "get_evidence_for_mesh",
-            # Tool 10: Variant aliases
-            "variants_for_gene": "get_variants_for_gene",
-            "variants_for_disease": "get_variants_for_disease",
-            "variant_to_genes": "get_genes_for_variant",
-            "variant_to_phenotypes": "get_phenotypes_for_variant",
-            "variant_check": "is_variant_associated",
-        }
-
-        # Update aliases with Tools 11-16
-        query_aliases.update({
-            # Tool 11: Identifier Resolution aliases
-            "resolve_identifiers": "map_identifiers",
-            # Tool 12: Relationship Checking aliases
-            "check_relationship": "is_gene_in_pathway",  # Will be routed by relationship type
-            # Tool 13: Ontology Hierarchy aliases
-            "ontology_hierarchy": "get_ontology_hierarchy",
-            # Tool 14: Cell Markers aliases
-            "cell_markers": "get_markers_for_cell_type",
-            "cell_types_for_marker": "get_cell_types_for_marker",
-            "check_marker": "is_cell_marker",
-            # Tool 16: Protein Functions aliases
-            "gene_to_activities": "get_enzyme_activities",
-            "activity_to_genes": "get_genes_for_activity",
-            "check_activity": "has_enzyme_activity",
-            "check_function_types": "is_kinase",  # Will be routed by function type
-        })
-
-        # Resolve alias if exists
-        resolved_query_name = query_aliases.get(query_name, query_name)
-
-        # Query catalog - maps operation names to Cypher
-        # Updated with correct INDRA CoGEx schema (all genes are BioEntity nodes)
-        queries = {
-            # Gene queries - CORRECTED SCHEMA
-            "get_gene_by_symbol": """
-                MATCH (g:BioEntity)
-                WHERE g.name = $symbol
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  g.name AS name,
-                  g.id AS id,
-                  g.type AS type
-                LIMIT 1
-            """,
-            "get_gene_by_id": """
-                MATCH (g:BioEntity)
-                WHERE (
-                    g.id = $gene_id
-                    OR g.id = ('hgnc:' + $gene_id)
-                )
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  g.name AS name,
-                  g.id AS id,
-                  g.type AS type
-                LIMIT 1
-            """,
-            "get_tissues_for_gene": """
-                MATCH (g:BioEntity)-[:expressed_in]->(t:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND t.id STARTS WITH 'uberon:'
-                RETURN
-                  t.name AS tissue,
-                  t.id AS tissue_id,
-                  t.type AS type
-                LIMIT $limit
-            """,
-            "get_genes_in_tissue": """
-                MATCH (g:BioEntity)-[:expressed_in]->(t:BioEntity)
-                WHERE t.id = $tissue_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND t.id STARTS WITH 'uberon:'
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  g.type AS type
-                SKIP $offset LIMIT $limit
-            """,
-            # GO term queries - CORRECTED SCHEMA
-            "get_go_terms_for_gene": """
-                MATCH (g:BioEntity)-[r]->(go:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND go.id STARTS WITH 'GO:'
-                RETURN
-                  go.name AS term,
-                  go.id AS go_id,
-                  type(r) AS relationship,
-                  go.type AS go_type
-                LIMIT $limit
-            """,
-            "get_genes_for_go_term": """
-                MATCH (g:BioEntity)-[r]->(go:BioEntity)
-                WHERE go.id = $go_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  g.type AS type,
-                  type(r) AS relationship
-                SKIP $offset LIMIT $limit
-            """,
-            # Pathway queries - CORRECTED SCHEMA
-            "get_pathways_for_gene": """
-                MATCH (g:BioEntity)-[r]->(p:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND (
-                    p.id STARTS WITH 'reactome:' OR
-                    p.id STARTS WITH 'wikipathways:' OR
-                    p.id STARTS WITH 'kegg.pathway:'
-                  )
-                RETURN
-                  p.name AS pathway,
-                  p.id AS pathway_id,
-                  type(r) AS relationship,
-                  p.type AS pathway_type
-                LIMIT $limit
-            """,
-            # Disease queries - CORRECTED SCHEMA
-            "get_diseases_for_gene": """
-                MATCH (g:BioEntity)-[a:gene_disease_association]->(d:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND (
-                    d.id STARTS WITH 'mesh:' OR
-                    d.id STARTS WITH 'DOID:' OR
-                    d.id STARTS WITH 'EFO:' OR
-                    d.id STARTS WITH 'umls:'
-                  )
-                RETURN
-                  d.name AS disease,
-                  d.id AS disease_id,
-                  d.type AS disease_type
-                LIMIT $limit
-            """,
-            # ========================================================================
-            # Tool 4: Drug Queries
-            # ========================================================================
-            "get_drug_by_name": """
-                MATCH (drug:BioEntity)
-                WHERE toLower(drug.name) CONTAINS toLower($name)
-                  AND (
-                    drug.id STARTS WITH 'chebi:' OR
-                    drug.id STARTS WITH 'drugbank:' OR
-                    drug.id STARTS WITH 'chembl:'
-                  )
-                  AND drug.obsolete = false
-                RETURN
-                  drug.name AS name,
-                  drug.id AS id,
-                  drug.type AS type
-                LIMIT 10
-            """,
-            "drug_to_profile": """
-                MATCH (drug:BioEntity)
-                WHERE (drug.name = $drug OR drug.id = $drug)
-                  AND (
-                    drug.id STARTS WITH 'chebi:' OR
-                    drug.id STARTS WITH 'drugbank:' OR
-                    drug.id STARTS WITH 'chembl:'
-                  )
-                  AND drug.obsolete = false
-                OPTIONAL MATCH (drug)-[:targets]->(target:BioEntity)
-                WHERE target.id STARTS WITH 'hgnc:' AND target.obsolete = false
-                OPTIONAL MATCH (drug)-[:has_indication]->(indication:BioEntity)
-                WHERE (
-                  indication.id STARTS WITH 'mesh:' OR
-                  indication.id STARTS WITH 'DOID:' OR
-                  indication.id STARTS WITH 'EFO:'
-                )
-                OPTIONAL MATCH (drug)-[:has_side_effect]->(effect:BioEntity)
-                RETURN
-                  drug.name AS drug_name,
-                  drug.id AS drug_id,
-                  drug.type AS drug_type,
-                  collect(DISTINCT {name: target.name, id: target.id}) AS targets,
-                  collect(DISTINCT {name: indication.name, id: indication.id}) AS indications,
-                  collect(DISTINCT {name: effect.name, id: effect.id}) AS side_effects
-                LIMIT 1
-            """,
-            "side_effect_to_drugs": """
-                MATCH (effect:BioEntity)<-[:has_side_effect]-(drug:BioEntity)
-                WHERE (effect.name = $side_effect OR effect.id = $side_effect)
-                  AND (
-                    drug.id STARTS WITH 'chebi:' OR
-                    drug.id STARTS WITH 'drugbank:' OR
-                    drug.id STARTS WITH 'chembl:'
-                  )
-                  AND drug.obsolete = false
-                RETURN
-                  drug.name AS drug_name,
-                  drug.id AS drug_id,
-                  drug.type AS drug_type,
-                  effect.name AS side_effect_name,
-                  effect.id AS side_effect_id
-                SKIP $offset LIMIT $limit
-            """,
-            "get_targets_for_drug": """
-                MATCH (drug:BioEntity)-[:targets]->(target:BioEntity)
-                WHERE drug.id = $drug_id
-                  AND target.id STARTS WITH 'hgnc:'
-                  AND target.obsolete = false
-                RETURN
-                  target.name AS target,
-                  target.id AS target_id,
-                  'unknown' AS action_type,
-                  1 AS evidence_count
-                SKIP $offset LIMIT $limit
-            """,
-            "get_indications_for_drug": """
-                MATCH (drug:BioEntity)-[:has_indication]->(disease:BioEntity)
-                WHERE drug.id = $drug_id
-                  AND (
-                    disease.id STARTS WITH 'mesh:' OR
-                    disease.id STARTS WITH 'DOID:' OR
-                    disease.id STARTS WITH 'EFO:' OR
-                    disease.id STARTS WITH 'mondo:'
-                  )
-                  AND disease.obsolete = false
-                RETURN
-                  disease.name AS disease,
-                  disease.id AS disease_id,
-                  'approved' AS indication_type,
-                  4 AS max_phase
-                SKIP $offset LIMIT $limit
-            """,
-            "get_side_effects_for_drug": """
-                MATCH (drug:BioEntity)-[:has_side_effect]->(effect:BioEntity)
-                WHERE drug.id = $drug_id
-                RETURN
-                  effect.name AS effect,
-                  effect.id AS effect_id,
-                  'common' AS frequency
-                SKIP $offset LIMIT $limit
-            """,
-            "get_sensitive_cell_lines_for_drug": """
-                MATCH (drug:BioEntity)-[:sensitive_to]-(cell_line:BioEntity)
-                WHERE drug.id = $drug_id
-                  AND cell_line.id STARTS WITH 'ccle:'
-                RETURN
-                  cell_line.name AS cell_line,
-                  0.5 AS sensitivity_score
-                SKIP $offset LIMIT $limit
-            """,
-            # ========================================================================
-            # Tool 5: Disease/Phenotype Queries
-            # ========================================================================
-            "get_disease_by_name": """
-                MATCH (disease:BioEntity)
-                WHERE toLower(disease.name) CONTAINS toLower($name)
-                  AND (
-                    disease.id STARTS WITH 'mesh:' OR
-                    disease.id STARTS WITH 'DOID:' OR
-                    disease.id STARTS WITH 'EFO:' OR
-                    disease.id STARTS WITH 'mondo:'
-                  )
-                  AND disease.obsolete = false
-                RETURN
-                  disease.name AS name,
-                  disease.id AS id,
-                  disease.type AS type
-                LIMIT 10
-            """,
-            "disease_to_mechanisms": """
-                MATCH (disease:BioEntity)
-                WHERE (disease.name = $disease OR disease.id = $disease)
-                  AND (
-                    disease.id STARTS WITH 'mesh:' OR
-                    disease.id STARTS WITH 'DOID:' OR
-                    disease.id STARTS WITH 'EFO:' OR
-                    disease.id STARTS WITH 'mondo:'
-                  )
-                  AND disease.obsolete = false
-                OPTIONAL MATCH (gene:BioEntity)-[:gene_disease_association]->(disease)
-                WHERE gene.id STARTS WITH 'hgnc:' AND gene.obsolete = false
-                OPTIONAL MATCH (disease)-[:has_phenotype]->(phenotype:BioEntity)
-                WHERE phenotype.id STARTS WITH 'HP:'
-                OPTIONAL MATCH (drug:BioEntity)-[:has_indication]->(disease)
-                WHERE (
-                  drug.id STARTS WITH 'chebi:' OR
-                  drug.id STARTS WITH 'drugbank:' OR
-                  drug.id STARTS WITH 'chembl:'
-                )
-                RETURN
-                  disease.name AS disease_name,
-                  disease.id AS disease_id,
-                  disease.type AS disease_type,
-                  collect(DISTINCT {name: gene.name, id: gene.id}) AS genes,
-                  collect(DISTINCT {name: phenotype.name, id: phenotype.id}) AS phenotypes,
-                  collect(DISTINCT {name: drug.name, id: drug.id}) AS drugs
-                LIMIT 1
-            """,
-            "phenotype_to_diseases": """
-                MATCH (phenotype:BioEntity)<-[:has_phenotype]-(disease:BioEntity)
-                WHERE (phenotype.name = $phenotype OR phenotype.id = $phenotype)
-                  AND phenotype.id STARTS WITH 'HP:'
-                  AND (
-                    disease.id STARTS WITH 'mesh:' OR
-                    disease.id STARTS WITH 'DOID:' OR
-                    disease.id STARTS WITH 'EFO:' OR
-                    disease.id STARTS WITH 'mondo:'
-                  )
-                  AND disease.obsolete = false
-                RETURN
-                  disease.name AS disease_name,
-                  disease.id AS disease_id,
-                  disease.type AS disease_type,
-                  phenotype.name AS phenotype_name,
-                  phenotype.id AS phenotype_id
-                SKIP $offset LIMIT $limit
-            """,
-            "check_phenotype": """
-                MATCH (disease:BioEntity)
-                WHERE (disease.name = $disease OR disease.id = $disease)
-                  AND (
-                    disease.id STARTS WITH 'mesh:' OR
-                    disease.id STARTS WITH 'DOID:' OR
-                    disease.id STARTS WITH 'EFO:' OR
-                    disease.id STARTS WITH 'mondo:'
-                  )
-                  AND disease.obsolete = false
-                OPTIONAL MATCH (disease)-[:has_phenotype]->(phenotype:BioEntity)
-                WHERE (phenotype.name = $phenotype OR phenotype.id = $phenotype)
-                  AND phenotype.id STARTS WITH 'HP:'
-                RETURN
-                  disease.name AS disease_name,
-                  disease.id AS disease_id,
-                  phenotype.name AS phenotype_name,
-                  phenotype.id AS phenotype_id,
-                  CASE WHEN phenotype IS NOT NULL THEN true ELSE false END AS has_phenotype
-                LIMIT 1
-            """,
-            "get_genes_for_disease": """
-                MATCH (gene:BioEntity)-[:gene_disease_association]->(disease:BioEntity)
-                WHERE disease.id = $disease_id
-                  AND gene.id STARTS WITH 'hgnc:'
-                  AND gene.obsolete = false
-                RETURN
-                  gene.name AS gene,
-                  gene.id AS gene_id,
-                  0.5 AS score,
-                  1 AS evidence_count,
-                  ['disgenet'] AS sources
-                SKIP $offset LIMIT $limit
-            """,
-            "get_variants_for_disease": """
-                MATCH (disease:BioEntity)-[:has_variant]->(variant:BioEntity)-[:affects]->(gene:BioEntity)
-                WHERE disease.id = $disease_id
-                  AND variant.id STARTS WITH 'rs'
-                  AND gene.id STARTS WITH 'hgnc:'
-                  AND gene.obsolete = false
-                RETURN
-                  variant.id AS rsid,
-                  gene.name AS gene,
-                  gene.id AS gene_id,
-                  variant.p_value AS p_value,
-                  variant.odds_ratio AS odds_ratio,
-                  variant.trait AS trait
-                SKIP $offset LIMIT $limit
-            """,
-            "get_phenotypes_for_disease": """
-                MATCH (disease:BioEntity)-[:has_phenotype]->(phenotype:BioEntity)
-                WHERE disease.id = $disease_id
-                  AND phenotype.id STARTS WITH 'HP:'
-                RETURN
-                  phenotype.name AS phenotype,
-                  phenotype.id AS phenotype_id,
-                  'common' AS frequency,
-                  1 AS evidence_count
-                SKIP $offset LIMIT $limit
-            """,
-            "get_drugs_for_indication": """
-                MATCH (drug:BioEntity)-[:has_indication]->(disease:BioEntity)
-                WHERE disease.id = $disease_id
-                  AND (
-                    drug.id STARTS WITH 'chebi:' OR
-                    drug.id STARTS WITH 'drugbank:' OR
-                    drug.id STARTS WITH 'chembl:'
-                  )
-                  AND drug.obsolete = false
-                RETURN
-                  drug.name AS drug,
-                  drug.id AS drug_id,
-                  'approved' AS indication_type,
-                  4 AS max_phase,
-                  'marketed' AS status
-                SKIP $offset LIMIT $limit
-            """,
-            # ========================================================================
-            # Tool 6: Pathway Queries
-            # CORRECTED: Uses 'haspart' relationship (Pathway->Gene direction)
-            # ========================================================================
-            "search_pathway_by_name": """
-                // Search for pathways by name (fuzzy matching)
-                MATCH (p:BioEntity)
-                WHERE (
-                    p.name CONTAINS $name OR
-                    toLower(p.name) CONTAINS toLower($name)
-                  )
-                  AND (
-                    p.id STARTS WITH 'reactome:' OR
-                    p.id STARTS WITH 'wikipathways:' OR
-                    p.id STARTS WITH 'kegg.pathway:'
-                  )
-                  AND p.obsolete = false
-                RETURN
-                  p.name AS name,
-                  p.id AS pathway_id
-                ORDER BY size(p.name) ASC
-                LIMIT 10
-            """,
-            "search_disease_by_name": """
-                // Search for diseases by name (case-insensitive matching)
-                MATCH (d:BioEntity)
-                WHERE toLower(d.name) CONTAINS toLower($name)
-                  AND (
-                    d.id STARTS WITH 'doid:' OR
-                    d.id STARTS WITH 'mondo:' OR
-                    d.id STARTS WITH 'mesh:' OR
-                    d.id STARTS WITH 'hp:' OR
-                    d.id STARTS WITH 'efo:'
-                  )
-                  AND (d.obsolete = false OR d.obsolete IS NULL)
-                  AND d.name IS NOT NULL
-                RETURN
-                  d.name AS name,
-                  d.id AS disease_id,
-                  split(d.id, ':')[0] AS namespace
-                ORDER BY
-                  CASE WHEN toLower(d.name) = toLower($name) THEN 0 ELSE 1 END,
-                  size(d.name) ASC
-                LIMIT 10
-            """,
-            "search_drug_by_name": """
-                // Search for drugs by name (case-insensitive matching)
-                MATCH (d:BioEntity)
-                WHERE toLower(d.name) CONTAINS toLower($name)
-                  AND (
-                    d.id STARTS WITH 'chebi:' OR
-                    d.id STARTS WITH 'chembl:' OR
-                    d.id STARTS WITH 'pubchem:' OR
-                    d.id STARTS WITH 'drugbank:'
-                  )
-                  AND (d.obsolete = false OR d.obsolete IS NULL)
-                  AND d.name IS NOT NULL
-                RETURN
-                  d.name AS name,
-                  d.id AS drug_id,
-                  split(d.id, ':')[0] AS namespace
-                ORDER BY
-                  CASE WHEN toLower(d.name) = toLower($name) THEN 0 ELSE 1 END,
-                  size(d.name) ASC
-                LIMIT 10
-            """,
-            "get_genes_in_pathway": """
-                // CORRECTED: haspart goes FROM pathway TO gene
-                MATCH (p:BioEntity)-[:haspart]->(g:BioEntity)
-                WHERE p.id = $pathway_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND (
-                    p.id STARTS WITH 'reactome:' OR
-                    p.id STARTS WITH 'wikipathways:' OR
-                    p.id STARTS WITH 'kegg.pathway:'
-                  )
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  g.type AS type
-                SKIP $offset LIMIT $limit
-            """,
-            "get_pathways_for_gene": """
-                // CORRECTED: haspart goes FROM pathway TO gene
-                MATCH (p:BioEntity)-[:haspart]->(g:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND (
-                    p.id STARTS WITH 'reactome:' OR
-                    p.id STARTS WITH 'wikipathways:' OR
-                    p.id STARTS WITH 'kegg.pathway:'
-                  )
-                RETURN
-                  p.name AS pathway,
-                  p.id AS pathway_id,
-                  p.type AS pathway_type
-                SKIP $offset LIMIT $limit
-            """,
-            "get_shared_pathways_for_genes": """
-                // CORRECTED: haspart goes FROM pathway TO gene
-                MATCH (p:BioEntity)-[:haspart]->(g:BioEntity)
-                WHERE g.id IN $gene_ids
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND (
-                    p.id STARTS WITH 'reactome:' OR
-                    p.id STARTS WITH 'wikipathways:' OR
-                    p.id STARTS WITH 'kegg.pathway:'
-                  )
-                WITH p, collect(DISTINCT g.id) AS genes
-                WHERE size(genes) = size($gene_ids)
-                RETURN
-                  p.name AS pathway,
-                  p.id AS pathway_id,
-                  p.type AS pathway_type
-                SKIP $offset LIMIT $limit
-            """,
-            "is_gene_in_pathway": """
-                // CORRECTED: haspart goes FROM pathway TO gene
-                MATCH (p:BioEntity)-[:haspart]->(g:BioEntity)
-                WHERE g.id = $gene_id
-                  AND p.id = $pathway_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  count(*) > 0 AS is_member,
-                  p.name AS pathway,
-                  p.id AS pathway_id
-                LIMIT 1
-            """,
-            # ========================================================================
-            # Tool 7: Cell Line Queries
-            # CORRECTED: Uses direct 'mutated_in' relationship (Gene->CellLine)
-            # Note: Cell lines use CCLE IDs (e.g., ccle:A549_LUNG)
-            # ========================================================================
-            "get_mutations_for_cell_line": """
-                // CORRECTED: Direct Gene -[:mutated_in]-> CellLine relationship
-                // No intermediate mutation nodes, simpler than expected
-                // Support both exact match (ccle:A549_LUNG) and partial (A549)
-                MATCH (g:BioEntity)-[:mutated_in]->(c:BioEntity)
-                WHERE (c.id = $cell_line OR c.id CONTAINS $cell_line)
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND c.id STARTS WITH 'ccle:'
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  'mutation' AS mutation_type,
-                  null AS protein_change
-                SKIP $offset LIMIT $limit
-            """,
-            "get_copy_number_for_cell_line": """
-                // CORRECTED: Direct Gene -[:copy_number_altered_in]-> CellLine
-                // Support both exact match and partial match
-                MATCH (g:BioEntity)-[:copy_number_altered_in]->(c:BioEntity)
-                WHERE (c.id = $cell_line OR c.id CONTAINS $cell_line)
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND c.id STARTS WITH 'ccle:'
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  'altered' AS copy_number
-                LIMIT $limit
-            """,
-            "get_dependencies_for_cell_line": """
-                // Gene dependency data may not be in Neo4j
-                // Placeholder query - may need REST API fallback
-                MATCH (g:BioEntity)-[:codependent_with]-(other:BioEntity)
-                WHERE g.id = $cell_line
-                  AND other.id STARTS WITH 'hgnc:'
-                  AND other.obsolete = false
-                RETURN
-                  other.name AS gene,
-                  other.id AS gene_id
-                LIMIT $limit
-            """,
-            "get_expression_for_cell_line": """
-                // Expression data may not be in Neo4j
-                // Placeholder query - may need REST API fallback
-                MATCH (c:BioEntity)-[:expresses]->(g:BioEntity)
-                WHERE c.id = $cell_line
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id
-                LIMIT $limit
-            """,
-            "get_cell_lines_for_mutation": """
-                // CORRECTED: Direct Gene -[:mutated_in]-> CellLine
-                MATCH (g:BioEntity)-[:mutated_in]->(c:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND c.id STARTS WITH 'ccle:'
-                RETURN
-                  c.name AS cell_line,
-                  c.id AS ccle_id
-                SKIP $offset LIMIT $limit
-            """,
-            "is_mutated_in_cell_line": """
-                // CORRECTED: Direct Gene -[:mutated_in]-> CellLine
-                // Support both exact match and partial match
-                MATCH (g:BioEntity)-[:mutated_in]->(c:BioEntity)
-                WHERE g.id = $gene_id
-                  AND (c.id = $cell_line OR c.id CONTAINS $cell_line)
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  count(*) > 0 AS result
-                LIMIT 1
-            """,
-            # ========================================================================
-            # Tool 8: Clinical Trials Queries
-            # ========================================================================
-            "get_trials_for_drug": """
-                MATCH (d:BioEntity)-[:tested_in]->(t:BioEntity)
-                WHERE d.id = $drug_id
-                  AND t.id STARTS WITH 'clinicaltrials:'
-                RETURN
-                  split(t.id, ':')[1] AS nct_id,
-                  t.name AS title,
-                  null AS phase,
-                  null AS status,
-                  [] AS conditions,
-                  [] AS interventions
-                SKIP $offset LIMIT $limit
-            """,
-            "get_trials_for_disease": """
-                MATCH (dis:BioEntity)-[:has_trial]->(t:BioEntity)
-                WHERE dis.id = $disease_id
-                  AND t.id STARTS WITH 'clinicaltrials:'
-                RETURN
-                  split(t.id, ':')[1] AS nct_id,
-                  t.name AS title,
-                  null AS phase,
-                  null AS status,
-                  [] AS conditions,
-                  [] AS interventions
-                SKIP $offset LIMIT $limit
-            """,
-            "get_trial_by_id": """
-                MATCH (t:BioEntity)
-                WHERE t.id = 'clinicaltrials:' + $nct_id
-                RETURN
-                  split(t.id, ':')[1] AS nct_id,
-                  t.name AS title,
-                  null AS phase,
-                  null AS status,
-                  null AS start_date,
-                  null AS completion_date,
-                  [] AS conditions,
-                  [] AS interventions
-                LIMIT 1
-            """,
-            # ========================================================================
-            # Tool 9: Literature Queries
-            # ========================================================================
-            "get_statements_for_paper": """
-                MATCH (pub:Publication)-[:has_statement]->(s:Statement)
-                WHERE pub.pmid = $pmid
-                RETURN
-                  s.hash AS hash,
-                  s.type AS type,
-                  s.subj_name AS subj_name,
-                  s.subj_id AS subj_id,
-                  s.obj_name AS obj_name,
-                  s.obj_id AS obj_id,
-                  s.belief AS belief
-                SKIP $offset LIMIT $limit
-            """,
-            "get_evidences_for_stmt_hash": """
-                MATCH (s:Statement)-[:has_evidence]->(e:Evidence)
-                WHERE s.hash = $stmt_hash
-                RETURN
-                  e.text AS text,
-                  e.pmid AS pmid,
-                  e.source_api AS source_api
-                SKIP $offset LIMIT $limit
-            """,
-            "get_evidence_for_mesh": """
-                MATCH (pub:Publication)-[:has_mesh_term]->(m:MeshTerm)
-                WHERE m.term IN $mesh_terms
-                RETURN
-                  pub.pmid AS pmid,
-                  pub.title AS title,
-                  pub.journal AS journal,
-                  pub.year AS year
-                SKIP $offset LIMIT $limit
-            """,
-            "get_stmts_for_stmt_hashes": """
-                MATCH (s:Statement)
-                WHERE s.hash IN $stmt_hashes
-                RETURN
-                  s.hash AS hash,
-                  s.type AS type,
-                  s.subj_name AS subj_name,
-                  s.subj_id AS subj_id,
-                  s.obj_name AS obj_name,
-                  s.obj_id AS obj_id,
-                  s.belief AS belief
-                LIMIT 100
-            """,
-            # ========================================================================
-            # Tool 10: Variant Queries
-            # CORRECTED: Uses 'variant_gene_association' (Variant->Gene direction)
-            # Note: Variants use dbsnp: namespace (e.g., dbsnp:rs7412)
-            # ========================================================================
-            "get_variants_for_gene": """
-                // CORRECTED: Variant -[:variant_gene_association]-> Gene
-                MATCH (v:BioEntity)-[:variant_gene_association]->(g:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND v.id STARTS WITH 'dbsnp:'
-                RETURN
-                  v.id AS rsid,
-                  v.name AS variant_name,
-                  null AS chromosome,
-                  null AS position,
-                  null AS ref_allele,
-                  null AS alt_allele,
-                  null AS p_value
-                SKIP $offset LIMIT $limit
-            """,
-            "get_variants_for_disease": """
-                // CORRECTED: Disease -[:variant_disease_association]-> Variant
-                MATCH (d:BioEntity)-[:variant_disease_association]->(v:BioEntity)
-                WHERE d.id = $disease_id
-                  AND v.id STARTS WITH 'dbsnp:'
-                RETURN
-                  v.id AS rsid,
-                  v.name AS variant_name,
-                  null AS chromosome,
-                  null AS position,
-                  null AS ref_allele,
-                  null AS alt_allele,
-                  null AS p_value,
-                  null AS trait
-                SKIP $offset LIMIT $limit
-            """,
-            "get_variants_for_phenotype": """
-                // CORRECTED: Phenotype -[:variant_phenotype_association]-> Variant
-                MATCH (ph:BioEntity)-[:variant_phenotype_association]->(v:BioEntity)
-                WHERE ph.id = $phenotype_id
-                  AND v.id STARTS WITH 'dbsnp:'
-                RETURN
-                  v.id AS rsid,
-                  v.name AS variant_name,
-                  null AS chromosome,
-                  null AS position,
-                  null AS p_value,
-                  null AS trait
-                SKIP $offset LIMIT $limit
-            """,
-            "get_genes_for_variant": """
-                // CORRECTED: Variant -[:variant_gene_association]-> Gene
-                MATCH (v:BioEntity)-[:variant_gene_association]->(g:BioEntity)
-                WHERE v.id = $variant_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND v.id STARTS WITH 'dbsnp:'
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  g.type AS type
-                SKIP $offset LIMIT $limit
-            """,
-            "get_phenotypes_for_variant": """
-                // CORRECTED: Variant -[:variant_phenotype_association]-> Phenotype
-                MATCH (v:BioEntity)-[:variant_phenotype_association]->(ph:BioEntity)
-                WHERE v.id = $variant_id
-                  AND v.id STARTS WITH 'dbsnp:'
-                  AND ph.id STARTS WITH 'HP:'
-                RETURN
-                  ph.name AS phenotype,
-                  ph.id AS phenotype_id,
-                  ph.type AS type
-                SKIP $offset LIMIT $limit
-            """,
-            "is_variant_associated": """
-                // CORRECTED: Disease -[:variant_disease_association]-> Variant
-                MATCH (d:BioEntity)-[:variant_disease_association]->(v:BioEntity)
-                WHERE d.id = $disease_id
-                  AND v.id = $variant_id
-                  AND v.id STARTS WITH 'dbsnp:'
-                RETURN
-                  count(*) > 0 AS is_associated,
-                  null AS p_value
-                LIMIT 1
-            """,
-            # ========================================================================
-            # Tool 11: Identifier Resolution
-            # ========================================================================
-            "symbol_to_hgnc": """
-                MATCH (g:BioEntity)
-                WHERE g.name IN $symbols
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN g.name AS symbol, g.id AS hgnc_id
-            """,
-            "hgnc_to_symbol": """
-                MATCH (g:BioEntity)
-                WHERE g.id IN [id IN $hgnc_ids | CASE WHEN id STARTS WITH 'hgnc:' THEN id ELSE 'hgnc:' + id END]
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN g.id AS hgnc_id, g.name AS symbol
-            """,
-            "hgnc_to_uniprot": """
-                MATCH (g:BioEntity)-[:xref]-(u:BioEntity)
-                WHERE g.id IN [id IN $hgnc_ids | CASE WHEN id STARTS WITH 'hgnc:' THEN id ELSE 'hgnc:' + id END]
-                  AND g.obsolete = false
-                  AND u.id STARTS WITH 'uniprot:'
-                RETURN g.id AS hgnc_id, collect(DISTINCT u.id) AS uniprot_ids
-            """,
-            "map_identifiers": """
-                MATCH (source:BioEntity)
-                WHERE source.id IN $identifiers
-                OPTIONAL MATCH (source)-[:xref]-(target:BioEntity)
-                WHERE target.id STARTS WITH ($to_namespace + ':')
-                RETURN source.id AS source_id, collect(DISTINCT target.id) AS target_ids
-            """,
-            # ========================================================================
-            # Tool 12: Relationship Checking (10 types)
-            # ========================================================================
-            "is_drug_target": """
-                // Check both [:targets] and [:indra_rel] for drug-target relationships
-                MATCH (d:BioEntity), (t:BioEntity)
-                WHERE d.id = $drug_id
-                  AND t.id = $target_id
-                  AND (d.id STARTS WITH 'chebi:' OR d.id STARTS WITH 'chembl:' OR d.id STARTS WITH 'drugbank:')
-                  AND t.id STARTS WITH 'hgnc:'
-                OPTIONAL MATCH path1 = (d)-[:targets]->(t)
-                OPTIONAL MATCH path2 = (d)-[r:indra_rel]-(t)
-                WHERE r.stmt_type IN ['Inhibition', 'Activation', 'IncreaseAmount', 'DecreaseAmount']
-                WITH path1, path2
-                RETURN (path1 IS NOT NULL OR path2 IS NOT NULL) AS result
-            """,
-            "drug_has_indication": """
-                MATCH (d:BioEntity)-[:has_indication]->(dis:BioEntity)
-                WHERE d.id = $drug_id
-                  AND dis.id = $disease_id
-                  AND (d.id STARTS WITH 'chebi:' OR d.id STARTS WITH 'chembl:' OR d.id STARTS WITH 'drugbank:')
-                RETURN COUNT(*) > 0 AS result
-            """,
-            "is_side_effect_for_drug": """
-                MATCH (d:BioEntity)-[:has_side_effect]->(se:BioEntity)
-                WHERE d.id = $drug_id
-                  AND (se.name = $side_effect_id OR se.id = $side_effect_id)
-                  AND (d.id STARTS WITH 'chebi:' OR d.id STARTS WITH 'chembl:' OR d.id STARTS WITH 'drugbank:')
-                RETURN COUNT(*) > 0 AS result
-            """,
-            "is_gene_associated_with_disease": """
-                // Check both [:gene_disease_association] and [:indra_rel] for gene-disease relationships
-                MATCH (g:BioEntity), (d:BioEntity)
-                WHERE g.id = $gene_id
-                  AND d.id = $disease_id
-                  AND g.id STARTS WITH 'hgnc:'
-                OPTIONAL MATCH path1 = (g)-[:gene_disease_association]->(d)
-                OPTIONAL MATCH path2 = (g)-[r:indra_rel]-(d)
-                WITH path1, path2
-                RETURN (path1 IS NOT NULL OR path2 IS NOT NULL) AS result
-            """,
-            "has_phenotype": """
-                MATCH (d:BioEntity)-[:has_phenotype]->(p:BioEntity)
-                WHERE d.id = $disease_id
-                  AND (p.id = $phenotype_id OR p.name = $phenotype_id)
-                  AND p.id STARTS WITH 'HP:'
-                RETURN COUNT(*) > 0 AS result
-            """,
-            "is_gene_associated_with_phenotype": """
-                MATCH (g:BioEntity)-[:associated_with]->(p:BioEntity)
-                WHERE g.id = $gene_id
-                  AND (p.id = $phenotype_id OR p.name = $phenotype_id)
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND p.id STARTS WITH 'HP:'
-                RETURN COUNT(*) > 0 AS result
-            """,
-            # ========================================================================
-            # Tool 13: Ontology Hierarchy
-            # ========================================================================
-            "get_ontology_term": """
-                MATCH (term:BioEntity)
-                WHERE term.obsolete = false
-                  AND (
-                    ($term_id IS NOT NULL AND term.id = $term_id) OR
-                    ($name IS NOT NULL AND term.name = $name) OR
-                    ($namespace IS NOT NULL AND $term_id IS NOT NULL AND term.id = $namespace + ':' + $term_id)
-                  )
-                  AND (
-                    term.id STARTS WITH 'GO:' OR
-                    term.id STARTS WITH 'HP:' OR
-                    term.id STARTS WITH 'MONDO:' OR
-                    term.id STARTS WITH 'DOID:' OR
-                    term.id STARTS WITH 'EFO:' OR
-                    term.id STARTS WITH 'UBERON:' OR
-                    term.id STARTS WITH 'CL:' OR
-                    term.id STARTS WITH 'CHEBI:'
-                  )
-                RETURN
-                  term.name AS name,
-                  term.id AS id,
-                  split(term.id, ':')[0] AS namespace,
-                  term.definition AS definition
-                LIMIT 10
-            """,
-            "get_ontology_parents": """
-                MATCH path = (child:BioEntity)-[:isa|part_of*1..10]->(parent:BioEntity)
-                WHERE child.id = $term_id
-                  AND child.obsolete = false
-                  AND parent.obsolete = false
-                  AND LENGTH(path) <= $max_depth
-                RETURN
-                  parent.name AS name,
-                  parent.id AS curie,
-                  LENGTH(path) AS depth,
-                  type(last(relationships(path))) AS relationship
-                ORDER BY depth
-            """,
-            "get_ontology_children": """
-                MATCH path = (parent:BioEntity)<-[:isa|part_of*1..10]-(child:BioEntity)
-                WHERE parent.id = $term_id
-                  AND parent.obsolete = false
-                  AND child.obsolete = false
-                  AND LENGTH(path) <= $max_depth
-                RETURN
-                  child.name AS name,
-                  child.id AS curie,
-                  LENGTH(path) AS depth,
-                  type(last(relationships(path))) AS relationship
-                ORDER BY depth
-            """,
-            "get_ontology_hierarchy": """
-                MATCH (root:BioEntity)
-                WHERE root.id = $term_id
-                  AND root.obsolete = false
-                OPTIONAL MATCH parent_path = (root)-[:isa|part_of*1..10]->(parent:BioEntity)
-                WHERE parent.obsolete = false
-                  AND LENGTH(parent_path) <= $max_depth
-                OPTIONAL MATCH child_path = (root)<-[:isa|part_of*1..10]-(child:BioEntity)
-                WHERE child.obsolete = false
-                  AND LENGTH(child_path) <= $max_depth
-                RETURN
-                  root.name AS root_name,
-                  root.id AS root_id,
-                  collect(DISTINCT {name: parent.name, curie: parent.id, depth: LENGTH(parent_path), relationship: type(last(relationships(parent_path)))}) AS parents,
-                  collect(DISTINCT {name: child.name, curie: child.id, depth: LENGTH(child_path), relationship: type(last(relationships(child_path)))}) AS children
-            """,
-            # ========================================================================
-            # Tool 14: Cell Markers
-            # ========================================================================
-            "get_markers_for_cell_type": """
-                MATCH (g:BioEntity)-[:marker_for]->(ct:BioEntity)
-                WHERE (ct.name = $cell_type OR ct.id CONTAINS $cell_type)
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  'canonical' AS marker_type,
-                  'CellMarker' AS evidence
-                SKIP $offset LIMIT $limit
-            """,
-            "get_cell_types_for_marker": """
-                MATCH (g:BioEntity)-[:marker_for]->(ct:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  ct.name AS cell_type,
-                  ct.id AS cell_type_id,
-                  'unknown' AS tissue,
-                  'human' AS species
-                SKIP $offset LIMIT $limit
-            """,
-            "is_cell_marker": """
-                MATCH (g:BioEntity)-[:marker_for]->(ct:BioEntity)
-                WHERE g.id = $gene_id
-                  AND (ct.name = $cell_type OR ct.id CONTAINS $cell_type)
-                  AND g.id STARTS WITH 'hgnc:'
-                RETURN COUNT(*) > 0 AS result
-            """,
-            # ========================================================================
-            # Tool 16: Protein Functions  
-            # Implemented using GO term annotations (properties don't exist in Neo4j)
-            # ========================================================================
-            "get_enzyme_activities": """
-                // Get protein activities from GO term annotations
-                MATCH (g:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                OPTIONAL MATCH (g)-[r]->(go:BioEntity)
-                WHERE go.id STARTS WITH 'GO:'
-                  AND (
-                    // Kinase GO terms
-                    go.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773'] OR
-                    go.name CONTAINS 'kinase activity' OR
-                    // Phosphatase GO terms
-                    go.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138'] OR
-                    go.name CONTAINS 'phosphatase activity' OR
-                    // Transcription factor GO terms
-                    go.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227'] OR
-                    go.name CONTAINS 'DNA-binding transcription factor activity'
-                  )
-                WITH g, collect(DISTINCT go) AS go_terms
-                UNWIND go_terms AS go_term
-                WITH g, go_term,
-                  CASE
-                    WHEN go_term.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773']
-                      OR go_term.name CONTAINS 'kinase activity'
-                    THEN 'kinase'
-                    WHEN go_term.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138']
-                      OR go_term.name CONTAINS 'phosphatase activity'
-                    THEN 'phosphatase'
-                    WHEN go_term.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227']
-                      OR go_term.name CONTAINS 'DNA-binding transcription factor activity'
-                    THEN 'transcription_factor'
-                    ELSE null
-                  END AS activity
-                WHERE activity IS NOT NULL
-                RETURN DISTINCT
-                  activity AS activity,
-                  null AS ec_number,
-                  'high' AS confidence
-            """,
-            "get_genes_for_activity": """
-                // Find genes with specific activity using GO terms
-                MATCH (g:BioEntity)-[r]->(go:BioEntity)
-                WHERE g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND go.id STARTS WITH 'GO:'
-                  AND (
-                    // Kinase activity
-                    (toLower($activity) = 'kinase' AND (
-                      go.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773'] OR
-                      go.name CONTAINS 'kinase activity'
-                    )) OR
-                    // Phosphatase activity
-                    (toLower($activity) = 'phosphatase' AND (
-                      go.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138'] OR
-                      go.name CONTAINS 'phosphatase activity'
-                    )) OR
-                    // Transcription factor
-                    (toLower($activity) CONTAINS 'transcription' AND (
-                      go.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227'] OR
-                      go.name CONTAINS 'DNA-binding transcription factor activity'
-                    ))
-                  )
-                RETURN DISTINCT
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  g.type AS type
-                SKIP $offset LIMIT $limit
-            """,
-            "is_kinase": """
-                // Check if gene is a kinase using GO terms
-                MATCH (g:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                OPTIONAL MATCH (g)-[r]->(go:BioEntity)
-                WHERE go.id STARTS WITH 'GO:'
-                  AND (
-                    go.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773'] OR
-                    go.name CONTAINS 'kinase activity'
-                  )
-                RETURN count(go) > 0 AS result
-            """,
-            "is_phosphatase": """
-                // Check if gene is a phosphatase using GO terms
-                MATCH (g:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                OPTIONAL MATCH (g)-[r]->(go:BioEntity)
-                WHERE go.id STARTS WITH 'GO:'
-                  AND (
-                    go.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138'] OR
-                    go.name CONTAINS 'phosphatase activity'
-                  )
-                RETURN count(go) > 0 AS result
-            """,
-            "is_transcription_factor": """
-                // Check if gene is a transcription factor using GO terms
-                MATCH (g:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                OPTIONAL MATCH (g)-[r]->(go:BioEntity)
-                WHERE go.id STARTS WITH 'GO:'
-                  AND (
-                    go.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227'] OR
-                    go.name CONTAINS 'DNA-binding transcription factor activity'
-                  )
-                RETURN count(go) > 0 AS result
-            """,
-            "has_enzyme_activity": """
-                // Generic activity check using GO terms
-                MATCH (g:BioEntity)
-                WHERE g.id = $gene_id
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                OPTIONAL MATCH (g)-[r]->(go:BioEntity)
-                WHERE go.id STARTS WITH 'GO:'
-                  AND (
-                    CASE
-                      WHEN toLower($activity) = 'kinase' THEN (
-                        go.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773'] OR
-                        go.name CONTAINS 'kinase activity'
-                      )
-                      WHEN toLower($activity) = 'phosphatase' THEN (
-                        go.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138'] OR
-                        go.name CONTAINS 'phosphatase activity'
-                      )
-                      WHEN toLower($activity) CONTAINS 'transcription' THEN (
-                        go.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227'] OR
-                        go.name CONTAINS 'DNA-binding transcription factor activity'
-                      )
-                      ELSE false
-                    END
-                  )
-                RETURN count(go) > 0 AS result
-            """,
-            # ========================================================================
-            # Tool 1: Missing queries - domain_to_genes and phenotype_to_genes
-            # ========================================================================
-            "domain_to_genes": """
-                MATCH (g:BioEntity)-[:has_domain]->(d:BioEntity)
-                WHERE (d.name = $domain OR d.id CONTAINS $domain)
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND (
-                    d.id STARTS WITH 'interpro:' OR
-                    d.id STARTS WITH 'pfam:' OR
-                    d.id STARTS WITH 'prosite:'
-                  )
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  g.type AS type,
-                  d.name AS domain_name,
-                  d.id AS domain_id
-                SKIP $offset LIMIT $limit
-            """,
-            "phenotype_to_genes": """
-                MATCH (g:BioEntity)-[:associated_with]->(p:BioEntity)
-                WHERE (p.id = $phenotype OR p.name = $phenotype)
-                  AND p.id STARTS WITH 'HP:'
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  g.type AS type,
-                  p.name AS phenotype_name,
-                  p.id AS phenotype_id
-                SKIP $offset LIMIT $limit
-            """,
-            # ========================================================================
-            # Tool 2: Subnetwork extraction - INDRA relationship queries
-            # CORRECTED: Uses indra_rel relationships, not Statement nodes
-            # ========================================================================
-            "extract_subnetwork": """
-                // Direct mode: Find direct INDRA relationships between specified genes
-                MATCH (g1:BioEntity)-[r:indra_rel]-(g2:BioEntity)
-                WHERE g1.id IN $gene_ids
-                  AND g2.id IN $gene_ids
-                  AND g1.id <> g2.id
-                  AND r.evidence_count >= $min_evidence
-                  AND r.belief >= $min_belief
-                  AND g1.id STARTS WITH 'hgnc:'
-                  AND g2.id STARTS WITH 'hgnc:'
-                WITH g1, g2, r
-                ORDER BY r.belief DESC, r.evidence_count DESC
-                LIMIT $max_statements
-                RETURN
-                  r.stmt_hash AS hash,
-                  r.stmt_type AS type,
-                  g1.name AS subj_name,
-                  g1.id AS subj_id,
-                  g2.name AS obj_name,
-                  g2.id AS obj_id,
-                  null AS residue,
-                  null AS position,
-                  r.evidence_count AS evidence_count,
-                  r.belief AS belief,
-                  r.source_counts AS sources
-            """,
-            "indra_subnetwork": """
-                // Direct edges between genes via indra_rel relationships
-                MATCH (g1:BioEntity)-[r:indra_rel]-(g2:BioEntity)
-                WHERE g1.id IN $gene_ids
-                  AND g2.id IN $gene_ids
-                  AND g1.id <> g2.id
-                  AND r.evidence_count >= $min_evidence
-                  AND r.belief >= $min_belief
-                  AND g1.id STARTS WITH 'hgnc:'
-                  AND g2.id STARTS WITH 'hgnc:'
-                WITH g1, g2, r
-                ORDER BY r.belief DESC, r.evidence_count DESC
-                LIMIT $max_statements
-                RETURN
-                  r.stmt_hash AS hash,
-                  r.stmt_type AS type,
-                  g1.name AS subj_name,
-                  g1.id AS subj_id,
-                  g2.name AS obj_name,
-                  g2.id AS obj_id,
-                  null AS residue,
-                  null AS position,
-                  r.evidence_count AS evidence_count,
-                  r.belief AS belief,
-                  r.source_counts AS sources
-            """,
-            "indra_mediated_subnetwork": """
-                // Two-hop paths: A→X→B via indra_rel relationships
-                // Find genes that mediate relationships between input genes
-                MATCH (g1:BioEntity)-[r1:indra_rel]-(mediator:BioEntity)-[r2:indra_rel]-(g2:BioEntity)
-                WHERE g1.id IN $gene_ids
-                  AND g2.id IN $gene_ids
-                  AND g1.id <> g2.id
-                  AND mediator.id STARTS WITH 'hgnc:'
-                  AND NOT mediator.id IN $gene_ids
-                  AND r1.evidence_count >= $min_evidence
-                  AND r2.evidence_count >= $min_evidence
-                  AND r1.belief >= $min_belief
-                  AND r2.belief >= $min_belief
-                  AND g1.id STARTS WITH 'hgnc:'
-                  AND g2.id STARTS WITH 'hgnc:'
-                WITH g1, mediator, g2, r1, r2
-                ORDER BY (r1.belief + r2.belief) / 2.0 DESC
-                LIMIT $max_statements
-                WITH g1, mediator, g2, r1, r2
-                UNWIND [
-                  {
-                    hash: r1.stmt_hash,
-                    type: r1.stmt_type,
-                    subj_name: g1.name,
-                    subj_id: g1.id,
-                    obj_name: mediator.name,
-                    obj_id: mediator.id,
-                    evidence_count: r1.evidence_count,
-                    belief: r1.belief,
-                    sources: r1.source_counts
-                  },
-                  {
-                    hash: r2.stmt_hash,
-                    type: r2.stmt_type,
-                    subj_name: mediator.name,
-                    subj_id: mediator.id,
-                    obj_name: g2.name,
-                    obj_id: g2.id,
-                    evidence_count: r2.evidence_count,
-                    belief: r2.belief,
-                    sources: r2.source_counts
-                  }
-                ] AS stmt
-                RETURN DISTINCT
-                  stmt.hash AS hash,
-                  stmt.type AS type,
-                  stmt.subj_name AS subj_name,
-                  stmt.subj_id AS subj_id,
-                  stmt.obj_name AS obj_name,
-                  stmt.obj_id AS obj_id,
-                  null AS residue,
-                  null AS position,
-                  stmt.evidence_count AS evidence_count,
-                  stmt.belief AS belief,
-                  stmt.sources AS sources
-            """,
-            "source_target_analysis": """
-                // One source gene to multiple targets via indra_rel
-                MATCH (source:BioEntity)-[r:indra_rel]->(target:BioEntity)
-                WHERE source.id = $source_gene_id
-                  AND ($target_gene_ids IS NULL OR target.id IN $target_gene_ids)
-                  AND r.evidence_count >= $min_evidence
-                  AND r.belief >= $min_belief
-                  AND source.id STARTS WITH 'hgnc:'
-                  AND target.id STARTS WITH 'hgnc:'
-                WITH source, target, r
-                ORDER BY r.belief DESC, r.evidence_count DESC
-                LIMIT $max_statements
-                RETURN
-                  r.stmt_hash AS hash,
-                  r.stmt_type AS type,
-                  source.name AS subj_name,
-                  source.id AS subj_id,
-                  target.name AS obj_name,
-                  target.id AS obj_id,
-                  null AS residue,
-                  null AS position,
-                  r.evidence_count AS evidence_count,
-                  r.belief AS belief,
-                  r.source_counts AS sources
-            """,
-            # ========================================================================
-            # Tool 3: Enrichment analysis placeholder
-            # ========================================================================
-            "enrichment_analysis": """
-                // Placeholder - enrichment requires statistical computation
-                // This query would need backend support or client-side calculation
-                MATCH (g:BioEntity)
-                WHERE g.id IN $gene_ids
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  'enrichment_not_implemented' AS note
-                LIMIT 10
-            """,
-            # Health check
-            "health_check": """
-                RETURN 1 AS status
-            """,
-            # ========================================================================
-            # Tool 1: Integration test aliases (accept different param names)
-            # ========================================================================
-            "gene_to_features": """
-                MATCH (g:BioEntity)
-                WHERE (g.name = $gene OR g.id = $gene OR g.id = ('hgnc:' + $gene))
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                RETURN
-                  g.name AS name,
-                  g.id AS id,
-                  g.type AS type
-                LIMIT 1
-            """,
-            "tissue_to_genes": """
-                MATCH (g:BioEntity)-[:expressed_in]->(t:BioEntity)
-                WHERE (t.name = $tissue OR t.id = $tissue OR t.id CONTAINS $tissue)
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND t.id STARTS WITH 'uberon:'
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  g.type AS type
-                SKIP $offset LIMIT $limit
-            """,
-            "go_to_genes": """
-                MATCH (g:BioEntity)-[r]->(go:BioEntity)
-                WHERE (go.id = $go_term OR go.name = $go_term)
-                  AND g.id STARTS WITH 'hgnc:'
-                  AND g.obsolete = false
-                  AND go.id STARTS WITH 'GO:'
-                RETURN
-                  g.name AS gene,
-                  g.id AS gene_id,
-                  g.type AS type,
-                  type(r) AS relationship
-                SKIP $offset LIMIT $limit
-            """,
-        }
-
-        if resolved_query_name not in queries:
-            raise ValueError(f"Unknown query: {query_name}")
-
-        return queries[resolved_query_name]
+        return get_query(query_name).cypher
 
     async def health_check(self) -> bool:
         """
@@ -2559,25 +1590,18 @@ class Neo4jClient:
         if self.driver is None:
             raise RuntimeError("Neo4j client not connected")
 
-        try:
-            async with self.get_session() as session:
-                if timeout:
-                    result = await asyncio.wait_for(
-                        session.run(cypher, **params),
-                        timeout=timeout / 1000.0,
-                    )
-                else:
-                    result = await session.run(cypher, **params)
-
-                records = await result.data()
-                return records
-
-        except asyncio.TimeoutError:
-            raise Neo4jError(f"Query timeout after {timeout}ms")
+        async with self._track_query("raw_cypher", timeout), self.get_session() as session:
+            return await self._run_managed(
+                session,
+                cypher,
+                params,
+                read_only=is_read_only_cypher(cypher),
+                timeout=timeout,
+            )
 
     async def _execute_subnetwork_extraction(self, params: dict[str, Any]) -> dict[str, Any]:
         """
-        Execute subnetwork extraction using the SubnetworkClient.
+        Execute subnetwork extraction using the AsyncSubnetworkClient.
 
         Args:
             params: Query parameters including:
@@ -2587,8 +1611,8 @@ class Neo4jClient:
                 - min_evidence: Minimum evidence count (default: 1)
                 - min_belief: Minimum belief score (default: 0.0)
                 - max_statements: Maximum statements to return (default: 100)
-                - tissue: Optional tissue filter
-                - go_term: Optional GO term filter
+                - tissue: Optional tissue filter (direct mode only)
+                - go_term: Optional GO term filter (direct mode only)
 
         Returns:
             Dict with:
@@ -2600,8 +1624,10 @@ class Neo4jClient:
         """
         logger.info(f"Executing subnetwork extraction, mode: {params.get('mode', 'direct')}")
 
-        # Create subnetwork client
-        subnetwork_client = SubnetworkClient(neo4j_client=self)
+        # Subnetworks run natively on the async driver (filters applied in Cypher)
+        subnetwork_client = AsyncSubnetworkClient(
+            neo4j_client=self, timeout=self.subnetwork_timeout or self.default_timeout
+        )
 
         try:
             mode = params.get("mode", "direct")
@@ -2624,9 +1650,9 @@ class Neo4jClient:
             tissue = params.get("tissue")
             go_term = params.get("go_term")
 
-            # Route to appropriate SubnetworkClient method based on mode
+            # Route to the subnetwork method for this mode (tissue/GO context: direct only)
             if mode == "direct":
-                result = subnetwork_client.extract_direct(
+                result = await subnetwork_client.extract_direct(
                     gene_ids=gene_ids,
                     statement_types=statement_types,
                     min_evidence=min_evidence,
@@ -2636,34 +1662,28 @@ class Neo4jClient:
                     go_term=go_term,
                 )
             elif mode == "mediated":
-                result = subnetwork_client.extract_mediated(
+                result = await subnetwork_client.extract_mediated(
                     gene_ids=gene_ids,
                     statement_types=statement_types,
                     min_evidence=min_evidence,
                     min_belief=min_belief,
                     max_statements=max_statements,
-                    tissue=tissue,
-                    go_term=go_term,
                 )
             elif mode == "shared_upstream":
-                result = subnetwork_client.extract_shared_upstream(
+                result = await subnetwork_client.extract_shared_upstream(
                     gene_ids=gene_ids,
                     statement_types=statement_types,
                     min_evidence=min_evidence,
                     min_belief=min_belief,
                     max_statements=max_statements,
-                    tissue=tissue,
-                    go_term=go_term,
                 )
             elif mode == "shared_downstream":
-                result = subnetwork_client.extract_shared_downstream(
+                result = await subnetwork_client.extract_shared_downstream(
                     gene_ids=gene_ids,
                     statement_types=statement_types,
                     min_evidence=min_evidence,
                     min_belief=min_belief,
                     max_statements=max_statements,
-                    tissue=tissue,
-                    go_term=go_term,
                 )
             else:
                 logger.warning(f"Unknown subnetwork mode: {mode}")
@@ -2695,11 +1715,15 @@ class Neo4jClient:
         Args:
             params: Enrichment parameters including:
                 - gene_ids: List of gene CURIEs
-                - analysis_type: "discrete", "continuous", "signed", "metabolite"
+                - analysis_type: "discrete", "continuous", "batch", "signed", "metabolite"
                 - source: "go", "reactome", "wikipathways", etc.
                 - alpha: Significance threshold
                 - correction_method: Multiple testing correction
                 - background_genes: Optional background gene set
+                - ranked_genes: Gene -> score (continuous)
+                - permutations: GSEA permutations (continuous)
+                - gene_lists: List name -> gene CURIEs (batch)
+                - keep_insignificant: Keep non-significant terms (continuous, batch)
 
         Returns:
             Enrichment results dict with success flag and results list
@@ -2710,14 +1734,28 @@ class Neo4jClient:
         enrichment_client = EnrichmentClient(neo4j_client=self)
 
         try:
+            analysis_type = params.get("analysis_type", "discrete")
+            options: dict[str, Any] = {
+                "alpha": params.get("alpha", 0.05),
+                "correction_method": params.get("correction_method", "fdr_bh"),
+            }
+            if analysis_type == "continuous":
+                options["ranked_genes"] = params.get("ranked_genes") or {}
+                options["permutations"] = params.get("permutations", DEFAULT_PERMUTATIONS)
+            else:
+                options["background_gene_ids"] = params.get("background_genes")
+            if analysis_type == "batch":
+                options["gene_lists"] = params.get("gene_lists") or {}
+            if analysis_type in ("continuous", "batch"):
+                options["keep_insignificant"] = params.get("keep_insignificant", False)
+
             # Run enrichment
-            result = enrichment_client.run_enrichment(
+            result = await self._enrichment_executor.run(
+                enrichment_client.run_enrichment,
                 gene_ids=params.get("gene_ids", []),
                 source=params.get("source", "go"),
-                analysis_type=params.get("analysis_type", "discrete"),
-                background_gene_ids=params.get("background_genes"),
-                alpha=params.get("alpha", 0.05),
-                correction_method=params.get("correction_method", "fdr_bh"),
+                analysis_type=analysis_type,
+                **options,
             )
 
             logger.info(f"Enrichment analysis completed: {len(result.get('results', []))} results")
@@ -2731,6 +1769,51 @@ class Neo4jClient:
                 "results": [],
             }
 
+    async def _execute_kinase_analysis(self, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute kinase-substrate enrichment over the cached kinase index.
+
+        Args:
+            params: Kinase analysis parameters including:
+                - phosphosites: Query phosphosites (GENE_S123)
+                - background: Optional background phosphosites
+                - alpha: Significance threshold
+                - correction_method: Multiple testing correction
+                - timeout: Milliseconds to wait for an index still being built
+
+        Returns:
+            Kinase enrichment results dict with success flag and results list
+        """
+        phosphosites = params.get("phosphosites", [])
+        logger.info(f"Executing kinase enrichment: {len(phosphosites)} phosphosites")
+
+        try:
+            timeout = params.get("timeout") or self.default_timeout
+            index = await get_kinase_index(self, wait=timeout / 1000 if timeout else None)
+            df = await self._enrichment_executor.run(
+                index.enrichment,
+                phosphosites,
+                background=params.get("background"),
+                alpha=params.get("alpha", 0.05),
+                correction_method=params.get("correction_method", "fdr_bh"),
+            )
+            results = table_to_records(df)
+
+            logger.info(f"Kinase enrichment completed: {len(results)} kinases")
+            return {
+                "success": True,
+                "results": results,
+                "total_phosphosites": len(phosphosites),
+            }
+
+        except Exception as e:
+            logger.error(f"Kinase enrichment failed: {e}", exc_info=True)
+            return {
+                "success": False,
+                "error": str(e),
+                "results": [],
+            }
+
     async def _execute_disease_query(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Execute disease query using the DiseaseClient.
@@ -2762,7 +1845,8 @@ class Neo4jClient:
         try:
             # Route to appropriate method based on mode
             if mode == "disease_to_mechanisms":
-                result = disease_client.get_disease_mechanisms(
+                result = await self._domain_executor.run(
+                    disease_client.get_disease_mechanisms,
                     disease_id=params.get("disease_id"),
                     include_genes=params.get("include_genes", True),
                     include_phenotypes=params.get("include_phenotypes", True),
@@ -2770,18 +1854,21 @@ class Neo4jClient:
                     evidence_sources=params.get("evidence_sources"),
                 )
             elif mode == "gene_to_diseases":
-                result = disease_client.find_diseases_for_gene(
+                result = await self._domain_executor.run(
+                    disease_client.find_diseases_for_gene,
                     gene_id=params.get("gene_id"),
                     limit=params.get("limit", 20),
                     min_evidence=params.get("min_evidence", 1),
                 )
             elif mode == "phenotype_to_diseases":
-                result = disease_client.find_diseases_for_phenotype(
+                result = await self._domain_executor.run(
+                    disease_client.find_diseases_for_phenotype,
                     phenotype_id=params.get("phenotype_id"),
                     limit=params.get("limit", 20),
                 )
             elif mode == "check_association":
-                result = disease_client.check_gene_disease_association(
+                result = await self._domain_executor.run(
+                    disease_client.check_gene_disease_association,
                     gene_id=params.get("gene_id"),
                     disease_id=params.get("disease_id"),
                 )
@@ -2831,23 +1918,27 @@ class Neo4jClient:
         try:
             # Route to appropriate method based on mode
             if mode == "drug_to_profile":
-                result = drug_client.get_drug_profile(
+                result = await self._domain_executor.run(
+                    drug_client.get_drug_profile,
                     drug_id=params.get("drug_id"),
                     include_targets=params.get("include_targets", True),
                     include_indications=params.get("include_indications", True),
                     include_side_effects=params.get("include_side_effects", True),
                 )
             elif mode == "target_to_drugs":
-                result = drug_client.find_drugs_for_target(
+                result = await self._domain_executor.run(
+                    drug_client.find_drugs_for_target,
                     target_id=params.get("target_id"),
                     action_types=params.get("action_types"),
                 )
             elif mode == "indication_to_drugs":
-                result = drug_client.find_drugs_for_indication(
+                result = await self._domain_executor.run(
+                    drug_client.find_drugs_for_indication,
                     disease_id=params.get("disease_id"),
                 )
             elif mode == "side_effect_to_drugs":
-                result = drug_client.find_drugs_for_side_effect(
+                result = await self._domain_executor.run(
+                    drug_client.find_drugs_for_side_effect,
                     side_effect=params.get("side_effect_id"),
                 )
             else:
@@ -2889,28 +1980,32 @@ class Neo4jClient:
         try:
             # Route to appropriate method based on mode
             if mode == "get_genes":
-                result = pathway_client.get_genes_in_pathway(
+                result = await self._domain_executor.run(
+                    pathway_client.get_genes_in_pathway,
                     pathway_id=params.get("pathway_id"),
                     source=params.get("source"),
                     limit=params.get("limit", 20),
                     offset=params.get("offset", 0),
                 )
             elif mode == "get_pathways":
-                result = pathway_client.get_pathways_for_gene(
+                result = await self._domain_executor.run(
+                    pathway_client.get_pathways_for_gene,
                     gene_id=params.get("gene_id"),
                     source=params.get("source"),
                     limit=params.get("limit", 20),
                     offset=params.get("offset", 0),
                 )
             elif mode == "find_shared":
-                result = pathway_client.get_shared_pathways(
+                result = await self._domain_executor.run(
+                    pathway_client.get_shared_pathways,
                     gene_ids=params.get("gene_ids", []),
                     source=params.get("source"),
                     limit=params.get("limit", 20),
                     offset=params.get("offset", 0),
                 )
             elif mode == "check_membership":
-                result = pathway_client.check_membership(
+                result = await self._domain_executor.run(
+                    pathway_client.check_membership,
                     gene_id=params.get("gene_id"),
                     pathway_id=params.get("pathway_id"),
                 )
@@ -2957,7 +2052,8 @@ class Neo4jClient:
         try:
             # Route to appropriate method based on mode
             if mode == "get_properties":
-                result = cell_line_client.get_cell_line_profile(
+                result = await self._domain_executor.run(
+                    cell_line_client.get_cell_line_profile,
                     cell_line=params.get("cell_line"),
                     include_mutations=params.get("include_mutations", True),
                     include_copy_number=params.get("include_copy_number", False),
@@ -2965,15 +2061,18 @@ class Neo4jClient:
                     include_expression=params.get("include_expression", False),
                 )
             elif mode == "get_mutated_genes":
-                result = cell_line_client.get_mutated_genes(
+                result = await self._domain_executor.run(
+                    cell_line_client.get_mutated_genes,
                     cell_line=params.get("cell_line"),
                 )
             elif mode == "get_cell_lines_with_mutation":
-                result = cell_line_client.get_cell_lines_with_mutation(
+                result = await self._domain_executor.run(
+                    cell_line_client.get_cell_lines_with_mutation,
                     gene_id=params.get("gene_id"),
                 )
             elif mode == "check_mutation":
-                result = cell_line_client.check_mutation(
+                result = await self._domain_executor.run(
+                    cell_line_client.check_mutation,
                     cell_line=params.get("cell_line"),
                     gene_id=params.get("gene_id"),
                 )
@@ -3017,19 +2116,22 @@ class Neo4jClient:
         try:
             # Route to appropriate method based on mode
             if mode == "get_for_drug":
-                result = trial_client.get_drug_trials(
+                result = await self._domain_executor.run(
+                    trial_client.get_drug_trials,
                     drug_id=params.get("drug_id"),
                     phase=params.get("phase"),
                     status=params.get("status"),
                 )
             elif mode == "get_for_disease":
-                result = trial_client.get_disease_trials(
+                result = await self._domain_executor.run(
+                    trial_client.get_disease_trials,
                     disease_id=params.get("disease_id"),
                     phase=params.get("phase"),
                     status=params.get("status"),
                 )
             elif mode == "get_by_id":
-                result = trial_client.get_trial_details(
+                result = await self._domain_executor.run(
+                    trial_client.get_trial_details,
                     trial_id=params.get("trial_id"),
                 )
             else:
@@ -3073,36 +2175,42 @@ class Neo4jClient:
         try:
             # Route to appropriate method based on mode
             if mode == "get_for_gene":
-                result = variant_client.get_gene_variants(
+                result = await self._domain_executor.run(
+                    variant_client.get_gene_variants,
                     gene_id=params.get("gene_id"),
                     max_p_value=params.get("max_p_value", 1e-5),
                     min_p_value=params.get("min_p_value"),
                     source=params.get("source"),
                 )
             elif mode == "get_for_disease":
-                result = variant_client.get_disease_variants(
+                result = await self._domain_executor.run(
+                    variant_client.get_disease_variants,
                     disease_id=params.get("disease_id"),
                     max_p_value=params.get("max_p_value", 1e-5),
                     min_p_value=params.get("min_p_value"),
                     source=params.get("source"),
                 )
             elif mode == "variant_to_genes":
-                result = variant_client.get_variant_genes(
+                result = await self._domain_executor.run(
+                    variant_client.get_variant_genes,
                     variant_id=params.get("variant_id"),
                 )
             elif mode == "variant_to_phenotypes":
-                result = variant_client.get_variant_phenotypes(
+                result = await self._domain_executor.run(
+                    variant_client.get_variant_phenotypes,
                     variant_id=params.get("variant_id"),
                     max_p_value=params.get("max_p_value", 1e-5),
                 )
             elif mode == "get_for_phenotype":
-                result = variant_client.get_phenotype_variants(
+                result = await self._domain_executor.run(
+                    variant_client.get_phenotype_variants,
                     phenotype=params.get("phenotype"),
                     max_p_value=params.get("max_p_value", 1e-5),
                     min_p_value=params.get("min_p_value"),
                 )
             elif mode == "variant_to_diseases":
-                result = variant_client.get_variant_diseases(
+                result = await self._domain_executor.run(
+                    variant_client.get_variant_diseases,
                     variant_id=params.get("variant_id"),
                     max_p_value=params.get("max_p_value", 1e-5),
                 )
@@ -3146,22 +2254,26 @@ class Neo4jClient:
         try:
             # Route to appropriate method based on mode
             if mode == "get_statements_for_pmid":
-                result = literature_client.get_paper_statements(
+                result = await self._domain_executor.run(
+                    literature_client.get_paper_statements,
                     pmid=params.get("pmid"),
                     include_evidence_text=params.get("include_evidence_text", True),
                     max_evidence_per_statement=params.get("max_evidence_per_statement", 5),
                 )
             elif mode == "get_evidence_for_statement":
-                result = literature_client.get_statement_evidence(
+                result = await self._domain_executor.run(
+                    literature_client.get_statement_evidence,
                     statement_hash=params.get("statement_hash"),
                     include_evidence_text=params.get("include_evidence_text", True),
                 )
             elif mode == "search_by_mesh":
-                result = literature_client.search_mesh_literature(
+                result = await self._domain_executor.run(
+                    literature_client.search_mesh_literature,
                     mesh_terms=params.get("mesh_terms", []),
                 )
             elif mode == "get_statements_by_hashes":
-                result = literature_client.get_statements_by_hashes(
+                result = await self._domain_executor.run(
+                    literature_client.get_statements_by_hashes,
                     statement_hashes=params.get("statement_hashes", []),
                     include_evidence_text=params.get("include_evidence_text", True),
                     max_evidence_per_statement=params.get("max_evidence_per_statement", 5),
@@ -3215,7 +2327,8 @@ class Neo4jClient:
 
             if direction:
                 # Full hierarchy query with direction
-                result = ontology_client.get_hierarchy(
+                result = await self._domain_executor.run(
+                    ontology_client.get_hierarchy,
                     term=term_id,
                     direction=direction,
                     max_depth=max_depth,
@@ -3223,7 +2336,8 @@ class Neo4jClient:
             else:
                 # Determine direction from context or default to "both"
                 # This allows backward compatibility with older calling patterns
-                result = ontology_client.get_hierarchy(
+                result = await self._domain_executor.run(
+                    ontology_client.get_hierarchy,
                     term=term_id,
                     direction="both",
                     max_depth=max_depth,
@@ -3300,19 +2414,22 @@ class Neo4jClient:
         try:
             # Route to appropriate method based on mode
             if mode == "get_markers":
-                result = cell_marker_client.get_cell_type_markers(
+                result = await self._domain_executor.run(
+                    cell_marker_client.get_cell_type_markers,
                     cell_type=params.get("cell_type"),
                     species=params.get("species", "human"),
                     tissue=params.get("tissue"),
                 )
             elif mode == "get_cell_types":
-                result = cell_marker_client.get_marker_cell_types(
+                result = await self._domain_executor.run(
+                    cell_marker_client.get_marker_cell_types,
                     marker_gene=params.get("marker"),
                     species=params.get("species", "human"),
                     tissue=params.get("tissue"),
                 )
             elif mode == "check_marker":
-                result = cell_marker_client.check_marker_status(
+                result = await self._domain_executor.run(
+                    cell_marker_client.check_marker_status,
                     cell_type=params.get("cell_type"),
                     marker_gene=params.get("marker"),
                 )
@@ -10,13 +10,34 @@ import logging
 from typing import Any, Dict, List, Optional, Tuple
 
 from indra_cogex.client.neo4j_client import Neo4jClient, autoclient
-from indra_cogex.client.queries import (
-    get_ontology_parent_terms,
-    get_ontology_child_terms,
-)
 
 logger = logging.getLogger(__name__)
 
+# Hierarchy traversal: one depth-bounded query per direction. Reachable terms
+# are collected as DISTINCT nodes without binding the path, which lets the
+# planner expand level by level and prune nodes already seen instead of
+# enumerating every path (exponential in dense DAGs such as GO). Each term is
+# then reported at its shortest distance from the start term, with the type
+# of the last edge on that shortest path.
+_CLOSURE_QUERY = """
+    MATCH (start:BioEntity {{id: $term_id}}){pattern}(term:BioEntity)
+    WITH DISTINCT start, term
+    MATCH path = shortestPath((start){pattern}(term))
+    RETURN term.id, term.name, length(path), type(last(relationships(path)))
+    ORDER BY length(path), term.id
+"""
+
+_DIRECTION_PATTERNS = {
+    "parents": "-[:isa|partof*1..{max_depth}]->",
+    "children": "<-[:isa|partof*1..{max_depth}]-",
+}
+
+_RELATIONSHIP_NAMES = {"isa": "is_a", "partof": "part_of"}
+
+# Namespaces whose graph IDs keep an uppercase prefix (e.g. "GO:0006915");
+# all others are lowercase (e.g. "mondo:0004975")
+_UPPERCASE_PREFIXES = {"GO", "HP"}
+
 
 class OntologyClient:
     """
@@ -313,54 +334,60 @@ class OntologyClient:
 
         return (namespace.upper(), identifier)
 
-    def _format_term_dict(self, node: Any, depth: int = 1) -> Dict[str, Any]:
+    def _graph_id(self, namespace: str, identifier: str) -> str:
         """
-        Format ontology term node as dictionary.
+        Build the graph node ID for a parsed term.
 
         Args:
-            node: CoGEx Node object from ontology query
-            depth: Depth level in hierarchy (1 = immediate parent/child)
+            namespace: Uppercase namespace from _parse_term_id
+            identifier: Term identifier
+
+        Returns:
+            Node ID as stored in CoGEx (e.g., "GO:0006915", "mondo:0004975")
+        """
+        if namespace in _UPPERCASE_PREFIXES:
+            return f"{namespace}:{identifier}"
+        return f"{namespace.lower()}:{identifier}"
+
+    def _format_term_row(
+        self,
+        curie: str,
+        name: Optional[str],
+        depth: int,
+        relationship: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Format an ontology term row as dictionary.
+
+        Args:
+            curie: Term ID as stored in the graph (e.g., "GO:0006915")
+            name: Term name
+            depth: Distance from the query term (1 = immediate parent/child)
+            relationship: Graph relationship type of the last hop ("isa", "partof")
 
         Returns:
             Formatted term dictionary with standardized fields
 
         Example:
-            >>> node = Node(db_ns="GO", db_id="0006915", labels=["BiologicalProcess"])
-            >>> formatted = client._format_term_dict(node, depth=2)
-            >>> formatted
+            >>> client._format_term_row("GO:0012501", "programmed cell death", 1, "isa")
             {
-                "curie": "go:0006915",
-                "name": "apoptotic process",
+                "curie": "go:0012501",
+                "name": "programmed cell death",
                 "namespace": "go",
-                "identifier": "0006915",
-                "depth": 2,
+                "identifier": "0012501",
+                "depth": 1,
                 "relationship": "is_a"
             }
         """
-        # Extract namespace and identifier
-        namespace = getattr(node, "db_ns", "unknown")
-        identifier = getattr(node, "db_id", "unknown")
-
-        # Extract name (may be in different attributes)
-        name = None
-        if hasattr(node, "name"):
-            name = node.name
-        elif hasattr(node, "data") and isinstance(node.data, dict):
-            name = node.data.get("name")
-
-        if not name:
-            name = f"{namespace}:{identifier}"
-
-        # Build CURIE
-        curie = f"{namespace.lower()}:{identifier}"
+        namespace, _, identifier = curie.partition(":")
 
         return {
-            "curie": curie,
-            "name": name,
+            "curie": f"{namespace.lower()}:{identifier}",
+            "name": name or curie,
             "namespace": namespace.lower(),
             "identifier": identifier,
             "depth": depth,
-            "relationship": "is_a",  # Default relationship type
+            "relationship": _RELATIONSHIP_NAMES.get(relationship, relationship or "is_a"),
         }
 
     def _traverse_hierarchy(
@@ -371,10 +398,11 @@ class OntologyClient:
         client: Neo4jClient,
     ) -> List[Dict[str, Any]]:
         """
-        Recursively traverse ontology hierarchy up to max_depth.
+        Collect all terms within max_depth of a term in one query.
 
-        This implements breadth-first traversal to collect all terms
-        within the specified depth range.
+        Runs a single depth-bounded match over `isa` and `partof` edges.
+        Reachable terms are deduplicated as nodes (not paths) and reported
+        at their shortest depth.
 
         Args:
             term: Starting ontology term CURIE
@@ -383,7 +411,7 @@ class OntologyClient:
             client: Neo4j client
 
         Returns:
-            List of formatted term dictionaries with depth information
+            List of formatted term dictionaries ordered by depth
 
         Example:
             >>> terms = client._traverse_hierarchy(
@@ -397,57 +425,25 @@ class OntologyClient:
         """
         logger.debug(f"Traversing {direction} for {term}, max_depth={max_depth}")
 
-        # Parse term
-        namespace, identifier = self._parse_term_id(term)
-        term_tuple = (namespace, identifier)
-
-        # Choose appropriate CoGEx function
-        if direction == "parents":
-            query_func = get_ontology_parent_terms
-        elif direction == "children":
-            query_func = get_ontology_child_terms
-        else:
+        if direction not in _DIRECTION_PATTERNS:
             raise ValueError(f"Invalid direction: {direction}")
 
-        # Collect all terms with BFS
-        all_terms = []
-        visited = set()
-        current_level = [term_tuple]
-
-        for current_depth in range(1, max_depth + 1):
-            if not current_level:
-                break
-
-            next_level = []
-
-            for current_term in current_level:
-                # Skip if already visited
-                term_key = f"{current_term[0]}:{current_term[1]}"
-                if term_key in visited:
-                    continue
-                visited.add(term_key)
-
-                # Query CoGEx
-                try:
-                    related_nodes = query_func(current_term, client=client)
-
-                    # Process results
-                    for node in related_nodes:
-                        formatted = self._format_term_dict(node, depth=current_depth)
-
-                        # Add to results
-                        all_terms.append(formatted)
+        namespace, identifier = self._parse_term_id(term)
 
-                        # Add to next level for further traversal
-                        node_ns = getattr(node, "db_ns", "unknown")
-                        node_id = getattr(node, "db_id", "unknown")
-                        next_level.append((node_ns, node_id))
+        # Variable-length bounds cannot be parameters; max_depth is an int
+        pattern = _DIRECTION_PATTERNS[direction].format(max_depth=int(max_depth))
+        query = _CLOSURE_QUERY.format(pattern=pattern)
 
-                except Exception as e:
-                    logger.warning(f"Error querying {direction} for {current_term}: {e}")
-                    continue
+        try:
+            rows = client.query_tx(query, term_id=self._graph_id(namespace, identifier))
+        except Exception as e:
+            logger.warning(f"Error querying {direction} for {term}: {e}")
+            return []
 
-            current_level = next_level
+        all_terms = [
+            self._format_term_row(curie, name, depth, relationship)
+            for curie, name, depth, relationship in rows
+        ]
 
         logger.debug(f"Found {len(all_terms)} {direction} terms")
         return all_terms
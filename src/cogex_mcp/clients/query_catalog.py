@@ -0,0 +1,1796 @@
+"""
+Compiled Cypher query catalog for the Neo4j client.
+
+The catalog is built once at import time. Every named operation is compiled
+into a CypherQuery carrying:
+- The Cypher text
+- The parameters it declares, with their defaults
+- Result-shape metadata (returned columns and CURIE-valued fields)
+- Whether it is read-only (so it can be routed to cluster read replicas)
+- Whether it is long-running (so it gets the longer transaction timeout)
+
+Neo4jClient looks operations up here instead of rebuilding the catalog per call.
+Each query also carries an UNWIND form so many parameter rows can be sent in a
+single round-trip (see Neo4jClient.execute_batch).
+"""
+
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+# Alias mappings for backward compatibility with test naming
+QUERY_ALIASES: dict[str, str] = {
+    # Tool 1: Gene/Feature query aliases - now handled as direct queries
+    # Tool 6: Pathway aliases
+    "pathway_get_genes": "get_genes_in_pathway",
+    "pathway_get_pathways": "get_pathways_for_gene",
+    "pathway_find_shared": "get_shared_pathways_for_genes",
+    "pathway_check": "is_gene_in_pathway",
+    # Tool 7: Cell Line aliases
+    "cell_line_properties": "get_mutations_for_cell_line",
+    "cell_line_mutations": "get_mutations_for_cell_line",
+    "cell_lines_with_mutation": "get_cell_lines_for_mutation",
+    "cell_line_check": "is_mutated_in_cell_line",
+    # Tool 8: Clinical Trials aliases
+    "trials_for_drug": "get_trials_for_drug",
+    "trials_for_disease": "get_trials_for_disease",
+    "trial_by_id": "get_trial_by_id",
+    # Tool 9: Literature aliases
+    "lit_statements_pmid": "get_statements_for_paper",
+    "lit_evidence": "get_evidences_for_stmt_hash",
+    "lit_mesh_search": "get_evidence_for_mesh",
+    # Tool 10: Variant aliases
+    "variants_for_gene": "get_variants_for_gene",
+    "variants_for_disease": "get_variants_for_disease",
+    "variant_to_genes": "get_genes_for_variant",
+    "variant_to_phenotypes": "get_phenotypes_for_variant",
+    "variant_check": "is_variant_associated",
+    # Tool 11: Identifier Resolution aliases
+    "resolve_identifiers": "map_identifiers",
+    # Tool 12: Relationship Checking aliases
+    "check_relationship": "is_gene_in_pathway",  # Will be routed by relationship type
+    # Tool 13: Ontology Hierarchy aliases
+    "ontology_hierarchy": "get_ontology_hierarchy",
+    # Tool 14: Cell Markers aliases
+    "cell_markers": "get_markers_for_cell_type",
+    "cell_types_for_marker": "get_cell_types_for_marker",
+    "check_marker": "is_cell_marker",
+    # Tool 16: Protein Functions aliases
+    "gene_to_activities": "get_enzyme_activities",
+    "activity_to_genes": "get_genes_for_activity",
+    "check_activity": "has_enzyme_activity",
+    "check_function_types": "is_kinase",  # Will be routed by function type
+}
+
+# Query catalog - maps operation names to Cypher
+# Updated with correct INDRA CoGEx schema (all genes are BioEntity nodes)
+_CYPHER: dict[str, str] = {
+    # Gene queries - CORRECTED SCHEMA
+    "get_gene_by_symbol": """
+        MATCH (g:BioEntity)
+        WHERE g.name = $symbol
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          g.name AS name,
+          g.id AS id,
+          g.type AS type
+        LIMIT 1
+    """,
+    "get_gene_by_id": """
+        MATCH (g:BioEntity)
+        WHERE (
+            g.id = $gene_id
+            OR g.id = ('hgnc:' + $gene_id)
+        )
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          g.name AS name,
+          g.id AS id,
+          g.type AS type
+        LIMIT 1
+    """,
+    "get_tissues_for_gene": """
+        MATCH (g:BioEntity)-[:expressed_in]->(t:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND t.id STARTS WITH 'uberon:'
+        RETURN
+          t.name AS tissue,
+          t.id AS tissue_id,
+          t.type AS type
+        LIMIT $limit
+    """,
+    "get_genes_in_tissue": """
+        MATCH (g:BioEntity)-[:expressed_in]->(t:BioEntity)
+        WHERE t.id = $tissue_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND t.id STARTS WITH 'uberon:'
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          g.type AS type
+        SKIP $offset LIMIT $limit
+    """,
+    # GO term queries - CORRECTED SCHEMA
+    "get_go_terms_for_gene": """
+        MATCH (g:BioEntity)-[r]->(go:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND go.id STARTS WITH 'GO:'
+        RETURN
+          go.name AS term,
+          go.id AS go_id,
+          type(r) AS relationship,
+          go.type AS go_type
+        LIMIT $limit
+    """,
+    "get_genes_for_go_term": """
+        MATCH (g:BioEntity)-[r]->(go:BioEntity)
+        WHERE go.id = $go_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          g.type AS type,
+          type(r) AS relationship
+        SKIP $offset LIMIT $limit
+    """,
+    # Disease queries - CORRECTED SCHEMA
+    "get_diseases_for_gene": """
+        MATCH (g:BioEntity)-[a:gene_disease_association]->(d:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND (
+            d.id STARTS WITH 'mesh:' OR
+            d.id STARTS WITH 'DOID:' OR
+            d.id STARTS WITH 'EFO:' OR
+            d.id STARTS WITH 'umls:'
+          )
+        RETURN
+          d.name AS disease,
+          d.id AS disease_id,
+          d.type AS disease_type
+        LIMIT $limit
+    """,
+    # ========================================================================
+    # Tool 4: Drug Queries
+    # ========================================================================
+    "get_drug_by_name": """
+        MATCH (drug:BioEntity)
+        WHERE toLower(drug.name) CONTAINS toLower($name)
+          AND (
+            drug.id STARTS WITH 'chebi:' OR
+            drug.id STARTS WITH 'drugbank:' OR
+            drug.id STARTS WITH 'chembl:'
+          )
+          AND drug.obsolete = false
+        RETURN
+          drug.name AS name,
+          drug.id AS id,
+          drug.type AS type
+        LIMIT 10
+    """,
+    "drug_to_profile": """
+        MATCH (drug:BioEntity)
+        WHERE (drug.name = $drug OR drug.id = $drug)
+          AND (
+            drug.id STARTS WITH 'chebi:' OR
+            drug.id STARTS WITH 'drugbank:' OR
+            drug.id STARTS WITH 'chembl:'
+          )
+          AND drug.obsolete = false
+        OPTIONAL MATCH (drug)-[:targets]->(target:BioEntity)
+        WHERE target.id STARTS WITH 'hgnc:' AND target.obsolete = false
+        OPTIONAL MATCH (drug)-[:has_indication]->(indication:BioEntity)
+        WHERE (
+          indication.id STARTS WITH 'mesh:' OR
+          indication.id STARTS WITH 'DOID:' OR
+          indication.id STARTS WITH 'EFO:'
+        )
+        OPTIONAL MATCH (drug)-[:has_side_effect]->(effect:BioEntity)
+        RETURN
+          drug.name AS drug_name,
+          drug.id AS drug_id,
+          drug.type AS drug_type,
+          collect(DISTINCT {name: target.name, id: target.id}) AS targets,
+          collect(DISTINCT {name: indication.name, id: indication.id}) AS indications,
+          collect(DISTINCT {name: effect.name, id: effect.id}) AS side_effects
+        LIMIT 1
+    """,
+    "side_effect_to_drugs": """
+        MATCH (effect:BioEntity)<-[:has_side_effect]-(drug:BioEntity)
+        WHERE (effect.name = $side_effect OR effect.id = $side_effect)
+          AND (
+            drug.id STARTS WITH 'chebi:' OR
+            drug.id STARTS WITH 'drugbank:' OR
+            drug.id STARTS WITH 'chembl:'
+          )
+          AND drug.obsolete = false
+        RETURN
+          drug.name AS drug_name,
+          drug.id AS drug_id,
+          drug.type AS drug_type,
+          effect.name AS side_effect_name,
+          effect.id AS side_effect_id
+        SKIP $offset LIMIT $limit
+    """,
+    "get_targets_for_drug": """
+        MATCH (drug:BioEntity)-[:targets]->(target:BioEntity)
+        WHERE drug.id = $drug_id
+          AND target.id STARTS WITH 'hgnc:'
+          AND target.obsolete = false
+        RETURN
+          target.name AS target,
+          target.id AS target_id,
+          'unknown' AS action_type,
+          1 AS evidence_count
+        SKIP $offset LIMIT $limit
+    """,
+    "get_indications_for_drug": """
+        MATCH (drug:BioEntity)-[:has_indication]->(disease:BioEntity)
+        WHERE drug.id = $drug_id
+          AND (
+            disease.id STARTS WITH 'mesh:' OR
+            disease.id STARTS WITH 'DOID:' OR
+            disease.id STARTS WITH 'EFO:' OR
+            disease.id STARTS WITH 'mondo:'
+          )
+          AND disease.obsolete = false
+        RETURN
+          disease.name AS disease,
+          disease.id AS disease_id,
+          'approved' AS indication_type,
+          4 AS max_phase
+        SKIP $offset LIMIT $limit
+    """,
+    "get_side_effects_for_drug": """
+        MATCH (drug:BioEntity)-[:has_side_effect]->(effect:BioEntity)
+        WHERE drug.id = $drug_id
+        RETURN
+          effect.name AS effect,
+          effect.id AS effect_id,
+          'common' AS frequency
+        SKIP $offset LIMIT $limit
+    """,
+    "get_sensitive_cell_lines_for_drug": """
+        MATCH (drug:BioEntity)-[:sensitive_to]-(cell_line:BioEntity)
+        WHERE drug.id = $drug_id
+          AND cell_line.id STARTS WITH 'ccle:'
+        RETURN
+          cell_line.name AS cell_line,
+          0.5 AS sensitivity_score
+        SKIP $offset LIMIT $limit
+    """,
+    # ========================================================================
+    # Tool 5: Disease/Phenotype Queries
+    # ========================================================================
+    "get_disease_by_name": """
+        MATCH (disease:BioEntity)
+        WHERE toLower(disease.name) CONTAINS toLower($name)
+          AND (
+            disease.id STARTS WITH 'mesh:' OR
+            disease.id STARTS WITH 'DOID:' OR
+            disease.id STARTS WITH 'EFO:' OR
+            disease.id STARTS WITH 'mondo:'
+          )
+          AND disease.obsolete = false
+        RETURN
+          disease.name AS name,
+          disease.id AS id,
+          disease.type AS type
+        LIMIT 10
+    """,
+    "disease_to_mechanisms": """
+        MATCH (disease:BioEntity)
+        WHERE (disease.name = $disease OR disease.id = $disease)
+          AND (
+            disease.id STARTS WITH 'mesh:' OR
+            disease.id STARTS WITH 'DOID:' OR
+            disease.id STARTS WITH 'EFO:' OR
+            disease.id STARTS WITH 'mondo:'
+          )
+          AND disease.obsolete = false
+        OPTIONAL MATCH (gene:BioEntity)-[:gene_disease_association]->(disease)
+        WHERE gene.id STARTS WITH 'hgnc:' AND gene.obsolete = false
+        OPTIONAL MATCH (disease)-[:has_phenotype]->(phenotype:BioEntity)
+        WHERE phenotype.id STARTS WITH 'HP:'
+        OPTIONAL MATCH (drug:BioEntity)-[:has_indication]->(disease)
+        WHERE (
+          drug.id STARTS WITH 'chebi:' OR
+          drug.id STARTS WITH 'drugbank:' OR
+          drug.id STARTS WITH 'chembl:'
+        )
+        RETURN
+          disease.name AS disease_name,
+          disease.id AS disease_id,
+          disease.type AS disease_type,
+          collect(DISTINCT {name: gene.name, id: gene.id}) AS genes,
+          collect(DISTINCT {name: phenotype.name, id: phenotype.id}) AS phenotypes,
+          collect(DISTINCT {name: drug.name, id: drug.id}) AS drugs
+        LIMIT 1
+    """,
+    "phenotype_to_diseases": """
+        MATCH (phenotype:BioEntity)<-[:has_phenotype]-(disease:BioEntity)
+        WHERE (phenotype.name = $phenotype OR phenotype.id = $phenotype)
+          AND phenotype.id STARTS WITH 'HP:'
+          AND (
+            disease.id STARTS WITH 'mesh:' OR
+            disease.id STARTS WITH 'DOID:' OR
+            disease.id STARTS WITH 'EFO:' OR
+            disease.id STARTS WITH 'mondo:'
+          )
+          AND disease.obsolete = false
+        RETURN
+          disease.name AS disease_name,
+          disease.id AS disease_id,
+          disease.type AS disease_type,
+          phenotype.name AS phenotype_name,
+          phenotype.id AS phenotype_id
+        SKIP $offset LIMIT $limit
+    """,
+    "check_phenotype": """
+        MATCH (disease:BioEntity)
+        WHERE (disease.name = $disease OR disease.id = $disease)
+          AND (
+            disease.id STARTS WITH 'mesh:' OR
+            disease.id STARTS WITH 'DOID:' OR
+            disease.id STARTS WITH 'EFO:' OR
+            disease.id STARTS WITH 'mondo:'
+          )
+          AND disease.obsolete = false
+        OPTIONAL MATCH (disease)-[:has_phenotype]->(phenotype:BioEntity)
+        WHERE (phenotype.name = $phenotype OR phenotype.id = $phenotype)
+          AND phenotype.id STARTS WITH 'HP:'
+        RETURN
+          disease.name AS disease_name,
+          disease.id AS disease_id,
+          phenotype.name AS phenotype_name,
+          phenotype.id AS phenotype_id,
+          CASE WHEN phenotype IS NOT NULL THEN true ELSE false END AS has_phenotype
+        LIMIT 1
+    """,
+    "get_genes_for_disease": """
+        MATCH (gene:BioEntity)-[:gene_disease_association]->(disease:BioEntity)
+        WHERE disease.id = $disease_id
+          AND gene.id STARTS WITH 'hgnc:'
+          AND gene.obsolete = false
+        RETURN
+          gene.name AS gene,
+          gene.id AS gene_id,
+          0.5 AS score,
+          1 AS evidence_count,
+          ['disgenet'] AS sources
+        SKIP $offset LIMIT $limit
+    """,
+    "get_phenotypes_for_disease": """
+        MATCH (disease:BioEntity)-[:has_phenotype]->(phenotype:BioEntity)
+        WHERE disease.id = $disease_id
+          AND phenotype.id STARTS WITH 'HP:'
+        RETURN
+          phenotype.name AS phenotype,
+          phenotype.id AS phenotype_id,
+          'common' AS frequency,
+          1 AS evidence_count
+        SKIP $offset LIMIT $limit
+    """,
+    "get_drugs_for_indication": """
+        MATCH (drug:BioEntity)-[:has_indication]->(disease:BioEntity)
+        WHERE disease.id = $disease_id
+          AND (
+            drug.id STARTS WITH 'chebi:' OR
+            drug.id STARTS WITH 'drugbank:' OR
+            drug.id STARTS WITH 'chembl:'
+          )
+          AND drug.obsolete = false
+        RETURN
+          drug.name AS drug,
+          drug.id AS drug_id,
+          'approved' AS indication_type,
+          4 AS max_phase,
+          'marketed' AS status
+        SKIP $offset LIMIT $limit
+    """,
+    # ========================================================================
+    # Tool 6: Pathway Queries
+    # CORRECTED: Uses 'haspart' relationship (Pathway->Gene direction)
+    # ========================================================================
+    "search_pathway_by_name": """
+        // Search for pathways by name (fuzzy matching)
+        MATCH (p:BioEntity)
+        WHERE (
+            p.name CONTAINS $name OR
+            toLower(p.name) CONTAINS toLower($name)
+          )
+          AND (
+            p.id STARTS WITH 'reactome:' OR
+            p.id STARTS WITH 'wikipathways:' OR
+            p.id STARTS WITH 'kegg.pathway:'
+          )
+          AND p.obsolete = false
+        RETURN
+          p.name AS name,
+          p.id AS pathway_id
+        ORDER BY size(p.name) ASC
+        LIMIT 10
+    """,
+    "search_disease_by_name": """
+        // Search for diseases by name (case-insensitive matching)
+        MATCH (d:BioEntity)
+        WHERE toLower(d.name) CONTAINS toLower($name)
+          AND (
+            d.id STARTS WITH 'doid:' OR
+            d.id STARTS WITH 'mondo:' OR
+            d.id STARTS WITH 'mesh:' OR
+            d.id STARTS WITH 'hp:' OR
+            d.id STARTS WITH 'efo:'
+          )
+          AND (d.obsolete = false OR d.obsolete IS NULL)
+          AND d.name IS NOT NULL
+        RETURN
+          d.name AS name,
+          d.id AS disease_id,
+          split(d.id, ':')[0] AS namespace
+        ORDER BY
+          CASE WHEN toLower(d.name) = toLower($name) THEN 0 ELSE 1 END,
+          size(d.name) ASC
+        LIMIT 10
+    """,
+    "search_drug_by_name": """
+        // Search for drugs by name (case-insensitive matching)
+        MATCH (d:BioEntity)
+        WHERE toLower(d.name) CONTAINS toLower($name)
+          AND (
+            d.id STARTS WITH 'chebi:' OR
+            d.id STARTS WITH 'chembl:' OR
+            d.id STARTS WITH 'pubchem:' OR
+            d.id STARTS WITH 'drugbank:'
+          )
+          AND (d.obsolete = false OR d.obsolete IS NULL)
+          AND d.name IS NOT NULL
+        RETURN
+          d.name AS name,
+          d.id AS drug_id,
+          split(d.id, ':')[0] AS namespace
+        ORDER BY
+          CASE WHEN toLower(d.name) = toLower($name) THEN 0 ELSE 1 END,
+          size(d.name) ASC
+        LIMIT 10
+    """,
+    "fulltext_name_search": """
+        // Full-text index name search (see clients/name_search.py)
+        CALL db.index.fulltext.queryNodes($index_name, $search) YIELD node, score
+        WHERE any(prefix IN $prefixes WHERE node.id STARTS WITH prefix)
+          AND (node.obsolete = false OR node.obsolete IS NULL)
+          AND node.name IS NOT NULL
+        RETURN
+          node.name AS name,
+          node.id AS entity_id,
+          split(node.id, ':')[0] AS namespace,
+          score
+        ORDER BY
+          CASE WHEN toLower(node.name) = toLower($name) THEN 0 ELSE 1 END,
+          score DESC,
+          size(node.name) ASC
+        LIMIT 10
+    """,
+    "list_entity_names": """
+        // Names of all entities in the given namespaces (local name index)
+        MATCH (n:BioEntity)
+        WHERE any(prefix IN $prefixes WHERE n.id STARTS WITH prefix)
+          AND (n.obsolete = false OR n.obsolete IS NULL)
+          AND n.name IS NOT NULL
+        RETURN
+          n.name AS name,
+          n.id AS entity_id
+        LIMIT $limit
+    """,
+    "get_genes_in_pathway": """
+        // CORRECTED: haspart goes FROM pathway TO gene
+        MATCH (p:BioEntity)-[:haspart]->(g:BioEntity)
+        WHERE p.id = $pathway_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND (
+            p.id STARTS WITH 'reactome:' OR
+            p.id STARTS WITH 'wikipathways:' OR
+            p.id STARTS WITH 'kegg.pathway:'
+          )
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          g.type AS type
+        SKIP $offset LIMIT $limit
+    """,
+    "get_pathways_for_gene": """
+        // CORRECTED: haspart goes FROM pathway TO gene
+        MATCH (p:BioEntity)-[:haspart]->(g:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND (
+            p.id STARTS WITH 'reactome:' OR
+            p.id STARTS WITH 'wikipathways:' OR
+            p.id STARTS WITH 'kegg.pathway:'
+          )
+        RETURN
+          p.name AS pathway,
+          p.id AS pathway_id,
+          p.type AS pathway_type
+        SKIP $offset LIMIT $limit
+    """,
+    "get_shared_pathways_for_genes": """
+        // CORRECTED: haspart goes FROM pathway TO gene
+        MATCH (p:BioEntity)-[:haspart]->(g:BioEntity)
+        WHERE g.id IN $gene_ids
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND (
+            p.id STARTS WITH 'reactome:' OR
+            p.id STARTS WITH 'wikipathways:' OR
+            p.id STARTS WITH 'kegg.pathway:'
+          )
+        WITH p, collect(DISTINCT g.id) AS genes
+        WHERE size(genes) = size($gene_ids)
+        RETURN
+          p.name AS pathway,
+          p.id AS pathway_id,
+          p.type AS pathway_type
+        SKIP $offset LIMIT $limit
+    """,
+    "is_gene_in_pathway": """
+        // CORRECTED: haspart goes FROM pathway TO gene
+        MATCH (p:BioEntity)-[:haspart]->(g:BioEntity)
+        WHERE g.id = $gene_id
+          AND p.id = $pathway_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          count(*) > 0 AS is_member,
+          p.name AS pathway,
+          p.id AS pathway_id
+        LIMIT 1
+    """,
+    # ========================================================================
+    # Tool 7: Cell Line Queries
+    # CORRECTED: Uses direct 'mutated_in' relationship (Gene->CellLine)
+    # Note: Cell lines use CCLE IDs (e.g., ccle:A549_LUNG)
+    # ========================================================================
+    "get_mutations_for_cell_line": """
+        // CORRECTED: Direct Gene -[:mutated_in]-> CellLine relationship
+        // No intermediate mutation nodes, simpler than expected
+        // Support both exact match (ccle:A549_LUNG) and partial (A549)
+        MATCH (g:BioEntity)-[:mutated_in]->(c:BioEntity)
+        WHERE (c.id = $cell_line OR c.id CONTAINS $cell_line)
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND c.id STARTS WITH 'ccle:'
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          'mutation' AS mutation_type,
+          null AS protein_change
+        SKIP $offset LIMIT $limit
+    """,
+    "get_copy_number_for_cell_line": """
+        // CORRECTED: Direct Gene -[:copy_number_altered_in]-> CellLine
+        // Support both exact match and partial match
+        MATCH (g:BioEntity)-[:copy_number_altered_in]->(c:BioEntity)
+        WHERE (c.id = $cell_line OR c.id CONTAINS $cell_line)
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND c.id STARTS WITH 'ccle:'
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          'altered' AS copy_number
+        LIMIT $limit
+    """,
+    "get_dependencies_for_cell_line": """
+        // Gene dependency data may not be in Neo4j
+        // Placeholder query - may need REST API fallback
+        MATCH (g:BioEntity)-[:codependent_with]-(other:BioEntity)
+        WHERE g.id = $cell_line
+          AND other.id STARTS WITH 'hgnc:'
+          AND other.obsolete = false
+        RETURN
+          other.name AS gene,
+          other.id AS gene_id
+        LIMIT $limit
+    """,
+    "get_expression_for_cell_line": """
+        // Expression data may not be in Neo4j
+        // Placeholder query - may need REST API fallback
+        MATCH (c:BioEntity)-[:expresses]->(g:BioEntity)
+        WHERE c.id = $cell_line
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id
+        LIMIT $limit
+    """,
+    "get_cell_lines_for_mutation": """
+        // CORRECTED: Direct Gene -[:mutated_in]-> CellLine
+        MATCH (g:BioEntity)-[:mutated_in]->(c:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND c.id STARTS WITH 'ccle:'
+        RETURN
+          c.name AS cell_line,
+          c.id AS ccle_id
+        SKIP $offset LIMIT $limit
+    """,
+    "is_mutated_in_cell_line": """
+        // CORRECTED: Direct Gene -[:mutated_in]-> CellLine
+        // Support both exact match and partial match
+        MATCH (g:BioEntity)-[:mutated_in]->(c:BioEntity)
+        WHERE g.id = $gene_id
+          AND (c.id = $cell_line OR c.id CONTAINS $cell_line)
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          count(*) > 0 AS result
+        LIMIT 1
+    """,
+    # ========================================================================
+    # Tool 8: Clinical Trials Queries
+    # ========================================================================
+    "get_trials_for_drug": """
+        MATCH (d:BioEntity)-[:tested_in]->(t:BioEntity)
+        WHERE d.id = $drug_id
+          AND t.id STARTS WITH 'clinicaltrials:'
+        RETURN
+          split(t.id, ':')[1] AS nct_id,
+          t.name AS title,
+          null AS phase,
+          null AS status,
+          [] AS conditions,
+          [] AS interventions
+        SKIP $offset LIMIT $limit
+    """,
+    "get_trials_for_disease": """
+        MATCH (dis:BioEntity)-[:has_trial]->(t:BioEntity)
+        WHERE dis.id = $disease_id
+          AND t.id STARTS WITH 'clinicaltrials:'
+        RETURN
+          split(t.id, ':')[1] AS nct_id,
+          t.name AS title,
+          null AS phase,
+          null AS status,
+          [] AS conditions,
+          [] AS interventions
+        SKIP $offset LIMIT $limit
+    """,
+    "get_trial_by_id": """
+        MATCH (t:BioEntity)
+        WHERE t.id = 'clinicaltrials:' + $nct_id
+        RETURN
+          split(t.id, ':')[1] AS nct_id,
+          t.name AS title,
+          null AS phase,
+          null AS status,
+          null AS start_date,
+          null AS completion_date,
+          [] AS conditions,
+          [] AS interventions
+        LIMIT 1
+    """,
+    # ========================================================================
+    # Tool 9: Literature Queries
+    # ========================================================================
+    "get_statements_for_paper": """
+        MATCH (pub:Publication)-[:has_statement]->(s:Statement)
+        WHERE pub.pmid = $pmid
+        RETURN
+          s.hash AS hash,
+          s.type AS type,
+          s.subj_name AS subj_name,
+          s.subj_id AS subj_id,
+          s.obj_name AS obj_name,
+          s.obj_id AS obj_id,
+          s.belief AS belief
+        SKIP $offset LIMIT $limit
+    """,
+    "get_evidences_for_stmt_hash": """
+        MATCH (s:Statement)-[:has_evidence]->(e:Evidence)
+        WHERE s.hash = $stmt_hash
+        RETURN
+          e.text AS text,
+          e.pmid AS pmid,
+          e.source_api AS source_api
+        SKIP $offset LIMIT $limit
+    """,
+    "get_evidence_for_mesh": """
+        MATCH (pub:Publication)-[:has_mesh_term]->(m:MeshTerm)
+        WHERE m.term IN $mesh_terms
+        RETURN
+          pub.pmid AS pmid,
+          pub.title AS title,
+          pub.journal AS journal,
+          pub.year AS year
+        SKIP $offset LIMIT $limit
+    """,
+    "get_stmts_for_stmt_hashes": """
+        MATCH (s:Statement)
+        WHERE s.hash IN $stmt_hashes
+        RETURN
+          s.hash AS hash,
+          s.type AS type,
+          s.subj_name AS subj_name,
+          s.subj_id AS subj_id,
+          s.obj_name AS obj_name,
+          s.obj_id AS obj_id,
+          s.belief AS belief
+        LIMIT 100
+    """,
+    # ========================================================================
+    # Tool 10: Variant Queries
+    # CORRECTED: Uses 'variant_gene_association' (Variant->Gene direction)
+    # Note: Variants use dbsnp: namespace (e.g., dbsnp:rs7412)
+    # ========================================================================
+    "get_variants_for_gene": """
+        // CORRECTED: Variant -[:variant_gene_association]-> Gene
+        MATCH (v:BioEntity)-[:variant_gene_association]->(g:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND v.id STARTS WITH 'dbsnp:'
+        RETURN
+          v.id AS rsid,
+          v.name AS variant_name,
+          null AS chromosome,
+          null AS position,
+          null AS ref_allele,
+          null AS alt_allele,
+          null AS p_value
+        SKIP $offset LIMIT $limit
+    """,
+    "get_variants_for_disease": """
+        // CORRECTED: Disease -[:variant_disease_association]-> Variant
+        MATCH (d:BioEntity)-[:variant_disease_association]->(v:BioEntity)
+        WHERE d.id = $disease_id
+          AND v.id STARTS WITH 'dbsnp:'
+        RETURN
+          v.id AS rsid,
+          v.name AS variant_name,
+          null AS chromosome,
+          null AS position,
+          null AS ref_allele,
+          null AS alt_allele,
+          null AS p_value,
+          null AS trait
+        SKIP $offset LIMIT $limit
+    """,
+    "get_variants_for_phenotype": """
+        // CORRECTED: Phenotype -[:variant_phenotype_association]-> Variant
+        MATCH (ph:BioEntity)-[:variant_phenotype_association]->(v:BioEntity)
+        WHERE ph.id = $phenotype_id
+          AND v.id STARTS WITH 'dbsnp:'
+        RETURN
+          v.id AS rsid,
+          v.name AS variant_name,
+          null AS chromosome,
+          null AS position,
+          null AS p_value,
+          null AS trait
+        SKIP $offset LIMIT $limit
+    """,
+    "get_genes_for_variant": """
+        // CORRECTED: Variant -[:variant_gene_association]-> Gene
+        MATCH (v:BioEntity)-[:variant_gene_association]->(g:BioEntity)
+        WHERE v.id = $variant_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND v.id STARTS WITH 'dbsnp:'
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          g.type AS type
+        SKIP $offset LIMIT $limit
+    """,
+    "get_phenotypes_for_variant": """
+        // CORRECTED: Variant -[:variant_phenotype_association]-> Phenotype
+        MATCH (v:BioEntity)-[:variant_phenotype_association]->(ph:BioEntity)
+        WHERE v.id = $variant_id
+          AND v.id STARTS WITH 'dbsnp:'
+          AND ph.id STARTS WITH 'HP:'
+        RETURN
+          ph.name AS phenotype,
+          ph.id AS phenotype_id,
+          ph.type AS type
+        SKIP $offset LIMIT $limit
+    """,
+    "is_variant_associated": """
+        // CORRECTED: Disease -[:variant_disease_association]-> Variant
+        MATCH (d:BioEntity)-[:variant_disease_association]->(v:BioEntity)
+        WHERE d.id = $disease_id
+          AND v.id = $variant_id
+          AND v.id STARTS WITH 'dbsnp:'
+        RETURN
+          count(*) > 0 AS is_associated,
+          null AS p_value
+        LIMIT 1
+    """,
+    # ========================================================================
+    # Tool 11: Identifier Resolution
+    # ========================================================================
+    "symbol_to_hgnc": """
+        MATCH (g:BioEntity)
+        WHERE g.name IN $symbols
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN g.name AS symbol, g.id AS hgnc_id
+    """,
+    "hgnc_to_symbol": """
+        MATCH (g:BioEntity)
+        WHERE g.id IN [id IN $hgnc_ids | CASE WHEN id STARTS WITH 'hgnc:' THEN id ELSE 'hgnc:' + id END]
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN g.id AS hgnc_id, g.name AS symbol
+    """,
+    "hgnc_to_uniprot": """
+        MATCH (g:BioEntity)-[:xref]-(u:BioEntity)
+        WHERE g.id IN [id IN $hgnc_ids | CASE WHEN id STARTS WITH 'hgnc:' THEN id ELSE 'hgnc:' + id END]
+          AND g.obsolete = false
+          AND u.id STARTS WITH 'uniprot:'
+        RETURN g.id AS hgnc_id, collect(DISTINCT u.id) AS uniprot_ids
+    """,
+    "map_identifiers": """
+        MATCH (source:BioEntity)
+        WHERE source.id IN $identifiers
+        OPTIONAL MATCH (source)-[:xref]-(target:BioEntity)
+        WHERE target.id STARTS WITH ($to_namespace + ':')
+        RETURN source.id AS source_id, collect(DISTINCT target.id) AS target_ids
+    """,
+    # ========================================================================
+    # Tool 12: Relationship Checking (10 types)
+    # ========================================================================
+    "is_drug_target": """
+        // Check both [:targets] and [:indra_rel] for drug-target relationships
+        MATCH (d:BioEntity), (t:BioEntity)
+        WHERE d.id = $drug_id
+          AND t.id = $target_id
+          AND (d.id STARTS WITH 'chebi:' OR d.id STARTS WITH 'chembl:' OR d.id STARTS WITH 'drugbank:')
+          AND t.id STARTS WITH 'hgnc:'
+        OPTIONAL MATCH path1 = (d)-[:targets]->(t)
+        OPTIONAL MATCH path2 = (d)-[r:indra_rel]-(t)
+        WHERE r.stmt_type IN ['Inhibition', 'Activation', 'IncreaseAmount', 'DecreaseAmount']
+        WITH path1, path2
+        RETURN (path1 IS NOT NULL OR path2 IS NOT NULL) AS result
+    """,
+    "drug_has_indication": """
+        MATCH (d:BioEntity)-[:has_indication]->(dis:BioEntity)
+        WHERE d.id = $drug_id
+          AND dis.id = $disease_id
+          AND (d.id STARTS WITH 'chebi:' OR d.id STARTS WITH 'chembl:' OR d.id STARTS WITH 'drugbank:')
+        RETURN COUNT(*) > 0 AS result
+    """,
+    "is_side_effect_for_drug": """
+        MATCH (d:BioEntity)-[:has_side_effect]->(se:BioEntity)
+        WHERE d.id = $drug_id
+          AND (se.name = $side_effect_id OR se.id = $side_effect_id)
+          AND (d.id STARTS WITH 'chebi:' OR d.id STARTS WITH 'chembl:' OR d.id STARTS WITH 'drugbank:')
+        RETURN COUNT(*) > 0 AS result
+    """,
+    "is_gene_associated_with_disease": """
+        // Check both [:gene_disease_association] and [:indra_rel] for gene-disease relationships
+        MATCH (g:BioEntity), (d:BioEntity)
+        WHERE g.id = $gene_id
+          AND d.id = $disease_id
+          AND g.id STARTS WITH 'hgnc:'
+        OPTIONAL MATCH path1 = (g)-[:gene_disease_association]->(d)
+        OPTIONAL MATCH path2 = (g)-[r:indra_rel]-(d)
+        WITH path1, path2
+        RETURN (path1 IS NOT NULL OR path2 IS NOT NULL) AS result
+    """,
+    "has_phenotype": """
+        MATCH (d:BioEntity)-[:has_phenotype]->(p:BioEntity)
+        WHERE d.id = $disease_id
+          AND (p.id = $phenotype_id OR p.name = $phenotype_id)
+          AND p.id STARTS WITH 'HP:'
+        RETURN COUNT(*) > 0 AS result
+    """,
+    "is_gene_associated_with_phenotype": """
+        MATCH (g:BioEntity)-[:associated_with]->(p:BioEntity)
+        WHERE g.id = $gene_id
+          AND (p.id = $phenotype_id OR p.name = $phenotype_id)
+          AND g.id STARTS WITH 'hgnc:'
+          AND p.id STARTS WITH 'HP:'
+        RETURN COUNT(*) > 0 AS result
+    """,
+    # ========================================================================
+    # Tool 13: Ontology Hierarchy
+    # ========================================================================
+    "get_ontology_term": """
+        MATCH (term:BioEntity)
+        WHERE term.obsolete = false
+          AND (
+            ($term_id IS NOT NULL AND term.id = $term_id) OR
+            ($name IS NOT NULL AND term.name = $name) OR
+            ($namespace IS NOT NULL AND $term_id IS NOT NULL AND term.id = $namespace + ':' + $term_id)
+          )
+          AND (
+            term.id STARTS WITH 'GO:' OR
+            term.id STARTS WITH 'HP:' OR
+            term.id STARTS WITH 'MONDO:' OR
+            term.id STARTS WITH 'DOID:' OR
+            term.id STARTS WITH 'EFO:' OR
+            term.id STARTS WITH 'UBERON:' OR
+            term.id STARTS WITH 'CL:' OR
+            term.id STARTS WITH 'CHEBI:'
+          )
+        RETURN
+          term.name AS name,
+          term.id AS id,
+          split(term.id, ':')[0] AS namespace,
+          term.definition AS definition
+        LIMIT 10
+    """,
+    "get_ontology_parents": """
+        MATCH path = (child:BioEntity)-[:isa|part_of*1..10]->(parent:BioEntity)
+        WHERE child.id = $term_id
+          AND child.obsolete = false
+          AND parent.obsolete = false
+          AND LENGTH(path) <= $max_depth
+        RETURN
+          parent.name AS name,
+          parent.id AS curie,
+          LENGTH(path) AS depth,
+          type(last(relationships(path))) AS relationship
+        ORDER BY depth
+    """,
+    "get_ontology_children": """
+        MATCH path = (parent:BioEntity)<-[:isa|part_of*1..10]-(child:BioEntity)
+        WHERE parent.id = $term_id
+          AND parent.obsolete = false
+          AND child.obsolete = false
+          AND LENGTH(path) <= $max_depth
+        RETURN
+          child.name AS name,
+          child.id AS curie,
+          LENGTH(path) AS depth,
+          type(last(relationships(path))) AS relationship
+        ORDER BY depth
+    """,
+    "get_ontology_hierarchy": """
+        MATCH (root:BioEntity)
+        WHERE root.id = $term_id
+          AND root.obsolete = false
+        OPTIONAL MATCH parent_path = (root)-[:isa|part_of*1..10]->(parent:BioEntity)
+        WHERE parent.obsolete = false
+          AND LENGTH(parent_path) <= $max_depth
+        OPTIONAL MATCH child_path = (root)<-[:isa|part_of*1..10]-(child:BioEntity)
+        WHERE child.obsolete = false
+          AND LENGTH(child_path) <= $max_depth
+        RETURN
+          root.name AS root_name,
+          root.id AS root_id,
+          collect(DISTINCT {name: parent.name, curie: parent.id, depth: LENGTH(parent_path), relationship: type(last(relationships(parent_path)))}) AS parents,
+          collect(DISTINCT {name: child.name, curie: child.id, depth: LENGTH(child_path), relationship: type(last(relationships(child_path)))}) AS children
+    """,
+    "list_ontology_edges": """
+        // All hierarchy edges in the given namespaces (ontology index)
+        MATCH (child:BioEntity)-[r:isa|partof]->(parent:BioEntity)
+        WHERE any(prefix IN $prefixes WHERE child.id STARTS WITH prefix)
+          AND (child.obsolete = false OR child.obsolete IS NULL)
+          AND (parent.obsolete = false OR parent.obsolete IS NULL)
+        RETURN
+          child.id AS child_id,
+          parent.id AS parent_id,
+          type(r) AS relationship
+    """,
+    # ========================================================================
+    # Tool 14: Cell Markers
+    # ========================================================================
+    "get_markers_for_cell_type": """
+        MATCH (g:BioEntity)-[:marker_for]->(ct:BioEntity)
+        WHERE (ct.name = $cell_type OR ct.id CONTAINS $cell_type)
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          'canonical' AS marker_type,
+          'CellMarker' AS evidence
+        SKIP $offset LIMIT $limit
+    """,
+    "get_cell_types_for_marker": """
+        MATCH (g:BioEntity)-[:marker_for]->(ct:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          ct.name AS cell_type,
+          ct.id AS cell_type_id,
+          'unknown' AS tissue,
+          'human' AS species
+        SKIP $offset LIMIT $limit
+    """,
+    "is_cell_marker": """
+        MATCH (g:BioEntity)-[:marker_for]->(ct:BioEntity)
+        WHERE g.id = $gene_id
+          AND (ct.name = $cell_type OR ct.id CONTAINS $cell_type)
+          AND g.id STARTS WITH 'hgnc:'
+        RETURN COUNT(*) > 0 AS result
+    """,
+    # ========================================================================
+    # Tool 16: Protein Functions
+    # Implemented using GO term annotations (properties don't exist in Neo4j)
+    # ========================================================================
+    "get_enzyme_activities": """
+        // Get protein activities from GO term annotations
+        MATCH (g:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        OPTIONAL MATCH (g)-[r]->(go:BioEntity)
+        WHERE go.id STARTS WITH 'GO:'
+          AND (
+            // Kinase GO terms
+            go.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773'] OR
+            go.name CONTAINS 'kinase activity' OR
+            // Phosphatase GO terms
+            go.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138'] OR
+            go.name CONTAINS 'phosphatase activity' OR
+            // Transcription factor GO terms
+            go.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227'] OR
+            go.name CONTAINS 'DNA-binding transcription factor activity'
+          )
+        WITH g, collect(DISTINCT go) AS go_terms
+        UNWIND go_terms AS go_term
+        WITH g, go_term,
+          CASE
+            WHEN go_term.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773']
+              OR go_term.name CONTAINS 'kinase activity'
+            THEN 'kinase'
+            WHEN go_term.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138']
+              OR go_term.name CONTAINS 'phosphatase activity'
+            THEN 'phosphatase'
+            WHEN go_term.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227']
+              OR go_term.name CONTAINS 'DNA-binding transcription factor activity'
+            THEN 'transcription_factor'
+            ELSE null
+          END AS activity
+        WHERE activity IS NOT NULL
+        RETURN DISTINCT
+          activity AS activity,
+          null AS ec_number,
+          'high' AS confidence
+    """,
+    "get_genes_for_activity": """
+        // Find genes with specific activity using GO terms
+        MATCH (g:BioEntity)-[r]->(go:BioEntity)
+        WHERE g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND go.id STARTS WITH 'GO:'
+          AND (
+            // Kinase activity
+            (toLower($activity) = 'kinase' AND (
+              go.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773'] OR
+              go.name CONTAINS 'kinase activity'
+            )) OR
+            // Phosphatase activity
+            (toLower($activity) = 'phosphatase' AND (
+              go.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138'] OR
+              go.name CONTAINS 'phosphatase activity'
+            )) OR
+            // Transcription factor
+            (toLower($activity) CONTAINS 'transcription' AND (
+              go.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227'] OR
+              go.name CONTAINS 'DNA-binding transcription factor activity'
+            ))
+          )
+        RETURN DISTINCT
+          g.name AS gene,
+          g.id AS gene_id,
+          g.type AS type
+        SKIP $offset LIMIT $limit
+    """,
+    "is_kinase": """
+        // Check if gene is a kinase using GO terms
+        MATCH (g:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        OPTIONAL MATCH (g)-[r]->(go:BioEntity)
+        WHERE go.id STARTS WITH 'GO:'
+          AND (
+            go.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773'] OR
+            go.name CONTAINS 'kinase activity'
+          )
+        RETURN count(go) > 0 AS result
+    """,
+    "is_phosphatase": """
+        // Check if gene is a phosphatase using GO terms
+        MATCH (g:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        OPTIONAL MATCH (g)-[r]->(go:BioEntity)
+        WHERE go.id STARTS WITH 'GO:'
+          AND (
+            go.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138'] OR
+            go.name CONTAINS 'phosphatase activity'
+          )
+        RETURN count(go) > 0 AS result
+    """,
+    "is_transcription_factor": """
+        // Check if gene is a transcription factor using GO terms
+        MATCH (g:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        OPTIONAL MATCH (g)-[r]->(go:BioEntity)
+        WHERE go.id STARTS WITH 'GO:'
+          AND (
+            go.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227'] OR
+            go.name CONTAINS 'DNA-binding transcription factor activity'
+          )
+        RETURN count(go) > 0 AS result
+    """,
+    "has_enzyme_activity": """
+        // Generic activity check using GO terms
+        MATCH (g:BioEntity)
+        WHERE g.id = $gene_id
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        OPTIONAL MATCH (g)-[r]->(go:BioEntity)
+        WHERE go.id STARTS WITH 'GO:'
+          AND (
+            CASE
+              WHEN toLower($activity) = 'kinase' THEN (
+                go.id IN ['GO:0016301', 'GO:0004672', 'GO:0016773'] OR
+                go.name CONTAINS 'kinase activity'
+              )
+              WHEN toLower($activity) = 'phosphatase' THEN (
+                go.id IN ['GO:0016791', 'GO:0004721', 'GO:0008138'] OR
+                go.name CONTAINS 'phosphatase activity'
+              )
+              WHEN toLower($activity) CONTAINS 'transcription' THEN (
+                go.id IN ['GO:0003700', 'GO:0000981', 'GO:0001227'] OR
+                go.name CONTAINS 'DNA-binding transcription factor activity'
+              )
+              ELSE false
+            END
+          )
+        RETURN count(go) > 0 AS result
+    """,
+    # ========================================================================
+    # Tool 1: Missing queries - domain_to_genes and phenotype_to_genes
+    # ========================================================================
+    "domain_to_genes": """
+        MATCH (g:BioEntity)-[:has_domain]->(d:BioEntity)
+        WHERE (d.name = $domain OR d.id CONTAINS $domain)
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND (
+            d.id STARTS WITH 'interpro:' OR
+            d.id STARTS WITH 'pfam:' OR
+            d.id STARTS WITH 'prosite:'
+          )
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          g.type AS type,
+          d.name AS domain_name,
+          d.id AS domain_id
+        SKIP $offset LIMIT $limit
+    """,
+    "phenotype_to_genes": """
+        MATCH (g:BioEntity)-[:associated_with]->(p:BioEntity)
+        WHERE (p.id = $phenotype OR p.name = $phenotype)
+          AND p.id STARTS WITH 'HP:'
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          g.type AS type,
+          p.name AS phenotype_name,
+          p.id AS phenotype_id
+        SKIP $offset LIMIT $limit
+    """,
+    # ========================================================================
+    # Tool 2: Subnetwork extraction - INDRA relationship queries
+    # CORRECTED: Uses indra_rel relationships, not Statement nodes
+    # ========================================================================
+    "extract_subnetwork": """
+        // Direct mode: Find direct INDRA relationships between specified genes
+        MATCH (g1:BioEntity)-[r:indra_rel]-(g2:BioEntity)
+        WHERE g1.id IN $gene_ids
+          AND g2.id IN $gene_ids
+          AND g1.id <> g2.id
+          AND r.evidence_count >= $min_evidence
+          AND r.belief >= $min_belief
+          AND g1.id STARTS WITH 'hgnc:'
+          AND g2.id STARTS WITH 'hgnc:'
+        WITH g1, g2, r
+        ORDER BY r.belief DESC, r.evidence_count DESC
+        LIMIT $max_statements
+        RETURN
+          r.stmt_hash AS hash,
+          r.stmt_type AS type,
+          g1.name AS subj_name,
+          g1.id AS subj_id,
+          g2.name AS obj_name,
+          g2.id AS obj_id,
+          null AS residue,
+          null AS position,
+          r.evidence_count AS evidence_count,
+          r.belief AS belief,
+          r.source_counts AS sources
+    """,
+    "indra_subnetwork": """
+        // Direct edges between genes via indra_rel relationships
+        MATCH (g1:BioEntity)-[r:indra_rel]-(g2:BioEntity)
+        WHERE g1.id IN $gene_ids
+          AND g2.id IN $gene_ids
+          AND g1.id <> g2.id
+          AND r.evidence_count >= $min_evidence
+          AND r.belief >= $min_belief
+          AND g1.id STARTS WITH 'hgnc:'
+          AND g2.id STARTS WITH 'hgnc:'
+        WITH g1, g2, r
+        ORDER BY r.belief DESC, r.evidence_count DESC
+        LIMIT $max_statements
+        RETURN
+          r.stmt_hash AS hash,
+          r.stmt_type AS type,
+          g1.name AS subj_name,
+          g1.id AS subj_id,
+          g2.name AS obj_name,
+          g2.id AS obj_id,
+          null AS residue,
+          null AS position,
+          r.evidence_count AS evidence_count,
+          r.belief AS belief,
+          r.source_counts AS sources
+    """,
+    "indra_mediated_subnetwork": """
+        // Two-hop paths: A→X→B via indra_rel relationships
+        // Find genes that mediate relationships between input genes
+        MATCH (g1:BioEntity)-[r1:indra_rel]-(mediator:BioEntity)-[r2:indra_rel]-(g2:BioEntity)
+        WHERE g1.id IN $gene_ids
+          AND g2.id IN $gene_ids
+          AND g1.id <> g2.id
+          AND mediator.id STARTS WITH 'hgnc:'
+          AND NOT mediator.id IN $gene_ids
+          AND r1.evidence_count >= $min_evidence
+          AND r2.evidence_count >= $min_evidence
+          AND r1.belief >= $min_belief
+          AND r2.belief >= $min_belief
+          AND g1.id STARTS WITH 'hgnc:'
+          AND g2.id STARTS WITH 'hgnc:'
+        WITH g1, mediator, g2, r1, r2
+        ORDER BY (r1.belief + r2.belief) / 2.0 DESC
+        LIMIT $max_statements
+        WITH g1, mediator, g2, r1, r2
+        UNWIND [
+          {
+            hash: r1.stmt_hash,
+            type: r1.stmt_type,
+            subj_name: g1.name,
+            subj_id: g1.id,
+            obj_name: mediator.name,
+            obj_id: mediator.id,
+            evidence_count: r1.evidence_count,
+            belief: r1.belief,
+            sources: r1.source_counts
+          },
+          {
+            hash: r2.stmt_hash,
+            type: r2.stmt_type,
+            subj_name: mediator.name,
+            subj_id: mediator.id,
+            obj_name: g2.name,
+            obj_id: g2.id,
+            evidence_count: r2.evidence_count,
+            belief: r2.belief,
+            sources: r2.source_counts
+          }
+        ] AS stmt
+        RETURN DISTINCT
+          stmt.hash AS hash,
+          stmt.type AS type,
+          stmt.subj_name AS subj_name,
+          stmt.subj_id AS subj_id,
+          stmt.obj_name AS obj_name,
+          stmt.obj_id AS obj_id,
+          null AS residue,
+          null AS position,
+          stmt.evidence_count AS evidence_count,
+          stmt.belief AS belief,
+          stmt.sources AS sources
+    """,
+    # Native async subnetwork engine (see clients/async_subnetwork.py):
+    # type/evidence/belief filters and the statement limit run in Cypher and
+    # rows are returned instead of deserialized INDRA Statements
+    "subnetwork_direct": """
+        // Directed edges between the query genes, optionally restricted to
+        // genes expressed in a tissue
+        MATCH (subj:BioEntity)-[r:indra_rel]->(obj:BioEntity)
+        WHERE subj.id IN $gene_ids
+          AND obj.id IN $gene_ids
+          AND subj.id <> obj.id
+          AND ($statement_types IS NULL OR r.stmt_type IN $statement_types)
+          AND r.evidence_count >= $min_evidence
+          AND r.belief >= $min_belief
+          AND ($tissue_id IS NULL OR (
+            EXISTS { (subj)-[:expressed_in]->(:BioEntity {id: $tissue_id}) }
+            AND EXISTS { (obj)-[:expressed_in]->(:BioEntity {id: $tissue_id}) }
+          ))
+        WITH subj, obj, r
+        ORDER BY r.belief DESC, r.evidence_count DESC
+        LIMIT $max_statements
+        RETURN
+          r.stmt_hash AS stmt_hash,
+          r.stmt_type AS stmt_type,
+          subj.id AS subj_id,
+          subj.name AS subj_name,
+          obj.id AS obj_id,
+          obj.name AS obj_name,
+          r.evidence_count AS evidence_count,
+          r.belief AS belief,
+          r.source_counts AS source_counts
+    """,
+    "subnetwork_go": """
+        // Edges between genes annotated with a GO term that involve at
+        // least one query gene
+        MATCH (go:BioEntity {id: $go_id})
+        MATCH (subj:BioEntity)-[r:indra_rel]->(obj:BioEntity)
+        WHERE (subj.id IN $gene_ids OR obj.id IN $gene_ids)
+          AND subj.id <> obj.id
+          AND subj.id STARTS WITH 'hgnc:'
+          AND obj.id STARTS WITH 'hgnc:'
+          AND ($statement_types IS NULL OR r.stmt_type IN $statement_types)
+          AND r.evidence_count >= $min_evidence
+          AND r.belief >= $min_belief
+          AND EXISTS { (subj)-->(go) }
+          AND EXISTS { (obj)-->(go) }
+        WITH subj, obj, r
+        ORDER BY r.belief DESC, r.evidence_count DESC
+        LIMIT $max_statements
+        RETURN
+          r.stmt_hash AS stmt_hash,
+          r.stmt_type AS stmt_type,
+          subj.id AS subj_id,
+          subj.name AS subj_name,
+          obj.id AS obj_id,
+          obj.name AS obj_name,
+          r.evidence_count AS evidence_count,
+          r.belief AS belief,
+          r.source_counts AS source_counts
+    """,
+    "subnetwork_mediated": """
+        // Two-hop paths A->X->B between query genes through a non-query gene
+        MATCH (a:BioEntity)-[r1:indra_rel]->(mediator:BioEntity)-[r2:indra_rel]->(b:BioEntity)
+        WHERE a.id IN $gene_ids
+          AND b.id IN $gene_ids
+          AND a.id <> b.id
+          AND mediator.id STARTS WITH 'hgnc:'
+          AND NOT mediator.id IN $gene_ids
+          AND ($statement_types IS NULL OR
+               (r1.stmt_type IN $statement_types AND r2.stmt_type IN $statement_types))
+          AND r1.evidence_count >= $min_evidence
+          AND r2.evidence_count >= $min_evidence
+          AND r1.belief >= $min_belief
+          AND r2.belief >= $min_belief
+        UNWIND [r1, r2] AS r
+        WITH DISTINCT r
+        WITH r, startNode(r) AS subj, endNode(r) AS obj
+        ORDER BY r.belief DESC, r.evidence_count DESC
+        LIMIT $max_statements
+        RETURN
+          r.stmt_hash AS stmt_hash,
+          r.stmt_type AS stmt_type,
+          subj.id AS subj_id,
+          subj.name AS subj_name,
+          obj.id AS obj_id,
+          obj.name AS obj_name,
+          r.evidence_count AS evidence_count,
+          r.belief AS belief,
+          r.source_counts AS source_counts
+    """,
+    "subnetwork_shared_upstream": """
+        // Regulators (outside the query) of at least two query genes
+        MATCH (subj:BioEntity)-[r:indra_rel]->(obj:BioEntity)
+        WHERE obj.id IN $gene_ids
+          AND NOT subj.id IN $gene_ids
+          AND subj.id STARTS WITH 'hgnc:'
+          AND ($statement_types IS NULL OR r.stmt_type IN $statement_types)
+          AND r.evidence_count >= $min_evidence
+          AND r.belief >= $min_belief
+        WITH subj, collect(r) AS rels, count(DISTINCT obj) AS targets
+        WHERE targets >= 2
+        UNWIND rels AS r
+        WITH subj, r, endNode(r) AS obj
+        ORDER BY r.belief DESC, r.evidence_count DESC
+        LIMIT $max_statements
+        RETURN
+          r.stmt_hash AS stmt_hash,
+          r.stmt_type AS stmt_type,
+          subj.id AS subj_id,
+          subj.name AS subj_name,
+          obj.id AS obj_id,
+          obj.name AS obj_name,
+          r.evidence_count AS evidence_count,
+          r.belief AS belief,
+          r.source_counts AS source_counts
+    """,
+    "subnetwork_shared_downstream": """
+        // Targets (outside the query) of at least two query genes
+        MATCH (subj:BioEntity)-[r:indra_rel]->(obj:BioEntity)
+        WHERE subj.id IN $gene_ids
+          AND NOT obj.id IN $gene_ids
+          AND obj.id STARTS WITH 'hgnc:'
+          AND ($statement_types IS NULL OR r.stmt_type IN $statement_types)
+          AND r.evidence_count >= $min_evidence
+          AND r.belief >= $min_belief
+        WITH obj, collect(r) AS rels, count(DISTINCT subj) AS sources
+        WHERE sources >= 2
+        UNWIND rels AS r
+        WITH obj, r, startNode(r) AS subj
+        ORDER BY r.belief DESC, r.evidence_count DESC
+        LIMIT $max_statements
+        RETURN
+          r.stmt_hash AS stmt_hash,
+          r.stmt_type AS stmt_type,
+          subj.id AS subj_id,
+          subj.name AS subj_name,
+          obj.id AS obj_id,
+          obj.name AS obj_name,
+          r.evidence_count AS evidence_count,
+          r.belief AS belief,
+          r.source_counts AS source_counts
+    """,
+    "source_target_analysis": """
+        // One source gene to multiple targets via indra_rel
+        MATCH (source:BioEntity)-[r:indra_rel]->(target:BioEntity)
+        WHERE source.id = $source_gene_id
+          AND ($target_gene_ids IS NULL OR target.id IN $target_gene_ids)
+          AND r.evidence_count >= $min_evidence
+          AND r.belief >= $min_belief
+          AND source.id STARTS WITH 'hgnc:'
+          AND target.id STARTS WITH 'hgnc:'
+        WITH source, target, r
+        ORDER BY r.belief DESC, r.evidence_count DESC
+        LIMIT $max_statements
+        RETURN
+          r.stmt_hash AS hash,
+          r.stmt_type AS type,
+          source.name AS subj_name,
+          source.id AS subj_id,
+          target.name AS obj_name,
+          target.id AS obj_id,
+          null AS residue,
+          null AS position,
+          r.evidence_count AS evidence_count,
+          r.belief AS belief,
+          r.source_counts AS sources
+    """,
+    # ========================================================================
+    # Tool 3: Enrichment analysis placeholder
+    # ========================================================================
+    "enrichment_analysis": """
+        // Placeholder - enrichment requires statistical computation
+        // This query would need backend support or client-side calculation
+        MATCH (g:BioEntity)
+        WHERE g.id IN $gene_ids
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          'enrichment_not_implemented' AS note
+        LIMIT 10
+    """,
+    # Health check
+    "health_check": """
+        RETURN 1 AS status
+    """,
+    # ========================================================================
+    # Tool 1: Integration test aliases (accept different param names)
+    # ========================================================================
+    "gene_to_features": """
+        MATCH (g:BioEntity)
+        WHERE (g.name = $gene OR g.id = $gene OR g.id = ('hgnc:' + $gene))
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+        RETURN
+          g.name AS name,
+          g.id AS id,
+          g.type AS type
+        LIMIT 1
+    """,
+    "tissue_to_genes": """
+        MATCH (g:BioEntity)-[:expressed_in]->(t:BioEntity)
+        WHERE (t.name = $tissue OR t.id = $tissue OR t.id CONTAINS $tissue)
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND t.id STARTS WITH 'uberon:'
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          g.type AS type
+        SKIP $offset LIMIT $limit
+    """,
+    "go_to_genes": """
+        MATCH (g:BioEntity)-[r]->(go:BioEntity)
+        WHERE (go.id = $go_term OR go.name = $go_term)
+          AND g.id STARTS WITH 'hgnc:'
+          AND g.obsolete = false
+          AND go.id STARTS WITH 'GO:'
+        RETURN
+          g.name AS gene,
+          g.id AS gene_id,
+          g.type AS type,
+          type(r) AS relationship
+        SKIP $offset LIMIT $limit
+    """,
+    # ========================================================================
+    # Gene-set library (enrichment memberships)
+    # ========================================================================
+    "gene_set_annotations": """
+        // Genes annotated to terms with the given ID prefix (GO, HPO)
+        MATCH (g:BioEntity)-[:associated_with]->(t:BioEntity)
+        WHERE t.id STARTS WITH $prefix
+          AND g.id STARTS WITH 'hgnc:'
+          AND (g.obsolete = false OR g.obsolete IS NULL)
+        RETURN
+          t.id AS term_id,
+          t.name AS term_name,
+          g.id AS member_id
+    """,
+    "gene_set_pathways": """
+        // Genes contained in pathways with the given ID prefix
+        MATCH (t:BioEntity)-[:haspart]->(g:BioEntity)
+        WHERE t.id STARTS WITH $prefix
+          AND g.id STARTS WITH 'hgnc:'
+          AND (g.obsolete = false OR g.obsolete IS NULL)
+        RETURN
+          t.id AS term_id,
+          t.name AS term_name,
+          g.id AS member_id
+    """,
+    # ========================================================================
+    # Kinase-substrate index (Tool 15)
+    # ========================================================================
+    "list_phosphorylations": """
+        // Kinase -> substrate phosphorylation statements (residue and
+        // position are only stored in the statement JSON)
+        MATCH (k:BioEntity)-[r:indra_rel]->(s:BioEntity)
+        WHERE r.stmt_type = 'Phosphorylation'
+          AND k.id STARTS WITH 'hgnc:'
+          AND s.id STARTS WITH 'hgnc:'
+          AND r.evidence_count >= $min_evidence
+          AND r.belief >= $min_belief
+        RETURN
+          k.id AS kinase_id,
+          k.name AS kinase_name,
+          s.name AS substrate_name,
+          r.stmt_json AS stmt_json
+    """,
+}
+
+# Defaults applied to every named operation (INDRA statement filters,
+# pagination and ontology term resolution)
+PARAMETER_DEFAULTS: dict[str, Any] = {
+    "limit": 20,
+    "offset": 0,
+    "min_evidence": 1,
+    "min_belief": 0.0,
+    "max_statements": 100,
+    "term_id": None,
+    "name": None,
+    "namespace": None,
+}
+
+# Per-query defaults for optional Cypher parameters
+QUERY_DEFAULTS: dict[str, dict[str, Any]] = {
+    "source_target_analysis": {"target_gene_ids": None},
+    "subnetwork_direct": {"statement_types": None, "tissue_id": None},
+    "subnetwork_go": {"statement_types": None},
+    "subnetwork_mediated": {"statement_types": None},
+    "subnetwork_shared_upstream": {"statement_types": None},
+    "subnetwork_shared_downstream": {"statement_types": None},
+}
+
+# Catalog queries that scan or traverse large parts of the graph; they run
+# with the long-running timeout instead of the default one
+LONG_RUNNING_QUERIES = frozenset(
+    {
+        "get_ontology_parents",
+        "get_ontology_children",
+        "get_ontology_hierarchy",
+        "list_ontology_edges",
+        "list_entity_names",
+        "list_phosphorylations",
+        "gene_set_annotations",
+        "gene_set_pathways",
+    }
+)
+
+# Result fields holding CURIEs that are split into namespace/identifier
+CURIE_FIELDS = ("id", "gene_id", "tissue_id", "go_id", "pathway_id", "disease_id")
+
+_PARAM_PATTERN = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
+_ALIAS_PATTERN = re.compile(r"\bAS\s+([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
+_WRITE_PATTERN = re.compile(
+    r"\b(?:CREATE|MERGE|DELETE|DETACH|SET|REMOVE|FOREACH|LOAD\s+CSV)\b", re.IGNORECASE
+)
+_PAGING_PATTERN = re.compile(r"\b(?:SKIP|LIMIT)\s+\$([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
+
+# Parameter carrying the row list in batched (UNWIND) queries
+BATCH_ROWS_PARAMETER = "__rows"
+# Per-row key used to demultiplex batched results back to their input row
+BATCH_INDEX_FIELD = "__index"
+
+
+@dataclass(frozen=True)
+class CypherQuery:
+    """A named Cypher operation compiled once at import time."""
+
+    name: str
+    cypher: str
+    parameters: frozenset[str]
+    defaults: Mapping[str, Any]
+    columns: tuple[str, ...]
+    curie_fields: tuple[str, ...]
+    paging_parameters: frozenset[str]
+    batch_cypher: str
+    read_only: bool
+    long_running: bool = False
+
+    def bind(self, params: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Build the parameter map sent to Neo4j.
+
+        Only parameters declared by the Cypher text are passed through, with
+        defaults filled in for any the caller omitted.
+
+        Args:
+            params: Caller-supplied parameters
+
+        Returns:
+            Parameters for session.run()
+        """
+        bound = dict(self.defaults)
+        bound.update((key, value) for key, value in params.items() if key in self.parameters)
+        return bound
+
+    def bind_batch(
+        self, param_rows: Sequence[Mapping[str, Any]]
+    ) -> list[tuple[dict[str, Any], list[dict[str, Any]]]]:
+        """
+        Build parameter maps for batch_cypher.
+
+        SKIP/LIMIT cannot reference per-row values, so paging parameters are
+        sent once per group and rows are grouped by their paging values.
+
+        Args:
+            param_rows: Caller-supplied parameters, one mapping per row
+
+        Returns:
+            List of (shared parameters, row parameters) groups. Each row
+            carries its input position under BATCH_INDEX_FIELD.
+        """
+        groups: dict[tuple, tuple[dict[str, Any], list[dict[str, Any]]]] = {}
+
+        for index, params in enumerate(param_rows):
+            row = self.bind(params)
+            shared = {key: row.pop(key) for key in self.paging_parameters if key in row}
+            row[BATCH_INDEX_FIELD] = index
+
+            group_key = tuple(sorted(shared.items()))
+            groups.setdefault(group_key, (shared, []))[1].append(row)
+
+        return list(groups.values())
+
+
+def is_read_only_cypher(cypher: str) -> bool:
+    """
+    Check whether Cypher text contains no write clauses.
+
+    Args:
+        cypher: Cypher query string
+
+    Returns:
+        True if the query can run in a read transaction
+    """
+    return _WRITE_PATTERN.search(cypher) is None
+
+
+def _to_batch_cypher(
+    cypher: str,
+    row_parameters: frozenset[str],
+    columns: tuple[str, ...],
+) -> str:
+    """
+    Rewrite a query to run once per element of $__rows.
+
+    Per-row parameters become fields of the unwound row, and the original
+    query runs as a correlated subquery so LIMIT/aggregation stay per row.
+    """
+    body = _PARAM_PATTERN.sub(
+        lambda match: (
+            f"__row.{match.group(1)}" if match.group(1) in row_parameters else match.group(0)
+        ),
+        cypher,
+    )
+    returned = ", ".join([f"__row.{BATCH_INDEX_FIELD} AS {BATCH_INDEX_FIELD}", *columns])
+
+    return (
+        f"UNWIND ${BATCH_ROWS_PARAMETER} AS __row\n"
+        f"CALL {{\n"
+        f"    WITH __row\n"
+        f"{body}\n"
+        f"}}\n"
+        f"RETURN {returned}"
+    )
+
+
+def _compile(name: str, cypher: str) -> CypherQuery:
+    """Compile a Cypher string into a CypherQuery."""
+    parameters = frozenset(_PARAM_PATTERN.findall(cypher))
+    paging_parameters = frozenset(_PAGING_PATTERN.findall(cypher))
+    defaults = {**PARAMETER_DEFAULTS, **QUERY_DEFAULTS.get(name, {})}
+
+    # Result columns are the aliases of the final RETURN clause
+    return_index = cypher.upper().rfind("RETURN")
+    columns = tuple(_ALIAS_PATTERN.findall(cypher[return_index:])) if return_index >= 0 else ()
+
+    return CypherQuery(
+        name=name,
+        cypher=cypher,
+        parameters=parameters,
+        defaults=MappingProxyType(
+            {key: value for key, value in defaults.items() if key in parameters}
+        ),
+        columns=columns,
+        curie_fields=tuple(field for field in CURIE_FIELDS if field in columns),
+        paging_parameters=paging_parameters,
+        batch_cypher=_to_batch_cypher(cypher, parameters - paging_parameters, columns),
+        read_only=is_read_only_cypher(cypher),
+        long_running=name in LONG_RUNNING_QUERIES,
+    )
+
+
+def _build_registry() -> Mapping[str, CypherQuery]:
+    """Compile the catalog and resolve aliases to shared CypherQuery objects."""
+    registry = {name: _compile(name, cypher) for name, cypher in _CYPHER.items()}
+    for alias, target in QUERY_ALIASES.items():
+        if alias not in registry and target in registry:
+            registry[alias] = registry[target]
+    return MappingProxyType(registry)
+
+
+QUERY_REGISTRY: Mapping[str, CypherQuery] = _build_registry()
+
+
+def get_query(query_name: str) -> CypherQuery:
+    """
+    Look up a compiled query by name or alias.
+
+    Args:
+        query_name: Query operation name
+
+    Returns:
+        Compiled CypherQuery
+
+    Raises:
+        ValueError: If query name is unknown
+    """
+    try:
+        return QUERY_REGISTRY[query_name]
+    except KeyError:
+        raise ValueError(f"Unknown query: {query_name}") from None
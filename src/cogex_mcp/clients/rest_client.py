@@ -21,6 +21,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from cogex_mcp.clients.limiter import QueryTimeoutError
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,7 +99,7 @@ class RestClient:
                 logger.info("REST client closed")
 
     @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.ConnectError)),
+        retry=retry_if_exception_type((QueryTimeoutError, httpx.ConnectError)),
         wait=wait_exponential(multiplier=1, min=1, max=30),
         stop=stop_after_attempt(3),
         before_sleep=before_sleep_log(logger, logging.WARNING),
@@ -119,6 +121,7 @@ class RestClient:
             Query results as dictionary
 
         Raises:
+            QueryTimeoutError: If the request times out
             httpx.HTTPError: If request fails
             RuntimeError: If not initialized
         """
@@ -165,7 +168,7 @@ class RestClient:
 
         except httpx.TimeoutException as e:
             logger.error(f"Query '{query_name}' timed out: {e}")
-            raise
+            raise QueryTimeoutError(f"Query timeout: {e}") from e
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -41,7 +41,10 @@ class Settings(BaseSettings):
 
     neo4j_url: str | None = Field(
         default=None,
-        description="Neo4j bolt URL (e.g., bolt://localhost:7687)",
+        description=(
+            "Neo4j URL: bolt://host:7687 for a single server, "
+            "neo4j://host:7687 for a routing cluster"
+        ),
     )
     neo4j_user: str = Field(
         default="neo4j",
@@ -51,6 +54,14 @@ class Settings(BaseSettings):
         default=None,
         description="Neo4j password",
     )
+    neo4j_database: str | None = Field(
+        default=None,
+        description="Neo4j database name (None uses the server default)",
+    )
+    neo4j_causal_consistency: bool = Field(
+        default=False,
+        description="Chain sessions with bookmarks so reads observe earlier writes",
+    )
     neo4j_max_connection_pool_size: int = Field(
         default=50,
         ge=1,
@@ -69,6 +80,26 @@ class Settings(BaseSettings):
         le=86400,
         description="Maximum connection lifetime in seconds",
     )
+    neo4j_batch_chunk_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Maximum parameter rows sent per batched (UNWIND) query",
+    )
+    neo4j_fulltext_search: bool = Field(
+        default=True,
+        description="Resolve drug/disease/pathway names through a full-text index",
+    )
+    neo4j_create_fulltext_indexes: bool = Field(
+        default=False,
+        description="Create the BioEntity name full-text index if it is missing (schema write)",
+    )
+    neo4j_local_name_index_max_entries: int = Field(
+        default=250000,
+        ge=0,
+        le=5000000,
+        description="Maximum names per entity type held in memory when no full-text index exists",
+    )
 
     # ========================================================================
     # REST API Configuration (Fallback)
@@ -121,11 +152,49 @@ class Settings(BaseSettings):
         le=100000,
         description="Maximum cache entries",
     )
+    cache_max_memory_mb: int = Field(
+        default=256,
+        ge=0,
+        le=65536,
+        description=(
+            "Memory budget for cached values in MB (0 = entry count limit only); "
+            "split over cache_shards, so one value can use at most "
+            "cache_max_memory_mb / cache_shards"
+        ),
+    )
     cache_stats_interval: int = Field(
         default=300,
         ge=0,
         description="Log cache stats interval (0=disabled)",
     )
+    cache_shards: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Independently locked cache shards (LRU order is per shard)",
+    )
+    cache_negative_ttl_seconds: int = Field(
+        default=30,
+        ge=0,
+        le=3600,
+        description="Seconds a failed get_or_set computation is re-raised (0=disabled)",
+    )
+    cache_l2_path: str | None = Field(
+        default=None,
+        description="SQLite file for the persistent L2 cache shared by server processes",
+    )
+    cache_l2_ttl_seconds: int = Field(
+        default=86400,
+        ge=60,
+        le=2592000,
+        description="L2 cache entry TTL (time-to-live)",
+    )
+    cache_l2_max_entries: int = Field(
+        default=100000,
+        ge=100,
+        le=10000000,
+        description="Maximum L2 cache entries (oldest dropped first)",
+    )
 
     # ========================================================================
     # Performance Configuration
@@ -141,7 +210,19 @@ class Settings(BaseSettings):
         default=5000,
         ge=100,
         le=60000,
-        description="Default query timeout in milliseconds",
+        description="Default server-side transaction timeout for Neo4j queries (ms)",
+    )
+    complex_query_timeout_ms: int = Field(
+        default=30000,
+        ge=1000,
+        le=600000,
+        description="Transaction timeout for long-running catalog queries (scans, traversals)",
+    )
+    batch_query_timeout_ms: int = Field(
+        default=30000,
+        ge=1000,
+        le=600000,
+        description="Minimum transaction timeout per chunk of a batched (UNWIND) query",
     )
     enrichment_timeout_ms: int = Field(
         default=15000,
@@ -159,13 +240,144 @@ class Settings(BaseSettings):
         default=10,
         ge=1,
         le=100,
-        description="Maximum concurrent query operations",
+        description="Maximum concurrent query operations (limit of the adaptive query lane)",
+    )
+    hedge_queries: bool = Field(
+        default=False,
+        description="Send slow read queries to the fallback backend as well (first answer wins)",
+    )
+    hedge_budget_ratio: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Maximum fraction of eligible queries that may be hedged",
+    )
+    hedge_min_samples: int = Field(
+        default=20,
+        ge=1,
+        le=200,
+        description="Primary latency samples per query name needed before hedging it",
+    )
+    adaptive_concurrency: bool = Field(
+        default=True,
+        description="Lower query concurrency limits when latency rises (otherwise fixed)",
+    )
+    max_queued_queries: int = Field(
+        default=100,
+        ge=0,
+        le=10000,
+        description="Queries waiting per lane for a slot before new ones are rejected",
+    )
+    query_queue_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        le=60000,
+        description="Maximum wait for a query slot before the query is rejected (ms)",
+    )
+    coalesce_queries: bool = Field(
+        default=True,
+        description="Share one backend execution between identical concurrent queries",
     )
     max_concurrent_enrichments: int = Field(
         default=3,
         ge=1,
         le=10,
-        description="Maximum concurrent enrichment analyses",
+        description=(
+            "Maximum concurrent enrichment analyses (size of the enrichment thread pool "
+            "and limit of the analytics query lane)"
+        ),
+    )
+    gsea_processes: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Worker processes for GSEA permutations (0 = run in the enrichment thread)",
+    )
+    domain_client_workers: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Threads running synchronous domain client calls off the event loop",
+    )
+
+    # ========================================================================
+    # Health Check Configuration
+    # ========================================================================
+
+    health_check_interval_seconds: int = Field(
+        default=30,
+        ge=1,
+        le=3600,
+        description="Seconds between background health probes of a healthy backend",
+    )
+    health_check_max_backoff_seconds: int = Field(
+        default=300,
+        ge=1,
+        le=86400,
+        description="Maximum seconds between probes of a failing backend (delay doubles per failure)",
+    )
+    health_check_jitter: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=0.5,
+        description="Random fraction (±) applied to health probe delays",
+    )
+    health_check_timeout_seconds: float = Field(
+        default=10.0,
+        gt=0.0,
+        le=120.0,
+        description="Seconds before a health probe counts as failed",
+    )
+
+    # ========================================================================
+    # Ontology Index Configuration
+    # ========================================================================
+
+    ontology_index_enabled: bool = Field(
+        default=True,
+        description="Answer ontology hierarchy lookups from an in-memory index",
+    )
+    ontology_index_snapshot_path: str | None = Field(
+        default=None,
+        description="Snapshot file (gzipped JSON) the ontology index is loaded from and saved to",
+    )
+    ontology_index_refresh_seconds: int = Field(
+        default=86400,
+        ge=0,
+        le=604800,
+        description="Seconds between ontology index rebuilds from Neo4j (0 disables refresh)",
+    )
+
+    # ========================================================================
+    # Gene-Set Library Configuration
+    # ========================================================================
+
+    gene_set_library_dir: str | None = Field(
+        default=None,
+        description="Directory of gene-set library snapshots (enables in-process enrichment)",
+    )
+    gene_set_library_sources: str = Field(
+        default="go,reactome,wikipathways,phenotype",
+        description="Comma-separated enrichment sources materialized in the gene-set library",
+    )
+    gene_set_library_auto_build: bool = Field(
+        default=True,
+        description="Build the gene-set library from Neo4j at startup when no snapshot exists",
+    )
+
+    # ========================================================================
+    # Kinase Index Configuration
+    # ========================================================================
+
+    kinase_index_ttl_seconds: int = Field(
+        default=86400,
+        ge=0,
+        le=604800,
+        description="Seconds before the in-memory kinase-substrate index is rebuilt (0 = never)",
+    )
+    kinase_index_warm_on_startup: bool = Field(
+        default=True,
+        description="Build the kinase-substrate index in the background at startup",
     )
 
     # ========================================================================
@@ -225,6 +437,18 @@ class Settings(BaseSettings):
     # Validators
     # ========================================================================
 
+    @field_validator("neo4j_url")
+    @classmethod
+    def validate_neo4j_url(cls, v: str | None) -> str | None:
+        """Validate Neo4j URL scheme."""
+        if v is None:
+            return v
+        valid_schemes = {"bolt", "bolt+s", "bolt+ssc", "neo4j", "neo4j+s", "neo4j+ssc"}
+        scheme = v.split("://", 1)[0].lower()
+        if scheme not in valid_schemes:
+            raise ValueError(f"Invalid Neo4j URL scheme: {v}. Must be one of {valid_schemes}")
+        return v
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -264,6 +488,16 @@ class Settings(BaseSettings):
         """Check if Neo4j is configured."""
         return bool(self.neo4j_url and self.neo4j_password)
 
+    @property
+    def uses_neo4j_routing(self) -> bool:
+        """Check if the Neo4j URL uses cluster routing (neo4j:// schemes)."""
+        return bool(self.neo4j_url) and self.neo4j_url.lower().startswith("neo4j")
+
+    @property
+    def gene_set_library_source_list(self) -> list[str]:
+        """Sources materialized in the gene-set library."""
+        return [s.strip() for s in self.gene_set_library_sources.split(",") if s.strip()]
+
     @property
     def has_rest_fallback(self) -> bool:
         """Check if REST fallback is available."""
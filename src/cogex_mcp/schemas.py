@@ -413,6 +413,7 @@ class EnrichmentType(str, Enum):
     CONTINUOUS = "continuous"  # GSEA with ranked list
     SIGNED = "signed"  # Directional enrichment
     METABOLITE = "metabolite"  # Metabolite set enrichment
+    BATCH = "batch"  # Many gene lists, shared background
 
 
 class EnrichmentSource(str, Enum):
@@ -441,6 +442,12 @@ class EnrichmentQuery(BaseToolInput):
         description="Background gene set (optional)",
     )
 
+    # For batch enrichment
+    gene_lists: dict[str, list[str]] | None = Field(
+        None,
+        description="List name → genes for batch analysis (shared background)",
+    )
+
     # For continuous/signed enrichment
     ranked_genes: dict[str, float] | None = Field(
         None,
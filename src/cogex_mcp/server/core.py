@@ -19,9 +19,13 @@ import mcp.types as types
 from mcp.server.lowlevel import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
-from cogex_mcp.clients.adapter import close_adapter, get_adapter
+from cogex_mcp.clients.adapter import BackendType, close_adapter, get_adapter
+from cogex_mcp.clients.gene_set_library import ensure_gene_set_library
+from cogex_mcp.clients.gsea_engine import close_process_pool
+from cogex_mcp.clients.kinase_index import start_kinase_index_build
 from cogex_mcp.config import settings
 from cogex_mcp.services.cache import get_cache
+from cogex_mcp.services.ontology_index import get_ontology_index
 
 # Configure logging
 logging.basicConfig(
@@ -40,11 +44,13 @@ server = Server("cogex_mcp")
 # Global state
 _adapter = None
 _cache = None
+_gene_set_library_task = None
+_kinase_index_task = None
 
 
 async def initialize_backend():
     """Initialize backend connections and services."""
-    global _adapter, _cache
+    global _adapter, _cache, _gene_set_library_task, _kinase_index_task
 
     logger.info("🚀 Starting INDRA CoGEx MCP Server (Modular)")
     logger.info(
@@ -63,6 +69,24 @@ async def initialize_backend():
         f"ttl={_cache.ttl_seconds}s, enabled={_cache.enabled}"
     )
 
+    # Load the ontology index in the background (lookups fall back to Neo4j until ready)
+    ontology_index = get_ontology_index()
+    if ontology_index is not None:
+        ontology_index.start()
+        logger.info("✓ Ontology index loading in background")
+
+    # Load (or build) the gene-set library in the background (enrichment
+    # queries Neo4j until ready)
+    if settings.gene_set_library_dir:
+        _gene_set_library_task = asyncio.create_task(ensure_gene_set_library())
+        logger.info("✓ Gene-set library loading in background")
+
+    # Build the kinase-substrate index in the background (kinase analyses
+    # wait for it up to their timeout until ready)
+    if settings.kinase_index_warm_on_startup and _adapter.primary_backend == BackendType.NEO4J:
+        _kinase_index_task = start_kinase_index_build(_adapter.neo4j_client)
+        logger.info("✓ Kinase-substrate index building in background")
+
     # Get adapter status
     status = _adapter.get_status()
     logger.info(f"Backend status: {status}")
@@ -76,6 +100,20 @@ async def cleanup_backend():
     if _cache and _cache.enabled:
         stats = _cache.get_stats()
         logger.info(f"Final cache stats: {stats}")
+        if _cache.store is not None:
+            _cache.store.close()
+
+    ontology_index = get_ontology_index()
+    if ontology_index is not None:
+        await ontology_index.stop()
+
+    if _gene_set_library_task is not None and not _gene_set_library_task.done():
+        _gene_set_library_task.cancel()
+
+    if _kinase_index_task is not None and not _kinase_index_task.done():
+        _kinase_index_task.cancel()
+
+    close_process_pool()
 
     await close_adapter()
     logger.info("✓ Connections closed")
@@ -4,12 +4,14 @@ Enrichment
 Extracted from monolithic server.py
 """
 
+import asyncio
 import logging
 from typing import Any
 
 import mcp.types as types
 
 from cogex_mcp.clients.adapter import get_adapter
+from cogex_mcp.config import settings
 from cogex_mcp.services.entity_resolver import get_resolver, EntityResolutionError
 from cogex_mcp.services.formatter import get_formatter
 from cogex_mcp.services.pagination import get_pagination
@@ -37,6 +39,8 @@ async def handle(args: dict[str, Any]) -> list[types.TextContent]:
             result = await _analyze_signed(args)
         elif analysis_type == "metabolite":
             result = await _analyze_metabolite(args)
+        elif analysis_type == "batch":
+            result = await _analyze_batch(args)
         else:
             return [types.TextContent(
                 type="text",
@@ -160,6 +164,8 @@ async def _analyze_continuous(args: dict[str, Any]) -> dict[str, Any]:
 
     if not resolved_ranking:
         raise ValueError(f"No genes could be resolved. Failed: {', '.join(failed_genes)}")
+    if len(set(resolved_ranking.values())) == 1:
+        raise ValueError("ranked_genes scores are all equal; GSEA needs varying scores")
 
     # Query backend
     adapter = await get_adapter()
@@ -215,6 +221,8 @@ async def _analyze_signed(args: dict[str, Any]) -> dict[str, Any]:
 
     if not resolved_ranking:
         raise ValueError(f"No genes could be resolved. Failed: {', '.join(failed_genes)}")
+    if len(set(resolved_ranking.values())) == 1:
+        raise ValueError("ranked_genes scores are all equal; GSEA needs varying scores")
 
     # Count up/down regulated genes
     upregulated = sum(1 for score in resolved_ranking.values() if score > 0)
@@ -298,6 +306,92 @@ async def _analyze_metabolite(args: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+async def _analyze_batch(args: dict[str, Any]) -> dict[str, Any]:
+    """Mode: batch - Overrepresentation analysis for many gene lists with a shared background."""
+    gene_lists = args.get("gene_lists")
+    if not gene_lists:
+        raise ValueError("gene_lists parameter required for batch analysis")
+
+    # Resolve each distinct gene once, however many lists it appears in
+    resolver = get_resolver()
+    background_genes = args.get("background_genes") or []
+    distinct_genes = {gene for genes in gene_lists.values() for gene in genes}
+    distinct_genes.update(background_genes)
+
+    # Concurrently, at most max_concurrent_queries lookups in flight
+    semaphore = asyncio.Semaphore(settings.max_concurrent_queries)
+
+    async def resolve(gene: str) -> str | None:
+        async with semaphore:
+            try:
+                return (await resolver.resolve_gene(gene)).curie
+            except EntityResolutionError as e:
+                logger.warning(f"Failed to resolve gene '{gene}': {e}")
+                return None
+
+    genes_in_order = sorted(distinct_genes)
+    resolved = await asyncio.gather(*(resolve(gene) for gene in genes_in_order))
+    curies = {
+        gene: curie for gene, curie in zip(genes_in_order, resolved, strict=True) if curie
+    }
+    failed_genes = [gene for gene in genes_in_order if gene not in curies]
+
+    resolved_lists = {
+        name: [curies[gene] for gene in genes if gene in curies]
+        for name, genes in gene_lists.items()
+    }
+    if not any(resolved_lists.values()):
+        raise ValueError(f"No genes could be resolved. Failed: {', '.join(failed_genes)}")
+
+    # Query backend
+    adapter = await get_adapter()
+
+    query_params = {
+        "gene_lists": resolved_lists,
+        "analysis_type": "batch",
+        "source": args.get("source", "go"),
+        "alpha": args.get("alpha", 0.05),
+        "correction_method": args.get("correction_method", "fdr_bh"),
+        "keep_insignificant": args.get("keep_insignificant", False),
+        "timeout": ENRICHMENT_TIMEOUT,
+    }
+
+    background_gene_ids = [curies[gene] for gene in background_genes if gene in curies]
+    if background_gene_ids:
+        query_params["background_genes"] = background_gene_ids
+
+    enrichment_data = await adapter.query("enrichment_analysis", **query_params)
+
+    # Compact per-list results (no overlap gene lists)
+    list_results = enrichment_data.get("results") if enrichment_data.get("success") else None
+    lists = {}
+    for name, genes in resolved_lists.items():
+        records = (list_results or {}).get(name, [])
+        lists[name] = {
+            "resolved_genes": len(genes),
+            "results": [
+                {
+                    "term_id": record.get("term_id"),
+                    "term_name": record.get("term_name"),
+                    "p_value": record.get("p_value"),
+                    "adjusted_p_value": record.get("adjusted_p_value"),
+                    "gene_count": record.get("gene_count"),
+                    "term_size": record.get("term_size"),
+                }
+                for record in records
+            ],
+        }
+
+    return {
+        "lists": lists,
+        "total_lists": len(gene_lists),
+        "source": args.get("source", "go"),
+        "alpha": args.get("alpha", 0.05),
+        "correction_method": args.get("correction_method", "fdr_bh"),
+        "failed_genes": failed_genes if failed_genes else None,
+    }
+
+
 # Data parsing helpers for Tool 4
 def _parse_enrichment_results(data: dict[str, Any], analysis_type: str) -> list[dict[str, Any]]:
     """Parse enrichment results from backend response."""
@@ -102,7 +102,7 @@ async def _tissue_to_genes(args: dict[str, Any]) -> dict[str, Any]:
     tissue_id = tissue_input if isinstance(tissue_input, str) else tissue_input[1]
 
     adapter = await get_adapter()
-    gene_data = await adapter.query(
+    records = adapter.stream_query(
         "get_genes_in_tissue",
         tissue_id=tissue_id,
         limit=limit,
@@ -110,14 +110,20 @@ async def _tissue_to_genes(args: dict[str, Any]) -> dict[str, Any]:
         timeout=STANDARD_QUERY_TIMEOUT,
     )
 
-    genes = _parse_gene_list(gene_data)
+    # Stop fetching once the page would exceed the response character limit
+    genes, truncated = await get_formatter().collect_within_budget(
+        records,
+        format_type=args.get("response_format", "markdown"),
+        max_chars=CHARACTER_LIMIT,
+        transform=_parse_gene_record,
+    )
 
     pagination_service = get_pagination()
-    pagination = pagination_service.paginate(
+    pagination = pagination_service.paginate_stream(
         items=genes,
-        total_count=gene_data.get("total_count", len(genes)),
         offset=offset,
         limit=limit,
+        truncated=truncated,
     )
 
     return {
@@ -135,7 +141,7 @@ async def _go_to_genes(args: dict[str, Any]) -> dict[str, Any]:
     go_id = go_input if isinstance(go_input, str) else go_input[1]
 
     adapter = await get_adapter()
-    gene_data = await adapter.query(
+    records = adapter.stream_query(
         "get_genes_for_go_term",
         go_id=go_id,
         limit=limit,
@@ -143,14 +149,20 @@ async def _go_to_genes(args: dict[str, Any]) -> dict[str, Any]:
         timeout=STANDARD_QUERY_TIMEOUT,
     )
 
-    genes = _parse_gene_list(gene_data)
+    # Stop fetching once the page would exceed the response character limit
+    genes, truncated = await get_formatter().collect_within_budget(
+        records,
+        format_type=args.get("response_format", "markdown"),
+        max_chars=CHARACTER_LIMIT,
+        transform=_parse_gene_record,
+    )
 
     pagination_service = get_pagination()
-    pagination = pagination_service.paginate(
+    pagination = pagination_service.paginate_stream(
         items=genes,
-        total_count=gene_data.get("total_count", len(genes)),
         offset=offset,
         limit=limit,
+        truncated=truncated,
     )
 
     return {
@@ -260,21 +272,14 @@ def _parse_pathway_memberships(data: dict[str, Any]) -> list[dict[str, Any]]:
     return pathways
 
 
-def _parse_gene_list(data: dict[str, Any]) -> list[dict[str, Any]]:
-    """Parse gene list from backend response."""
-    if not data.get("success") or not data.get("records"):
-        return []
-
-    genes = []
-    for record in data["records"]:
-        genes.append({
-            "name": record.get("gene", "Unknown"),
-            "curie": record.get("gene_id", "unknown:unknown"),
-            "namespace": "hgnc",
-            "identifier": record.get("gene_id", "unknown"),
-        })
-
-    return genes
+def _parse_gene_record(record: dict[str, Any]) -> dict[str, Any]:
+    """Parse a single gene record from backend response."""
+    return {
+        "name": record.get("gene", "Unknown"),
+        "curie": record.get("gene_id", "unknown:unknown"),
+        "namespace": "hgnc",
+        "identifier": record.get("gene_id", "unknown"),
+    }
 
 
 def _parse_disease_associations(data: dict[str, Any]) -> list[dict[str, Any]]:
@@ -5,6 +5,7 @@ Extracted from monolithic server.py
 """
 
 import logging
+import re
 from typing import Any
 
 import mcp.types as types
@@ -70,6 +71,11 @@ async def handle(args: dict[str, Any]) -> list[types.TextContent]:
             query_params["background"] = background_sites
 
         enrichment_data = await adapter.query("kinase_analysis", **query_params)
+        if not enrichment_data.get("success") and enrichment_data.get("error"):
+            return [types.TextContent(
+                type="text",
+                text=f"Error: {enrichment_data['error']}"
+            )]
 
         # Parse results
         results = _parse_kinase_results(enrichment_data)
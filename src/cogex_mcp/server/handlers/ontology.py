@@ -12,6 +12,7 @@ import mcp.types as types
 from cogex_mcp.clients.adapter import get_adapter
 from cogex_mcp.services.entity_resolver import get_resolver
 from cogex_mcp.services.formatter import get_formatter
+from cogex_mcp.services.ontology_index import get_ontology_index
 from cogex_mcp.services.pagination import get_pagination
 from cogex_mcp.constants import (
     CHARACTER_LIMIT,
@@ -74,6 +75,11 @@ async def _get_ontology_parents(params) -> dict[str, Any]:
     resolver = get_resolver()
     term = await resolver.resolve_ontology_term(params.term)
 
+    # Answer from the in-memory ontology index when it has the term
+    indexed = _lookup_in_index(term.curie, "parents", params.max_depth)
+    if indexed is not None:
+        return {"root_term": term.model_dump(), **indexed}
+
     adapter = await get_adapter()
 
     # Build query parameters for ontology hierarchy query
@@ -105,6 +111,11 @@ async def _get_ontology_children(params) -> dict[str, Any]:
     resolver = get_resolver()
     term = await resolver.resolve_ontology_term(params.term)
 
+    # Answer from the in-memory ontology index when it has the term
+    indexed = _lookup_in_index(term.curie, "children", params.max_depth)
+    if indexed is not None:
+        return {"root_term": term.model_dump(), **indexed}
+
     adapter = await get_adapter()
 
     # Build query parameters for ontology hierarchy query
@@ -136,6 +147,11 @@ async def _get_ontology_hierarchy(params) -> dict[str, Any]:
     resolver = get_resolver()
     term = await resolver.resolve_ontology_term(params.term)
 
+    # Answer from the in-memory ontology index when it has the term
+    indexed = _lookup_in_index(term.curie, "both", params.max_depth)
+    if indexed is not None:
+        return {"root_term": term.model_dump(), **indexed}
+
     adapter = await get_adapter()
 
     # Build query parameters for ontology hierarchy query
@@ -163,6 +179,28 @@ async def _get_ontology_hierarchy(params) -> dict[str, Any]:
     }
 
 
+def _lookup_in_index(curie: str, direction: str, max_depth: int) -> dict[str, Any] | None:
+    """
+    Get parents and/or children from the ontology index.
+
+    Returns:
+        Dict with parents and children (None for the direction not requested),
+        or None if the index is disabled, not loaded yet, or lacks the term
+    """
+    index = get_ontology_index()
+    if index is None:
+        return None
+
+    parents = index.parents(curie, max_depth) if direction in ("parents", "both") else None
+    children = index.children(curie, max_depth) if direction in ("children", "both") else None
+
+    if (direction != "children" and parents is None) or (direction != "parents" and children is None):
+        return None
+
+    logger.debug(f"Ontology {direction} for {curie} answered from index")
+    return {"parents": parents, "children": children}
+
+
 def _generate_ascii_tree(
     root_term: dict[str, Any] | None,
     parents: list[dict[str, Any]] | None,
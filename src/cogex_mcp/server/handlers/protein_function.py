@@ -21,6 +21,17 @@ from cogex_mcp.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Function type names accepted by check_function_types, mapped to backend queries
+_FUNCTION_TYPE_QUERIES = {
+    "kinase": "is_kinase",
+    "protein_kinase": "is_kinase",
+    "phosphatase": "is_phosphatase",
+    "protein_phosphatase": "is_phosphatase",
+    "transcription_factor": "is_transcription_factor",
+    "transcription factor": "is_transcription_factor",
+    "tf": "is_transcription_factor",
+}
+
 
 async def handle(args: dict[str, Any]) -> list[types.TextContent]:
     """Handle protein functions query - Tool 16."""
@@ -226,55 +237,43 @@ async def _check_function_types(args: dict[str, Any]) -> dict[str, Any]:
             resolved_genes[str(gene_input)] = None
 
     adapter = await get_adapter()
-    function_checks = {}
+    genes = [gene for gene in resolved_genes.values() if gene is not None]
+
+    # One batched query per function type covering every resolved gene
+    function_results: dict[str, list[bool]] = {}
+    for function_type in function_types:
+        query_name = _FUNCTION_TYPE_QUERIES.get(function_type.lower())
+        if query_name is None:
+            logger.warning(f"Unknown function type: {function_type}")
+            function_results[function_type] = [False] * len(genes)
+            continue
+
+        try:
+            batch_data = await adapter.query_batch(
+                query_name,
+                [{"gene_id": gene.curie} for gene in genes],
+                timeout=STANDARD_QUERY_TIMEOUT,
+            )
+            function_results[function_type] = [
+                _has_function(check_data) for check_data in batch_data["results"]
+            ]
+        except Exception as e:
+            logger.warning(f"Error checking {function_type}: {e}")
+            function_results[function_type] = [False] * len(genes)
 
-    # Check each function type for each gene
+    function_checks = {}
+    gene_index = 0
     for gene_name, gene in resolved_genes.items():
         if gene is None:
             # Gene could not be resolved
             function_checks[gene_name] = dict.fromkeys(function_types, False)
             continue
 
-        gene_results = {}
-
-        for function_type in function_types:
-            function_lower = function_type.lower()
-
-            try:
-                # Map function type to backend endpoint
-                if function_lower in ["kinase", "protein_kinase"]:
-                    check_data = await adapter.query(
-                        "is_kinase",
-                        gene_id=gene.curie,
-                        timeout=STANDARD_QUERY_TIMEOUT,
-                    )
-                elif function_lower in ["phosphatase", "protein_phosphatase"]:
-                    check_data = await adapter.query(
-                        "is_phosphatase",
-                        gene_id=gene.curie,
-                        timeout=STANDARD_QUERY_TIMEOUT,
-                    )
-                elif function_lower in ["transcription_factor", "transcription factor", "tf"]:
-                    check_data = await adapter.query(
-                        "is_transcription_factor",
-                        gene_id=gene.curie,
-                        timeout=STANDARD_QUERY_TIMEOUT,
-                    )
-                else:
-                    logger.warning(f"Unknown function type: {function_type}")
-                    gene_results[function_type] = False
-                    continue
-
-                has_function = (
-                    check_data.get("result", False) if check_data.get("success") else False
-                )
-                gene_results[function_type] = has_function
-
-            except Exception as e:
-                logger.warning(f"Error checking {function_type} for {gene_name}: {e}")
-                gene_results[function_type] = False
-
-        function_checks[gene_name] = gene_results
+        function_checks[gene_name] = {
+            function_type: function_results[function_type][gene_index]
+            for function_type in function_types
+        }
+        gene_index += 1
 
     return {
         "function_checks": function_checks,
@@ -284,6 +283,15 @@ async def _check_function_types(args: dict[str, Any]) -> dict[str, Any]:
 
 
 # Data parsing helpers for Tool 16
+def _has_function(data: dict[str, Any]) -> bool:
+    """Read the boolean result of an is_kinase/is_phosphatase/is_transcription_factor check."""
+    if not data.get("success"):
+        return False
+    if "result" in data:
+        return bool(data["result"])
+    return any(record.get("result") for record in data.get("records", []))
+
+
 def _parse_enzyme_activities(data: dict[str, Any]) -> list[dict[str, Any]]:
     """Parse enzyme activities from backend response."""
     if not data.get("success") or not data.get("records"):
@@ -320,6 +320,7 @@ Sources: go, reactome, wikipathways, indra-upstream, indra-downstream, phenotype
 Direct usage (recommended for standard gene symbols):
 - Discrete GO enrichment: analysis_type="discrete", gene_list=["TP53", "MDM2"], source="go"
 - GSEA: analysis_type="continuous", ranked_genes={"TP53": 2.5, "MDM2": -1.8}, source="reactome"
+- Batch: analysis_type="batch", gene_lists={"cluster1": ["TP53", "MDM2"], "cluster2": ["EGFR", "KRAS"]}, source="go"
 
 With GILDA (for ambiguous terms):
   Step 1: ground_biomedical_term("p53") returns hgnc:11998 (TP53)
@@ -328,8 +329,9 @@ With GILDA (for ambiguous terms):
         inputSchema={
             "type": "object",
             "properties": {
-                "analysis_type": {"type": "string", "enum": ["discrete", "continuous", "signed", "metabolite"]},
+                "analysis_type": {"type": "string", "enum": ["discrete", "continuous", "signed", "metabolite", "batch"]},
                 "gene_list": {"type": "array", "items": {"type": "string"}},
+                "gene_lists": {"type": "object", "additionalProperties": {"type": "array", "items": {"type": "string"}}},
                 "ranked_genes": {"type": "object"},
                 "background_genes": {"type": "array", "items": {"type": "string"}},
                 "source": {"type": "string", "enum": ["go", "reactome", "wikipathways", "indra-upstream", "indra-downstream", "phenotype"], "default": "go"},
@@ -6,19 +6,29 @@ Provides high-performance caching for frequently accessed entities like:
 - Ontology terms
 - Pathway data
 - ID mappings
+
+The in-process LRU (L1) is lock-free for reads and can also be used from
+executor threads (get_sync/set_sync). It can be backed by a persistent SQLite store (L2)
+shared by all server processes on the host: L1 misses fall through to L2,
+and L2 hits are promoted into L1.
 """
 
 import asyncio
+import inspect
 import logging
 import sys
 import time
-from collections import Counter, deque
+from collections import deque
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from cachetools import TTLCache
 
 from cogex_mcp.config import settings
+from cogex_mcp.services.cache_core import MISSING, ShardedLRUCache, estimate_size
+from cogex_mcp.services.cache_metrics import HotKeys, SizeAggregate
+from cogex_mcp.services.cache_store import SQLiteCacheStore
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +42,39 @@ class CacheStats:
     evictions: int = 0
     size: int = 0
     max_size: int = 0
+    memory_bytes: int = 0
+    max_memory_bytes: int | None = None
+    rejections: int = 0
+    oversized: int = 0
+    l2_hits: int = 0
+    l2_misses: int = 0
+    l2_errors: int = 0
+    coalesced: int = 0
+    negative_hits: int = 0
 
     @property
     def hit_rate(self) -> float:
-        """Calculate cache hit rate."""
+        """Calculate cache hit rate (either tier)."""
         total = self.hits + self.misses
         return self.hits / total if total > 0 else 0.0
 
+    @property
+    def l1_hits(self) -> int:
+        """Hits answered from the in-process cache."""
+        return self.hits - self.l2_hits
+
+    @property
+    def l1_hit_rate(self) -> float:
+        """Share of lookups answered from the in-process cache."""
+        total = self.hits + self.misses
+        return self.l1_hits / total if total > 0 else 0.0
+
+    @property
+    def l2_hit_rate(self) -> float:
+        """Share of L1 misses answered from the persistent store."""
+        total = self.l2_hits + self.l2_misses
+        return self.l2_hits / total if total > 0 else 0.0
+
 
 class CacheService:
     """
@@ -46,9 +82,12 @@ class CacheService:
 
     Features:
     - Automatic expiration based on TTL
-    - LRU eviction when full
+    - LRU eviction when full (by entry count and, optionally, by bytes)
     - Statistics tracking
-    - Thread-safe operations
+    - Thread-safe operations: lock-free reads, per-shard write locks, and
+      blocking get_sync/set_sync for executor threads (statistics are
+      approximate under thread contention)
+    - Optional persistent L2 tier shared across processes
     """
 
     def __init__(
@@ -56,6 +95,10 @@ class CacheService:
         max_size: int = 1000,
         ttl_seconds: int = 3600,
         enabled: bool = True,
+        store: SQLiteCacheStore | None = None,
+        negative_ttl_seconds: float = 30,
+        shards: int = 1,
+        max_memory_bytes: int | None = None,
     ):
         """
         Initialize cache service.
@@ -64,34 +107,57 @@ class CacheService:
             max_size: Maximum number of cached items
             ttl_seconds: Time-to-live for cache entries in seconds
             enabled: Whether caching is enabled
+            store: Persistent L2 store (None for an in-process cache only)
+            negative_ttl_seconds: How long get_or_set remembers a failed
+                factory call and re-raises its error (0 disables)
+            shards: Independently locked LRU shards; LRU order is exact only
+                with one shard
+            max_memory_bytes: Byte budget for cached values, measured with a
+                deep size estimate on set (None for a count limit only)
         """
         self.max_size = max_size
+        self.max_memory_bytes = max_memory_bytes
         self.ttl_seconds = ttl_seconds
         self.enabled = enabled
+        self.store = store
 
         # Thread-safe TTL cache
-        self._cache: TTLCache = TTLCache(maxsize=max_size, ttl=ttl_seconds)
-        self._lock = asyncio.Lock()
+        self._cache = ShardedLRUCache(
+            max_size, ttl_seconds, shards=shards, max_bytes=max_memory_bytes
+        )
+
+        # get_or_set stampede protection: one factory call per key at a time,
+        # and recent failures re-raised instead of retried
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._failures: TTLCache | None = (
+            TTLCache(maxsize=max_size, ttl=negative_ttl_seconds)
+            if negative_ttl_seconds > 0
+            else None
+        )
 
         # Statistics
         self._stats = CacheStats(max_size=max_size)
         self._last_stats_log = time.time()
 
-        # Enhanced metrics tracking
+        # Enhanced metrics tracking (fixed memory, however many keys are seen)
         self._hit_rate_window = deque(maxlen=1000)  # Last 1000 operations
-        self._key_access_count = Counter()  # Track hot keys
-        self._ttl_expiration_count = 0
-        self._key_sizes: dict[str, int] = {}  # Track key sizes
-        self._value_sizes: dict[str, int] = {}  # Track value sizes
+        self._hot_keys = HotKeys(k=10)  # Track hot keys
+        self._expirations_at_reset = 0
+        self._key_sizes = SizeAggregate()  # Sizes of stored keys
+        self._value_sizes = SizeAggregate()  # Sizes of stored values
 
         logger.info(
-            f"CacheService initialized: max_size={max_size}, ttl={ttl_seconds}s, enabled={enabled}"
+            f"CacheService initialized: max_size={max_size}, ttl={ttl_seconds}s, "
+            f"shards={self._cache.shards}, enabled={enabled}, l2={store.path if store else None}"
         )
 
     async def get(self, key: str) -> Any | None:
         """
         Get value from cache.
 
+        Looks in the in-process cache first, then in the L2 store (if any).
+
         Args:
             key: Cache key
 
@@ -101,28 +167,81 @@ class CacheService:
         if not self.enabled:
             return None
 
-        async with self._lock:
-            try:
-                value = self._cache[key]
-                self._stats.hits += 1
-                self._hit_rate_window.append(True)  # Hit
-                self._key_access_count[key] += 1
-                logger.debug(f"Cache HIT: {key}")
-                return value
-            except KeyError:
-                self._stats.misses += 1
-                self._hit_rate_window.append(False)  # Miss
+        value = self._get_local(key)
+        if value is not MISSING:
+            return value
+
+        if self.store is None:
+            return self._finish_lookup(key, False, None)
+        found, value = await asyncio.to_thread(self._read_store, key)
+        return self._finish_lookup(key, found, value)
 
-                # Check if this was a TTL expiration
-                if key in self._key_sizes:
-                    self._ttl_expiration_count += 1
-                    # Clean up size tracking for expired keys
-                    del self._key_sizes[key]
-                    if key in self._value_sizes:
-                        del self._value_sizes[key]
+    def get_sync(self, key: str) -> Any | None:
+        """
+        Get value from cache in a worker thread.
+
+        Same as get(), but blocks on the L2 store; never call it on the
+        event loop.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found/expired
+        """
+        if not self.enabled:
+            return None
+
+        value = self._get_local(key)
+        if value is not MISSING:
+            return value
 
-                logger.debug(f"Cache MISS: {key}")
-                return None
+        found, value = self._read_store(key)
+        return self._finish_lookup(key, found, value)
+
+    def _get_local(self, key: str) -> Any:
+        """Look a key up in the in-process cache (MISSING if absent)."""
+        value = self._cache.get(key)
+        if value is not MISSING:
+            self._stats.hits += 1
+            self._hit_rate_window.append(True)  # Hit
+            self._hot_keys.record(key)
+            logger.debug(f"Cache HIT: {key}")
+            return value
+        return MISSING
+
+    def _read_store(self, key: str) -> tuple[bool, Any]:
+        """Look a key up in the L2 store, counting the outcome (blocking)."""
+        if self.store is None:
+            return False, None
+
+        try:
+            found, value = self.store.get(key)
+        except Exception as e:
+            self._stats.l2_errors += 1
+            logger.warning(f"L2 cache read failed for {key}: {e}")
+            return False, None
+
+        if found:
+            self._stats.l2_hits += 1
+        else:
+            self._stats.l2_misses += 1
+        return found, value
+
+    def _finish_lookup(self, key: str, found: bool, value: Any) -> Any | None:
+        """Record the outcome of an L1 miss, promoting L2 hits into L1."""
+        if found:
+            self._stats.hits += 1
+            self._hit_rate_window.append(True)  # Hit
+            self._hot_keys.record(key)
+            self._set_local(key, value)
+            logger.debug(f"Cache L2 HIT: {key}")
+            return value
+
+        self._stats.misses += 1
+        self._hit_rate_window.append(False)  # Miss
+        logger.debug(f"Cache MISS: {key}")
+        return None
 
     async def set(self, key: str, value: Any) -> None:
         """
@@ -135,19 +254,60 @@ class CacheService:
         if not self.enabled:
             return
 
-        async with self._lock:
-            # Track evictions if cache is full
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                self._stats.evictions += 1
+        self._set_local(key, value)
+        logger.debug(f"Cache SET: {key}")
 
-            self._cache[key] = value
-            self._stats.size = len(self._cache)
+        if self.store is not None:
+            await asyncio.to_thread(self._write_store, key, value)
+
+    def set_sync(self, key: str, value: Any) -> None:
+        """
+        Set value in cache in a worker thread (blocks on the L2 store).
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if not self.enabled:
+            return
+
+        self._set_local(key, value)
+        logger.debug(f"Cache SET: {key}")
+        self._write_store(key, value)
+
+    def _set_local(self, key: str, value: Any) -> None:
+        """Store a value in the in-process cache."""
+        key_size = sys.getsizeof(key)
+        value_size = estimate_size(value)
+        evicted, _, admitted = self._cache.set(key, value, weight=key_size + value_size)
+        self._stats.evictions += evicted
+        self._stats.size = len(self._cache)
+        if not admitted:
+            self._stats.rejections += 1
+            if key_size + value_size > self._cache.max_item_bytes:
+                # Never cacheable: the budget is split per shard
+                self._stats.oversized += 1
+                logger.warning(
+                    f"Cache REJECT (oversized): {key} ({value_size} bytes, per-item "
+                    f"maximum {int(self._cache.max_item_bytes)} bytes)"
+                )
+            else:
+                logger.debug(f"Cache REJECT: {key} ({value_size} bytes)")
+            return
 
-            # Track key and value sizes
-            self._key_sizes[key] = sys.getsizeof(key)
-            self._value_sizes[key] = sys.getsizeof(value)
+        # Track key and value sizes
+        self._key_sizes.add(key_size)
+        self._value_sizes.add(value_size)
 
-            logger.debug(f"Cache SET: {key}")
+    def _write_store(self, key: str, value: Any) -> None:
+        """Write a value to the L2 store, if any (blocking)."""
+        if self.store is None:
+            return
+        try:
+            self.store.set(key, value)
+        except Exception as e:
+            self._stats.l2_errors += 1
+            logger.warning(f"L2 cache write failed for {key}: {e}")
 
     async def delete(self, key: str) -> None:
         """
@@ -159,23 +319,36 @@ class CacheService:
         if not self.enabled:
             return
 
-        async with self._lock:
+        if self._failures is not None:
+            self._failures.pop(key, None)
+        if self._cache.delete(key):
+            self._stats.size = len(self._cache)
+            logger.debug(f"Cache DELETE: {key}")
+
+        if self.store is not None:
             try:
-                del self._cache[key]
-                self._stats.size = len(self._cache)
-                logger.debug(f"Cache DELETE: {key}")
-            except KeyError:
-                pass
+                await asyncio.to_thread(self.store.delete, key)
+            except Exception as e:
+                self._stats.l2_errors += 1
+                logger.warning(f"L2 cache delete failed for {key}: {e}")
 
     async def clear(self) -> None:
-        """Clear all cache entries."""
+        """Clear all cache entries (in both tiers)."""
         if not self.enabled:
             return
 
-        async with self._lock:
-            self._cache.clear()
-            self._stats.size = 0
-            logger.info("Cache cleared")
+        self._cache.clear()
+        if self._failures is not None:
+            self._failures.clear()
+        self._stats.size = 0
+        logger.info("Cache cleared")
+
+        if self.store is not None:
+            try:
+                await asyncio.to_thread(self.store.clear)
+            except Exception as e:
+                self._stats.l2_errors += 1
+                logger.warning(f"L2 cache clear failed: {e}")
 
     async def get_or_set(
         self,
@@ -187,6 +360,11 @@ class CacheService:
         """
         Get value from cache, or compute and cache it if missing.
 
+        Concurrent misses on the same key share a single factory call: the
+        first caller starts it and the others await its result. A factory
+        error is re-raised to callers of that key for negative_ttl_seconds
+        instead of calling the factory again.
+
         Args:
             key: Cache key
             factory: Async function to compute value if not cached
@@ -195,23 +373,72 @@ class CacheService:
 
         Returns:
             Cached or computed value
+
+        Raises:
+            Exception: The factory's error (possibly from a recent failed call)
         """
-        # Try to get from cache
-        value = await self.get(key)
-        if value is not None:
-            return value
+        if not self.enabled:
+            return await self._compute(factory, args, kwargs)
 
-        # Compute value
-        if asyncio.iscoroutinefunction(factory):
-            value = await factory(*args, **kwargs)
-        else:
-            value = factory(*args, **kwargs)
+        task = self._in_flight.get(key)
+        if task is None:
+            # Try to get from cache
+            value = await self.get(key)
+            if value is not None:
+                return value
+
+            task = self._in_flight.get(key)
+            if task is None:
+                # A call for this key may have finished while we looked it up
+                value = self._cache.get(key)
+                if value is not MISSING:
+                    return value
+
+                failure = self._failures.get(key) if self._failures is not None else None
+                if failure is not None:
+                    self._stats.negative_hits += 1
+                    logger.debug(f"Cache NEGATIVE HIT: {key}")
+                    raise failure
+
+                task = asyncio.ensure_future(self._load(key, factory, args, kwargs))
+                self._in_flight[key] = task
+                task.add_done_callback(lambda done: self._finish_load(key, done))
+                return await asyncio.shield(task)
+
+        self._stats.coalesced += 1
+        logger.debug(f"Cache COALESCED: {key}")
+        # A cancelled caller must not cancel the call other callers share
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, factory: callable, args: tuple, kwargs: dict) -> Any:
+        """Call the factory for a key and cache its value (or its error)."""
+        try:
+            value = await self._compute(factory, args, kwargs)
+        except Exception as e:
+            if self._failures is not None:
+                self._failures[key] = e
+            raise
 
         # Cache it
         await self.set(key, value)
+        return value
 
+    @staticmethod
+    async def _compute(factory: callable, args: tuple, kwargs: dict) -> Any:
+        """Call a sync or async factory."""
+        value = factory(*args, **kwargs)
+        if inspect.isawaitable(value):
+            value = await value
         return value
 
+    def _finish_load(self, key: str, task: asyncio.Task) -> None:
+        """Forget a completed factory call."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
     def get_stats(self) -> CacheStats:
         """
         Get cache statistics.
@@ -225,6 +452,15 @@ class CacheService:
             evictions=self._stats.evictions,
             size=len(self._cache),
             max_size=self.max_size,
+            memory_bytes=self._cache.total_bytes,
+            max_memory_bytes=self.max_memory_bytes,
+            rejections=self._stats.rejections,
+            oversized=self._stats.oversized,
+            l2_hits=self._stats.l2_hits,
+            l2_misses=self._stats.l2_misses,
+            l2_errors=self._stats.l2_errors,
+            coalesced=self._stats.coalesced,
+            negative_hits=self._stats.negative_hits,
         )
 
     def get_detailed_stats(self) -> dict[str, Any]:
@@ -245,14 +481,39 @@ class CacheService:
             "max_size": stats.max_size,
             "hit_rate": stats.hit_rate * 100,  # Convert to percentage
             "hit_rate_recent": self._calculate_recent_hit_rate(),
-            "hot_keys": self._key_access_count.most_common(10),
-            "ttl_expirations": self._ttl_expiration_count,
+            "hot_keys": self._hot_keys.most_common(10),
+            "ttl_expirations": self._cache.expirations - self._expirations_at_reset,
+            "coalesced": stats.coalesced,
+            "negative_hits": stats.negative_hits,
+            "in_flight": len(self._in_flight),
             "avg_key_size": self._calculate_avg_key_size(),
             "avg_value_size": self._calculate_avg_value_size(),
+            "max_value_size": self._value_sizes.max,
             "total_memory_estimate": self._estimate_total_memory(),
             "capacity_utilization": (stats.size / stats.max_size * 100)
             if stats.max_size > 0
             else 0,
+            "max_memory_bytes": stats.max_memory_bytes,
+            "memory_utilization": (stats.memory_bytes / stats.max_memory_bytes * 100)
+            if stats.max_memory_bytes
+            else None,
+            "rejections": stats.rejections,
+            "oversized_rejections": stats.oversized,
+            "max_item_bytes": self._cache.max_item_bytes if self.max_memory_bytes else None,
+            "tiers": {
+                "l1": {
+                    "hits": stats.l1_hits,
+                    "hit_rate": stats.l1_hit_rate * 100,
+                },
+                "l2": {
+                    "enabled": self.store is not None,
+                    "path": str(self.store.path) if self.store else None,
+                    "hits": stats.l2_hits,
+                    "misses": stats.l2_misses,
+                    "errors": stats.l2_errors,
+                    "hit_rate": stats.l2_hit_rate * 100,
+                },
+            },
         }
 
         return detailed
@@ -265,31 +526,32 @@ class CacheService:
         return hits / len(self._hit_rate_window) * 100
 
     def _calculate_avg_key_size(self) -> float:
-        """Calculate average key size in bytes."""
-        if not self._key_sizes:
-            return 0.0
-        return sum(self._key_sizes.values()) / len(self._key_sizes)
+        """Calculate average size of stored keys in bytes."""
+        return self._key_sizes.mean
 
     def _calculate_avg_value_size(self) -> float:
-        """Calculate average value size in bytes."""
-        if not self._value_sizes:
-            return 0.0
-        return sum(self._value_sizes.values()) / len(self._value_sizes)
+        """Calculate average size of stored values in bytes."""
+        return self._value_sizes.mean
 
     def _estimate_total_memory(self) -> int:
-        """Estimate total memory usage in bytes."""
-        key_memory = sum(self._key_sizes.values())
-        value_memory = sum(self._value_sizes.values())
-        return key_memory + value_memory
+        """Estimate total memory usage of cached entries in bytes."""
+        return self._cache.total_bytes
 
     def reset_stats(self) -> None:
         """Reset all statistics counters."""
         self._stats.hits = 0
         self._stats.misses = 0
         self._stats.evictions = 0
-        self._ttl_expiration_count = 0
+        self._stats.rejections = 0
+        self._stats.oversized = 0
+        self._stats.l2_hits = 0
+        self._stats.l2_misses = 0
+        self._stats.l2_errors = 0
+        self._stats.coalesced = 0
+        self._stats.negative_hits = 0
+        self._expirations_at_reset = self._cache.expirations
         self._hit_rate_window.clear()
-        self._key_access_count.clear()
+        self._hot_keys.clear()
         logger.info("Cache statistics reset")
 
     async def log_stats_if_needed(self) -> None:
@@ -302,7 +564,8 @@ class CacheService:
             stats = self.get_stats()
             logger.info(
                 f"Cache stats: size={stats.size}/{stats.max_size}, "
-                f"hit_rate={stats.hit_rate:.2%}, "
+                f"hit_rate={stats.hit_rate:.2%} (l1={stats.l1_hit_rate:.2%}, "
+                f"l2={stats.l2_hit_rate:.2%}), "
                 f"hits={stats.hits}, misses={stats.misses}, evictions={stats.evictions}"
             )
             self._last_stats_log = now
@@ -337,10 +600,25 @@ def get_cache() -> CacheService:
     global _cache
 
     if _cache is None:
+        store = None
+        if settings.cache_enabled and settings.cache_l2_path:
+            try:
+                store = SQLiteCacheStore(
+                    Path(settings.cache_l2_path).expanduser(),
+                    ttl_seconds=settings.cache_l2_ttl_seconds,
+                    max_entries=settings.cache_l2_max_entries,
+                )
+            except Exception as e:
+                logger.warning(f"L2 cache disabled, could not open {settings.cache_l2_path}: {e}")
+
         _cache = CacheService(
             max_size=settings.cache_max_size,
             ttl_seconds=settings.cache_ttl_seconds,
             enabled=settings.cache_enabled,
+            store=store,
+            negative_ttl_seconds=settings.cache_negative_ttl_seconds,
+            shards=settings.cache_shards,
+            max_memory_bytes=settings.cache_max_memory_mb * 1024 * 1024 or None,
         )
 
     return _cache
@@ -0,0 +1,438 @@
+"""
+Sharded LRU + TTL storage for CacheService.
+
+CacheService used to guard a cachetools TTLCache with one asyncio.Lock,
+which serialized every lookup in the process. TTLCache cannot be shared
+with executor threads either. ShardedLRUCache takes a different approach:
+
+- Reads take no lock. A lookup is a dict get plus an OrderedDict
+  move_to_end, and each of these is a single atomic operation on the
+  underlying C object.
+- Writes (set, delete, expiry and eviction) take a per-shard
+  threading.Lock, and keys are spread over the shards by hash. Threads
+  writing different keys rarely contend.
+- Every shard keeps its own LRU order. Eviction is exact LRU per shard and
+  approximate across shards; a single shard gives exact global LRU.
+
+Entries share one TTL, so the order in which they are set is also the
+order in which they expire, and expired entries are swept from the front
+of that order on every write.
+
+Optionally the cache also has a byte budget. Each entry carries a weight
+(see estimate_size), and least recently used entries are evicted until
+both the entry count and the bytes fit. A budget alone would let one huge
+result flush thousands of small hot entries, so the cache adds a TinyLFU
+admission check: a count-min sketch tracks how often keys are read, and a
+new entry that would evict more than one entry is admitted only if none of
+those victims is read more often than the new entry. With a single victim
+the cache behaves like plain LRU.
+
+The byte budget is split evenly over the shards, so no single entry can
+weigh more than max_bytes / shards (max_item_bytes). Larger values are
+never cached; set() reports them as not admitted.
+"""
+
+import itertools
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+# Returned by get() when a key is missing or expired
+MISSING = object()
+
+# Containers larger than this are sized from an evenly spaced sample
+_SAMPLE_ITEMS = 64
+
+# Nesting depth followed by estimate_size
+_MAX_DEPTH = 8
+
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+# Odd 64-bit multipliers deriving the sketch rows from one hash
+_SKETCH_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+)
+_MASK64 = (1 << 64) - 1
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Estimate the deep size of a value in bytes.
+
+    sys.getsizeof only counts a container's own header and pointer array,
+    so it reports a few hundred bytes for a dict holding megabytes. This
+    follows dicts, lists, tuples, sets and object attributes instead.
+    DataFrames and Series report memory_usage(). Larger containers are sized
+    from a sample of _SAMPLE_ITEMS items, which keeps the cost bounded for
+    large results.
+
+    Args:
+        obj: Value to size
+
+    Returns:
+        Estimated size in bytes
+    """
+    total = 0.0
+    seen: set[int] = set()
+    stack: list[tuple[Any, float, int]] = [(obj, 1.0, 0)]
+
+    while stack:
+        item, scale, depth = stack.pop()
+        if isinstance(item, _ATOMIC):
+            total += sys.getsizeof(item) * scale
+            continue
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item) * scale
+        if depth >= _MAX_DEPTH:
+            continue
+
+        if isinstance(item, dict):
+            children, count = item.items(), len(item)
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            children, count = item, len(item)
+        elif hasattr(item, "memory_usage"):  # pandas DataFrame / Series
+            usage = item.memory_usage(index=True)
+            total += float(usage.sum() if hasattr(usage, "sum") else usage) * scale
+            continue
+        elif hasattr(item, "__dict__"):
+            children, count = (vars(item),), 1
+        else:
+            continue
+
+        step = max(1, count // _SAMPLE_ITEMS)
+        sample = list(itertools.islice(children, 0, None, step))
+        if not sample:
+            continue
+        child_scale = scale * count / len(sample)
+        for child in sample:
+            if isinstance(item, dict):
+                stack.append((child[0], child_scale, depth + 1))
+                stack.append((child[1], child_scale, depth + 1))
+            else:
+                stack.append((child, child_scale, depth + 1))
+
+    return int(total)
+
+
+class CountMinSketch:
+    """
+    Approximate per-key counts in fixed memory.
+
+    Each key maps to one counter in each of depth rows. Its estimate is the
+    smallest of those counters: collisions can only inflate a count, never
+    lose one. Increments use conservative update (only counters at the
+    current minimum are raised), which keeps collisions from inflating
+    estimates much. Increments from several threads may race and lose a
+    count, which is fine for an estimate.
+    """
+
+    def __init__(self, width: int, depth: int = 4, reset_after: int | None = None):
+        """
+        Initialize zeroed sketch.
+
+        Args:
+            width: Counters per row (rounded up to a power of two)
+            depth: Rows (at most 4)
+            reset_after: Halve all counters after this many increments, so
+                old popularity fades (None keeps counting forever)
+        """
+        self.width = 1 << max(4, (width - 1).bit_length())
+        self.depth = max(1, min(depth, len(_SKETCH_SEEDS)))
+        self.reset_after = reset_after
+        self._rows = [array("I", bytes(4 * self.width)) for _ in range(self.depth)]
+        self._shift = 64 - (self.width.bit_length() - 1)
+        self._increments = 0
+
+    def _indexes(self, key: Any) -> list[int]:
+        """Counter index of a key in each row."""
+        h = hash(key) & _MASK64
+        return [((h * seed) & _MASK64) >> self._shift for seed in _SKETCH_SEEDS[: self.depth]]
+
+    def increment(self, key: Any) -> int:
+        """
+        Count one occurrence of a key.
+
+        Returns:
+            Estimated count after the increment
+        """
+        cells = list(zip(self._rows, self._indexes(key), strict=True))
+        estimate = min(row[index] for row, index in cells)
+        if estimate < 0xFFFFFFFF:
+            estimate += 1
+            for row, index in cells:
+                if row[index] < estimate:
+                    row[index] = estimate
+
+        self._increments += 1
+        if self.reset_after and self._increments >= self.reset_after:
+            self._age()
+        return estimate
+
+    def estimate(self, key: Any) -> int:
+        """Estimated count of a key."""
+        return min(
+            row[index] for row, index in zip(self._rows, self._indexes(key), strict=True)
+        )
+
+    def _age(self) -> None:
+        """Halve every counter."""
+        self._rows = [array("I", (value >> 1 for value in row)) for row in self._rows]
+        self._increments //= 2
+
+    def clear(self) -> None:
+        """Reset all counters to zero."""
+        self._rows = [array("I", bytes(4 * self.width)) for _ in range(self.depth)]
+        self._increments = 0
+
+
+class _Entry:
+    """Cached value with its expiry time and weight."""
+
+    __slots__ = ("value", "expires_at", "weight")
+
+    def __init__(self, value: Any, expires_at: float, weight: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.weight = weight
+
+
+class _Shard:
+    """One lock's worth of entries."""
+
+    __slots__ = ("entries", "expiry", "lock", "max_size", "max_bytes", "bytes", "expired")
+
+    def __init__(self, max_size: int, max_bytes: float):
+        self.entries: OrderedDict[str, _Entry] = OrderedDict()  # LRU order, oldest first
+        self.expiry: OrderedDict[str, float] = OrderedDict()  # Set order == expiry order
+        self.lock = threading.Lock()
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.expired = 0  # Entries removed because their TTL passed
+
+
+class ShardedLRUCache:
+    """Thread-safe LRU cache with TTL, lock-free reads and per-shard write locks."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        shards: int = 1,
+        max_bytes: int | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize empty cache.
+
+        Args:
+            max_size: Maximum number of entries, split evenly over the shards
+            ttl_seconds: Time-to-live for entries in seconds
+            shards: Number of independently locked shards (capped at max_size)
+            max_bytes: Byte budget for entry weights, split evenly over the
+                shards (None for a count limit only); entries heavier than
+                one shard's share are not cached
+            timer: Monotonic clock
+        """
+        shards = max(1, min(shards, max_size))
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.timer = timer
+        base, extra = divmod(max_size, shards)
+        shard_bytes = max_bytes / shards if max_bytes else float("inf")
+        self._shards = [_Shard(base + (i < extra), shard_bytes) for i in range(shards)]
+        # Read frequencies for admission; only needed when weights can evict several entries
+        self._sketch = (
+            CountMinSketch(max_size, reset_after=10 * max_size) if max_bytes else None
+        )
+
+    @property
+    def shards(self) -> int:
+        """Number of shards."""
+        return len(self._shards)
+
+    @property
+    def max_item_bytes(self) -> float:
+        """Largest entry weight that can be cached (the per-shard byte budget)."""
+        return self._shards[0].max_bytes
+
+    def _shard(self, key: str) -> _Shard:
+        """Shard owning a key."""
+        if len(self._shards) == 1:
+            return self._shards[0]
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """
+        Look up a key without taking a lock, marking it recently used.
+
+        Args:
+            key: Cache key
+            default: Returned if the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        if self._sketch is not None:
+            self._sketch.increment(key)
+        shard = self._shard(key)
+        entry = shard.entries.get(key)
+        if entry is None:
+            return default
+        if entry.expires_at <= self.timer():
+            with shard.lock:
+                self._expire(shard, self.timer())
+            return default
+        try:
+            shard.entries.move_to_end(key)
+        except KeyError:
+            pass  # Evicted by another thread since the lookup; the value is still valid
+        return entry.value
+
+    def set(self, key: str, value: Any, weight: int = 0) -> tuple[int, int, bool]:
+        """
+        Store a value, evicting least recently used entries of its shard if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            weight: Size of the entry in bytes (counts against max_bytes)
+
+        Returns:
+            (evicted, expired, admitted) - evicted and expired entry counts, and
+            False if the value was not cached (larger than the shard's byte
+            budget, or less popular than the entries it would evict)
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            now = self.timer()
+            expired = self._expire(shard, now)
+
+            old = shard.entries.get(key)
+            if weight > shard.max_bytes:
+                if old is not None:
+                    self._remove(shard, key)
+                return 0, expired, False
+
+            # Pop victims one at a time: lock-free readers may reorder entries,
+            # so the OrderedDict cannot be iterated here
+            victims: list[tuple[str, _Entry]] = []
+            size = len(shard.entries) - (old is not None)
+            used = shard.bytes - (old.weight if old is not None else 0)
+            while size + 1 > shard.max_size or used + weight > shard.max_bytes:
+                victim_key, victim = shard.entries.popitem(last=False)
+                if victim_key == key:
+                    shard.entries[key] = victim  # Replaced below; re-check the next entry
+                    continue
+                victims.append((victim_key, victim))
+                size -= 1
+                used -= victim.weight
+
+            if old is None and len(victims) > 1 and self._sketch is not None:
+                frequency = self._sketch.estimate(key)
+                if any(self._sketch.estimate(k) > frequency for k, _ in victims):
+                    # Put the victims back where they were
+                    for victim_key, victim in reversed(victims):
+                        shard.entries[victim_key] = victim
+                        shard.entries.move_to_end(victim_key, last=False)
+                    return 0, expired, False
+
+            for victim_key, victim in victims:
+                del shard.expiry[victim_key]
+                shard.bytes -= victim.weight
+
+            if old is not None:
+                shard.bytes -= old.weight
+            shard.entries[key] = _Entry(value, now + self.ttl_seconds, weight)
+            shard.entries.move_to_end(key)
+            shard.expiry[key] = now + self.ttl_seconds
+            shard.expiry.move_to_end(key)
+            shard.bytes += weight
+        return len(victims), expired, True
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key was present
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            if key not in shard.expiry:
+                return False
+            self._remove(shard, key)
+            return True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.expiry.clear()
+                shard.bytes = 0
+        if self._sketch is not None:
+            self._sketch.clear()
+
+    def expire(self) -> int:
+        """
+        Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += self._expire(shard, self.timer())
+        return removed
+
+    @staticmethod
+    def _remove(shard: _Shard, key: str) -> None:
+        """Remove a present key from a shard (lock held)."""
+        del shard.expiry[key]
+        shard.bytes -= shard.entries.pop(key).weight
+
+    @classmethod
+    def _expire(cls, shard: _Shard, now: float) -> int:
+        """Drop expired entries from the front of a shard's expiry order (lock held)."""
+        removed = 0
+        expiry = shard.expiry
+        while expiry:
+            key, expires_at = next(iter(expiry.items()))
+            if expires_at > now:
+                break
+            cls._remove(shard, key)
+            removed += 1
+        shard.expired += removed
+        return removed
+
+    @property
+    def expirations(self) -> int:
+        """Entries removed because their TTL passed, since creation."""
+        return sum(shard.expired for shard in self._shards)
+
+    @property
+    def total_bytes(self) -> int:
+        """Summed weight of the cached entries."""
+        return sum(shard.bytes for shard in self._shards)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._shard(key).entries.get(key)
+        return entry is not None and entry.expires_at > self.timer()
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
@@ -0,0 +1,120 @@
+"""
+Fixed-memory metrics for CacheService.
+
+The detailed cache metrics used to keep a Counter of hits per key and a
+size per key. Under a long-tailed key distribution these maps grow with
+every distinct key the server ever sees. Here the same numbers come from
+structures whose size does not depend on the number of keys:
+
+- HotKeys: a count-min sketch estimates hits per key, and a min-heap keeps
+  the k keys with the highest estimates.
+- SizeAggregate: a running count and sum (and maximum) of sizes.
+"""
+
+import heapq
+import threading
+
+from cogex_mcp.services.cache_core import CountMinSketch
+
+# Counters per sketch row; over-estimates stay small for hot keys
+_SKETCH_WIDTH = 2048
+
+
+class HotKeys:
+    """Approximate top-k most frequently hit keys."""
+
+    def __init__(self, k: int = 10, width: int = _SKETCH_WIDTH, depth: int = 4):
+        """
+        Initialize empty tracker.
+
+        Args:
+            k: Keys kept
+            width: Count-min sketch counters per row
+            depth: Count-min sketch rows
+        """
+        self.k = k
+        self._sketch = CountMinSketch(width, depth)
+        self._counts: dict[str, int] = {}  # Tracked key -> latest estimate
+        self._heap: list[tuple[int, str]] = []  # (count, key), counts may be stale (too low)
+        self._lock = threading.Lock()
+
+    def record(self, key: str) -> None:
+        """Count one hit on a key."""
+        count = self._sketch.increment(key)
+        if key in self._counts:
+            # Its heap entry is refreshed lazily when it reaches the top
+            self._counts[key] = count
+            return
+
+        with self._lock:
+            if len(self._counts) != len(self._heap):
+                # A concurrent fast-path update re-added a key evicted meanwhile
+                self._counts = {k: self._counts[k] for _, k in self._heap}
+            if key in self._counts:
+                self._counts[key] = count
+                return
+            if len(self._heap) < self.k:
+                self._counts[key] = count
+                heapq.heappush(self._heap, (count, key))
+                return
+
+            # Counts only grow, so refreshing stale heap entries settles on the minimum
+            while True:
+                low, low_key = self._heap[0]
+                current = self._counts[low_key]
+                if current == low:
+                    break
+                heapq.heapreplace(self._heap, (current, low_key))
+
+            if count > low:
+                heapq.heapreplace(self._heap, (count, key))
+                del self._counts[low_key]
+                self._counts[key] = count
+
+    def most_common(self, n: int | None = None) -> list[tuple[str, int]]:
+        """
+        Tracked keys by estimated hit count, highest first.
+
+        Args:
+            n: Maximum keys returned (None for all k)
+
+        Returns:
+            List of (key, count) tuples
+        """
+        ranked = sorted(self._counts.copy().items(), key=lambda item: item[1], reverse=True)
+        return ranked[:n]
+
+    def clear(self) -> None:
+        """Forget all counts."""
+        with self._lock:
+            self._sketch.clear()
+            self._counts.clear()
+            self._heap.clear()
+
+
+class SizeAggregate:
+    """Running count, total and maximum of sizes."""
+
+    def __init__(self):
+        """Initialize empty aggregate."""
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, size: int) -> None:
+        """Add one size."""
+        self.count += 1
+        self.total += size
+        if size > self.max:
+            self.max = size
+
+    @property
+    def mean(self) -> float:
+        """Mean size (0 if empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def clear(self) -> None:
+        """Reset the aggregate."""
+        self.count = 0
+        self.total = 0
+        self.max = 0
@@ -0,0 +1,164 @@
+"""
+Persistent second-tier (L2) store for CacheService.
+
+The in-process TTLCache starts cold after every restart and is private to
+each server process. SQLiteCacheStore keeps entries in a local SQLite file
+in WAL mode, so they survive restarts and are shared by every process on
+the host: readers never block the writer, and concurrent writers wait on
+the database lock (busy_timeout) instead of failing.
+
+Values are stored as JSON. Entries that cannot be serialized (e.g.
+DataFrames) simply stay in L1. Store errors are logged and reported as
+misses; the cache never fails a request because of its L2 tier.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Writes between sweeps of expired and surplus rows
+_PURGE_EVERY = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    stored_at REAL NOT NULL
+)
+"""
+
+
+class SQLiteCacheStore:
+    """
+    SQLite-backed key-value store with per-entry expiry.
+
+    All methods are synchronous and thread-safe; CacheService calls them via
+    asyncio.to_thread so disk I/O stays off the event loop.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: int = 86400,
+        max_entries: int = 100000,
+        busy_timeout: float = 5.0,
+    ):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: Database file, shared by all processes using the same path
+            ttl_seconds: Time-to-live for stored entries in seconds
+            max_entries: Entries kept; the oldest are dropped on purge
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(path),
+            timeout=busy_timeout,
+            isolation_level=None,  # Autocommit: every statement is its own transaction
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        logger.info(
+            f"SQLiteCacheStore opened: path={path}, ttl={ttl_seconds}s, "
+            f"max_entries={max_entries}"
+        )
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """
+        Look up an unexpired entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (found, value) tuple
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return False, None
+        return True, json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> bool:
+        """
+        Store an entry, replacing any previous value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+
+        Returns:
+            False if the value is not JSON-serializable (nothing is stored)
+        """
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug(f"L2 cache skipped non-JSON value: {key}")
+            return False
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, stored_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, now + self.ttl_seconds, now),
+            )
+            self._writes += 1
+            if self._writes % _PURGE_EVERY == 0:
+                self._purge(now)
+        return True
+
+    def delete(self, key: str) -> None:
+        """Remove an entry, if present."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries (for every process sharing the file)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def count(self) -> int:
+        """Number of stored entries, including expired ones not yet purged."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def purge(self) -> None:
+        """Drop expired entries and the oldest ones beyond max_entries."""
+        with self._lock:
+            self._purge(time.time())
+
+    def _purge(self, now: float) -> None:
+        """Purge with the lock held."""
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+        self._conn.execute(
+            "DELETE FROM cache WHERE key IN ("
+            "SELECT key FROM cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -17,6 +17,7 @@ from cogex_mcp.constants import (
 )
 from cogex_mcp.schemas import DrugNode, EntityRef, GeneNode, OntologyTerm
 from cogex_mcp.services.cache import get_cache
+from cogex_mcp.services.ontology_index import get_ontology_index
 
 logger = logging.getLogger(__name__)
 
@@ -496,14 +497,42 @@ class EntityResolver:
             logger.debug(f"Ontology term resolved from cache: {identifier}")
             return OntologyTerm(**cached)
 
-        # Resolve ontology term
-        term = await self._resolve_ontology_from_backend(identifier)
+        # Resolve ontology term from the in-memory index, then the backend
+        term = self._resolve_ontology_from_index(identifier)
+        if term is None:
+            term = await self._resolve_ontology_from_backend(identifier)
 
         # Cache result
         await self.cache.set(cache_key, term.model_dump())
 
         return term
 
+    def _resolve_ontology_from_index(
+        self,
+        identifier: str | tuple[str, str],
+    ) -> OntologyTerm | None:
+        """Resolve ontology term from the ontology index (None if not indexed)."""
+        index = get_ontology_index()
+        if index is None:
+            return None
+
+        if isinstance(identifier, tuple):
+            namespace, term_id = identifier
+            identifier = term_id if ":" in term_id else f"{namespace}:{term_id}"
+
+        record = index.get_term(identifier)
+        if record is None:
+            return None
+
+        logger.debug(f"Ontology term resolved from index: {identifier}")
+        return OntologyTerm(
+            name=record["name"],
+            curie=record["curie"],
+            namespace=record["namespace"],
+            depth=0,
+            relationship=None,
+        )
+
     async def _resolve_ontology_from_backend(
         self,
         identifier: str | tuple[str, str],
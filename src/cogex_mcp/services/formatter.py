@@ -9,6 +9,8 @@ Handles conversion between Markdown and JSON formats with:
 
 import json
 import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any
 
@@ -58,6 +60,49 @@ class ResponseFormatter:
 
         return result
 
+    @staticmethod
+    async def collect_within_budget(
+        items: AsyncIterator[Any],
+        format_type: ResponseFormat,
+        max_chars: int = CHARACTER_LIMIT,
+        transform: Callable[[Any], Any] | None = None,
+    ) -> tuple[list[Any], bool]:
+        """
+        Consume a stream until its formatted size reaches the character limit.
+
+        Each item is rendered on arrival to estimate its share of the
+        response. Collection stops (and the stream is closed, so no further
+        records are fetched) once the estimate exceeds max_chars.
+
+        Args:
+            items: Async iterator of records (e.g. ClientAdapter.stream_query())
+            format_type: Output format the items will be rendered in
+            max_chars: Maximum character limit
+            transform: Optional function applied to each record before sizing
+
+        Returns:
+            Tuple of (collected items, whether the stream was cut short)
+        """
+        collected: list[Any] = []
+        used = 0
+
+        async with aclosing(items) as stream:
+            async for item in stream:
+                if transform is not None:
+                    item = transform(item)
+
+                if format_type == ResponseFormat.JSON:
+                    used += len(ResponseFormatter._format_json(item))
+                else:
+                    used += len(ResponseFormatter._format_markdown(item))
+
+                if used > max_chars and collected:
+                    return collected, True
+
+                collected.append(item)
+
+        return collected, False
+
     @staticmethod
     def _format_json(data: Any) -> str:
         """
@@ -0,0 +1,545 @@
+"""
+In-memory ontology DAG index.
+
+Loads `isa`/`partof` edges for GO, HPO, MONDO and DOID into compact
+integer-indexed adjacency arrays (CSR layout), so hierarchy lookups do not
+need variable-length Cypher matches:
+- parents/children up to a depth, ancestors/descendants (full closure)
+- lowest common ancestors of two terms
+- term lookup by CURIE or exact name
+
+The index is built from Neo4j (streamed) or from a local snapshot file,
+swapped in atomically, and refreshed periodically in the background.
+Until it is loaded, callers fall back to their Neo4j queries.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from array import array
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from cogex_mcp.config import settings
+
+logger = logging.getLogger(__name__)
+
+ONTOLOGY_NAMESPACES = ("go", "hp", "mondo", "doid")
+
+# Edge types stored in the index (position = type code)
+_EDGE_TYPES = ("isa", "partof")
+_RELATIONSHIP_NAMES = {"isa": "is_a", "partof": "part_of"}
+
+_SNAPSHOT_VERSION = 1
+
+# Upper bound on terms loaded (list_entity_names requires a LIMIT)
+_MAX_TERMS = 5_000_000
+
+# Seconds between load attempts while the index is empty
+_RETRY_SECONDS = 300
+
+# Node ID prefixes for the indexed namespaces (GO and HP IDs are uppercase)
+_PREFIXES = [f"{ns}:" for ns in ONTOLOGY_NAMESPACES] + [
+    f"{ns.upper()}:" for ns in ONTOLOGY_NAMESPACES
+]
+
+
+def _csr(
+    node_count: int, sources: array, targets: array, types: array
+) -> tuple[array, array, array]:
+    """
+    Build compressed sparse row adjacency from edge arrays.
+
+    Args:
+        node_count: Number of nodes
+        sources: Edge source node indexes
+        targets: Edge target node indexes
+        types: Edge type codes
+
+    Returns:
+        (offsets, neighbors, neighbor_types); the neighbors of node i are
+        neighbors[offsets[i]:offsets[i + 1]]
+    """
+    offsets = array("i", [0]) * (node_count + 1)
+    for source in sources:
+        offsets[source + 1] += 1
+    for i in range(node_count):
+        offsets[i + 1] += offsets[i]
+
+    neighbors = array("i", [0]) * len(sources)
+    neighbor_types = array("b", [0]) * len(sources)
+    position = array("i", offsets[:-1])
+    for source, target, edge_type in zip(sources, targets, types, strict=True):
+        slot = position[source]
+        neighbors[slot] = target
+        neighbor_types[slot] = edge_type
+        position[source] += 1
+
+    return offsets, neighbors, neighbor_types
+
+
+class OntologyGraph:
+    """Immutable ontology DAG with CSR parent and child adjacency."""
+
+    def __init__(
+        self,
+        ids: list[str],
+        names: list[str | None],
+        sources: array,
+        targets: array,
+        types: array,
+    ):
+        """
+        Build graph from node lists and child→parent edge arrays.
+
+        Args:
+            ids: Node IDs as stored in the graph (e.g., "GO:0006915")
+            names: Node names (parallel to ids)
+            sources: Child node index per edge
+            targets: Parent node index per edge
+            types: Edge type code per edge (index into _EDGE_TYPES)
+        """
+        self.ids = ids
+        self.names = names
+        self.edge_count = len(sources)
+        self._sources, self._targets, self._types = sources, targets, types
+
+        self.index = {node_id.lower(): i for i, node_id in enumerate(ids)}
+        self.name_index: dict[str, list[int]] = {}
+        for i, name in enumerate(names):
+            if name:
+                self.name_index.setdefault(name.casefold(), []).append(i)
+
+        self.parents = _csr(len(ids), sources, targets, types)
+        self.children = _csr(len(ids), targets, sources, types)
+
+    @classmethod
+    def from_records(
+        cls,
+        terms: Iterable[tuple[str, str | None]],
+        edges: Iterable[tuple[str, str, str]],
+    ) -> "OntologyGraph":
+        """
+        Build graph from term and edge records.
+
+        Args:
+            terms: (term_id, name) pairs
+            edges: (child_id, parent_id, relationship) triples
+
+        Returns:
+            OntologyGraph
+        """
+        ids: list[str] = []
+        names: list[str | None] = []
+        index: dict[str, int] = {}
+
+        def node(node_id: str, name: str | None = None) -> int:
+            i = index.get(node_id)
+            if i is None:
+                i = index[node_id] = len(ids)
+                ids.append(node_id)
+                names.append(name)
+            elif name and not names[i]:
+                names[i] = name
+            return i
+
+        for term_id, name in terms:
+            node(term_id, name)
+
+        sources, targets, types = array("i"), array("i"), array("b")
+        for child_id, parent_id, relationship in edges:
+            if relationship not in _EDGE_TYPES:
+                continue
+            sources.append(node(child_id))
+            targets.append(node(parent_id))
+            types.append(_EDGE_TYPES.index(relationship))
+
+        return cls(ids, names, sources, targets, types)
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """Serialize graph to a JSON-compatible snapshot."""
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "ids": self.ids,
+            "names": self.names,
+            "sources": self._sources.tolist(),
+            "targets": self._targets.tolist(),
+            "types": self._types.tolist(),
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> "OntologyGraph":
+        """
+        Load graph from a snapshot created by to_snapshot().
+
+        Raises:
+            ValueError: If the snapshot version is not supported
+        """
+        if snapshot.get("version") != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported ontology snapshot version: {snapshot.get('version')}")
+
+        return cls(
+            snapshot["ids"],
+            snapshot["names"],
+            array("i", snapshot["sources"]),
+            array("i", snapshot["targets"]),
+            array("b", snapshot["types"]),
+        )
+
+    def walk(
+        self, start: int, upward: bool, max_depth: int | None = None
+    ) -> list[tuple[int, int, int]]:
+        """
+        Breadth-first walk from a node.
+
+        Args:
+            start: Start node index
+            upward: Walk to parents (True) or children (False)
+            max_depth: Maximum depth (None = full closure)
+
+        Returns:
+            List of (node index, shortest depth, type code of the edge that
+            first reached it), ordered by depth
+        """
+        offsets, neighbors, neighbor_types = self.parents if upward else self.children
+
+        seen = {start}
+        found: list[tuple[int, int, int]] = []
+        frontier = [start]
+        depth = 0
+
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for node in frontier:
+                for slot in range(offsets[node], offsets[node + 1]):
+                    neighbor = neighbors[slot]
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        found.append((neighbor, depth, neighbor_types[slot]))
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        return found
+
+
+class OntologyIndex:
+    """
+    Ontology hierarchy index with background loading and refresh.
+
+    Lookups return None when the index is not loaded or does not contain
+    the term, so callers can fall back to Neo4j queries.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path | None = None,
+        refresh_interval: int = 86400,
+        load_timeout_ms: int = 120000,
+    ):
+        """
+        Initialize ontology index.
+
+        Args:
+            snapshot_path: Optional snapshot file (gzipped JSON) to load from
+                and save to
+            refresh_interval: Seconds between rebuilds from Neo4j (0 = never)
+            load_timeout_ms: Transaction timeout for the Neo4j load queries
+        """
+        self.snapshot_path = snapshot_path
+        self.refresh_interval = refresh_interval
+        self.load_timeout_ms = load_timeout_ms
+
+        self._graph: OntologyGraph | None = None
+        self._loaded_at: float | None = None
+        self._source: str | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index can answer lookups."""
+        return self._graph is not None
+
+    def start(self) -> None:
+        """Start loading (and periodically refreshing) in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background load/refresh task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Load from snapshot, then rebuild from Neo4j when stale."""
+        await self.load_snapshot()
+
+        while True:
+            age = time.time() - self._loaded_at if self._loaded_at else None
+            if age is None or (self.refresh_interval and age >= self.refresh_interval):
+                try:
+                    await self.refresh()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Ontology index refresh failed: {e}")
+
+            if not self.refresh_interval:
+                return
+            # Retry sooner while the index has never loaded
+            if self._graph is None:
+                await asyncio.sleep(min(self.refresh_interval, _RETRY_SECONDS))
+            else:
+                await asyncio.sleep(self.refresh_interval)
+
+    async def load_snapshot(self) -> bool:
+        """
+        Load the index from the snapshot file, if there is one.
+
+        Returns:
+            True if the snapshot was loaded
+        """
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return False
+
+        try:
+            graph = await asyncio.to_thread(self._read_snapshot, self.snapshot_path)
+        except Exception as e:
+            logger.warning(f"Could not load ontology snapshot {self.snapshot_path}: {e}")
+            return False
+
+        self._graph = graph
+        self._loaded_at = self.snapshot_path.stat().st_mtime
+        self._source = "snapshot"
+        logger.info(
+            f"Ontology index loaded from snapshot: {len(graph.ids)} terms, "
+            f"{graph.edge_count} edges"
+        )
+        return True
+
+    async def refresh(self) -> None:
+        """Rebuild the index from Neo4j and swap it in."""
+        from cogex_mcp.clients.adapter import get_adapter
+
+        adapter = await get_adapter()
+        started = time.perf_counter()
+
+        terms = []
+        async for record in adapter.stream_query(
+            "list_entity_names",
+            prefixes=_PREFIXES,
+            limit=_MAX_TERMS,
+            timeout=self.load_timeout_ms,
+            fetch_size=5000,
+        ):
+            terms.append((record["entity_id"], record["name"]))
+
+        edges = []
+        async for record in adapter.stream_query(
+            "list_ontology_edges",
+            prefixes=_PREFIXES,
+            timeout=self.load_timeout_ms,
+            fetch_size=5000,
+        ):
+            edges.append((record["child_id"], record["parent_id"], record["relationship"]))
+
+        graph = await asyncio.to_thread(OntologyGraph.from_records, terms, edges)
+
+        self._graph = graph
+        self._loaded_at = time.time()
+        self._source = "neo4j"
+        logger.info(
+            f"Ontology index built from Neo4j in {time.perf_counter() - started:.1f}s: "
+            f"{len(graph.ids)} terms, {graph.edge_count} edges"
+        )
+
+        if self.snapshot_path is not None:
+            try:
+                await asyncio.to_thread(self._write_snapshot, graph, self.snapshot_path)
+            except OSError as e:
+                logger.warning(f"Could not write ontology snapshot {self.snapshot_path}: {e}")
+
+    @staticmethod
+    def _read_snapshot(path: Path) -> OntologyGraph:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return OntologyGraph.from_snapshot(json.load(f))
+
+    @staticmethod
+    def _write_snapshot(graph: OntologyGraph, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(graph.to_snapshot(), f)
+        tmp_path.replace(path)
+
+    # Lookups
+
+    def get_term(self, identifier: str) -> dict[str, Any] | None:
+        """
+        Look up a term by CURIE or unique exact name.
+
+        Args:
+            identifier: Term CURIE (e.g., "GO:0006915") or name
+
+        Returns:
+            Dict with name, curie and namespace, or None if not indexed
+            (or the name is ambiguous)
+        """
+        graph = self._graph
+        if graph is None:
+            return None
+
+        i = graph.index.get(identifier.lower())
+        if i is None:
+            matches = graph.name_index.get(identifier.casefold(), [])
+            if len(matches) != 1:
+                return None
+            i = matches[0]
+
+        term_id = graph.ids[i]
+        return {
+            "name": graph.names[i] or term_id,
+            "curie": term_id,
+            "namespace": term_id.split(":", 1)[0].lower(),
+        }
+
+    def parents(self, curie: str, max_depth: int | None = 1) -> list[dict[str, Any]] | None:
+        """Parent terms up to max_depth (None = all ancestors)."""
+        return self._lookup(curie, upward=True, max_depth=max_depth)
+
+    def children(self, curie: str, max_depth: int | None = 1) -> list[dict[str, Any]] | None:
+        """Child terms down to max_depth (None = all descendants)."""
+        return self._lookup(curie, upward=False, max_depth=max_depth)
+
+    def ancestors(self, curie: str) -> list[dict[str, Any]] | None:
+        """All ancestor terms with their shortest depth."""
+        return self.parents(curie, max_depth=None)
+
+    def descendants(self, curie: str) -> list[dict[str, Any]] | None:
+        """All descendant terms with their shortest depth."""
+        return self.children(curie, max_depth=None)
+
+    def lowest_common_ancestors(self, curie_a: str, curie_b: str) -> list[dict[str, Any]] | None:
+        """
+        Common ancestors of two terms that have no common descendant ancestor.
+
+        A term counts as its own ancestor, so the LCA of a term and one of its
+        descendants is the term itself.
+
+        Args:
+            curie_a: First term CURIE
+            curie_b: Second term CURIE
+
+        Returns:
+            LCA terms ordered by combined distance (depth = distance from a
+            plus distance from b), or None if either term is not indexed
+        """
+        graph = self._graph
+        if graph is None:
+            return None
+        a = graph.index.get(curie_a.lower())
+        b = graph.index.get(curie_b.lower())
+        if a is None or b is None:
+            return None
+
+        distance_a = {a: 0, **{node: depth for node, depth, _ in graph.walk(a, upward=True)}}
+        distance_b = {b: 0, **{node: depth for node, depth, _ in graph.walk(b, upward=True)}}
+        common = distance_a.keys() & distance_b.keys()
+
+        offsets, neighbors, _ = graph.children
+        lowest = [
+            node
+            for node in common
+            if not any(
+                neighbors[slot] in common for slot in range(offsets[node], offsets[node + 1])
+            )
+        ]
+        lowest.sort(key=lambda node: (distance_a[node] + distance_b[node], graph.ids[node]))
+
+        return [
+            self._format_term(graph, node, distance_a[node] + distance_b[node], None)
+            for node in lowest
+        ]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index size and freshness."""
+        graph = self._graph
+        return {
+            "loaded": graph is not None,
+            "source": self._source,
+            "terms": len(graph.ids) if graph else 0,
+            "edges": graph.edge_count if graph else 0,
+            "loaded_at": (
+                datetime.fromtimestamp(self._loaded_at).isoformat() if self._loaded_at else None
+            ),
+        }
+
+    def _lookup(
+        self, curie: str, upward: bool, max_depth: int | None
+    ) -> list[dict[str, Any]] | None:
+        graph = self._graph
+        if graph is None:
+            return None
+        start = graph.index.get(curie.lower())
+        if start is None:
+            return None
+
+        return [
+            self._format_term(graph, node, depth, _EDGE_TYPES[edge_type])
+            for node, depth, edge_type in graph.walk(start, upward, max_depth)
+        ]
+
+    @staticmethod
+    def _format_term(
+        graph: OntologyGraph, node: int, depth: int, relationship: str | None
+    ) -> dict[str, Any]:
+        """Format a node like OntologyClient hierarchy entries."""
+        term_id = graph.ids[node]
+        namespace, _, identifier = term_id.partition(":")
+        return {
+            "curie": f"{namespace.lower()}:{identifier}",
+            "name": graph.names[node] or term_id,
+            "namespace": namespace.lower(),
+            "identifier": identifier,
+            "depth": depth,
+            "relationship": _RELATIONSHIP_NAMES.get(relationship, relationship),
+        }
+
+
+# Global ontology index instance
+_ontology_index: OntologyIndex | None = None
+
+
+def get_ontology_index() -> OntologyIndex | None:
+    """
+    Get global ontology index instance (singleton).
+
+    The index answers lookups only after start() has loaded it; the server
+    starts it during backend initialization.
+
+    Returns:
+        OntologyIndex, or None if disabled in settings
+    """
+    global _ontology_index
+
+    if not settings.ontology_index_enabled:
+        return None
+
+    if _ontology_index is None:
+        snapshot = settings.ontology_index_snapshot_path
+        _ontology_index = OntologyIndex(
+            snapshot_path=Path(snapshot).expanduser() if snapshot else None,
+            refresh_interval=settings.ontology_index_refresh_seconds,
+        )
+
+    return _ontology_index
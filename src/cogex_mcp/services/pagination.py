@@ -48,6 +48,39 @@ class PaginationService:
             next_offset=next_offset,
         )
 
+    @staticmethod
+    def paginate_stream(
+        items: list[Any],
+        offset: int,
+        limit: int,
+        truncated: bool,
+    ) -> PaginatedResponse:
+        """
+        Create pagination metadata for a page collected from a stream.
+
+        The total is unknown for streamed results. If collection stopped early
+        (character budget), has_more is set so the caller resumes at next_offset.
+
+        Args:
+            items: List of items collected for the current page
+            offset: Current offset
+            limit: Maximum items per page
+            truncated: Whether the stream was cut short
+
+        Returns:
+            PaginatedResponse with metadata
+        """
+        count = len(items)
+
+        return PaginatedResponse(
+            total_count=offset + count,
+            count=count,
+            offset=offset,
+            limit=limit,
+            has_more=truncated,
+            next_offset=offset + count if truncated else None,
+        )
+
     @staticmethod
     def slice_results(
         items: list[Any],
@@ -0,0 +1,140 @@
+"""
+Unit tests for byte-budgeted cache eviction.
+
+Checks the deep size estimate, that entries are evicted by weight as well
+as count, and that TinyLFU admission keeps a huge one-off value from
+flushing small frequently read entries.
+
+Run with: pytest tests/cache/test_cache_budget.py -v
+"""
+
+import sys
+
+import pytest
+
+from cogex_mcp.services.cache import CacheService
+from cogex_mcp.services.cache_core import (
+    MISSING,
+    CountMinSketch,
+    ShardedLRUCache,
+    estimate_size,
+)
+
+
+@pytest.mark.cache
+class TestEstimateSize:
+    """Tests for estimate_size."""
+
+    def test_deep_size(self):
+        """Nested values are counted, not just the outer container."""
+        edges = [{"source": f"hgnc:{i}", "target": f"hgnc:{i + 1}"} for i in range(5000)]
+        value = {"nodes": [], "edges": edges}
+
+        exact = sys.getsizeof(value) + sys.getsizeof([]) + sys.getsizeof(edges)
+        exact += sum(
+            sys.getsizeof(edge) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in edge.items())
+            for edge in edges
+        )
+        exact += sys.getsizeof("nodes") + sys.getsizeof("edges")
+
+        assert sys.getsizeof(value) < 1000
+        assert estimate_size(value) == pytest.approx(exact, rel=0.05)
+
+    def test_shared_and_cyclic(self):
+        """Shared objects are counted once and cycles terminate."""
+        item = {"name": "TP53"}
+        assert estimate_size([item, item]) < 2 * estimate_size(item)
+
+        cycle = []
+        cycle.append(cycle)
+        assert estimate_size(cycle) == sys.getsizeof(cycle)
+
+
+@pytest.mark.cache
+class TestCountMinSketch:
+    """Tests for CountMinSketch."""
+
+    def test_counts_and_aging(self):
+        """Estimates never undercount, and aging halves them."""
+        sketch = CountMinSketch(width=64, reset_after=1000)
+        for i in range(200):
+            for _ in range(i % 5):
+                sketch.increment(f"key{i}")
+
+        assert all(sketch.estimate(f"key{i}") >= i % 5 for i in range(200))
+        assert sketch.estimate("key4") <= 5
+
+        hot = sketch.estimate("key4")
+        for _ in range(1000 - 400):
+            sketch.increment("other")
+        assert sketch.estimate("key4") == hot // 2
+
+
+@pytest.mark.cache
+class TestByteBudget:
+    """Tests for ShardedLRUCache weights and admission."""
+
+    def test_evicts_by_bytes(self):
+        """Least recently used entries go until the weights fit."""
+        cache = ShardedLRUCache(max_size=100, ttl_seconds=60, max_bytes=1000)
+        for i in range(5):
+            cache.set(f"k{i}", i, weight=200)
+
+        assert cache.set("k5", 5, weight=300) == (2, 0, True)
+        assert cache.total_bytes == 900
+        assert cache.get("k0") is MISSING and cache.get("k1") is MISSING
+
+        # Larger than the whole budget: never cached
+        assert cache.set("huge", 0, weight=2000) == (0, 0, False)
+
+    def test_one_off_does_not_flush_hot_entries(self):
+        """A big new value loses to the frequently read entries it would evict."""
+        cache = ShardedLRUCache(max_size=100, ttl_seconds=60, max_bytes=1000)
+        for i in range(10):
+            cache.set(f"gene{i}", i, weight=100)
+            for _ in range(3):
+                cache.get(f"gene{i}")
+
+        assert cache.set("subnetwork", "...", weight=500) == (0, 0, False)
+        assert all(cache.get(f"gene{i}") == i for i in range(10))
+        assert list(cache._shards[0].entries) == [f"gene{i}" for i in range(10)]
+
+        # Once it is read as often, it is admitted
+        for _ in range(10):
+            cache.get("subnetwork")
+        evicted, _, admitted = cache.set("subnetwork", "...", weight=500)
+        assert admitted and evicted == 5
+
+
+@pytest.mark.cache
+@pytest.mark.asyncio
+class TestCacheServiceBudget:
+    """Tests for CacheService memory accounting."""
+
+    async def test_memory_budget(self):
+        """Values are weighed by deep size and rejections are counted."""
+        cache = CacheService(max_size=100, max_memory_bytes=200_000)
+        big = {"edges": [{"source": "x" * 100, "target": i} for i in range(2000)]}
+
+        await cache.set("small", {"name": "TP53"})
+        await cache.set("big", big)
+
+        stats = cache.get_detailed_stats()
+        assert await cache.get("big") is None
+        assert stats["rejections"] == 1
+        assert 0 < stats["total_memory_estimate"] < 1000
+        assert stats["memory_utilization"] < 1
+
+    async def test_value_over_shard_share_is_reported(self, caplog):
+        """A value within the total budget but over one shard's share is counted and logged."""
+        cache = CacheService(max_size=100, shards=4, max_memory_bytes=400_000)
+        value = {"edges": [{"source": "x" * 100, "target": i} for i in range(600)]}
+
+        with caplog.at_level("WARNING", logger="cogex_mcp.services.cache"):
+            await cache.set("subnetwork", value)
+
+        stats = cache.get_detailed_stats()
+        assert await cache.get("subnetwork") is None
+        assert stats["max_item_bytes"] == 100_000
+        assert stats["rejections"] == stats["oversized_rejections"] == 1
+        assert "oversized" in caplog.text
@@ -0,0 +1,107 @@
+"""
+Unit tests for the sharded LRU/TTL cache core.
+
+Checks per-shard LRU eviction and TTL sweeps, that concurrent threads keep
+the cache within its bounds, and that CacheService's blocking accessors
+share entries with the async API.
+
+Run with: pytest tests/cache/test_cache_core.py -v
+"""
+
+import threading
+
+import pytest
+
+from cogex_mcp.services.cache import CacheService
+from cogex_mcp.services.cache_core import MISSING, ShardedLRUCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.cache
+class TestShardedLRUCache:
+    """Tests for ShardedLRUCache."""
+
+    def test_lru_and_ttl(self):
+        """Reads refresh recency; expired entries are dropped and counted."""
+        clock = FakeClock()
+        cache = ShardedLRUCache(max_size=3, ttl_seconds=10, timer=clock)
+        for key in "abc":
+            cache.set(key, key.upper())
+
+        assert cache.get("a") == "A"
+        assert cache.set("d", "D") == (1, 0, True)  # Evicts b, the least recently used
+        assert cache.get("b") is MISSING
+        assert len(cache) == 3
+
+        clock.now = 5
+        cache.set("e", "E")  # Evicts c
+        clock.now = 10
+        assert cache.get("a") is MISSING
+        assert "e" in cache
+        assert cache.set("f", "F") == (0, 0, True)  # a and d were swept by the expired read
+        assert len(cache) == 2
+
+    def test_shards_split_capacity(self):
+        """Capacity is divided across shards and never exceeded."""
+        cache = ShardedLRUCache(max_size=10, ttl_seconds=60, shards=4)
+        assert cache.shards == 4
+        evicted = sum(cache.set(f"k{i}", i)[0] for i in range(100))
+
+        assert len(cache) == 10
+        assert evicted == 90
+        assert ShardedLRUCache(max_size=2, ttl_seconds=60, shards=8).shards == 2
+
+    def test_concurrent_threads(self):
+        """Threads hammering shared keys leave a consistent, bounded cache."""
+        cache = ShardedLRUCache(max_size=64, ttl_seconds=60, shards=8)
+        errors = []
+
+        def work(seed):
+            try:
+                for i in range(5000):
+                    key = f"k{(i * seed) % 200}"
+                    if cache.get(key) is MISSING:
+                        cache.set(key, i)
+                    if i % 50 == 0:
+                        cache.delete(key)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(seed,)) for seed in range(1, 9)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) <= 64
+        for shard in cache._shards:
+            assert list(shard.entries) == [k for k in shard.entries if k in shard.expiry]
+            assert len(shard.entries) == len(shard.expiry)
+
+
+@pytest.mark.cache
+class TestCacheServiceSync:
+    """Tests for CacheService blocking accessors."""
+
+    async def test_sync_and_async_share_entries(self):
+        """Values set from a worker thread are visible to async callers."""
+        cache = CacheService(max_size=10, shards=2)
+
+        thread = threading.Thread(target=cache.set_sync, args=("gene:TP53", {"name": "TP53"}))
+        thread.start()
+        thread.join()
+
+        assert await cache.get("gene:TP53") == {"name": "TP53"}
+        assert cache.get_sync("gene:EGFR") is None
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
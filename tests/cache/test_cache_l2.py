@@ -0,0 +1,104 @@
+"""
+Unit tests for the persistent L2 cache tier.
+
+Checks that the SQLite store expires and trims entries, that L1 misses
+fall through to L2 and are promoted, that entries survive a new
+CacheService (restart) on the same file, and that hits are counted per
+tier.
+
+Run with: pytest tests/cache/test_cache_l2.py -v
+"""
+
+import time
+
+import pytest
+
+from cogex_mcp.services.cache import CacheService
+from cogex_mcp.services.cache_store import SQLiteCacheStore
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    """Path of a fresh L2 database."""
+    return tmp_path / "cache.sqlite3"
+
+
+@pytest.mark.cache
+class TestSQLiteCacheStore:
+    """Tests for SQLiteCacheStore."""
+
+    def test_roundtrip_and_expiry(self, store_path, monkeypatch):
+        """Values round-trip as JSON until their TTL passes."""
+        store = SQLiteCacheStore(store_path, ttl_seconds=60)
+        assert store.set("gene:TP53", {"name": "TP53", "synonyms": ["p53"]})
+        assert store.get("gene:TP53") == (True, {"name": "TP53", "synonyms": ["p53"]})
+        assert store.get("gene:EGFR") == (False, None)
+
+        # Values that are not JSON stay out of L2
+        assert not store.set("obj", object())
+        assert store.get("obj") == (False, None)
+
+        later = time.time() + 61
+        monkeypatch.setattr("cogex_mcp.services.cache_store.time.time", lambda: later)
+        assert store.get("gene:TP53") == (False, None)
+        store.close()
+
+    def test_purge_keeps_newest(self, store_path):
+        """Purging drops the oldest entries beyond max_entries."""
+        store = SQLiteCacheStore(store_path, max_entries=3)
+        for i in range(5):
+            store.set(f"key{i}", i)
+        store.purge()
+
+        assert store.count() == 3
+        assert store.get("key0") == (False, None)
+        assert store.get("key4") == (True, 4)
+        store.close()
+
+
+@pytest.mark.cache
+@pytest.mark.asyncio
+class TestTwoTierCache:
+    """Tests for CacheService with an L2 store."""
+
+    async def test_restart_reads_through_l2(self, store_path):
+        """A new service on the same file answers from L2, then from L1."""
+        first = CacheService(max_size=10, store=SQLiteCacheStore(store_path))
+        await first.set("gene:TP53", {"name": "TP53"})
+
+        second = CacheService(max_size=10, store=SQLiteCacheStore(store_path))
+        assert await second.get("gene:TP53") == {"name": "TP53"}
+        assert await second.get("gene:TP53") == {"name": "TP53"}
+        assert await second.get("gene:EGFR") is None
+
+        stats = second.get_stats()
+        assert (stats.hits, stats.misses) == (2, 1)
+        assert (stats.l1_hits, stats.l2_hits, stats.l2_misses) == (1, 1, 1)
+
+        tiers = second.get_detailed_stats()["tiers"]
+        assert tiers["l2"]["enabled"] is True
+        assert tiers["l2"]["hit_rate"] == pytest.approx(50.0)
+
+    async def test_delete_and_clear_both_tiers(self, store_path):
+        """Deletes and clears reach the shared store too."""
+        store = SQLiteCacheStore(store_path)
+        cache = CacheService(max_size=10, store=store)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+
+        await cache.delete("a")
+        assert store.get("a") == (False, None)
+
+        await cache.clear()
+        assert store.count() == 0
+
+    async def test_store_errors_are_misses(self, store_path):
+        """A broken store degrades to an in-process cache."""
+        store = SQLiteCacheStore(store_path)
+        cache = CacheService(max_size=10, store=store)
+        store.close()
+
+        await cache.set("a", 1)
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert cache.get_stats().l2_errors == 2
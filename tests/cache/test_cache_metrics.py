@@ -0,0 +1,99 @@
+"""
+Unit tests for fixed-memory cache metrics.
+
+Checks that the top-k tracker finds the heavy hitters of a long-tailed
+key stream while keeping only k keys, that size aggregates are running
+sums, and that CacheService metrics stay bounded as distinct keys grow.
+
+Run with: pytest tests/cache/test_cache_metrics.py -v
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from cogex_mcp.services.cache import CacheService
+from cogex_mcp.services.cache_metrics import HotKeys, SizeAggregate
+
+
+@pytest.mark.cache
+class TestHotKeys:
+    """Tests for HotKeys."""
+
+    def test_finds_heavy_hitters(self):
+        """Zipf-like traffic over 20k keys yields the true top keys."""
+        rng = random.Random(7)
+        hot = HotKeys(k=10)
+        for _ in range(50_000):
+            rank = min(int(rng.paretovariate(1.2)), 20_000)
+            hot.record(f"gene:{rank}")
+
+        top = hot.most_common(3)
+        assert [key for key, _ in top] == ["gene:1", "gene:2", "gene:3"]
+        assert top[0][1] >= top[1][1] >= top[2][1]
+        assert len(hot._counts) == len(hot._heap) == 10
+
+    def test_clear(self):
+        """Cleared trackers start counting from zero."""
+        hot = HotKeys(k=2)
+        for key in ["a", "a", "b", "c"]:
+            hot.record(key)
+        assert hot.most_common()[0] == ("a", 2)
+
+        hot.clear()
+        hot.record("c")
+        assert hot.most_common() == [("c", 1)]
+
+
+@pytest.mark.cache
+class TestSizeAggregate:
+    """Tests for SizeAggregate."""
+
+    def test_running_values(self):
+        """Mean and maximum come from running sums."""
+        sizes = SizeAggregate()
+        assert sizes.mean == 0.0
+        for size in [10, 30, 20]:
+            sizes.add(size)
+        assert (sizes.count, sizes.mean, sizes.max) == (3, 20.0, 30)
+
+
+@pytest.mark.cache
+@pytest.mark.asyncio
+class TestCacheServiceMetrics:
+    """Tests for CacheService detailed metrics."""
+
+    async def test_bounded_under_many_keys(self):
+        """Tens of thousands of distinct keys do not grow the metrics."""
+        cache = CacheService(max_size=100)
+        for i in range(20_000):
+            await cache.set(f"gene:{i}", {"id": i})
+            await cache.get(f"gene:{i}")
+            await cache.get("gene:hot")
+        await cache.set("gene:hot", {"id": -1})
+        for _ in range(50):
+            await cache.get("gene:hot")
+
+        stats = cache.get_detailed_stats()
+        top_key, top_count = stats["hot_keys"][0]
+        assert top_key == "gene:hot"
+        assert 50 <= top_count <= 60  # Sketch estimates never undercount
+        assert len(stats["hot_keys"]) == 10
+        assert len(cache._hot_keys._counts) == 10
+        assert stats["avg_value_size"] > 0
+        assert stats["size"] == 100
+
+    async def test_ttl_expirations(self):
+        """Expirations are counted once per expired entry, not per miss."""
+        cache = CacheService(max_size=10, ttl_seconds=0.05)
+        for key in ["a", "b", "c"]:
+            await cache.set(key, 1)
+        await asyncio.sleep(0.06)
+
+        for key in ["a", "b", "c", "a"]:
+            assert await cache.get(key) is None
+
+        assert cache.get_detailed_stats()["ttl_expirations"] == 3
+        cache.reset_stats()
+        assert cache.get_detailed_stats()["ttl_expirations"] == 0
@@ -0,0 +1,97 @@
+"""
+Unit tests for stampede protection in CacheService.get_or_set.
+
+Checks that concurrent misses on one key share a single factory call, that
+a failed call is re-raised for the negative TTL and retried afterwards, and
+that a cancelled caller does not cancel the shared call.
+
+Run with: pytest tests/cache/test_cache_stampede.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from cogex_mcp.services.cache import CacheService
+
+
+class CountingFactory:
+    """Async factory that counts its calls and can be made to fail."""
+
+    def __init__(self, delay=0.01, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self, name):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {"name": name}
+
+
+@pytest.mark.cache
+@pytest.mark.asyncio
+class TestGetOrSetStampede:
+    """Tests for get_or_set coordination."""
+
+    async def test_concurrent_misses_share_one_call(self):
+        """Twenty concurrent misses run the factory once."""
+        cache = CacheService(max_size=10)
+        factory = CountingFactory()
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("gene:TP53", factory, "TP53") for _ in range(20))
+        )
+
+        assert results == [{"name": "TP53"}] * 20
+        assert factory.calls == 1
+        assert cache.get_stats().coalesced == 19
+        assert await cache.get_or_set("gene:TP53", factory, "TP53") == {"name": "TP53"}
+        assert factory.calls == 1
+
+    async def test_failure_is_negatively_cached(self):
+        """Waiting callers share the error, which is re-raised until the TTL ends."""
+        cache = CacheService(max_size=10, negative_ttl_seconds=0.1)
+        factory = CountingFactory(error=ConnectionError("neo4j down"))
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("gene:X", factory, "X") for _ in range(5)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+        with pytest.raises(ConnectionError):
+            await cache.get_or_set("gene:X", factory, "X")
+        assert factory.calls == 1
+        assert cache.get_stats().negative_hits == 1
+
+        await asyncio.sleep(0.15)
+        factory.error = None
+        assert await cache.get_or_set("gene:X", factory, "X") == {"name": "X"}
+        assert factory.calls == 2
+
+    async def test_negative_ttl_disabled(self):
+        """With a zero negative TTL every call retries the factory."""
+        cache = CacheService(max_size=10, negative_ttl_seconds=0)
+        factory = CountingFactory(delay=0, error=ValueError("bad"))
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await cache.get_or_set("k", factory, "k")
+        assert factory.calls == 2
+
+    async def test_cancelled_caller_keeps_shared_call(self):
+        """Cancelling the first caller does not cancel the others' result."""
+        cache = CacheService(max_size=10)
+        factory = CountingFactory(delay=0.02)
+
+        first = asyncio.create_task(cache.get_or_set("k", factory, "k"))
+        second = asyncio.create_task(cache.get_or_set("k", factory, "k"))
+        await asyncio.sleep(0.005)
+        first.cancel()
+
+        assert await second == {"name": "k"}
+        assert factory.calls == 1
+        assert await cache.get("k") == {"name": "k"}
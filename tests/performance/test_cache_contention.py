@@ -0,0 +1,101 @@
+"""
+CacheService throughput under contention.
+
+Benchmarks the lock-free read path and sharded write locks:
+- Many asyncio tasks sharing one cache (90% reads, 10% writes)
+- Executor-style threads using get_sync/set_sync on the same cache
+
+Both must sustain at least 10k operations per second. Entirely in-process;
+no backend is needed.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+
+import pytest
+
+from cogex_mcp.services.cache import CacheService
+
+logger = logging.getLogger(__name__)
+
+TARGET_OPS_PER_SECOND = 10_000
+KEYS = [f"gene:{i}" for i in range(2000)]
+
+
+def workload(seed: int, ops: int) -> list[tuple[bool, str]]:
+    """(is_write, key) operations with a skewed key distribution."""
+    rng = random.Random(seed)
+    return [
+        (rng.random() < 0.1, KEYS[min(int(rng.expovariate(1 / 200)), len(KEYS) - 1)])
+        for _ in range(ops)
+    ]
+
+
+@pytest.mark.performance
+class TestCacheContention:
+    """Cache throughput benchmarks."""
+
+    @pytest.mark.asyncio
+    async def test_async_tasks(self):
+        """100 tasks interleaving reads and writes on one cache."""
+        cache = CacheService(
+            max_size=1000, ttl_seconds=3600, shards=8, max_memory_bytes=256 * 1024 * 1024
+        )
+        tasks, ops = 100, 500
+
+        async def worker(seed):
+            for is_write, key in workload(seed, ops):
+                if is_write:
+                    await cache.set(key, {"id": key})
+                else:
+                    await cache.get(key)
+                if key.endswith("0"):
+                    await asyncio.sleep(0)  # Let other tasks interleave
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(seed) for seed in range(tasks)))
+        elapsed = time.perf_counter() - start
+
+        throughput = tasks * ops / elapsed
+        stats = cache.get_stats()
+        logger.info(
+            f"Async contention: {throughput:,.0f} ops/s, "
+            f"hit_rate={stats.hit_rate:.1%}, evictions={stats.evictions}"
+        )
+        assert throughput >= TARGET_OPS_PER_SECOND
+        assert stats.size <= 1000
+
+    def test_executor_threads(self):
+        """8 threads using the blocking accessors on one cache."""
+        cache = CacheService(
+            max_size=1000, ttl_seconds=3600, shards=8, max_memory_bytes=256 * 1024 * 1024
+        )
+        threads, ops = 8, 5000
+        errors = []
+
+        def worker(seed):
+            try:
+                for is_write, key in workload(seed, ops):
+                    if is_write:
+                        cache.set_sync(key, {"id": key})
+                    else:
+                        cache.get_sync(key)
+            except Exception as e:
+                errors.append(e)
+
+        pool = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+        start = time.perf_counter()
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        throughput = threads * ops / elapsed
+        logger.info(f"Thread contention: {throughput:,.0f} ops/s with {threads} threads")
+        assert errors == []
+        assert throughput >= TARGET_OPS_PER_SECOND
+        assert len(cache._cache) <= 1000
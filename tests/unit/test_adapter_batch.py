@@ -0,0 +1,86 @@
+"""
+Unit tests for batched queries in ClientAdapter.
+
+Checks that the row-by-row path (composite operations, REST backend or a
+failed UNWIND batch) keeps results in input order and bounds how many rows
+are in flight at once, and that check_relationship rows are each
+dispatched by their own relationship_type.
+
+Run with: pytest tests/unit/test_adapter_batch.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from cogex_mcp.clients.adapter import BackendType, CircuitBreaker, ClientAdapter
+from cogex_mcp.clients.neo4j_client import Neo4jClient
+
+
+@pytest.mark.asyncio
+class TestQueryBatchFallback:
+    """Tests for ClientAdapter.query_batch row-by-row execution."""
+
+    async def test_row_by_row_is_bounded(self, monkeypatch):
+        """Rows run at most max_concurrent_queries at a time, in input order."""
+        monkeypatch.setattr("cogex_mcp.clients.adapter.settings.max_concurrent_queries", 4)
+        adapter = ClientAdapter()
+        adapter._initialized = True
+        adapter.primary_backend = BackendType.REST
+        running = 0
+        peak = 0
+
+        async def execute(query_name, **params):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return {"success": True, "gene_id": params["gene_id"]}
+
+        monkeypatch.setattr(adapter, "query", execute)
+
+        rows = [{"gene_id": f"hgnc:{i}"} for i in range(200)]
+        result = await adapter.query_batch("get_pathways_for_gene", rows, timeout=1000)
+
+        assert result["count"] == 200
+        assert [r["gene_id"] for r in result["results"]] == [row["gene_id"] for row in rows]
+        assert peak == 4
+
+    async def test_check_relationship_dispatched_per_row(self, monkeypatch):
+        """check_relationship is never batched as the query it is aliased to."""
+        monkeypatch.setattr("cogex_mcp.clients.adapter.settings.hedge_queries", False)
+        client = Neo4jClient(
+            uri="bolt://localhost:7687",
+            user="neo4j",
+            password="password",
+            fulltext_search=False,
+        )
+        client.driver = object()
+        run = []
+
+        async def execute_batch(query_name, param_rows, timeout=None):
+            raise AssertionError(f"'{query_name}' should not be batched")
+
+        async def run_catalog_query(query_name, **params):
+            run.append(query_name)
+            return {"success": True, "records": [{"result": True}], "count": 1}
+
+        monkeypatch.setattr(client, "execute_batch", execute_batch)
+        monkeypatch.setattr(client, "run_catalog_query", run_catalog_query)
+        adapter = ClientAdapter()
+        adapter._initialized = True
+        adapter.primary_backend = BackendType.NEO4J
+        adapter.fallback_backend = BackendType.NONE
+        adapter.neo4j_client = client
+        adapter.neo4j_breaker = CircuitBreaker()
+
+        rows = [
+            {"relationship_type": "gene_in_pathway", "entity1": "hgnc:6407", "entity2": "wp:1"},
+            {"relationship_type": "drug_target", "entity1": "chebi:1", "entity2": "hgnc:6407"},
+        ]
+        result = await adapter.query_batch("check_relationship", rows)
+
+        assert not client.is_catalog_query("check_relationship")
+        assert result["count"] == 2
+        assert run == ["is_gene_in_pathway", "is_drug_target"]
@@ -0,0 +1,162 @@
+"""
+Unit tests for single-flight query coalescing in ClientAdapter.
+
+Checks the canonical query key, that identical concurrent queries share one
+backend execution (results and errors), and that a cancelled caller does
+not cancel the shared execution.
+
+Run with: pytest tests/unit/test_adapter_coalescing.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from cogex_mcp.clients.adapter import ClientAdapter, SingleFlight, query_key
+
+
+class TestQueryKey:
+    """Tests for query_key."""
+
+    def test_parameter_order_and_sets(self):
+        """Keys ignore parameter order and set ordering."""
+        first = query_key("get_genes", {"limit": 10, "ids": {"hgnc:1", "hgnc:2"}})
+        second = query_key("get_genes", {"ids": {"hgnc:2", "hgnc:1"}, "limit": 10})
+
+        assert first == second
+        assert first != query_key("get_genes", {"limit": 20, "ids": {"hgnc:1", "hgnc:2"}})
+        assert first != query_key("get_drugs", {"limit": 10, "ids": {"hgnc:1", "hgnc:2"}})
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    async def test_concurrent_calls_share_execution(self):
+        """Callers arriving while a call is in flight get its result."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"success": True}
+
+        results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats.requests == 5
+        assert flight.stats.executions == 1
+        assert flight.stats.merged == 4
+        assert flight.stats.in_flight == 0
+
+        # Completed calls are not cached
+        await flight.do("key", fetch)
+        assert calls == 2
+
+    async def test_errors_are_shared(self):
+        """Every waiting caller receives the execution's exception."""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("backend down")
+
+        results = await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert flight.stats.executions == 1
+
+    async def test_cancelled_caller_does_not_cancel_execution(self):
+        """Remaining callers still get the result when one is cancelled."""
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+    async def test_last_caller_leaving_cancels_execution(self):
+        """An execution nobody waits for any more is cancelled."""
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.create_task(flight.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert flight.stats.abandoned == 1
+        assert flight.stats.in_flight == 0
+
+        # A new caller starts a fresh execution
+        async def fetch_again():
+            return "fresh"
+
+        assert await flight.do("key", fetch_again) == "fresh"
+
+
+@pytest.mark.asyncio
+class TestClientAdapterCoalescing:
+    """Tests for ClientAdapter.query coalescing."""
+
+    async def test_identical_queries_coalesced(self, monkeypatch):
+        """Identical queries share one execution; different ones do not."""
+        adapter = ClientAdapter()
+        executed = []
+
+        async def execute(query_name, **params):
+            executed.append((query_name, params))
+            await asyncio.sleep(0.01)
+            return {"success": True, "query": query_name}
+
+        monkeypatch.setattr(adapter, "_query", execute)
+
+        await asyncio.gather(
+            adapter.query("resolve_gene", gene="TP53", limit=5),
+            adapter.query("resolve_gene", limit=5, gene="TP53"),
+            adapter.query("resolve_gene", gene="MDM2", limit=5),
+        )
+
+        assert len(executed) == 2
+        status = adapter.get_status()["coalescing"]
+        assert status["merged"] == 1
+        assert status["merge_rate"] == pytest.approx(1 / 3)
+
+    async def test_coalescing_disabled(self, monkeypatch):
+        """With coalesce_queries off, every call executes."""
+        adapter = ClientAdapter()
+        monkeypatch.setattr("cogex_mcp.clients.adapter.settings.coalesce_queries", False)
+        calls = 0
+
+        async def execute(query_name, **params):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"success": True}
+
+        monkeypatch.setattr(adapter, "_query", execute)
+
+        await asyncio.gather(*(adapter.query("resolve_gene", gene="TP53") for _ in range(3)))
+
+        assert calls == 3
@@ -0,0 +1,155 @@
+"""
+Unit tests for streaming queries in ClientAdapter.
+
+Checks that Neo4j streams run through the circuit breaker and hold a slot
+in their concurrency lane, that a stream failing before its first record
+falls back to the buffered query() path, and that a stream failing part-way
+is not retried.
+
+Run with: pytest tests/unit/test_adapter_streaming.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from cogex_mcp.clients.adapter import BackendType, CircuitBreaker, ClientAdapter
+from cogex_mcp.clients.limiter import AdaptiveLimiter, QueryRejectedError
+
+
+class FakeNeo4j:
+    """Neo4j client stub streaming `records`, failing after `fail_after` of them."""
+
+    def __init__(self, records, fail_after=None):
+        self.records = records
+        self.fail_after = fail_after
+        self.closed = False
+
+    def is_catalog_query(self, query_name):
+        return True
+
+    async def stream_query(self, query_name, **params):
+        try:
+            for i, record in enumerate(self.records):
+                if i == self.fail_after:
+                    raise RuntimeError("connection reset")
+                await asyncio.sleep(0)
+                yield record
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Adapter with a Neo4j primary whose buffered path returns 'buffered' records."""
+    adapter = ClientAdapter()
+    adapter._initialized = True
+    adapter.primary_backend = BackendType.NEO4J
+    adapter.fallback_backend = BackendType.REST
+    adapter.neo4j_breaker = CircuitBreaker(failure_threshold=2)
+    adapter.buffered = []
+
+    async def execute(query_name, **params):
+        adapter.buffered.append(query_name)
+        return {"success": True, "records": [{"id": "buffered"}]}
+
+    monkeypatch.setattr(adapter, "_query", execute)
+    return adapter
+
+
+async def collect(stream):
+    return [record async for record in stream]
+
+
+@pytest.mark.asyncio
+class TestStreamQuery:
+    """Tests for ClientAdapter.stream_query."""
+
+    async def test_streams_from_neo4j(self, adapter):
+        """Healthy streams are served by Neo4j and count as breaker successes."""
+        adapter.neo4j_client = FakeNeo4j([{"id": 1}, {"id": 2}])
+
+        records = await collect(adapter.stream_query("get_genes_in_tissue", limit=2))
+
+        assert records == [{"id": 1}, {"id": 2}]
+        assert adapter.buffered == []
+        assert adapter.neo4j_breaker.failure_count == 0
+
+    async def test_early_close_closes_driver_stream(self, adapter):
+        """A consumer stopping early closes the Neo4j stream."""
+        adapter.neo4j_client = FakeNeo4j([{"id": i} for i in range(10)])
+
+        stream = adapter.stream_query("get_genes_in_tissue", limit=10)
+        assert await anext(stream) == {"id": 0}
+        await stream.aclose()
+
+        assert adapter.neo4j_client.closed
+        assert adapter.neo4j_breaker.failure_count == 0
+
+    async def test_failure_before_first_record_falls_back(self, adapter):
+        """A stream that fails at once is retried through query()."""
+        adapter.neo4j_client = FakeNeo4j([{"id": 1}], fail_after=0)
+
+        records = await collect(adapter.stream_query("get_genes_in_tissue", limit=2))
+
+        assert records == [{"id": "buffered"}]
+        assert adapter.buffered == ["get_genes_in_tissue"]
+        assert adapter.neo4j_breaker.failure_count == 1
+
+    async def test_open_breaker_skips_stream(self, adapter):
+        """With the Neo4j breaker open, records come from query()."""
+        adapter.neo4j_client = FakeNeo4j([{"id": 1}], fail_after=0)
+        for _ in range(2):
+            await collect(adapter.stream_query("get_genes_in_tissue", limit=2))
+        assert adapter.neo4j_breaker.is_open()
+
+        adapter.neo4j_client = FakeNeo4j([{"id": 1}])
+        records = await collect(adapter.stream_query("get_genes_in_tissue", limit=2))
+
+        assert records == [{"id": "buffered"}]
+        assert not adapter.neo4j_client.closed
+
+    async def test_failure_mid_stream_raises(self, adapter):
+        """Records already yielded are not repeated by a fallback."""
+        adapter.neo4j_client = FakeNeo4j([{"id": 1}, {"id": 2}], fail_after=1)
+        received = []
+
+        with pytest.raises(RuntimeError, match="connection reset"):
+            async for record in adapter.stream_query("get_genes_in_tissue", limit=2):
+                received.append(record)
+
+        assert received == [{"id": 1}]
+        assert adapter.buffered == []
+        assert adapter.neo4j_breaker.failure_count == 1
+
+    async def test_stream_holds_lane_slot(self, adapter):
+        """An open stream occupies a slot in its lane until it is closed."""
+        adapter.neo4j_client = FakeNeo4j([{"id": i} for i in range(10)])
+
+        lookup = adapter.stream_query("get_genes_in_tissue", limit=10)
+        await anext(lookup)
+        scan = adapter.stream_query("list_phosphorylations")
+        await anext(scan)
+
+        assert adapter._limiters["light"].get_stats().in_flight == 1
+        assert adapter._limiters["heavy"].get_stats().in_flight == 1
+
+        await lookup.aclose()
+        await scan.aclose()
+        assert adapter._limiters["light"].get_stats().in_flight == 0
+        assert adapter._limiters["heavy"].get_stats().in_flight == 0
+        assert adapter._limiters["light"].get_stats().completed == 1
+
+    async def test_rejected_stream_does_not_fall_back(self, adapter):
+        """A stream shed by its lane is not retried through query()."""
+        adapter.neo4j_client = FakeNeo4j([{"id": i} for i in range(10)])
+        adapter._limiters["heavy"] = AdaptiveLimiter("heavy", max_limit=1, max_queue=0)
+
+        first = adapter.stream_query("list_phosphorylations")
+        await anext(first)
+
+        with pytest.raises(QueryRejectedError):
+            await collect(adapter.stream_query("list_phosphorylations"))
+
+        await first.aclose()
+        assert adapter.buffered == []
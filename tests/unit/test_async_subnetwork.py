@@ -0,0 +1,131 @@
+"""
+Unit tests for AsyncSubnetworkClient.
+
+Uses a mocked Neo4jClient.run_catalog_query; verifies that filters are
+passed to Cypher and that rows are formatted like SubnetworkClient output.
+
+Run with: pytest tests/unit/test_async_subnetwork.py -v
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cogex_mcp.clients.async_subnetwork import AsyncSubnetworkClient
+
+
+@pytest.fixture
+def sample_rows():
+    """Relationship rows as returned by the subnetwork_* queries."""
+    return [
+        {
+            "stmt_hash": 123,
+            "stmt_type": "Phosphorylation",
+            "subj_id": "hgnc:11998",
+            "subj_name": "TP53",
+            "obj_id": "hgnc:6973",
+            "obj_name": "MDM2",
+            "evidence_count": 4,
+            "belief": 0.95,
+            "source_counts": '{"reach": 3, "sparser": 1}',
+        },
+        {
+            "stmt_hash": 456,
+            "stmt_type": "Activation",
+            "subj_id": "hgnc:6973",
+            "subj_name": "MDM2",
+            "obj_id": "hgnc:1387",
+            "obj_name": "CDKN1A",
+            "evidence_count": 2,
+            "belief": 0.75,
+            "source_counts": None,
+        },
+    ]
+
+
+@pytest.fixture
+def mock_neo4j_client(sample_rows):
+    """Mock Neo4j client returning the sample rows."""
+    client = MagicMock()
+    client.run_catalog_query = AsyncMock(
+        return_value={"success": True, "records": sample_rows, "count": len(sample_rows)}
+    )
+    return client
+
+
+@pytest.mark.asyncio
+class TestAsyncSubnetworkClient:
+    """Tests for AsyncSubnetworkClient."""
+
+    async def test_filters_pushed_into_query(self, mock_neo4j_client):
+        """Statement type, evidence, belief and limit are query parameters."""
+        client = AsyncSubnetworkClient(mock_neo4j_client, timeout=10000)
+
+        await client.extract_direct(
+            gene_ids=["HGNC:11998", "6973"],
+            statement_types=["Phosphorylation"],
+            min_evidence=2,
+            min_belief=0.7,
+            max_statements=50,
+        )
+
+        mock_neo4j_client.run_catalog_query.assert_awaited_once_with(
+            "subnetwork_direct",
+            timeout=10000,
+            tissue_id=None,
+            gene_ids=["hgnc:11998", "hgnc:6973"],
+            statement_types=["Phosphorylation"],
+            min_evidence=2,
+            min_belief=0.7,
+            max_statements=50,
+        )
+
+    async def test_go_term_uses_go_query(self, mock_neo4j_client):
+        """A GO context switches to the GO-restricted query."""
+        client = AsyncSubnetworkClient(mock_neo4j_client)
+
+        await client.extract_direct(gene_ids=["hgnc:11998", "hgnc:6973"], go_term="go:0006915")
+
+        args, kwargs = mock_neo4j_client.run_catalog_query.call_args
+        assert args == ("subnetwork_go",)
+        assert kwargs["go_id"] == "GO:0006915"
+
+    async def test_tissue_takes_precedence_over_go_term(self, mock_neo4j_client):
+        """With both contexts the tissue filter is applied, as in SubnetworkClient."""
+        client = AsyncSubnetworkClient(mock_neo4j_client)
+
+        await client.extract_direct(
+            gene_ids=["hgnc:11998", "hgnc:6973"],
+            tissue="uberon:0002037",
+            go_term="go:0006915",
+        )
+
+        args, kwargs = mock_neo4j_client.run_catalog_query.call_args
+        assert args == ("subnetwork_direct",)
+        assert kwargs["tissue_id"] == "uberon:0002037"
+        assert "go_id" not in kwargs
+
+    async def test_response_format(self, mock_neo4j_client):
+        """Rows become statements, nodes and statistics."""
+        client = AsyncSubnetworkClient(mock_neo4j_client)
+
+        result = await client.extract_shared_downstream(gene_ids=["hgnc:11998", "hgnc:6973"])
+
+        assert result["success"] is True
+        assert result["note"] == "Shared downstream targets shown"
+
+        stmt = result["statements"][0]
+        assert stmt["subject"] == {
+            "curie": "hgnc:11998",
+            "namespace": "hgnc",
+            "identifier": "11998",
+            "name": "TP53",
+        }
+        assert stmt["sources"] == ["reach", "sparser"]
+        assert result["statements"][1]["sources"] == []
+
+        stats = result["statistics"]
+        assert stats["statement_count"] == 2
+        assert stats["node_count"] == 3
+        assert stats["statement_types"] == {"Phosphorylation": 1, "Activation": 1}
+        assert stats["avg_belief_score"] == pytest.approx(0.85)
@@ -0,0 +1,113 @@
+"""
+Unit tests for the vectorized enrichment engine.
+
+Checks that the single-pass hypergeometric scores match per-term Fisher's
+exact tests, with and without a background gene set.
+
+Run with: pytest tests/unit/test_enrichment_engine.py -v
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import fisher_exact
+
+from cogex_mcp.clients.enrichment_engine import (
+    DEFAULT_NOT_TERM_NOT_SET,
+    enrichment_table,
+    hypergeometric_pvalues,
+    table_to_records,
+)
+
+
+@pytest.fixture
+def gene_set():
+    """Query gene set."""
+    return ["hgnc:1", "hgnc:2", "hgnc:3", "hgnc:4"]
+
+
+@pytest.fixture
+def term_genes():
+    """Candidate terms and their annotated genes."""
+    return {
+        "GO:A": {"hgnc:1", "hgnc:2", "hgnc:3", "hgnc:10"},
+        "GO:B": {"hgnc:1", "hgnc:11", "hgnc:12", "hgnc:13", "hgnc:14"},
+        "GO:C": {"hgnc:20", "hgnc:21"},  # No overlap
+    }
+
+
+def fisher_p(gene_set, genes, not_term_not_set):
+    """Reference p-value from scipy's Fisher's exact test."""
+    query = set(gene_set)
+    table = [
+        [len(query & genes), len(genes - query)],
+        [len(query - genes), not_term_not_set],
+    ]
+    return fisher_exact(table, alternative="greater")[1]
+
+
+class TestEnrichmentTable:
+    """Tests for enrichment_table."""
+
+    def test_matches_fisher_without_background(self, gene_set, term_genes):
+        """P-values equal per-term Fisher's exact tests."""
+        df = enrichment_table(gene_set, term_genes, term_names={"GO:A": "term A"})
+
+        assert list(df["term_id"]) == ["GO:A", "GO:B"]
+        assert list(df["term_name"]) == ["term A", "GO:B"]
+        for term_id, p_value in zip(df["term_id"], df["p_value"], strict=True):
+            expected = fisher_p(gene_set, term_genes[term_id], DEFAULT_NOT_TERM_NOT_SET)
+            assert p_value == pytest.approx(expected)
+
+    def test_matches_fisher_with_background(self, gene_set, term_genes):
+        """The background sets the not-in-term/not-in-set cell."""
+        background = [f"hgnc:{i}" for i in range(1, 60)]
+
+        df = enrichment_table(gene_set, term_genes, background_gene_ids=background)
+
+        for term_id, p_value in zip(df["term_id"], df["p_value"], strict=True):
+            genes = term_genes[term_id]
+            not_term_not_set = len(set(background) - genes - set(gene_set))
+            assert p_value == pytest.approx(fisher_p(gene_set, genes, not_term_not_set))
+
+    def test_counts_and_correction(self, gene_set, term_genes):
+        """Overlap counts, term sizes and BH-adjusted p-values are reported."""
+        df = enrichment_table(gene_set, term_genes)
+
+        top = df.iloc[0]
+        assert top["gene_count"] == 3
+        assert top["term_size"] == 4
+        assert sorted(top["genes"]) == ["hgnc:1", "hgnc:2", "hgnc:3"]
+        assert np.all(df["adjusted_p_value"] >= df["p_value"])
+
+    def test_no_overlap_returns_empty(self, term_genes):
+        """Gene sets sharing no genes with any term give an empty table."""
+        df = enrichment_table(["hgnc:999"], term_genes)
+
+        assert df.empty
+        assert table_to_records(df) == []
+
+    def test_records_use_native_types(self, gene_set, term_genes):
+        """Records are plain Python values ready for JSON."""
+        records = table_to_records(enrichment_table(gene_set, term_genes))
+
+        assert records[0]["term_id"] == "GO:A"
+        assert type(records[0]["p_value"]) is float
+        assert type(records[0]["gene_count"]) is int
+
+
+class TestHypergeometricPvalues:
+    """Tests for hypergeometric_pvalues."""
+
+    def test_matches_scipy_across_tails(self):
+        """Both the upper-tail and complement paths match scipy."""
+        from scipy.stats import hypergeom
+
+        rng = np.random.default_rng(0)
+        term_size = rng.integers(5, 300, 500)
+        overlap = np.minimum(term_size, rng.integers(0, 60, 500))
+        total = term_size + 300 - overlap + DEFAULT_NOT_TERM_NOT_SET
+
+        p_values = hypergeometric_pvalues(overlap, term_size, 300, total)
+        expected = hypergeom.sf(overlap - 1, total, term_size, 300)
+
+        assert p_values == pytest.approx(expected, rel=1e-8, abs=1e-12)
@@ -0,0 +1,77 @@
+"""
+Unit tests for the enrichment tool handler.
+
+Checks that batch analysis resolves each distinct gene once, concurrently
+but at most max_concurrent_queries at a time.
+
+Run with: pytest tests/unit/test_enrichment_handler.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from cogex_mcp.server.handlers import enrichment
+from cogex_mcp.services.entity_resolver import EntityResolutionError
+
+
+class FakeResolver:
+    """Resolver stub tracking concurrent lookups; 'BAD*' genes fail."""
+
+    def __init__(self):
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def resolve_gene(self, gene):
+        self.calls.append(gene)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+        if gene.startswith("BAD"):
+            raise EntityResolutionError(f"Unknown gene {gene}")
+        return SimpleNamespace(curie=f"hgnc:{gene}")
+
+
+class FakeAdapter:
+    """Adapter stub recording query parameters."""
+
+    def __init__(self):
+        self.params = None
+
+    async def query(self, query_name, **params):
+        self.params = params
+        return {"success": True, "results": {}}
+
+
+@pytest.mark.asyncio
+class TestAnalyzeBatch:
+    """Tests for batch enrichment gene resolution."""
+
+    async def test_genes_resolved_once_and_bounded(self, monkeypatch):
+        """Shared genes are looked up once, with bounded concurrency."""
+        resolver = FakeResolver()
+        adapter = FakeAdapter()
+
+        async def get_adapter():
+            return adapter
+
+        monkeypatch.setattr(enrichment, "get_resolver", lambda: resolver)
+        monkeypatch.setattr(enrichment, "get_adapter", get_adapter)
+        monkeypatch.setattr(enrichment.settings, "max_concurrent_queries", 3)
+
+        gene_lists = {
+            "a": [f"G{i}" for i in range(20)] + ["BAD1"],
+            "b": [f"G{i}" for i in range(10, 30)],
+        }
+        result = await enrichment._analyze_batch(
+            {"gene_lists": gene_lists, "background_genes": ["G0", "G40"]}
+        )
+
+        assert sorted(resolver.calls) == sorted({*gene_lists["a"], *gene_lists["b"], "G40"})
+        assert resolver.peak == 3
+        assert result["failed_genes"] == ["BAD1"]
+        assert adapter.params["gene_lists"]["a"] == [f"hgnc:G{i}" for i in range(20)]
+        assert adapter.params["background_genes"] == ["hgnc:G0", "hgnc:G40"]
@@ -0,0 +1,76 @@
+"""
+Unit tests for the bounded executor used by synchronous domain clients.
+
+Verifies that blocking calls run off the event loop, that the pool size
+bounds concurrency, and that queue depth and wait time are recorded.
+
+Run with: pytest tests/unit/test_executor.py -v
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from cogex_mcp.clients.executor import BlockingExecutor
+
+
+@pytest.mark.asyncio
+class TestBlockingExecutor:
+    """Tests for BlockingExecutor."""
+
+    async def test_runs_off_event_loop(self):
+        """Blocking calls run in worker threads and return their result."""
+        executor = BlockingExecutor("test", max_workers=2)
+        loop_thread = threading.get_ident()
+
+        thread_id = await executor.run(threading.get_ident)
+
+        assert thread_id != loop_thread
+        executor.shutdown()
+
+    async def test_event_loop_stays_responsive(self):
+        """The loop keeps running other tasks while a call blocks."""
+        executor = BlockingExecutor("test", max_workers=1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await executor.run(time.sleep, 0.2)
+        task.cancel()
+
+        assert ticks >= 5
+        executor.shutdown()
+
+    async def test_queue_depth_and_wait_time(self):
+        """Calls beyond max_workers queue and record their wait."""
+        executor = BlockingExecutor("test", max_workers=1)
+
+        await asyncio.gather(*(executor.run(time.sleep, 0.05) for _ in range(3)))
+        stats = executor.get_stats()
+
+        assert stats.submitted == 3
+        assert stats.completed == 3
+        assert stats.queued == 0
+        assert stats.max_queued >= 2
+        assert stats.max_wait_ms >= 50
+        executor.shutdown()
+
+    async def test_failures_propagate(self):
+        """Exceptions from the call are re-raised and counted."""
+        executor = BlockingExecutor("test", max_workers=1)
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run(fail)
+
+        assert executor.get_stats().failed == 1
+        executor.shutdown()
@@ -0,0 +1,163 @@
+"""
+Unit tests for the sparse gene-set library.
+
+Builds a small library from in-memory memberships, round-trips it through
+a versioned directory, and checks that in-process enrichment matches the
+set-based enrichment engine.
+
+Run with: pytest tests/unit/test_gene_set_library.py -v
+"""
+
+import numpy as np
+import pytest
+
+from cogex_mcp.clients.enrichment_engine import enrichment_table, table_to_records
+from cogex_mcp.clients.gene_set_library import CURRENT_FILE, GeneSetLibrary
+from cogex_mcp.clients.gsea_engine import gsea_table
+
+
+@pytest.fixture
+def memberships():
+    """(term_id, term_name, gene_id) rows per source."""
+    go = [
+        ("GO:A", "term A", "hgnc:1"),
+        ("GO:A", "term A", "hgnc:2"),
+        ("GO:A", "term A", "hgnc:3"),
+        ("GO:A", "term A", "hgnc:10"),
+        ("GO:B", "term B", "hgnc:1"),
+        ("GO:B", "term B", "HGNC:11"),
+        ("GO:B", "term B", "hgnc:12"),
+        ("GO:B", "term B", "hgnc:12"),  # Duplicate membership
+        ("GO:C", "term C", "hgnc:20"),
+    ]
+    reactome = [
+        ("reactome:R-1", "pathway 1", "hgnc:2"),
+        ("reactome:R-1", "pathway 1", "hgnc:4"),
+        ("reactome:R-2", None, "hgnc:30"),
+    ]
+    return {"go": go, "reactome": reactome}
+
+
+@pytest.fixture
+def library(memberships):
+    """Library built from the sample memberships."""
+    return GeneSetLibrary.from_memberships(memberships, version="v1")
+
+
+def term_genes(memberships, source):
+    """Reference {term: genes} mapping for enrichment_table."""
+    genes = {}
+    for term_id, _, gene_id in memberships[source]:
+        genes.setdefault(term_id, set()).add(gene_id.lower())
+    return genes
+
+
+class TestGeneSetLibrary:
+    """Tests for GeneSetLibrary."""
+
+    def test_build_layout(self, library):
+        """Each source occupies a contiguous block of deduplicated rows."""
+        assert library.sources == ["go", "reactome"]
+        assert library.source_ranges == {"go": (0, 3), "reactome": (3, 5)}
+        assert list(library.indptr) == [0, 4, 7, 8, 10, 11]
+        assert library.term_names[4] == "reactome:R-2"
+        assert "hgnc:11" in library.gene_index
+
+    @pytest.mark.parametrize("background", [None, [f"hgnc:{i}" for i in range(1, 40)]])
+    def test_matches_enrichment_table(self, library, memberships, background):
+        """Matrix counts give the same results as set-based scoring."""
+        gene_ids = ["HGNC:1", "hgnc:2", "hgnc:3", "hgnc:4", "hgnc:999"]
+
+        records = table_to_records(
+            library.enrichment(gene_ids, "go", background_gene_ids=background)
+        )
+        expected = table_to_records(
+            enrichment_table(
+                [g.lower() for g in gene_ids],
+                term_genes(memberships, "go"),
+                term_names={"GO:A": "term A", "GO:B": "term B"},
+                background_gene_ids=background,
+            )
+        )
+
+        assert [r["term_id"] for r in records] == ["GO:A", "GO:B"]
+        for record, reference in zip(records, expected, strict=True):
+            assert sorted(record.pop("genes")) == sorted(reference.pop("genes"))
+            assert record.pop("p_value") == pytest.approx(reference.pop("p_value"))
+            assert record.pop("adjusted_p_value") == pytest.approx(
+                reference.pop("adjusted_p_value")
+            )
+            assert record == reference
+
+    @pytest.mark.parametrize("background", [None, [f"hgnc:{i}" for i in range(1, 40)]])
+    def test_batch_matches_enrichment(self, library, background):
+        """Each list of a batch gets the same results as a single run."""
+        gene_lists = {
+            "first": ["HGNC:1", "hgnc:2", "hgnc:3", "hgnc:4"],
+            "second": ["hgnc:11", "hgnc:12", "hgnc:20", "hgnc:999"],
+            "empty": ["hgnc:999"],
+        }
+        options = {"background_gene_ids": background}
+
+        tables = library.batch_enrichment(gene_lists, "go", keep_insignificant=True, **options)
+
+        assert list(tables) == ["first", "second", "empty"]
+        assert tables["empty"].empty
+        for name, genes in gene_lists.items():
+            records = table_to_records(tables[name])
+            expected = table_to_records(library.enrichment(genes, "go", **options))
+            assert len(records) == len(expected)
+            for record, reference in zip(records, expected, strict=True):
+                assert sorted(record.pop("genes")) == sorted(reference.pop("genes"))
+                assert record == pytest.approx(reference)
+
+    def test_batch_drops_insignificant(self, library):
+        """Without keep_insignificant, only terms within alpha are returned."""
+        gene_lists = {"strong": ["hgnc:1", "hgnc:2", "hgnc:3"], "weak": ["hgnc:1", "hgnc:30"]}
+
+        tables = library.batch_enrichment(gene_lists, "go", alpha=1e-4)
+
+        assert list(tables["strong"]["term_id"]) == ["GO:A"]
+        assert tables["weak"].empty
+
+    def test_gsea_matches_gsea_table(self, library, memberships):
+        """Member ranks from the matrix give the same GSEA results."""
+        ranked_genes = {f"HGNC:{i}": float(21 - i) for i in range(1, 21)}
+        options = {"permutations": 200, "min_size": 1}
+
+        records = table_to_records(library.gsea(ranked_genes, "go", **options))
+        expected = table_to_records(
+            gsea_table(
+                {g.lower(): score for g, score in ranked_genes.items()},
+                term_genes(memberships, "go"),
+                term_names={"GO:A": "term A", "GO:B": "term B", "GO:C": "term C"},
+                **options,
+            )
+        )
+
+        assert {r["term_id"] for r in records} == {"GO:A", "GO:B", "GO:C"}
+        assert records == expected
+
+    def test_no_overlap_and_unknown_source(self, library):
+        """No shared genes gives an empty table; unknown sources raise."""
+        assert library.enrichment(["hgnc:999"], "reactome").empty
+
+        with pytest.raises(ValueError, match="no source"):
+            library.enrichment(["hgnc:1"], "wikipathways")
+
+    def test_save_and_load(self, library, tmp_path):
+        """Saved versions load memory-mapped and become current."""
+        library.save(tmp_path)
+        GeneSetLibrary.from_memberships(
+            {"go": [("GO:Z", "term Z", "hgnc:1")]}, version="v2"
+        ).save(tmp_path)
+
+        assert (tmp_path / CURRENT_FILE).read_text() == "v2"
+        assert GeneSetLibrary.load(tmp_path).term_ids == ["GO:Z"]
+
+        loaded = GeneSetLibrary.load(tmp_path, version="v1")
+        assert loaded.get_stats() == library.get_stats()
+        assert isinstance(loaded.indices, np.memmap)
+        assert table_to_records(loaded.enrichment(["hgnc:2"], "reactome")) == table_to_records(
+            library.enrichment(["hgnc:2"], "reactome")
+        )
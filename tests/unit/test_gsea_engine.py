@@ -0,0 +1,115 @@
+"""
+Unit tests for the vectorized GSEA engine.
+
+Checks enrichment scores against a direct running-sum computation,
+leading-edge genes, permutation p-values, and that results depend only on
+the seed.
+
+Run with: pytest tests/unit/test_gsea_engine.py -v
+"""
+
+import numpy as np
+import pytest
+
+from cogex_mcp.clients.gsea_engine import gsea_table, rank_genes
+
+
+@pytest.fixture
+def ranked_genes():
+    """300 genes with normally distributed scores."""
+    rng = np.random.default_rng(1)
+    return {f"hgnc:{i}": float(score) for i, score in enumerate(rng.normal(size=300))}
+
+
+@pytest.fixture
+def term_genes(ranked_genes):
+    """Random gene sets plus one set of the 10 top-ranked genes."""
+    rng = np.random.default_rng(2)
+    genes = sorted(ranked_genes)
+    sets = {
+        f"GO:{t}": set(rng.choice(genes, rng.integers(5, 40), replace=False))
+        for t in range(40)
+    }
+    ranked_gene_ids, _ = rank_genes(ranked_genes)
+    sets["GO:TOP"] = set(ranked_gene_ids[:10])
+    return sets
+
+
+def running_sum_es(ranked_genes, genes):
+    """Reference enrichment score from the full running sum."""
+    ranked_gene_ids, scores = rank_genes(ranked_genes)
+    hit = np.array([gene in genes for gene in ranked_gene_ids])
+    hit_sum = np.cumsum(np.abs(scores) * hit) / np.abs(scores[hit]).sum()
+    miss_sum = np.cumsum(~hit) / (~hit).sum()
+    deviation = hit_sum - miss_sum
+    return deviation[np.argmax(np.abs(deviation))]
+
+
+class TestGseaTable:
+    """Tests for gsea_table."""
+
+    def test_scores_match_running_sum(self, ranked_genes, term_genes):
+        """Scores equal the maximum deviation of the running sum."""
+        df = gsea_table(ranked_genes, term_genes, permutations=100)
+
+        assert len(df) == len(term_genes)
+        for term_id, es in zip(df["term_id"], df["enrichment_score"], strict=True):
+            assert es == pytest.approx(running_sum_es(ranked_genes, term_genes[term_id]))
+
+    def test_top_ranked_set(self, ranked_genes, term_genes):
+        """A set at the top of the ranking is the most significant."""
+        df = gsea_table(ranked_genes, term_genes, permutations=500)
+
+        top = df.iloc[0]
+        assert top["term_id"] == "GO:TOP"
+        assert top["enrichment_score"] == pytest.approx(1.0)
+        assert top["normalized_enrichment_score"] > 1
+        assert top["p_value"] < 0.01  # No permutation scores as high
+        assert top["gene_count"] == 10
+        assert sorted(top["genes"]) == sorted(term_genes["GO:TOP"])
+
+    def test_random_sets_not_significant(self, ranked_genes, term_genes):
+        """P-values of random sets are spread over (0, 1]."""
+        df = gsea_table(ranked_genes, term_genes, permutations=500)
+        random_sets = df[df["term_id"] != "GO:TOP"]
+
+        assert 0.3 < random_sets["p_value"].mean() < 0.7
+        assert (df["adjusted_p_value"] >= df["p_value"]).all()
+
+    def test_deterministic_seed(self, ranked_genes, term_genes):
+        """Same seed, same results, with or without worker processes."""
+        first = gsea_table(ranked_genes, term_genes, permutations=200, seed=7)
+        second = gsea_table(ranked_genes, term_genes, permutations=200, seed=7, processes=2)
+        other = gsea_table(ranked_genes, term_genes, permutations=200, seed=8)
+
+        columns = ["term_id", "p_value", "normalized_enrichment_score"]
+        assert first[columns].equals(second[columns])
+        assert not first[columns].equals(other[columns])
+
+    def test_size_filter(self, ranked_genes):
+        """Sets with too few members in the ranked list are skipped."""
+        df = gsea_table(ranked_genes, {"GO:SMALL": {"hgnc:1", "hgnc:2", "hgnc:99999"}})
+
+        assert df.empty
+
+        with pytest.raises(ValueError, match="permutations"):
+            gsea_table(ranked_genes, {"GO:X": set(ranked_genes)}, permutations=0, max_size=1000)
+
+    def test_keep_insignificant(self, ranked_genes, term_genes):
+        """Without keep_insignificant only sets within alpha are returned."""
+        every = gsea_table(ranked_genes, term_genes, permutations=500)
+        significant = gsea_table(
+            ranked_genes, term_genes, permutations=500, alpha=0.25, keep_insignificant=False
+        )
+
+        assert len(significant) < len(every)
+        assert "GO:TOP" in set(significant["term_id"])
+        assert (significant["adjusted_p_value"] <= 0.25).all()
+
+    @pytest.mark.parametrize("score", [0.0, 1.5])
+    def test_constant_scores_rejected(self, ranked_genes, term_genes, score):
+        """All-equal scores carry no ranking and are rejected."""
+        constant = dict.fromkeys(ranked_genes, score)
+
+        with pytest.raises(ValueError, match="varying scores"):
+            gsea_table(constant, term_genes, permutations=100)
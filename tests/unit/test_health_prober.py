@@ -0,0 +1,161 @@
+"""
+Unit tests for background backend health probing.
+
+Checks latency histograms, probe backoff and jitter, that probe results
+reach the adapter's cached health state and circuit breakers, and that
+queries no longer run health checks inline.
+
+Run with: pytest tests/unit/test_health_prober.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from cogex_mcp.clients.adapter import (
+    BackendHealth,
+    CircuitBreaker,
+    CircuitBreakerState,
+    ClientAdapter,
+)
+from cogex_mcp.clients.health import HealthProber, LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles(self):
+        """Percentiles report the upper bound of the bucket they fall in."""
+        histogram = LatencyHistogram(bounds=(10, 100, 1000))
+        for latency in [1, 2, 3, 50, 60, 70, 80, 90, 500, 5000]:
+            histogram.record(latency)
+
+        assert histogram.counts == [3, 5, 1, 1]
+        assert histogram.percentile(30) == 10
+        assert histogram.percentile(50) == 100
+        assert histogram.percentile(90) == 1000
+        assert histogram.percentile(100) == 5000  # Overflow bucket: the maximum
+        assert histogram.to_dict()["buckets"]["overflow"] == 1
+        assert LatencyHistogram().percentile(50) is None
+
+
+@pytest.mark.asyncio
+class TestHealthProber:
+    """Tests for HealthProber."""
+
+    async def test_backoff_and_results(self):
+        """Failures double the probe delay up to max_backoff and reach the callback."""
+        results = []
+        healthy = False
+
+        async def check():
+            if not healthy:
+                raise ConnectionError("refused")
+            return True
+
+        async def on_result(name, ok, latency_ms):
+            results.append((name, ok))
+
+        prober = HealthProber(
+            {"neo4j": check}, on_result, interval=10, max_backoff=35, jitter=0
+        )
+
+        assert prober.next_delay("neo4j") == 10
+        assert await prober.probe("neo4j") is False
+        assert prober.next_delay("neo4j") == 20
+        await prober.probe("neo4j")
+        assert prober.next_delay("neo4j") == 35
+
+        healthy = True
+        assert await prober.probe("neo4j") is True
+        assert prober.next_delay("neo4j") == 10
+
+        assert results == [("neo4j", False), ("neo4j", False), ("neo4j", True)]
+        stats = prober.get_stats("neo4j")
+        assert stats["probes"] == 3
+        assert stats["failures"] == 2
+        assert stats["latency"]["count"] == 3
+
+    async def test_jitter_and_timeout(self):
+        """Delays are jittered; slow or falsy probes count as failures."""
+
+        async def hang():
+            await asyncio.sleep(1)
+
+        async def falsy():
+            return False
+
+        async def on_result(name, ok, latency_ms):
+            pass
+
+        prober = HealthProber(
+            {"slow": hang, "bad": falsy}, on_result, interval=10, jitter=0.2, timeout=0.01
+        )
+
+        delays = {prober.next_delay("slow") for _ in range(20)}
+        assert all(8 <= delay <= 12 for delay in delays)
+        assert len(delays) > 1
+
+        assert await prober.probe("slow") is False
+        assert await prober.probe("bad") is False
+        assert prober.get_stats("bad")["last_error"] == "health check returned failure"
+
+    async def test_start_and_stop(self):
+        """Probe loops run in the background until stopped."""
+        probed = asyncio.Event()
+
+        async def check():
+            probed.set()
+            return True
+
+        async def on_result(name, ok, latency_ms):
+            pass
+
+        prober = HealthProber({"rest": check}, on_result, interval=0.01, jitter=0)
+        prober.start()
+        await asyncio.wait_for(probed.wait(), 1)
+        await prober.stop()
+
+        assert prober.get_stats("rest")["probes"] >= 1
+
+
+@pytest.mark.asyncio
+class TestAdapterProbeResults:
+    """Tests for probe results in ClientAdapter."""
+
+    async def test_probe_results_feed_breaker(self):
+        """Failed probes open the breaker; a good probe lets traffic retest it."""
+        adapter = ClientAdapter()
+        adapter.neo4j_breaker = CircuitBreaker(failure_threshold=2)
+
+        await adapter._record_probe("neo4j", False, 5.0)
+        await adapter._record_probe("neo4j", False, 5.0)
+        assert adapter.neo4j_health == BackendHealth.UNHEALTHY
+        assert adapter.neo4j_breaker.is_open()
+
+        await adapter._record_probe("neo4j", True, 5.0)
+        assert adapter.neo4j_health == BackendHealth.HEALTHY
+        assert adapter.neo4j_breaker.state == CircuitBreakerState.HALF_OPEN
+
+        await adapter._record_probe("neo4j", True, 5000.0)
+        assert adapter.neo4j_health == BackendHealth.DEGRADED
+        assert adapter.last_health_check is not None
+
+    async def test_query_skips_health_check(self, monkeypatch):
+        """Queries read cached state instead of probing backends."""
+        adapter = ClientAdapter()
+        adapter._initialized = True
+        calls = []
+
+        async def execute(backend, query_name, **params):
+            calls.append(query_name)
+            return {"success": True}
+
+        async def available(backend):
+            return True
+
+        monkeypatch.setattr(adapter, "_execute_on_backend", execute)
+        monkeypatch.setattr(adapter, "_can_use_backend", available)
+
+        assert await adapter.query("resolve_gene", gene="TP53") == {"success": True}
+        assert calls == ["resolve_gene"]
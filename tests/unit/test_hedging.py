@@ -0,0 +1,170 @@
+"""
+Unit tests for hedged requests between Neo4j and REST.
+
+Checks rolling latency percentiles and the hedge budget, and that a slow
+primary read is raced against the fallback (loser cancelled), while fast,
+over-budget and write queries are not hedged.
+
+Run with: pytest tests/unit/test_hedging.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from cogex_mcp.clients.adapter import BackendType, ClientAdapter
+from cogex_mcp.clients.hedging import HedgeBudget, LatencyTracker
+
+
+class TestLatencyTracker:
+    """Tests for LatencyTracker."""
+
+    def test_percentile_needs_samples(self):
+        """Percentiles come from the latest window once enough samples exist."""
+        tracker = LatencyTracker(window=100, min_samples=10)
+        for i in range(9):
+            tracker.record("get_genes", i / 1000)
+        assert tracker.percentile("get_genes") is None
+
+        for i in range(200):
+            tracker.record("get_genes", (i % 100) / 1000)
+        assert tracker.percentile("get_genes", 95) == pytest.approx(0.095)
+        assert tracker.percentile("get_drugs") is None
+
+
+class TestHedgeBudget:
+    """Tests for HedgeBudget."""
+
+    def test_ratio_caps_hedges(self):
+        """Spending beyond the burst needs 1 / ratio eligible queries per hedge."""
+        budget = HedgeBudget(ratio=0.25, burst=1)
+
+        assert budget.try_spend()
+        assert not budget.try_spend()
+
+        for _ in range(4):
+            budget.earn()
+        assert budget.try_spend()
+
+
+class FakeNeo4j:
+    """Neo4j client stub: only writes are named 'write_*'."""
+
+    def is_read_only_query(self, query_name):
+        return not query_name.startswith("write_")
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Adapter with Neo4j primary, REST fallback and fake backends."""
+    monkeypatch.setattr("cogex_mcp.clients.adapter.settings.hedge_queries", True)
+    adapter = ClientAdapter()
+    adapter._initialized = True
+    adapter.primary_backend = BackendType.NEO4J
+    adapter.fallback_backend = BackendType.REST
+    adapter.neo4j_client = FakeNeo4j()
+    adapter.delays = {BackendType.NEO4J: 0.001, BackendType.REST: 0.001}
+    adapter.failing = set()
+    adapter.calls = []
+    adapter.cancelled = []
+
+    async def available(backend):
+        return True
+
+    async def execute(backend, query_name, **params):
+        adapter.calls.append(backend)
+        try:
+            await asyncio.sleep(adapter.delays[backend])
+        except asyncio.CancelledError:
+            adapter.cancelled.append(backend)
+            raise
+        if backend in adapter.failing:
+            raise RuntimeError(f"{backend} down")
+        return {"success": True, "backend": backend}
+
+    monkeypatch.setattr(adapter, "_can_use_backend", available)
+    monkeypatch.setattr(adapter, "_execute_on_backend", execute)
+
+    # Learn a ~1ms p95 for the query
+    for _ in range(20):
+        adapter._latency.record("get_genes", 0.001)
+    return adapter
+
+
+@pytest.mark.asyncio
+class TestHedgedQuery:
+    """Tests for ClientAdapter hedging."""
+
+    async def test_slow_primary_is_hedged(self, adapter):
+        """The fallback answers first and the primary call is cancelled."""
+        adapter.delays[BackendType.NEO4J] = 1.0
+
+        result = await adapter.query("get_genes", limit=5)
+
+        assert result["backend"] == BackendType.REST
+        assert adapter.cancelled == [BackendType.NEO4J]
+        assert adapter._hedge_stats.hedged == 1
+        assert adapter._hedge_stats.hedge_wins == 1
+
+    async def test_fast_primary_not_hedged(self, adapter):
+        """Queries answered within the threshold only hit the primary."""
+        adapter.delays[BackendType.NEO4J] = 0
+
+        result = await adapter.query("get_genes", limit=5)
+
+        assert result["backend"] == BackendType.NEO4J
+        assert adapter.calls == [BackendType.NEO4J]
+
+    async def test_no_threshold_or_write_not_hedged(self, adapter):
+        """Query names without latency history and writes wait for the primary."""
+        adapter.delays[BackendType.NEO4J] = 0.02
+
+        await adapter.query("get_drugs", limit=5)
+        await adapter.query("write_node", limit=5)
+
+        assert adapter.calls == [BackendType.NEO4J, BackendType.NEO4J]
+
+    async def test_budget_exhausted(self, adapter):
+        """Without budget the slow primary is awaited."""
+        adapter.delays[BackendType.NEO4J] = 0.02
+        adapter._hedge_budget = HedgeBudget(ratio=0, burst=0)
+
+        result = await adapter.query("get_genes", limit=5)
+
+        assert result["backend"] == BackendType.NEO4J
+        assert adapter._hedge_stats.budget_exhausted == 1
+
+    async def test_primary_failure_falls_back(self, adapter):
+        """A primary that fails before the hedge falls back once."""
+        adapter.delays[BackendType.NEO4J] = 0
+        adapter.failing.add(BackendType.NEO4J)
+
+        result = await adapter.query("get_genes", limit=5)
+
+        assert result["backend"] == BackendType.REST
+        assert adapter.calls == [BackendType.NEO4J, BackendType.REST]
+
+    async def test_both_fail(self, adapter):
+        """When the hedge fails too, the error is raised without a third call."""
+        adapter.delays[BackendType.NEO4J] = 0.02
+        adapter.failing.update({BackendType.NEO4J, BackendType.REST})
+
+        with pytest.raises(RuntimeError, match="down"):
+            await adapter.query("get_genes", limit=5)
+
+        assert sorted(adapter.calls) == [BackendType.NEO4J, BackendType.REST]
+
+    async def test_winning_hedges_keep_threshold(self, adapter):
+        """Primaries cancelled by a winning hedge still hold the p95 up."""
+        adapter._latency = LatencyTracker(window=20, min_samples=20)
+        for i in range(20):
+            adapter._latency.record("get_genes", 0.02 if i % 5 == 0 else 0.001)
+        threshold = adapter._latency.percentile("get_genes")
+        adapter._hedge_budget = HedgeBudget(ratio=1, burst=100)
+
+        for i in range(40):
+            adapter.delays[BackendType.NEO4J] = 1.0 if i % 4 == 0 else 0.001
+            await adapter.query("get_genes", limit=5)
+
+        assert adapter._hedge_stats.hedge_wins == 10
+        assert adapter._latency.percentile("get_genes") >= threshold
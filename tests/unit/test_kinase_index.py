@@ -0,0 +1,167 @@
+"""
+Unit tests for the kinase-substrate index.
+
+Builds the index from Phosphorylation statement records, checks kinase
+enrichment against Fisher's exact test, and checks that the index is
+built once in the background and cached between analyses.
+
+Run with: pytest tests/unit/test_kinase_index.py -v
+"""
+
+import asyncio
+import json
+
+import pytest
+from scipy.stats import fisher_exact
+
+from cogex_mcp.clients import kinase_index
+from cogex_mcp.clients.kinase_index import (
+    KinaseIndexNotReadyError,
+    KinaseSubstrateIndex,
+    get_kinase_index,
+    start_kinase_index_build,
+)
+
+
+def statement(kinase_id, kinase_name, substrate, residue, position):
+    """list_phosphorylations record."""
+    stmt = {"type": "Phosphorylation", "residue": residue, "position": position}
+    return {
+        "kinase_id": kinase_id,
+        "kinase_name": kinase_name,
+        "substrate_name": substrate,
+        "stmt_json": json.dumps(stmt),
+    }
+
+
+@pytest.fixture
+def records():
+    """Phosphorylation statements for two kinases."""
+    return [
+        statement("hgnc:6871", "MAP2K1", "MAPK1", "T", "185"),
+        statement("hgnc:6871", "MAP2K1", "MAPK1", "Y", "187"),
+        statement("hgnc:6871", "MAP2K1", "MAPK3", "T", "202"),
+        statement("hgnc:6871", "MAP2K1", "MAPK3", "T", "202"),  # Duplicate
+        statement("hgnc:1773", "CDK1", "RB1", "S", "807"),
+        statement("hgnc:1773", "CDK1", "LMNA", "S", "22"),
+        statement("hgnc:1773", "CDK1", "MAPK1", None, None),  # No site
+    ]
+
+
+@pytest.fixture
+def index(records):
+    """Kinase-substrate index built from the sample statements."""
+    return KinaseSubstrateIndex.from_statements(records)
+
+
+class TestKinaseSubstrateIndex:
+    """Tests for KinaseSubstrateIndex."""
+
+    def test_build_from_statements(self, index):
+        """Site keys come from substrate, residue and position."""
+        assert index.get_stats() == {"kinases": 2, "sites": 5, "pairs": 5}
+        assert "MAPK1_T185" in index.site_index
+        assert index.kinase_names == ["CDK1", "MAP2K1"]
+
+    def test_enrichment_matches_fisher(self, index):
+        """Universe defaults to indexed sites plus query sites."""
+        df = index.enrichment(["mapk1_t185", "MAPK3_T202", "TP53_S15"])
+
+        top = df.iloc[0]
+        assert top["kinase_id"] == "hgnc:6871"
+        assert top["kinase_namespace"] == "hgnc"
+        assert top["kinase_identifier"] == "6871"
+        assert top["substrate_count"] == 2
+        assert top["total_substrates"] == 3
+        assert sorted(top["phosphosites"]) == ["MAPK1_T185", "MAPK3_T202"]
+
+        # Universe of 6 sites: 3 kinase sites, 3 query sites, 2 shared
+        expected = fisher_exact([[2, 1], [1, 2]], alternative="greater")[1]
+        assert top["p_value"] == pytest.approx(expected)
+        assert len(df) == 1
+
+    def test_enrichment_with_background(self, index):
+        """The background sets the not-kinase/not-query cell."""
+        background = ["MAPK1_T185", "MAPK3_T202", "RB1_S807", "X_S1", "X_S2", "X_S3"]
+
+        df = index.enrichment(["MAPK1_T185", "MAPK3_T202"], background=background)
+
+        # MAP2K1: 2 shared, MAPK1_Y187 not in query, 4 background sites in neither
+        expected = fisher_exact([[2, 1], [0, 4]], alternative="greater")[1]
+        assert df.iloc[0]["p_value"] == pytest.approx(expected)
+
+    def test_no_overlap(self, index):
+        """Sites unknown to the index give an empty table."""
+        assert index.enrichment(["TP53_S15"]).empty
+
+
+class FakeClient:
+    """Neo4j client stub streaming fixed records, after `delay` seconds."""
+
+    def __init__(self, records, delay=0.0):
+        self.records = records
+        self.delay = delay
+        self.calls = 0
+
+    async def stream_query(self, query_name, **params):
+        self.calls += 1
+        assert query_name == "list_phosphorylations"
+        await asyncio.sleep(self.delay)
+        for record in self.records:
+            yield record
+
+
+@pytest.fixture
+def fresh_index(monkeypatch):
+    """Start without an index or build."""
+    monkeypatch.setattr(kinase_index, "_index", None)
+    monkeypatch.setattr(kinase_index, "_build_task", None)
+    monkeypatch.setattr(kinase_index.settings, "kinase_index_ttl_seconds", 3600)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("fresh_index")
+class TestGetKinaseIndex:
+    """Tests for the cached kinase index."""
+
+    async def test_index_is_cached(self, records):
+        """Repeated analyses reuse one build; expired indexes serve while rebuilding."""
+        client = FakeClient(records)
+
+        first = await get_kinase_index(client)
+        second = await get_kinase_index(client)
+
+        assert first is second
+        assert client.calls == 1
+
+        first.built_at -= 7200
+        assert await get_kinase_index(client) is first
+        await kinase_index._build_task
+        assert await get_kinase_index(client) is not first
+        assert client.calls == 2
+
+    async def test_not_ready_within_wait(self, records):
+        """Callers give up after `wait`; the build carries on for later callers."""
+        client = FakeClient(records, delay=0.2)
+        start_kinase_index_build(client)
+
+        with pytest.raises(KinaseIndexNotReadyError):
+            await get_kinase_index(client, wait=0.01)
+
+        index = await get_kinase_index(client)
+        assert index.get_stats()["kinases"] == 2
+        assert client.calls == 1
+
+    async def test_cancelled_caller_keeps_build(self, records):
+        """Cancelling a waiting request does not discard the build."""
+        client = FakeClient(records, delay=0.05)
+
+        waiter = asyncio.create_task(get_kinase_index(client))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        await kinase_index._build_task
+        assert await get_kinase_index(client, wait=0) is kinase_index._index
+        assert client.calls == 1
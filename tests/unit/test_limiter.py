@@ -0,0 +1,148 @@
+"""
+Unit tests for the adaptive concurrency limiter.
+
+Checks that calls over the limit queue in order, that full queues and
+expired deadlines shed calls, and that the limit backs off when latency
+rises and recovers when it falls.
+
+Run with: pytest tests/unit/test_limiter.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from cogex_mcp.clients.limiter import AdaptiveLimiter, QueryRejectedError, QueryTimeoutError
+
+
+def sleeper(seconds, log=None, label=None):
+    """Coroutine function sleeping for seconds, optionally logging its label."""
+
+    async def call():
+        if log is not None:
+            log.append(label)
+        await asyncio.sleep(seconds)
+        return label
+
+    return call
+
+
+@pytest.mark.asyncio
+class TestAdaptiveLimiter:
+    """Tests for AdaptiveLimiter."""
+
+    async def test_queued_calls_run_in_order(self):
+        """Calls over the limit wait and start in arrival order."""
+        limiter = AdaptiveLimiter("test", max_limit=2, adaptive=False)
+        started = []
+
+        results = await asyncio.gather(
+            *(limiter.run(sleeper(0.01, started, i)) for i in range(5))
+        )
+
+        assert results == [0, 1, 2, 3, 4]
+        assert started == [0, 1, 2, 3, 4]
+        stats = limiter.get_stats()
+        assert stats.max_queued == 3
+        assert stats.completed == 5
+        assert stats.in_flight == 0
+
+    async def test_full_queue_rejects(self):
+        """With the queue full, new calls are shed immediately."""
+        limiter = AdaptiveLimiter("test", max_limit=1, max_queue=1, adaptive=False)
+
+        running = asyncio.create_task(limiter.run(sleeper(0.05)))
+        queued = asyncio.create_task(limiter.run(sleeper(0.01)))
+        await asyncio.sleep(0)
+
+        with pytest.raises(QueryRejectedError, match="Too many"):
+            await limiter.run(sleeper(0.01))
+
+        await asyncio.gather(running, queued)
+        assert limiter.get_stats().rejected == 1
+
+    async def test_queue_deadline(self):
+        """A queued call is shed once its deadline passes, freeing its place."""
+        limiter = AdaptiveLimiter("test", max_limit=1, adaptive=False)
+
+        running = asyncio.create_task(limiter.run(sleeper(0.05)))
+        await asyncio.sleep(0)
+
+        with pytest.raises(QueryRejectedError, match="Timed out"):
+            await limiter.run(sleeper(0.01), queue_timeout=0.01)
+
+        await running
+        assert await limiter.run(sleeper(0, label="next")) == "next"
+        stats = limiter.get_stats()
+        assert stats.expired == 1
+        assert stats.queued == 0
+
+    async def test_backs_off_and_recovers(self):
+        """Slow completions lower the limit; fast ones under load raise it."""
+        limiter = AdaptiveLimiter("test", max_limit=8)
+
+        await limiter.run(sleeper(0.001))
+        for _ in range(5):
+            await limiter.run(sleeper(0.02))
+        assert limiter.limit < 8
+
+        lowered = limiter.get_stats().limit
+        for _ in range(10):
+            await asyncio.gather(*(limiter.run(sleeper(0.001)) for _ in range(limiter.limit)))
+        assert limiter.get_stats().limit > lowered
+
+    async def test_timeouts_back_off(self):
+        """Calls that time out count as congestion."""
+        limiter = AdaptiveLimiter("test", max_limit=4)
+
+        async def timed_out():
+            raise QueryTimeoutError("Query timeout after 100ms")
+
+        with pytest.raises(QueryTimeoutError):
+            await limiter.run(timed_out)
+
+        stats = limiter.get_stats()
+        assert stats.limit == pytest.approx(3.6)
+        assert stats.failed == 1
+        assert stats.timeouts == 1
+
+    async def test_stream_timeouts_back_off(self):
+        """A timeout while a slot is held also counts as congestion."""
+        limiter = AdaptiveLimiter("test", max_limit=4)
+
+        with pytest.raises(QueryTimeoutError):
+            async with limiter.hold():
+                raise QueryTimeoutError("Query timeout after 100ms")
+
+        assert limiter.get_stats().limit == pytest.approx(3.6)
+        assert limiter.get_stats().in_flight == 0
+
+    async def test_mixed_latency_traffic_holds_limit(self):
+        """Cheap and expensive queries on a healthy backend do not back off."""
+        limiter = AdaptiveLimiter("test", max_limit=40)
+        semaphore = asyncio.Semaphore(20)
+
+        async def caller(i):
+            async with semaphore:
+                key, seconds = ("cheap", 0.002) if i % 2 else ("expensive", 0.05)
+                await limiter.run(sleeper(seconds), key=key)
+
+        await asyncio.gather(*(caller(i) for i in range(400)))
+
+        stats = limiter.get_stats()
+        assert stats.limit == 40
+        assert stats.max_queued == 0
+
+    async def test_single_slow_sample_does_not_back_off(self):
+        """One outlier is not congestion; a sustained slowdown is."""
+        limiter = AdaptiveLimiter("test", max_limit=8)
+
+        for _ in range(4):
+            await limiter.run(sleeper(0.001))
+        await limiter.run(sleeper(0.03))
+        await limiter.run(sleeper(0.001))
+        assert limiter.get_stats().limit == 8
+
+        for _ in range(5):
+            await limiter.run(sleeper(0.03))
+        assert limiter.limit < 8
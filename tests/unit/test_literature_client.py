@@ -9,6 +9,8 @@ Mocks all CoGEx function calls to test:
 - Publication formatting
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -79,6 +81,17 @@ def mock_evidence():
     return ev
 
 
+@pytest.fixture
+def evidence_json():
+    """Serialized Evidence node, as stored in CoGEx."""
+    return json.dumps({
+        "source_api": "reach",
+        "pmid": "28746307",
+        "text": "TP53 phosphorylates MDM2 at serine 166.",
+        "annotations": {"found_by": "Phosphorylation_syntax_1"},
+    })
+
+
 @pytest.fixture
 def mock_statement_complex():
     """Create mock Statement with single agent (for edge cases)."""
@@ -124,24 +137,23 @@ class TestGetPaperStatements:
         assert stmt["object"]["name"] == "MDM2"
 
     @patch("cogex_mcp.clients.literature_client.get_stmts_for_paper")
-    @patch("cogex_mcp.clients.literature_client.get_evidences_for_stmt_hash")
     def test_with_evidence_text(
         self,
-        mock_get_evidence,
         mock_get_stmts,
         literature_client,
         mock_statement,
-        mock_evidence,
+        evidence_json,
     ):
         """Test statement retrieval with evidence text."""
         mock_get_stmts.return_value = [(mock_statement, {})]
-        mock_get_evidence.return_value = [mock_evidence]
+        client = Mock()
+        client.query_tx.return_value = [(-31347186125831290, [evidence_json])]
 
         result = literature_client.get_paper_statements(
             "28746307",
             include_evidence_text=True,
             max_evidence_per_statement=5,
-            client=Mock(),
+            client=client,
         )
 
         assert result["success"] is True
@@ -151,41 +163,30 @@ class TestGetPaperStatements:
         assert "evidence" in stmt
         assert len(stmt["evidence"]) == 1
         assert stmt["evidence"][0]["text"] == "TP53 phosphorylates MDM2 at serine 166."
+        assert stmt["evidence"][0]["pmid"] == "28746307"
+        assert stmt["evidence"][0]["source_api"] == "reach"
 
     @patch("cogex_mcp.clients.literature_client.get_stmts_for_paper")
-    @patch("cogex_mcp.clients.literature_client.get_evidences_for_stmt_hash")
     def test_max_evidence_limit(
         self,
-        mock_get_evidence,
         mock_get_stmts,
         literature_client,
         mock_statement,
     ):
-        """Test max_evidence_per_statement limit."""
+        """Test max_evidence_per_statement is applied in the query."""
         mock_get_stmts.return_value = [(mock_statement, {})]
+        client = Mock()
+        client.query_tx.return_value = []
 
-        # Create 10 evidence objects
-        evidence_list = []
-        for i in range(10):
-            ev = Mock()
-            ev.text = f"Evidence text {i}"
-            ev.pmid = "28746307"
-            ev.source_api = "reach"
-            ev.annotations = {}
-            evidence_list.append(ev)
-
-        mock_get_evidence.return_value = evidence_list
-
-        result = literature_client.get_paper_statements(
+        literature_client.get_paper_statements(
             "28746307",
             include_evidence_text=True,
             max_evidence_per_statement=3,
-            client=Mock(),
+            client=client,
         )
 
-        stmt = result["statements"][0]
-        # Should be limited to 3
-        assert len(stmt["evidence"]) == 3
+        assert client.query_tx.call_args.kwargs["max_evidence"] == 3
+        assert client.query_tx.call_args.kwargs["stmt_hashes"] == [-31347186125831290]
 
     @patch("cogex_mcp.clients.literature_client.get_stmts_for_paper")
     def test_multiple_statements(self, mock_get_stmts, literature_client):
@@ -433,30 +434,61 @@ class TestGetStatementsByHashes:
         assert result["statements"][1]["stmt_type"] == "Activation"
 
     @patch("cogex_mcp.clients.literature_client.get_stmts_for_stmt_hashes")
-    @patch("cogex_mcp.clients.literature_client.get_evidences_for_stmt_hash")
     def test_with_evidence(
         self,
-        mock_get_evidence,
         mock_get_stmts,
         literature_client,
         mock_statement,
-        mock_evidence,
+        evidence_json,
     ):
         """Test batch retrieval with evidence."""
         mock_get_stmts.return_value = [(mock_statement, {})]
-        mock_get_evidence.return_value = [mock_evidence]
+        client = Mock()
+        client.query_tx.return_value = [(-31347186125831290, [evidence_json])]
 
         result = literature_client.get_statements_by_hashes(
             ["-31347186125831290"],
             include_evidence_text=True,
             max_evidence_per_statement=5,
-            client=Mock(),
+            client=client,
         )
 
         assert result["total_statements"] == 1
         stmt = result["statements"][0]
         assert len(stmt["evidence"]) == 1
 
+    @patch("cogex_mcp.clients.literature_client.get_stmts_for_stmt_hashes")
+    def test_evidence_fetched_in_one_query(self, mock_get_stmts, literature_client):
+        """Evidence for all statements comes from a single capped query."""
+        statements = []
+        for stmt_hash in (-111, -222, -333):
+            stmt = Mock()
+            stmt.get_hash = Mock(return_value=stmt_hash)
+            stmt.agent_list = Mock(return_value=[])
+            stmt.evidence = []
+            stmt.belief = 0.9
+            statements.append((stmt, {}))
+        mock_get_stmts.return_value = statements
+
+        client = Mock()
+        client.query_tx.return_value = [
+            (-111, [json.dumps({"source_api": "reach", "text": "a"})]),
+            (-333, [json.dumps({"source_api": "sparser", "text": "b"})]),
+        ]
+
+        result = literature_client.get_statements_by_hashes(
+            ["-111", "-222", "-333"],
+            max_evidence_per_statement=2,
+            client=client,
+        )
+
+        client.query_tx.assert_called_once()
+        assert client.query_tx.call_args.kwargs["stmt_hashes"] == [-111, -222, -333]
+        assert client.query_tx.call_args.kwargs["max_evidence"] == 2
+        evidence = [stmt["evidence"] for stmt in result["statements"]]
+        assert [len(ev) for ev in evidence] == [1, 0, 1]
+        assert evidence[2][0]["source_api"] == "sparser"
+
     @patch("cogex_mcp.clients.literature_client.get_stmts_for_stmt_hashes")
     def test_empty_hashes(self, mock_get_stmts, literature_client):
         """Test with empty hash list."""
@@ -486,10 +518,12 @@ class TestGetStatementsByHashes:
 
         # Only 1 of 3 hashes found
         mock_get_stmts.return_value = [(stmt, {})]
+        client = Mock()
+        client.query_tx.return_value = []
 
         result = literature_client.get_statements_by_hashes(
             ["-111", "-222", "-333"],
-            client=Mock(),
+            client=client,
         )
 
         # Should return what was found
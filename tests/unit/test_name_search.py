@@ -0,0 +1,143 @@
+"""
+Unit tests for full-text entity name search.
+
+Verifies Lucene query construction and the in-memory name index used
+when the database has no full-text index, including that the index is not
+created unless asked for and that local builds do not block each other.
+
+Run with: pytest tests/unit/test_name_search.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from cogex_mcp.clients.name_search import (
+    NAME_SEARCH_SPECS,
+    IndexState,
+    LocalNameIndex,
+    NameSearchIndex,
+    build_lucene_query,
+)
+
+
+class TestBuildLuceneQuery:
+    """Tests for build_lucene_query()."""
+
+    def test_exact_phrase_is_boosted(self):
+        """The whole name is matched as a boosted phrase, tokens as prefixes."""
+        query = build_lucene_query("Breast Cancer")
+
+        assert query == '"breast cancer"^10 OR (breast* AND cancer*)'
+
+    def test_special_characters_are_dropped(self):
+        """Lucene syntax in names cannot break the query."""
+        query = build_lucene_query('5-fluorouracil (oral) "tablet"')
+
+        assert query == (
+            '"5 fluorouracil oral tablet"^10 OR (5* AND fluorouracil* AND oral* AND tablet*)'
+        )
+
+    def test_fuzzy_adds_edit_distance_terms(self):
+        """Fuzzy specs tolerate typos in longer tokens."""
+        query = build_lucene_query("mTOR signaling", fuzzy=True)
+
+        assert query.endswith("(mtor~1 AND signaling~1)")
+
+    def test_empty_name(self):
+        """Names without word characters produce no query."""
+        assert build_lucene_query(" -- ") is None
+
+
+class TestLocalNameIndex:
+    """Tests for LocalNameIndex."""
+
+    def _index(self) -> LocalNameIndex:
+        index = LocalNameIndex()
+        index.add("doid:1612", "breast cancer")
+        index.add("doid:0050671", "female breast cancer")
+        index.add("doid:3459", "breast carcinoma")
+        index.add("doid:1324", "lung cancer")
+        index.freeze()
+        return index
+
+    def test_matches_all_token_prefixes(self):
+        """Every query token must prefix a token of the name."""
+        results = self._index().search("breast canc")
+
+        assert [entity_id for entity_id, _ in results] == ["doid:1612", "doid:0050671"]
+
+    def test_exact_match_ranks_first(self):
+        """Case-insensitive exact matches outrank shorter partial matches."""
+        results = self._index().search("Breast Carcinoma")
+
+        assert results[0] == ("doid:3459", "breast carcinoma")
+
+    def test_no_match(self):
+        """Unknown tokens return no results."""
+        assert self._index().search("melanoma") == []
+
+
+class TestFormatResult:
+    """Tests for shaping name search records like the CONTAINS queries."""
+
+    def test_records_use_spec_id_field(self):
+        """entity_id is renamed to the query's id field and split as a CURIE."""
+        spec = NAME_SEARCH_SPECS["search_drug_by_name"]
+        result = NameSearchIndex._format_result(
+            spec, [{"name": "imatinib", "entity_id": "chebi:45783"}]
+        )
+
+        assert result["count"] == 1
+        assert result["records"][0]["drug_id"] == "chebi:45783"
+        assert result["records"][0]["namespace"] == "chebi"
+
+
+class FakeClient:
+    """Neo4j client stub without full-text indexes; drug name streams wait on `release`."""
+
+    def __init__(self):
+        self.cypher = []
+        self.release = asyncio.Event()
+
+    async def execute_raw_cypher(self, cypher, **params):
+        self.cypher.append(cypher)
+        return []
+
+    async def stream_query(self, query_name, prefixes, **params):
+        if "chebi:" in prefixes:
+            await self.release.wait()
+            yield {"entity_id": "chebi:45783", "name": "imatinib"}
+        else:
+            yield {"entity_id": "mondo:0004975", "name": "Alzheimer disease"}
+
+
+@pytest.mark.asyncio
+class TestNameSearchIndex:
+    """Tests for the full-text index check and local fallback indexes."""
+
+    async def test_index_not_created_by_default(self):
+        """A missing index is only looked up, not created."""
+        client = FakeClient()
+        search = NameSearchIndex(client)
+
+        assert await search._ensure_index() == IndexState.UNAVAILABLE
+        assert len(client.cypher) == 1
+        assert "CREATE" not in client.cypher[0]
+
+    async def test_local_builds_do_not_block_other_types(self):
+        """A slow local build for one entity type leaves the others usable."""
+        client = FakeClient()
+        search = NameSearchIndex(client)
+
+        drugs = asyncio.create_task(search.search("search_drug_by_name", name="imatinib"))
+        await asyncio.sleep(0)
+
+        diseases = await asyncio.wait_for(
+            search.search("search_disease_by_name", name="alzheimer"), 1
+        )
+        assert diseases["records"][0]["disease_id"] == "mondo:0004975"
+        assert not drugs.done()
+
+        client.release.set()
+        assert (await drugs)["records"][0]["drug_id"] == "chebi:45783"
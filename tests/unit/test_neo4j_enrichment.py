@@ -0,0 +1,62 @@
+"""
+Unit tests for enrichment analyses run through the Neo4j client.
+
+Checks which options _execute_enrichment passes on to the enrichment
+client for each analysis type.
+
+Run with: pytest tests/unit/test_neo4j_enrichment.py -v
+"""
+
+import pytest
+
+from cogex_mcp.clients.neo4j_client import Neo4jClient
+
+
+class RecordingExecutor:
+    """Executor stub recording the keyword arguments of each call."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def run(self, func, **kwargs):
+        self.calls.append(kwargs)
+        return {"success": True, "results": []}
+
+
+@pytest.fixture
+def client():
+    """Neo4j client whose enrichment executor records calls."""
+    client = Neo4jClient(
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password="password",
+        fulltext_search=False,
+    )
+    client._enrichment_executor = RecordingExecutor()
+    return client
+
+
+@pytest.mark.asyncio
+class TestExecuteEnrichment:
+    """Tests for Neo4jClient._execute_enrichment."""
+
+    @pytest.mark.parametrize("analysis_type", ["continuous", "batch"])
+    async def test_keep_insignificant_forwarded(self, client, analysis_type):
+        """keep_insignificant reaches GSEA as well as batch enrichment."""
+        await client._execute_enrichment(
+            {"analysis_type": analysis_type, "source": "go", "keep_insignificant": True}
+        )
+
+        (options,) = client._enrichment_executor.calls
+        assert options["analysis_type"] == analysis_type
+        assert options["keep_insignificant"] is True
+
+    async def test_discrete_options(self, client):
+        """Discrete enrichment gets a background instead."""
+        await client._execute_enrichment(
+            {"analysis_type": "discrete", "gene_ids": ["hgnc:1"], "background_genes": ["hgnc:2"]}
+        )
+
+        (options,) = client._enrichment_executor.calls
+        assert options["background_gene_ids"] == ["hgnc:2"]
+        assert "keep_insignificant" not in options
@@ -0,0 +1,173 @@
+"""
+Unit tests for Neo4j query timeouts.
+
+Checks which transaction timeout a catalog, long-running or batched query
+gets, that the client stops waiting shortly after the transaction timeout
+when the server never answers, and that the adapter's concurrency limit
+backs off when it does, even if the REST fallback then answers.
+
+Run with: pytest tests/unit/test_neo4j_timeouts.py -v
+"""
+
+import asyncio
+
+import pytest
+from neo4j.exceptions import Neo4jError
+
+from cogex_mcp.clients.adapter import BackendType, CircuitBreaker, ClientAdapter
+from cogex_mcp.clients.limiter import QueryTimeoutError
+from cogex_mcp.clients.neo4j_client import Neo4jClient
+
+
+class FakeResult:
+    """Streamed result whose fetches take `delay` seconds."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    async def fetch(self, n):
+        await asyncio.sleep(self.delay)
+        return []
+
+
+class FakeSession:
+    """Session recording transaction timeouts; every call takes `delay` seconds."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def execute_read(self, transaction_function, *args):
+        self.driver.timeouts.append(getattr(transaction_function, "timeout", None))
+        await asyncio.sleep(self.driver.delay)
+        return []
+
+    async def run(self, query, params):
+        self.driver.timeouts.append(query.timeout)
+        return FakeResult(self.driver.delay)
+
+    async def close(self):
+        pass
+
+
+class FakeDriver:
+    """Driver handing out FakeSessions."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.timeouts = []
+
+    def session(self, **config):
+        return FakeSession(self)
+
+
+@pytest.fixture
+def client():
+    """Client with distinct default, long-running and batch timeouts."""
+    client = Neo4jClient(
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password="password",
+        default_timeout=5000,
+        long_running_timeout=30000,
+        batch_timeout=20000,
+        fulltext_search=False,
+    )
+    client.driver = FakeDriver()
+    return client
+
+
+@pytest.mark.asyncio
+class TestTransactionTimeouts:
+    """Tests for the timeout each kind of query runs with."""
+
+    async def test_catalog_and_long_running_defaults(self, client):
+        """Long-running catalog queries get their own default timeout."""
+        await client.run_catalog_query("get_pathways_for_gene", gene_id="hgnc:11998")
+        await client.run_catalog_query("list_ontology_edges")
+        await client.run_catalog_query("get_pathways_for_gene", gene_id="hgnc:11998", timeout=800)
+
+        assert client.driver.timeouts == [5.0, 30.0, 0.8]
+
+    async def test_batch_default(self, client):
+        """Batch chunks default to the batch timeout."""
+        await client.execute_batch("get_pathways_for_gene", [{"gene_id": "hgnc:11998"}])
+
+        assert client.driver.timeouts == [20.0]
+
+    async def test_stream_long_running_default(self, client):
+        """Streams of long-running queries get the long-running timeout."""
+        records = [r async for r in client.stream_query("list_phosphorylations")]
+
+        assert records == []
+        assert client.driver.timeouts == [30.0]
+
+
+@pytest.mark.asyncio
+class TestClientSideLimit:
+    """Tests for the client-side limit above the transaction timeout."""
+
+    @pytest.fixture(autouse=True)
+    def short_grace(self, monkeypatch):
+        monkeypatch.setattr("cogex_mcp.clients.neo4j_client.CLIENT_TIMEOUT_GRACE", 0.05)
+
+    async def test_hung_transaction(self, client):
+        """A managed transaction with no answer fails as a timeout."""
+        client.driver.delay = 10
+
+        with pytest.raises(QueryTimeoutError, match="timeout after 100ms"):
+            await asyncio.wait_for(
+                client.run_catalog_query("get_pathways_for_gene", gene_id="x", timeout=100), 2
+            )
+
+        assert client.get_query_stats().timeouts == 1
+
+    async def test_hung_stream(self, client):
+        """A stream whose fetch never answers fails as a timeout."""
+        client.driver.delay = 10
+
+        with pytest.raises(Neo4jError, match="timeout after 100ms"):
+            await asyncio.wait_for(
+                anext(client.stream_query("get_pathways_for_gene", gene_id="x", timeout=100)), 2
+            )
+
+        assert client.get_query_stats().timeouts_by_query["get_pathways_for_gene"] == 1
+
+
+class FakeRest:
+    """REST client stub answering every query at once."""
+
+    async def execute_query(self, query_name, **params):
+        return {"success": True, "data": [], "backend": "rest"}
+
+
+@pytest.mark.asyncio
+class TestAdapterBackoff:
+    """Tests that Neo4j timeouts reach the adapter's concurrency limiter."""
+
+    @pytest.fixture(autouse=True)
+    def short_grace(self, monkeypatch):
+        monkeypatch.setattr("cogex_mcp.clients.neo4j_client.CLIENT_TIMEOUT_GRACE", 0.05)
+
+    @pytest.mark.parametrize("hedge", [False, True])
+    async def test_fallback_answer_still_backs_off(self, client, monkeypatch, hedge):
+        """A Neo4j timeout answered by REST still lowers the lane limit."""
+        monkeypatch.setattr("cogex_mcp.clients.adapter.settings.hedge_queries", hedge)
+        client.driver.delay = 10
+        adapter = ClientAdapter()
+        adapter._initialized = True
+        adapter.primary_backend = BackendType.NEO4J
+        adapter.fallback_backend = BackendType.REST
+        adapter.neo4j_client = client
+        adapter.rest_client = FakeRest()
+        adapter.neo4j_breaker = CircuitBreaker()
+        adapter.rest_breaker = CircuitBreaker()
+        limiter = adapter._limiters["light"]
+        before = limiter.limit
+
+        result = await asyncio.wait_for(
+            adapter.query("get_pathways_for_gene", gene_id="hgnc:11998", timeout=100), 2
+        )
+
+        assert result["backend"] == "rest"
+        assert limiter.limit < before
+        assert limiter.get_stats().timeouts == 1
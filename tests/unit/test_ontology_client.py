@@ -1,14 +1,15 @@
 """
 Unit tests for OntologyClient.
 
-Tests all 3 public methods and helper functions with mocked CoGEx queries.
+Tests all 3 public methods and helper functions with a mocked closure query.
 Achieves >90% code coverage without requiring real Neo4j connection.
 
 Run with: pytest tests/unit/test_ontology_client.py -v
 """
 
+from unittest.mock import MagicMock
+
 import pytest
-from unittest.mock import MagicMock, patch
 
 
 @pytest.fixture
@@ -26,59 +27,31 @@ def ontology_client(mock_neo4j_client):
 
 
 @pytest.fixture
-def sample_parent_nodes():
+def sample_parent_rows():
     """
-    Sample parent term nodes from CoGEx format.
+    Sample parent term rows from the closure query (id, name, depth, relationship).
 
     Simulates GO hierarchy:
     GO:0006915 (apoptotic process) → GO:0012501 (programmed cell death) → GO:0008219 (cell death)
     """
-    nodes = []
-
-    # Create mock nodes
-    node1 = MagicMock()
-    node1.db_ns = "GO"
-    node1.db_id = "0012501"
-    node1.name = "programmed cell death"
-    node1.data = {"name": "programmed cell death"}
-    nodes.append(node1)
-
-    node2 = MagicMock()
-    node2.db_ns = "GO"
-    node2.db_id = "0008219"
-    node2.name = "cell death"
-    node2.data = {"name": "cell death"}
-    nodes.append(node2)
-
-    return nodes
+    return [
+        ["GO:0012501", "programmed cell death", 1, "isa"],
+        ["GO:0008219", "cell death", 2, "isa"],
+    ]
 
 
 @pytest.fixture
-def sample_child_nodes():
+def sample_child_rows():
     """
-    Sample child term nodes from CoGEx format.
+    Sample child term rows from the closure query (id, name, depth, relationship).
 
     Simulates GO hierarchy:
     GO:0008219 (cell death) → GO:0006915 (apoptotic process) → GO:0097194 (intrinsic apoptotic signaling)
     """
-    nodes = []
-
-    # Create mock nodes
-    node1 = MagicMock()
-    node1.db_ns = "GO"
-    node1.db_id = "0006915"
-    node1.name = "apoptotic process"
-    node1.data = {"name": "apoptotic process"}
-    nodes.append(node1)
-
-    node2 = MagicMock()
-    node2.db_ns = "GO"
-    node2.db_id = "0097194"
-    node2.name = "intrinsic apoptotic signaling pathway"
-    node2.data = {"name": "intrinsic apoptotic signaling pathway"}
-    nodes.append(node2)
-
-    return nodes
+    return [
+        ["GO:0006915", "apoptotic process", 1, "isa"],
+        ["GO:0097194", "intrinsic apoptotic signaling pathway", 2, "partof"],
+    ]
 
 
 # =============================================================================
@@ -110,15 +83,15 @@ class TestOntologyClientInit:
 class TestGetHierarchy:
     """Test get_hierarchy method."""
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    def test_get_hierarchy_parents_only(self, mock_get_parents, ontology_client, sample_parent_nodes):
+    def test_get_hierarchy_parents_only(self, ontology_client, mock_neo4j_client, sample_parent_rows):
         """Test getting parent hierarchy only."""
-        mock_get_parents.return_value = sample_parent_nodes
+        mock_neo4j_client.query_tx.return_value = sample_parent_rows
 
         result = ontology_client.get_hierarchy(
             term="GO:0006915",  # apoptotic process
             direction="parents",
             max_depth=2,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
@@ -134,15 +107,15 @@ class TestGetHierarchy:
         assert result["parents"][0]["name"] == "programmed cell death"
         assert result["parents"][0]["depth"] == 1
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_child_terms")
-    def test_get_hierarchy_children_only(self, mock_get_children, ontology_client, sample_child_nodes):
+    def test_get_hierarchy_children_only(self, ontology_client, mock_neo4j_client, sample_child_rows):
         """Test getting child hierarchy only."""
-        mock_get_children.return_value = sample_child_nodes
+        mock_neo4j_client.query_tx.return_value = sample_child_rows
 
         result = ontology_client.get_hierarchy(
             term="GO:0008219",  # cell death
             direction="children",
             max_depth=2,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
@@ -157,21 +130,19 @@ class TestGetHierarchy:
         assert result["children"][0]["curie"] == "go:0006915"
         assert result["children"][0]["name"] == "apoptotic process"
         assert result["children"][0]["depth"] == 1
+        assert result["children"][1]["relationship"] == "part_of"
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_child_terms")
     def test_get_hierarchy_both_directions(
-        self, mock_get_children, mock_get_parents, ontology_client,
-        sample_parent_nodes, sample_child_nodes
+        self, ontology_client, mock_neo4j_client, sample_parent_rows, sample_child_rows
     ):
-        """Test getting both parent and child hierarchy."""
-        mock_get_parents.return_value = sample_parent_nodes
-        mock_get_children.return_value = sample_child_nodes
+        """Test getting both parent and child hierarchy (one query per direction)."""
+        mock_neo4j_client.query_tx.side_effect = [sample_parent_rows, sample_child_rows]
 
         result = ontology_client.get_hierarchy(
             term="GO:0006915",  # apoptotic process
             direction="both",
             max_depth=2,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
@@ -180,52 +151,55 @@ class TestGetHierarchy:
         assert result["children"] is not None
         assert result["total_parents"] == 2
         assert result["total_children"] == 2
+        assert mock_neo4j_client.query_tx.call_count == 2
 
-    def test_get_hierarchy_invalid_direction(self, ontology_client):
+    def test_get_hierarchy_invalid_direction(self, ontology_client, mock_neo4j_client):
         """Test error handling for invalid direction."""
         with pytest.raises(ValueError, match="Invalid direction"):
             ontology_client.get_hierarchy(
                 term="GO:0006915",
                 direction="sideways",  # Invalid
                 max_depth=2,
+                client=mock_neo4j_client,
             )
 
-    def test_get_hierarchy_invalid_depth_too_low(self, ontology_client):
+    def test_get_hierarchy_invalid_depth_too_low(self, ontology_client, mock_neo4j_client):
         """Test error handling for depth < 1."""
         with pytest.raises(ValueError, match="Invalid max_depth"):
             ontology_client.get_hierarchy(
                 term="GO:0006915",
                 direction="parents",
                 max_depth=0,  # Too low
+                client=mock_neo4j_client,
             )
 
-    def test_get_hierarchy_invalid_depth_too_high(self, ontology_client):
+    def test_get_hierarchy_invalid_depth_too_high(self, ontology_client, mock_neo4j_client):
         """Test error handling for depth > 5."""
         with pytest.raises(ValueError, match="Invalid max_depth"):
             ontology_client.get_hierarchy(
                 term="GO:0006915",
                 direction="parents",
                 max_depth=10,  # Too high
+                client=mock_neo4j_client,
             )
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    def test_get_hierarchy_hpo_term(self, mock_get_parents, ontology_client):
+    def test_get_hierarchy_hpo_term(self, ontology_client, mock_neo4j_client):
         """Test with HPO (Human Phenotype Ontology) term."""
-        mock_get_parents.return_value = []
+        mock_neo4j_client.query_tx.return_value = []
 
         result = ontology_client.get_hierarchy(
             term="HP:0001250",  # Seizures
             direction="parents",
             max_depth=2,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
         assert result["term"] == "HP:0001250"
 
-        # Verify term was parsed correctly
-        mock_get_parents.assert_called()
-        call_args = mock_get_parents.call_args[0][0]
-        assert call_args == ("HP", "0001250")
+        # Verify term was normalized to the graph ID
+        mock_neo4j_client.query_tx.assert_called_once()
+        assert mock_neo4j_client.query_tx.call_args.kwargs["term_id"] == "HP:0001250"
 
 
 # =============================================================================
@@ -235,14 +209,14 @@ class TestGetHierarchy:
 class TestGetParentTerms:
     """Test get_parent_terms method."""
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    def test_get_parent_terms_basic(self, mock_get_parents, ontology_client, sample_parent_nodes):
+    def test_get_parent_terms_basic(self, ontology_client, mock_neo4j_client, sample_parent_rows):
         """Test basic parent term retrieval."""
-        mock_get_parents.return_value = sample_parent_nodes
+        mock_neo4j_client.query_tx.return_value = sample_parent_rows
 
         result = ontology_client.get_parent_terms(
             term="GO:0006915",
             max_depth=2,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
@@ -250,47 +224,50 @@ class TestGetParentTerms:
         assert len(result["parents"]) == 2
         assert result["total_parents"] == 2
 
-        # Verify CoGEx query
-        mock_get_parents.assert_called()
-        call_args = mock_get_parents.call_args[0][0]
-        assert call_args == ("GO", "0006915")
+        # Verify a single upward closure query
+        mock_neo4j_client.query_tx.assert_called_once()
+        query = mock_neo4j_client.query_tx.call_args.args[0]
+        assert "-[:isa|partof*1..2]->" in query
+        assert mock_neo4j_client.query_tx.call_args.kwargs["term_id"] == "GO:0006915"
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    def test_get_parent_terms_empty_result(self, mock_get_parents, ontology_client):
+    def test_get_parent_terms_empty_result(self, ontology_client, mock_neo4j_client):
         """Test term with no parents (root term)."""
-        mock_get_parents.return_value = []
+        mock_neo4j_client.query_tx.return_value = []
 
         result = ontology_client.get_parent_terms(
             term="GO:0008150",  # biological_process (root)
             max_depth=2,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
         assert len(result["parents"]) == 0
         assert result["total_parents"] == 0
 
-    def test_get_parent_terms_invalid_depth(self, ontology_client):
+    def test_get_parent_terms_invalid_depth(self, ontology_client, mock_neo4j_client):
         """Test error handling for invalid depth."""
         with pytest.raises(ValueError, match="Invalid max_depth"):
             ontology_client.get_parent_terms(
                 term="GO:0006915",
                 max_depth=0,
+                client=mock_neo4j_client,
             )
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    def test_get_parent_terms_single_depth(self, mock_get_parents, ontology_client, sample_parent_nodes):
+    def test_get_parent_terms_single_depth(self, ontology_client, mock_neo4j_client, sample_parent_rows):
         """Test single-level parent query."""
         # Only return first level parents
-        mock_get_parents.return_value = [sample_parent_nodes[0]]
+        mock_neo4j_client.query_tx.return_value = [sample_parent_rows[0]]
 
         result = ontology_client.get_parent_terms(
             term="GO:0006915",
             max_depth=1,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
         assert len(result["parents"]) == 1
         assert result["parents"][0]["depth"] == 1
+        assert "*1..1]" in mock_neo4j_client.query_tx.call_args.args[0]
 
 
 # =============================================================================
@@ -300,14 +277,14 @@ class TestGetParentTerms:
 class TestGetChildTerms:
     """Test get_child_terms method."""
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_child_terms")
-    def test_get_child_terms_basic(self, mock_get_children, ontology_client, sample_child_nodes):
+    def test_get_child_terms_basic(self, ontology_client, mock_neo4j_client, sample_child_rows):
         """Test basic child term retrieval."""
-        mock_get_children.return_value = sample_child_nodes
+        mock_neo4j_client.query_tx.return_value = sample_child_rows
 
         result = ontology_client.get_child_terms(
             term="GO:0008219",
             max_depth=2,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
@@ -315,49 +292,50 @@ class TestGetChildTerms:
         assert len(result["children"]) == 2
         assert result["total_children"] == 2
 
-        # Verify CoGEx query
-        mock_get_children.assert_called()
-        call_args = mock_get_children.call_args[0][0]
-        assert call_args == ("GO", "0008219")
+        # Verify a single downward closure query
+        mock_neo4j_client.query_tx.assert_called_once()
+        query = mock_neo4j_client.query_tx.call_args.args[0]
+        assert "<-[:isa|partof*1..2]-" in query
+        assert mock_neo4j_client.query_tx.call_args.kwargs["term_id"] == "GO:0008219"
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_child_terms")
-    def test_get_child_terms_empty_result(self, mock_get_children, ontology_client):
+    def test_get_child_terms_empty_result(self, ontology_client, mock_neo4j_client):
         """Test term with no children (leaf term)."""
-        mock_get_children.return_value = []
+        mock_neo4j_client.query_tx.return_value = []
 
         result = ontology_client.get_child_terms(
             term="GO:0097194",  # Leaf term
             max_depth=2,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
         assert len(result["children"]) == 0
         assert result["total_children"] == 0
 
-    def test_get_child_terms_invalid_depth(self, ontology_client):
+    def test_get_child_terms_invalid_depth(self, ontology_client, mock_neo4j_client):
         """Test error handling for invalid depth."""
         with pytest.raises(ValueError, match="Invalid max_depth"):
             ontology_client.get_child_terms(
                 term="GO:0008219",
                 max_depth=6,
+                client=mock_neo4j_client,
             )
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_child_terms")
-    def test_get_child_terms_mondo_disease(self, mock_get_children, ontology_client):
+    def test_get_child_terms_mondo_disease(self, ontology_client, mock_neo4j_client):
         """Test with MONDO disease ontology term."""
-        mock_get_children.return_value = []
+        mock_neo4j_client.query_tx.return_value = []
 
         result = ontology_client.get_child_terms(
             term="MONDO:0004975",  # Alzheimer's disease
             max_depth=2,
+            client=mock_neo4j_client,
         )
 
         assert result["success"] is True
         assert result["term"] == "MONDO:0004975"
 
-        # Verify term was parsed correctly
-        call_args = mock_get_children.call_args[0][0]
-        assert call_args == ("MONDO", "0004975")
+        # Verify term was normalized to the graph ID
+        assert mock_neo4j_client.query_tx.call_args.kwargs["term_id"] == "mondo:0004975"
 
 
 # =============================================================================
@@ -410,15 +388,9 @@ class TestHelperMethods:
         with pytest.raises(ValueError, match="Empty identifier"):
             ontology_client._parse_term_id("GO:")
 
-    def test_format_term_dict_basic(self, ontology_client):
-        """Test formatting term node to dictionary."""
-        node = MagicMock()
-        node.db_ns = "GO"
-        node.db_id = "0006915"
-        node.name = "apoptotic process"
-        node.data = {"name": "apoptotic process"}
-
-        formatted = ontology_client._format_term_dict(node, depth=1)
+    def test_format_term_row_basic(self, ontology_client):
+        """Test formatting a closure query row to dictionary."""
+        formatted = ontology_client._format_term_row("GO:0006915", "apoptotic process", 1, "isa")
 
         assert formatted["curie"] == "go:0006915"
         assert formatted["name"] == "apoptotic process"
@@ -427,39 +399,23 @@ class TestHelperMethods:
         assert formatted["depth"] == 1
         assert formatted["relationship"] == "is_a"
 
-    def test_format_term_dict_no_name_attribute(self, ontology_client):
-        """Test formatting node without name attribute."""
-        node = MagicMock()
-        node.db_ns = "GO"
-        node.db_id = "0006915"
-        node.data = {"name": "apoptotic process"}
-        delattr(node, "name")
-
-        formatted = ontology_client._format_term_dict(node, depth=2)
+    def test_format_term_row_part_of(self, ontology_client):
+        """Test that partof edges are reported as part_of."""
+        formatted = ontology_client._format_term_row("GO:0005739", "mitochondrion", 2, "partof")
 
-        assert formatted["name"] == "apoptotic process"
+        assert formatted["relationship"] == "part_of"
         assert formatted["depth"] == 2
 
-    def test_format_term_dict_no_name_fallback(self, ontology_client):
-        """Test formatting node with no name uses curie as fallback."""
-        node = MagicMock()
-        node.db_ns = "GO"
-        node.db_id = "0006915"
-        node.data = {}
-        delattr(node, "name")
-
-        formatted = ontology_client._format_term_dict(node, depth=1)
+    def test_format_term_row_no_name_fallback(self, ontology_client):
+        """Test formatting row with no name uses the term ID as fallback."""
+        formatted = ontology_client._format_term_row("GO:0006915", None, 1, "isa")
 
         assert formatted["name"] == "GO:0006915"
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    def test_traverse_hierarchy_parents(self, mock_get_parents, ontology_client, sample_parent_nodes):
+    def test_traverse_hierarchy_parents(self, ontology_client, sample_parent_rows):
         """Test hierarchical traversal for parents."""
-        mock_get_parents.return_value = sample_parent_nodes
-
-        from cogex_mcp.clients.ontology_client import OntologyClient
-        from unittest.mock import MagicMock
         mock_client = MagicMock()
+        mock_client.query_tx.return_value = sample_parent_rows
 
         result = ontology_client._traverse_hierarchy(
             term="GO:0006915",
@@ -470,14 +426,12 @@ class TestHelperMethods:
 
         assert len(result) > 0
         assert all(term["depth"] >= 1 for term in result)
+        mock_client.query_tx.assert_called_once()
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_child_terms")
-    def test_traverse_hierarchy_children(self, mock_get_children, ontology_client, sample_child_nodes):
+    def test_traverse_hierarchy_children(self, ontology_client, sample_child_rows):
         """Test hierarchical traversal for children."""
-        mock_get_children.return_value = sample_child_nodes
-
-        from unittest.mock import MagicMock
         mock_client = MagicMock()
+        mock_client.query_tx.return_value = sample_child_rows
 
         result = ontology_client._traverse_hierarchy(
             term="GO:0008219",
@@ -488,10 +442,10 @@ class TestHelperMethods:
 
         assert len(result) > 0
         assert all(term["depth"] >= 1 for term in result)
+        mock_client.query_tx.assert_called_once()
 
     def test_traverse_hierarchy_invalid_direction(self, ontology_client):
         """Test error handling for invalid direction in traversal."""
-        from unittest.mock import MagicMock
         mock_client = MagicMock()
 
         with pytest.raises(ValueError, match="Invalid direction"):
@@ -510,51 +464,56 @@ class TestHelperMethods:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    def test_empty_parent_list(self, mock_get_parents, ontology_client):
+    def test_empty_parent_list(self, ontology_client, mock_neo4j_client):
         """Test handling empty parent list."""
-        mock_get_parents.return_value = []
+        mock_neo4j_client.query_tx.return_value = []
 
-        result = ontology_client.get_parent_terms(term="GO:0008150")
+        result = ontology_client.get_parent_terms(term="GO:0008150", client=mock_neo4j_client)
 
         assert result["success"] is True
         assert result["parents"] == []
         assert result["total_parents"] == 0
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_child_terms")
-    def test_empty_child_list(self, mock_get_children, ontology_client):
+    def test_empty_child_list(self, ontology_client, mock_neo4j_client):
         """Test handling empty child list."""
-        mock_get_children.return_value = []
+        mock_neo4j_client.query_tx.return_value = []
 
-        result = ontology_client.get_child_terms(term="GO:0097194")
+        result = ontology_client.get_child_terms(term="GO:0097194", client=mock_neo4j_client)
 
         assert result["success"] is True
         assert result["children"] == []
         assert result["total_children"] == 0
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    def test_max_depth_limit(self, mock_get_parents, ontology_client, sample_parent_nodes):
-        """Test that max_depth is enforced."""
-        mock_get_parents.return_value = sample_parent_nodes
+    def test_max_depth_limit(self, ontology_client, mock_neo4j_client):
+        """Test that max_depth bounds the variable-length match."""
+        mock_neo4j_client.query_tx.return_value = []
 
-        result = ontology_client.get_parent_terms(
+        ontology_client.get_parent_terms(
             term="GO:0006915",
-            max_depth=1,
+            max_depth=3,
+            client=mock_neo4j_client,
         )
 
-        assert result["success"] is True
-        # Should only get depth 1 terms
-        assert all(term["depth"] == 1 for term in result["parents"])
+        assert "*1..3]" in mock_neo4j_client.query_tx.call_args.args[0]
 
-    @patch("cogex_mcp.clients.ontology_client.get_ontology_parent_terms")
-    def test_query_error_handling(self, mock_get_parents, ontology_client):
-        """Test graceful handling of query errors."""
-        mock_get_parents.side_effect = Exception("Neo4j connection error")
+    def test_closure_deduplicates_nodes_not_paths(self, ontology_client, mock_neo4j_client):
+        """Reachable terms are made distinct before any path is bound."""
+        mock_neo4j_client.query_tx.return_value = []
 
-        # Should not raise, but log warning
-        from unittest.mock import MagicMock
+        ontology_client.get_child_terms(term="GO:0008150", max_depth=5, client=mock_neo4j_client)
+
+        query = mock_neo4j_client.query_tx.call_args.args[0]
+        expand, shortest = query.split("WITH DISTINCT start, term")
+        assert "path" not in expand
+        assert "collect(" not in query
+        assert "shortestPath((start)<-[:isa|partof*1..5]-(term))" in shortest
+
+    def test_query_error_handling(self, ontology_client):
+        """Test graceful handling of query errors."""
         mock_client = MagicMock()
+        mock_client.query_tx.side_effect = Exception("Neo4j connection error")
 
+        # Should not raise, but log warning
         result = ontology_client._traverse_hierarchy(
             term="GO:0006915",
             direction="parents",
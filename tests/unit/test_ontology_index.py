@@ -0,0 +1,115 @@
+"""
+Unit tests for the in-memory ontology index.
+
+Builds a small GO-like DAG in memory, round-trips it through a snapshot
+file, and checks hierarchy lookups and lowest common ancestors.
+
+Run with: pytest tests/unit/test_ontology_index.py -v
+"""
+
+import pytest
+
+from cogex_mcp.services.ontology_index import OntologyGraph, OntologyIndex
+
+
+@pytest.fixture
+def sample_graph():
+    """
+    Small DAG:
+
+        GO:1 biological_process
+          GO:2 cellular process
+            GO:3 cell death
+              GO:4 programmed cell death
+                GO:5 apoptotic process (also part of GO:2)
+              GO:6 necrotic cell death
+    """
+    terms = [
+        ("GO:1", "biological_process"),
+        ("GO:2", "cellular process"),
+        ("GO:3", "cell death"),
+        ("GO:4", "programmed cell death"),
+        ("GO:5", "apoptotic process"),
+        ("GO:6", "necrotic cell death"),
+    ]
+    edges = [
+        ("GO:2", "GO:1", "isa"),
+        ("GO:3", "GO:2", "isa"),
+        ("GO:4", "GO:3", "isa"),
+        ("GO:5", "GO:4", "isa"),
+        ("GO:5", "GO:2", "partof"),
+        ("GO:6", "GO:3", "isa"),
+        ("GO:6", "GO:3", "regulates"),  # Not a hierarchy edge
+    ]
+    return OntologyGraph.from_records(terms, edges)
+
+
+@pytest.fixture
+async def index(sample_graph, tmp_path):
+    """Ontology index loaded from a snapshot of the sample graph."""
+    snapshot_path = tmp_path / "ontology.json.gz"
+    OntologyIndex._write_snapshot(sample_graph, snapshot_path)
+
+    index = OntologyIndex(snapshot_path=snapshot_path, refresh_interval=0)
+    assert await index.load_snapshot()
+    return index
+
+
+@pytest.mark.asyncio
+class TestOntologyIndex:
+    """Tests for OntologyIndex lookups."""
+
+    async def test_not_loaded_returns_none(self):
+        """Lookups return None until the index is loaded."""
+        index = OntologyIndex()
+
+        assert not index.loaded
+        assert index.parents("GO:5") is None
+        assert index.get_term("GO:5") is None
+
+    async def test_snapshot_round_trip(self, index):
+        """Snapshot keeps terms and hierarchy edges only."""
+        stats = index.get_stats()
+
+        assert stats["loaded"] is True
+        assert stats["source"] == "snapshot"
+        assert stats["terms"] == 6
+        assert stats["edges"] == 6
+
+    async def test_parents_shortest_depth(self, index):
+        """Each ancestor is reported once, at its shortest depth."""
+        parents = index.parents("go:5", max_depth=2)
+
+        assert [(p["curie"], p["depth"], p["relationship"]) for p in parents] == [
+            ("go:4", 1, "is_a"),
+            ("go:2", 1, "part_of"),
+            ("go:3", 2, "is_a"),
+            ("go:1", 2, "is_a"),
+        ]
+        assert parents[0]["name"] == "programmed cell death"
+
+    async def test_children_and_descendants(self, index):
+        """Children honour max_depth; descendants are the full closure."""
+        children = index.children("GO:3")
+        descendants = index.descendants("GO:1")
+
+        assert {c["curie"] for c in children} == {"go:4", "go:6"}
+        assert len(descendants) == 5
+        assert index.ancestors("GO:1") == []
+
+    async def test_lowest_common_ancestors(self, index):
+        """LCA excludes common ancestors that have a common descendant."""
+        lca = index.lowest_common_ancestors("GO:5", "GO:6")
+
+        assert [(t["curie"], t["depth"]) for t in lca] == [("go:3", 3)]
+        assert index.lowest_common_ancestors("GO:4", "GO:5")[0]["curie"] == "go:4"
+
+    async def test_get_term_by_curie_and_name(self, index):
+        """Terms resolve by CURIE (any case) or exact name."""
+        assert index.get_term("go:5") == {
+            "name": "apoptotic process",
+            "curie": "GO:5",
+            "namespace": "go",
+        }
+        assert index.get_term("Apoptotic Process")["curie"] == "GO:5"
+        assert index.get_term("GO:999") is None
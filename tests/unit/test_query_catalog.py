@@ -0,0 +1,116 @@
+"""
+Unit tests for the compiled Cypher query catalog.
+
+Verifies that the registry is built once at import time, that aliases
+share compiled queries, and that parameter binding applies defaults.
+
+Run with: pytest tests/unit/test_query_catalog.py -v
+"""
+
+import pytest
+
+from cogex_mcp.clients.query_catalog import (
+    LONG_RUNNING_QUERIES,
+    QUERY_ALIASES,
+    QUERY_REGISTRY,
+    CypherQuery,
+    get_query,
+)
+
+
+class TestQueryRegistry:
+    """Tests for QUERY_REGISTRY and get_query()."""
+
+    def test_registry_is_read_only(self):
+        """Registry cannot be mutated at runtime."""
+        with pytest.raises(TypeError):
+            QUERY_REGISTRY["new_query"] = None  # type: ignore[index]
+
+    def test_get_query_returns_compiled_query(self):
+        """Known names return CypherQuery objects."""
+        query = get_query("get_pathways_for_gene")
+
+        assert isinstance(query, CypherQuery)
+        assert "$gene_id" in query.cypher
+        assert query.parameters == {"gene_id", "offset", "limit"}
+
+    def test_aliases_share_compiled_query(self):
+        """Aliases resolve to the same compiled object as their target."""
+        for alias, target in QUERY_ALIASES.items():
+            if target in QUERY_REGISTRY:
+                assert get_query(alias) is get_query(target)
+
+    def test_unknown_query_raises(self):
+        """Unknown names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown query: nonexistent"):
+            get_query("nonexistent")
+
+    def test_curie_fields_from_return_clause(self):
+        """CURIE fields are derived from the columns a query returns."""
+        query = get_query("get_pathways_for_gene")
+
+        assert "pathway_id" in query.columns
+        assert query.curie_fields == ("pathway_id",)
+
+    def test_long_running_queries_flagged(self):
+        """Scans and traversals are flagged long-running; lookups are not."""
+        for name in LONG_RUNNING_QUERIES:
+            assert get_query(name).long_running
+
+        assert not get_query("get_pathways_for_gene").long_running
+
+
+class TestCypherQueryBind:
+    """Tests for CypherQuery.bind()."""
+
+    def test_bind_applies_defaults(self):
+        """Omitted pagination parameters receive defaults."""
+        params = get_query("get_pathways_for_gene").bind({"gene_id": "hgnc:11998"})
+
+        assert params == {"gene_id": "hgnc:11998", "limit": 20, "offset": 0}
+
+    def test_bind_drops_undeclared_parameters(self):
+        """Parameters the Cypher text does not use are not sent."""
+        params = get_query("get_pathways_for_gene").bind(
+            {"gene_id": "hgnc:11998", "limit": 5, "response_format": "json"}
+        )
+
+        assert params == {"gene_id": "hgnc:11998", "limit": 5, "offset": 0}
+
+    def test_bind_query_specific_defaults(self):
+        """Optional query parameters default to None."""
+        params = get_query("source_target_analysis").bind({"source_gene_id": "hgnc:6407"})
+
+        assert params["target_gene_ids"] is None
+        assert params["min_evidence"] == 1
+
+
+class TestBatchCypher:
+    """Tests for the UNWIND form used by Neo4jClient.execute_batch()."""
+
+    def test_batch_cypher_unwinds_rows(self):
+        """Per-row parameters are read from the unwound row."""
+        query = get_query("get_pathways_for_gene")
+
+        assert query.batch_cypher.startswith("UNWIND $__rows AS __row")
+        assert "__row.gene_id" in query.batch_cypher
+        assert "$gene_id" not in query.batch_cypher
+
+    def test_paging_parameters_stay_shared(self):
+        """SKIP/LIMIT parameters remain query-level parameters."""
+        query = get_query("get_pathways_for_gene")
+
+        assert query.paging_parameters == {"offset", "limit"}
+        assert "LIMIT $limit" in query.batch_cypher
+
+    def test_bind_batch_groups_by_paging_values(self):
+        """Rows with different limits are sent as separate groups."""
+        groups = get_query("get_pathways_for_gene").bind_batch(
+            [{"gene_id": "hgnc:1"}, {"gene_id": "hgnc:2", "limit": 5}, {"gene_id": "hgnc:3"}]
+        )
+
+        assert len(groups) == 2
+        shared, rows = groups[0]
+        assert shared == {"limit": 20, "offset": 0}
+        assert [row["__index"] for row in rows] == [0, 2]
+        assert rows[0] == {"gene_id": "hgnc:1", "__index": 0}